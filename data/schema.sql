@@ -71,7 +71,26 @@ CREATE TABLE IF NOT EXISTS import_batches (
     completed_at DATETIME
 );
 
--- 6. Full-Text Search (Virtual Table)
+-- 6. Scraped Articles (staging, bulk-loaded by scraper/ --output-format sqlite)
+CREATE TABLE IF NOT EXISTS scraped_articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    slug TEXT UNIQUE NOT NULL,
+    title_en TEXT NOT NULL,
+    content TEXT NOT NULL,
+    author TEXT,
+    category TEXT NOT NULL,
+    tags TEXT,
+    featured_image TEXT,
+    inline_images TEXT,
+    movie_titles TEXT,
+    source_url TEXT NOT NULL,
+    source_site TEXT DEFAULT 'tasteofcinema.com',
+    page_count INTEGER DEFAULT 1,
+    scraped_at DATETIME,
+    staged_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 7. Full-Text Search (Virtual Table)
 CREATE VIRTUAL TABLE IF NOT EXISTS search_articles USING fts5(
     title_ar,
     excerpt_ar,
@@ -0,0 +1,96 @@
+"""
+bench_e2e.py — End-to-end throughput of ``scraper.main()`` against the mock site.
+
+Starts :mod:`mock_site` on a free local port, runs the full CLI pipeline
+(discovery → extraction → images → manifest) into a temporary output
+directory with ``--base-url`` pointing at it, and reports articles/sec and
+images/sec plus what the site served.  Site knobs (size, latency, error
+rates) are the ``mock_site.py`` flags; any unrecognised flag is passed
+through to ``scraper.py``.
+
+Usage:
+    python benchmarks/bench_e2e.py
+    python benchmarks/bench_e2e.py --articles 500 --latency 0.05 --workers 4 --image-workers 4
+    python benchmarks/bench_e2e.py --error-rate 0.02 --trace /tmp/trace.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import scraper as scraper_cli
+from manifest import load_manifest
+from mock_site import MockSite, add_site_arguments, config_from_args
+from models import ScrapeStatus
+
+
+def run(config, scraper_args: list[str], output_dir: Path) -> dict:
+    """Serve *config*, run ``scraper.main()`` once and return the measurements."""
+    with MockSite(config) as site:
+        argv = ["--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0", *scraper_args]
+        start = time.perf_counter()
+        exit_code = scraper_cli.main(argv)
+        elapsed = time.perf_counter() - start
+        served = site.stats()
+
+    manifest = load_manifest(output_dir)
+    entries = list(manifest.entries.values())
+    completed = sum(1 for e in entries if e.status == ScrapeStatus.COMPLETED)
+    images = sum(e.images_downloaded for e in entries)
+    return {
+        "exit_code": exit_code,
+        "seconds": elapsed,
+        "articles": completed,
+        "failed": sum(1 for e in entries if e.status == ScrapeStatus.FAILED),
+        "images": images,
+        "articles_per_second": completed / elapsed if elapsed else 0.0,
+        "images_per_second": images / elapsed if elapsed else 0.0,
+        "served": served,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end scraper throughput against a local mock site.")
+    add_site_arguments(parser)
+    parser.add_argument("--keep", metavar="DIR", default=None, help="write the output here instead of a temp dir")
+    args, scraper_args = parser.parse_known_args(argv)
+    config = config_from_args(args)
+
+    print(
+        f"Mock site: {config.articles} articles, {config.min_pages}-{config.max_pages} pages, "
+        f"{config.images_per_page} images/page, ~{config.page_kb} KB pages, {config.image_kb} KB images, "
+        f"latency {config.latency * 1000:.0f}±{config.jitter * 1000:.0f} ms, "
+        f"errors {config.error_rate:.0%} pages / {config.image_error_rate:.0%} images"
+    )
+    if scraper_args:
+        print(f"scraper.py {' '.join(scraper_args)}")
+
+    if args.keep:
+        result = run(config, scraper_args, Path(args.keep).resolve())
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run(config, scraper_args, Path(tmp) / "scraped")
+
+    served = result["served"]
+    mb = sum(served["bytes"].values()) / 1e6
+    print()
+    print(f"  exit code        {result['exit_code']}")
+    print(f"  wall time        {result['seconds']:10.2f} s")
+    print(f"  articles         {result['articles']:10d}  ({result['failed']} failed)")
+    print(f"  images           {result['images']:10d}")
+    print(f"  articles/sec     {result['articles_per_second']:10.2f}")
+    print(f"  images/sec       {result['images_per_second']:10.2f}")
+    print(f"  served           {sum(served['requests'].values()):10d} requests, {mb:.1f} MB "
+          f"({', '.join(f'{k} {v}' for k, v in sorted(served['requests'].items()))})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
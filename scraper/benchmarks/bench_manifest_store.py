@@ -0,0 +1,131 @@
+"""
+bench_manifest_store.py — Memory and query cost: pydantic entries vs CompactEntries.
+
+Builds N manifest entries (default 100,000; a third completed, a few
+undated) and compares resident size (tracemalloc) and the time for
+``get_sorted_entries`` / ``get_pending_entries`` with the entries held as
+one ``ManifestEntry`` per article versus the ``entry_store`` column store.
+
+Usage:
+    python benchmarks/bench_manifest_store.py
+    python benchmarks/bench_manifest_store.py --entries 250000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from entry_store import CompactEntries
+from manifest import get_pending_entries, get_sorted_entries, query_entries
+from models import Manifest, ScrapeStatus
+
+
+def raw_entries(n: int) -> dict[str, dict]:
+    entries = {}
+    for i in range(n):
+        slug = f"the-{i}-best-films-of-the-decade-ranked"
+        completed = i % 3 == 0
+        entries[slug] = {
+            "url": f"https://www.tasteofcinema.com/{2012 + i % 14}/{slug}/",
+            "slug": slug,
+            "status": "completed" if completed else "pending",
+            "last_modified": None if i % 50 == 0 else f"{2012 + i % 14}-{1 + i % 12:02d}-{1 + i % 28:02d}T{i % 24:02d}:00:00+00:00",
+            "scraped_at": "2026-02-28T14:32:11Z" if completed else None,
+            "pages_found": 2 if completed else 0,
+        }
+    return entries
+
+
+def _measure(build):
+    """Return (value, traced bytes, untraced build seconds)."""
+    gc.collect()
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size, elapsed
+
+
+def _time(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    raw = raw_entries(args.entries)
+    plain = Manifest(discovered_at="2026-01-01T00:00:00Z", total=0)
+    plain.entries, plain_bytes, plain_build = _measure(lambda: Manifest.model_validate({"discovered_at": "x", "total": 0, "entries": raw}).entries)
+    compact = Manifest(discovered_at="2026-01-01T00:00:00Z", total=0)
+    compact.entries, compact_bytes, compact_build = _measure(lambda: CompactEntries.from_mapping(raw))
+
+    print(f"{args.entries} entries\n")
+    print(f"  {'':<34} {'pydantic':>12} {'compact':>12}")
+    print(f"  {'memory (MB)':<34} {plain_bytes / 1e6:12.1f} {compact_bytes / 1e6:12.1f}")
+    print(f"  {'build from raw JSON (ms)':<34} {plain_build * 1000:12.1f} {compact_build * 1000:12.1f}")
+
+    def sorted_slugs(m: Manifest, pending_only: bool) -> list[str]:
+        return [e.slug for e in get_sorted_entries(m, pending_only=pending_only)]
+
+    def cold(fn):
+        """Run *fn* on the compact manifest with no entries materialized yet."""
+        def run(m: Manifest):
+            m.entries = CompactEntries.from_mapping(compact_raw)
+            start = time.perf_counter()
+            fn(m)
+            return time.perf_counter() - start
+        return run
+
+    compact_raw = compact.entries.to_jsonable()
+    pending = (ScrapeStatus.PENDING, ScrapeStatus.FAILED)
+    rows = (
+        ("sort pending, keys only (ms)",
+         lambda m: sorted(
+             (e for e in m.entries.values() if e.status in pending),
+             key=lambda e: (e.last_modified is None, e.last_modified or ""),
+         ),
+         lambda m: m.entries.sorted_slugs(statuses=pending)),
+        ("get_sorted_entries pending (ms)", get_sorted_entries, get_sorted_entries),
+        ("get_pending_entries (ms)", get_pending_entries, get_pending_entries),
+        ("count completed (ms)",
+         lambda m: sum(1 for e in m.entries.values() if e.status == ScrapeStatus.COMPLETED),
+         lambda m: m.entries.status_counts()[ScrapeStatus.COMPLETED]),
+    )
+    for label, plain_fn, compact_fn in rows:
+        plain_ms = _time(lambda: plain_fn(plain))
+        compact_ms = min(cold(compact_fn)(compact) for _ in range(3)) * 1000
+        print(f"  {label:<34} {plain_ms:12.1f} {compact_ms:12.1f}")
+
+    # "latest 10 pending": full sort + slice vs query_entries (heap top-k on
+    # plain entries, early-stopping walk of the warm date index on compact)
+    compact.entries.date_index()
+    latest_sorted = _time(lambda: get_sorted_entries(plain)[:10])
+    latest_plain = _time(lambda: query_entries(plain, limit=10))
+    latest_compact = _time(lambda: query_entries(compact, limit=10))
+    print(f"  {'latest 10 pending, sort + slice (ms)':<34} {latest_sorted:12.1f}")
+    print(f"  {'latest 10 pending, query_entries (ms)':<34} {latest_plain:12.1f} {latest_compact:12.3f}")
+
+    assert sorted_slugs(plain, True) == sorted_slugs(compact, True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+bench_serialize.py — Manifest save/load cost per serializer backend.
+
+Builds a realistic manifest (default 6,000 completed entries with a
+dozen probed images each, roughly the size of a full tasteofcinema.com
+crawl) and times every encode/decode path in ``serialize.py`` against the
+original ``model_dump_json`` / ``json.load`` + ``model_validate``.
+
+Usage:
+    python benchmarks/bench_serialize.py
+    python benchmarks/bench_serialize.py --entries 20000 --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import serialize
+from models import ImageInfo, Manifest, ManifestEntry, ScrapeStatus
+
+
+def build_manifest(n_entries: int, images_per_entry: int = 12) -> Manifest:
+    entries: dict[str, ManifestEntry] = {}
+    for i in range(n_entries):
+        slug = f"the-{i}-best-films-of-the-decade-ranked"
+        entries[slug] = ManifestEntry(
+            url=f"https://www.tasteofcinema.com/{2012 + i % 14}/{slug}/",
+            slug=slug,
+            last_modified=f"{2012 + i % 14}-{1 + i % 12:02d}-15T00:00:00+00:00",
+            status=ScrapeStatus.COMPLETED,
+            images_status=ScrapeStatus.COMPLETED,
+            pages_found=1 + i % 4,
+            images_found=images_per_entry,
+            images_downloaded=images_per_entry,
+            scraped_at="2026-02-28T14:32:11Z",
+            images=[
+                ImageInfo(file=f"{k:02d}-film-still.jpg", format="jpeg", width=1200, height=675)
+                for k in range(images_per_entry)
+            ],
+        )
+    return Manifest(discovered_at="2026-02-28T00:00:00Z", total=n_entries, entries=entries)
+
+
+def _time(fn, repeat: int) -> float:
+    """Median wall time of *fn* in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=6000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    manifest = build_manifest(args.entries)
+    pretty_bytes = manifest.model_dump_json(indent=2).encode("utf-8")
+    compact_bytes = manifest.model_dump_json().encode("utf-8")
+
+    rows: list[tuple[str, float, int | None]] = [
+        ("dump  model_dump_json(indent=2) [baseline]", _time(lambda: manifest.model_dump_json(indent=2), args.repeat), len(pretty_bytes)),
+    ]
+    for backend in serialize.BACKENDS:
+        try:
+            serialize.configure(backend=backend)
+        except RuntimeError:
+            print(f"(skipping {backend}: not installed)")
+            continue
+        for pretty in (True, False):
+            label = f"dump  {backend:<8} {'pretty' if pretty else 'compact'}"
+            size = len(serialize.dump_model(manifest, pretty=pretty))
+            rows.append((label, _time(lambda: serialize.dump_model(manifest, pretty=pretty), args.repeat), size))
+
+    rows.append(("load  json.load + model_validate [baseline]", _time(lambda: Manifest.model_validate(json.loads(pretty_bytes)), args.repeat), None))
+    rows.append(("load  load_model (pretty file)", _time(lambda: serialize.load_model(Manifest, pretty_bytes), args.repeat), None))
+    rows.append(("load  load_model (compact file)", _time(lambda: serialize.load_model(Manifest, compact_bytes), args.repeat), None))
+
+    print(f"Manifest: {args.entries} entries, median of {args.repeat} runs\n")
+    dump_base = rows[0][1]
+    load_base = next(ms for label, ms, _ in rows if label.startswith("load") and "baseline" in label)
+    for label, ms, size in rows:
+        base = dump_base if label.startswith("dump") else load_base
+        size_col = f"{size / 1e6:7.2f} MB" if size is not None else " " * 10
+        print(f"  {label:<46} {ms:9.1f} ms  {base / ms:5.2f}x  {size_col}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
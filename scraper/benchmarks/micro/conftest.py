@@ -0,0 +1,84 @@
+"""
+conftest.py — Generated fixtures for the pytest-benchmark micro suite.
+
+Provides:
+- a 100-item list article (10 pages x 10 entries, ~40 KB per page) from
+  the mock site generator, as raw pages and as merged content HTML
+- a 10,000-entry manifest (plain pydantic entries and the compact store)
+
+Inputs are deterministic so saved baselines stay comparable.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark", reason="pip install -e '.[bench]'")
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_manifest_store import raw_entries
+from entry_store import CompactEntries
+from mock_site import SiteConfig, SiteContent
+from models import Manifest
+
+BASE_URL = "https://www.tasteofcinema.com"
+MANIFEST_ENTRIES = 10_000
+
+
+# ---------------------------------------------------------------------------
+# List article
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def list_article() -> tuple[str, dict[str, bytes]]:
+    """``(url, {page url: html})`` for a 100-item, 10-page list article."""
+    content = SiteContent(SiteConfig(min_pages=10, max_pages=10, images_per_page=10, page_kb=40))
+    article = content.article(7)
+    url = BASE_URL + article.path
+    pages: dict[str, bytes] = {}
+    for n in range(1, article.pages + 1):
+        html = content.page(BASE_URL, article, n)
+        assert html is not None  # every page up to article.pages exists
+        pages[url if n == 1 else f"{url}{n}/"] = html
+    return url, pages
+
+
+@pytest.fixture(scope="session")
+def list_article_content(list_article) -> str:
+    """Merged ``.entry-content`` HTML of the 100-item article."""
+    from extract import _parse_article_html
+
+    url, pages = list_article
+    return "\n".join(
+        part for page_url, html in pages.items() for part in _parse_article_html(html, page_url)["content_parts"]
+    )
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def manifest_raw() -> dict[str, dict]:
+    return raw_entries(MANIFEST_ENTRIES)
+
+
+@pytest.fixture
+def plain_manifest(manifest_raw) -> Manifest:
+    return Manifest.model_validate(
+        {"discovered_at": "2026-01-01T00:00:00Z", "total": len(manifest_raw), "entries": manifest_raw}
+    )
+
+
+@pytest.fixture
+def compact_manifest(manifest_raw) -> Manifest:
+    manifest = Manifest(discovered_at="2026-01-01T00:00:00Z", total=len(manifest_raw))
+    manifest.entries = CompactEntries.from_mapping(manifest_raw)
+    return manifest
@@ -0,0 +1,40 @@
+"""
+test_bench_extract.py — Extraction hot paths on a 100-item list article.
+
+Benchmarks: ``_parse_article_html`` on one ~40 KB page,
+``extract_movie_titles`` on the merged content, ``fetch_all_pages`` over
+10 in-memory pages, and the whole ``extract_article`` (parse, paginate,
+merge, titles; no sink, no sleeping).
+"""
+
+from __future__ import annotations
+
+from extract import _parse_article_html, extract_article, extract_movie_titles, fetch_all_pages
+
+
+def _no_sleep(seconds: float) -> None:
+    pass
+
+
+def test_parse_article_html(benchmark, list_article) -> None:
+    url, pages = list_article
+    data = benchmark(_parse_article_html, pages[url], url)
+    assert len(data["inline_images"]) == 11 and len(data["pagination_links"]) == 9
+
+
+def test_extract_movie_titles(benchmark, list_article_content) -> None:
+    titles = benchmark(extract_movie_titles, list_article_content)
+    assert len(titles) == 100
+
+
+def test_fetch_all_pages(benchmark, list_article) -> None:
+    url, pages = list_article
+    first = _parse_article_html(pages[url], url)
+    result = benchmark(fetch_all_pages, url, first, pages.__getitem__, delay=0, sleep=_no_sleep)
+    assert len(result) == 10
+
+
+def test_extract_article(benchmark, list_article) -> None:
+    url, pages = list_article
+    article = benchmark(extract_article, url, pages[url], fetcher=pages.__getitem__, delay=0, sleep=_no_sleep)
+    assert article.pages_merged == 10 and len(article.movie_titles) == 100
@@ -0,0 +1,44 @@
+"""
+test_bench_manifest.py — Manifest query and persistence on 10,000 entries.
+
+Benchmarks: ``get_sorted_entries`` (pending, latest first) and the
+``query_entries`` "latest 10" plan on plain and compact entries, and
+``save_manifest`` / ``load_manifest`` round trips (save includes the
+``manifest.snap`` snapshot).
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from manifest import get_sorted_entries, load_manifest, query_entries, save_manifest
+
+KINDS = ("plain_manifest", "compact_manifest")
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_get_sorted_entries(benchmark, request, kind: str) -> None:
+    manifest = request.getfixturevalue(kind)
+    entries = benchmark(get_sorted_entries, manifest, pending_only=True)
+    assert len(entries) > 6000
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_query_latest_10(benchmark, request, kind: str) -> None:
+    manifest = request.getfixturevalue(kind)
+    entries = benchmark(query_entries, manifest, limit=10)
+    assert len(entries) == 10
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_save_manifest(benchmark, request, tmp_path, kind: str) -> None:
+    manifest = request.getfixturevalue(kind)
+    benchmark(save_manifest, manifest, tmp_path)
+    assert (tmp_path / "manifest.json").exists()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_load_manifest(benchmark, plain_manifest, tmp_path, compact: bool) -> None:
+    save_manifest(plain_manifest, tmp_path)
+    manifest = benchmark(load_manifest, tmp_path, compact=compact)
+    assert len(manifest.entries) == len(plain_manifest.entries)
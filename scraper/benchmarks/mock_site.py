@@ -0,0 +1,505 @@
+"""
+mock_site.py — Local stand-in for tasteofcinema.com for end-to-end runs.
+
+Serves a synthetic WordPress site that is shaped like the real one, so the
+whole pipeline (``scraper.main()``: discovery, extraction, pagination,
+images, manifest) can run against ``--base-url http://127.0.0.1:PORT``
+without touching the network.  Everything is generated on request and is
+deterministic for a given :class:`SiteConfig`.
+
+Covers:
+- ``/wp-sitemap.xml`` index and ``/wp-sitemap-posts-post-N.xml`` post
+  sitemaps (``loc`` + ``lastmod``)
+- Multi-page articles ``/<year>/<slug>/`` and ``/<year>/<slug>/<n>/`` with
+  ``.entry-title``, ``.author-name``, ``.cat-links``, ``.tag-links``,
+  ``.entry-content`` (featured ``wp-post-image`` + inline images) and
+  ``.page-links`` / ``.post-page-numbers`` pagination
+- JPEG-shaped image bodies under ``/wp-content/uploads/`` (valid header with
+  dimensions, padded to size — not decodable pixels), with ``ETag`` /
+  ``Accept-Ranges`` and ``Range`` support
+- Knobs: article count, posts per sitemap, pages per article, images per
+  page, HTML page / image sizes, per-response latency + jitter, 503 error
+  rates for article pages and images, and a site-wide outage (every request
+  503) for a window of requests
+- Request / byte counters per kind (``site.stats()``)
+
+Usage:
+    python benchmarks/mock_site.py --articles 500 --latency 0.05   # serve until Ctrl-C
+
+    from mock_site import MockSite, SiteConfig
+    with MockSite(SiteConfig(articles=20)) as site:
+        scraper.main(["--base-url", site.base_url, "--delay", "0", ...])
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SiteConfig:
+    """Shape and behaviour of the synthetic site."""
+
+    articles: int = 200
+    per_sitemap: int = 100
+    min_pages: int = 1
+    max_pages: int = 3
+    images_per_page: int = 3
+    page_kb: int = 40  # approximate HTML size of one article page
+    image_kb: int = 60
+    latency: float = 0.0  # seconds added to every response
+    jitter: float = 0.0  # +/- seconds, deterministic per request
+    error_rate: float = 0.0  # share of article page responses that are 503
+    image_error_rate: float = 0.0
+    retry_after: int | None = 1  # Retry-After seconds sent with each 503 (None: no header)
+    outage_start: int | None = None  # request number (0-based) at which the whole site goes down
+    outage_length: int = 0  # requests answered 503 before it comes back
+    seed: int = 0
+
+
+_ADJECTIVES = ("best", "underrated", "great", "essential", "overlooked", "strangest", "saddest", "funniest")
+_NOUNS = ("thrillers", "westerns", "noir-films", "debuts", "sci-fi-movies", "horror-films", "dramas", "comedies")
+_AUTHORS = ("Jack Murphy", "Jane Doe", "Vlad Radu", "Emily Chen", "Omar Haddad")
+_CATEGORIES = ("film-lists", "features", "reviews", "editorial")
+_WORDS = (
+    "cinema frame director shot light score cut scene actor story camera silence "
+    "colour memory genre script rhythm montage close-up widescreen festival"
+).split()
+
+_PAGE_RE = re.compile(r"^/(\d{4})/([a-z0-9-]+)/(?:(\d+)/)?$")
+_IMAGE_RE = re.compile(r"^/wp-content/uploads/\d{4}/([a-z0-9-]+)-(\d+)\.jpg$")
+_SITEMAP_RE = re.compile(r"^/wp-sitemap-posts-post-(\d+)\.xml$")
+
+_EPOCH = datetime(2012, 1, 1, tzinfo=timezone.utc)
+
+
+def _unit(*key: object) -> float:
+    """Deterministic value in [0, 1) for *key*."""
+    return zlib.crc32(":".join(map(str, key)).encode()) / 2**32
+
+
+# ---------------------------------------------------------------------------
+# Content generation
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Article:
+    index: int
+    slug: str
+    year: int
+    lastmod: str
+    pages: int
+    title: str
+
+    @property
+    def path(self) -> str:
+        return f"/{self.year}/{self.slug}/"
+
+
+class SiteContent:
+    """Deterministic generator for sitemaps, article pages and images."""
+
+    def __init__(self, config: SiteConfig) -> None:
+        self.config = config
+        self._image_cache: dict[int, bytes] = {}
+        self._lock = threading.Lock()
+
+    # -- articles -------------------------------------------------------------
+
+    def article(self, index: int) -> Article:
+        cfg = self.config
+        adjective = _ADJECTIVES[index % len(_ADJECTIVES)]
+        noun = _NOUNS[(index // len(_ADJECTIVES)) % len(_NOUNS)]
+        count = 10 + index % 16
+        slug = f"{count}-{adjective}-{noun}-{index}"
+        published = _EPOCH + timedelta(hours=index * 37 + int(_unit(cfg.seed, "t", index) * 36))
+        span = cfg.max_pages - cfg.min_pages + 1
+        pages = cfg.min_pages + int(_unit(cfg.seed, "p", index) * span)
+        title = f"The {count} {adjective.title()} {noun.replace('-', ' ').title()} You Need To See"
+        return Article(
+            index=index,
+            slug=slug,
+            year=published.year,
+            lastmod=published.isoformat(),
+            pages=pages,
+            title=title,
+        )
+
+    def find(self, year: int, slug: str) -> Article | None:
+        """Resolve a URL's year + slug back to its article (or ``None``)."""
+        try:
+            index = int(slug.rsplit("-", 1)[1])
+        except (IndexError, ValueError):
+            return None
+        if not 0 <= index < self.config.articles:
+            return None
+        article = self.article(index)
+        return article if (article.slug, article.year) == (slug, year) else None
+
+    # -- sitemaps -------------------------------------------------------------
+
+    @property
+    def sitemap_count(self) -> int:
+        return max(1, -(-self.config.articles // self.config.per_sitemap))
+
+    def sitemap_index(self, base_url: str) -> bytes:
+        locs = "".join(
+            f"  <sitemap><loc>{base_url}/wp-sitemap-posts-post-{k}.xml</loc></sitemap>\n"
+            for k in range(1, self.sitemap_count + 1)
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f"{locs}</sitemapindex>\n"
+        ).encode()
+
+    def post_sitemap(self, base_url: str, number: int) -> bytes | None:
+        if not 1 <= number <= self.sitemap_count:
+            return None
+        per = self.config.per_sitemap
+        rows = []
+        for index in range((number - 1) * per, min(number * per, self.config.articles)):
+            article = self.article(index)
+            rows.append(
+                f"  <url><loc>{base_url}{article.path}</loc>"
+                f"<lastmod>{article.lastmod}</lastmod></url>\n"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f"{''.join(rows)}</urlset>\n"
+        ).encode()
+
+    # -- article pages --------------------------------------------------------
+
+    def image_url(self, base_url: str, article: Article, n: int) -> str:
+        return f"{base_url}/wp-content/uploads/{article.year}/{article.slug}-{n}.jpg"
+
+    def page(self, base_url: str, article: Article, page: int) -> bytes | None:
+        if not 1 <= page <= article.pages:
+            return None
+        cfg = self.config
+        per_page = cfg.images_per_page
+        parts: list[str] = []
+        if page == 1:
+            parts.append(
+                f'<img class="attachment-post-thumbnail wp-post-image" '
+                f'src="{self.image_url(base_url, article, 0)}" alt="" />'
+            )
+
+        # Entries are spread over the pages, one inline image each
+        first_image = (page - 1) * per_page + 1
+        filler_budget = max(cfg.page_kb * 1024 - 2048, 0) // max(per_page, 1)
+        for k in range(per_page):
+            n = first_image + k
+            rank = article.pages * per_page - n + 1
+            film = f"{_WORDS[(article.index + n) % len(_WORDS)].title()} {n}"
+            parts.append(f"<p><strong>{rank}. {escape(film)} ({1950 + (article.index + n) % 70})</strong></p>")
+            parts.append(f'<img src="{self.image_url(base_url, article, n)}" alt="{escape(film)}" />')
+            parts.append(self._filler(article.index * 1000 + n, filler_budget))
+
+        if article.pages > 1:
+            links = []
+            for p in range(1, article.pages + 1):
+                if p == page:
+                    links.append(f'<span class="post-page-numbers current">{p}</span>')
+                else:
+                    href = base_url + article.path + ("" if p == 1 else f"{p}/")
+                    links.append(f'<a href="{href}" class="post-page-numbers">{p}</a>')
+            parts.append(f'<div class="page-links">Pages: {" ".join(links)}</div>')
+
+        author = _AUTHORS[article.index % len(_AUTHORS)]
+        category = _CATEGORIES[article.index % len(_CATEGORIES)]
+        tags = (article.slug.split("-")[2], str(article.year))
+        html = f"""<!DOCTYPE html>
+<html lang="en-US">
+<head><meta charset="UTF-8" /><title>{escape(article.title)} – Page {page} – Taste of Cinema</title></head>
+<body class="post-template-default single single-post">
+<article class="post type-post status-publish">
+  <header class="entry-header">
+    <h1 class="entry-title">{escape(article.title)}</h1>
+    <div class="entry-meta"><span class="author-name"><a href="{base_url}/author/">{author}</a></span></div>
+  </header>
+  <div class="entry-content">
+{chr(10).join(parts)}
+  </div>
+  <footer class="entry-footer">
+    <span class="cat-links"><a href="{base_url}/category/{category}/" rel="category tag">{category}</a></span>
+    <span class="tag-links">{"".join(f'<a href="{base_url}/tag/{t}/" rel="tag">{t}</a>' for t in tags)}</span>
+  </footer>
+</article>
+</body>
+</html>
+"""
+        return html.encode("utf-8")
+
+    @staticmethod
+    def _filler(key: int, size: int) -> str:
+        """Paragraphs of pseudo-text totalling roughly *size* bytes."""
+        out: list[str] = []
+        total, k = 0, key
+        while total < size:
+            words = [_WORDS[(k * 7 + j * 13) % len(_WORDS)] for j in range(40)]
+            paragraph = f"<p>{' '.join(words).capitalize()}.</p>"
+            out.append(paragraph)
+            total += len(paragraph)
+            k += 1
+        return "\n".join(out)
+
+    # -- images ---------------------------------------------------------------
+
+    def image(self, n: int) -> bytes:
+        """A JPEG-shaped body: SOI, APP0, SOF0 with dimensions, COM padding, EOI."""
+        with self._lock:
+            body = self._image_cache.get(n)
+            if body is None:
+                body = _jpeg_body(640 + n % 5 * 80, 360 + n % 3 * 40, self.config.image_kb * 1024)
+                self._image_cache[n] = body
+            return body
+
+
+def _jpeg_body(width: int, height: int, size: int) -> bytes:
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+    sof0 = b"\xff\xc0" + struct.pack(">HBHHB", 17, 8, height, width, 3) + b"\x01\x22\x00\x02\x11\x01\x03\x11\x01"
+    body = bytearray(b"\xff\xd8" + app0 + sof0)
+    while len(body) + 6 < size:
+        chunk = min(size - len(body) - 6, 65533)
+        body += b"\xff\xfe" + struct.pack(">H", chunk + 2) + bytes(i % 251 for i in range(chunk))
+    return bytes(body + b"\xff\xd9")
+
+
+# ---------------------------------------------------------------------------
+# HTTP server
+# ---------------------------------------------------------------------------
+
+
+class MockSite:
+    """
+    The synthetic site on a local port (0 picks a free one).
+
+    ``start()`` serves from a daemon thread and sets :attr:`base_url`;
+    ``stop()`` shuts it down.  Also a context manager.
+    """
+
+    def __init__(self, config: SiteConfig | None = None, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or SiteConfig()
+        self.content = SiteContent(self.config)
+        self._address = (host, port)
+        self._server: ThreadingHTTPServer | None = None
+        self._lock = threading.Lock()
+        self._hits: Counter[str] = Counter()  # per path, to vary errors across retries
+        self._served = 0  # requests so far, for the outage window
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent: Counter[str] = Counter()
+        self.base_url = ""
+
+    def start(self) -> "MockSite":
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                site._handle(self)
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002 - silence access log
+                pass
+
+        self._server = ThreadingHTTPServer(self._address, Handler)
+        self._server.daemon_threads = True
+        host, port = self._server.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+        threading.Thread(target=self._server.serve_forever, name="mock-site", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockSite":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stats(self) -> dict:
+        """Requests and bytes served so far, per kind (``sitemap``, ``page``, ``image``, ``error``, ``missing``)."""
+        with self._lock:
+            return {"requests": dict(self.requests), "bytes": dict(self.bytes_sent)}
+
+    # -- request handling -----------------------------------------------------
+
+    def _route(self, path: str) -> tuple[str, bytes | None, str]:
+        """``(kind, body, content type)``; ``body is None`` means 404."""
+        base, content = self.base_url, self.content
+        if path == "/wp-sitemap.xml":
+            return "sitemap", content.sitemap_index(base), "application/xml"
+        if m := _SITEMAP_RE.match(path):
+            return "sitemap", content.post_sitemap(base, int(m.group(1))), "application/xml"
+        if m := _PAGE_RE.match(path):
+            article = content.find(int(m.group(1)), m.group(2))
+            body = content.page(base, article, int(m.group(3) or 1)) if article else None
+            return "page", body, "text/html; charset=UTF-8"
+        if m := _IMAGE_RE.match(path):
+            slug, n = m.group(1), int(m.group(2))
+            index = slug.rsplit("-", 1)[-1]
+            article = content.article(int(index)) if index.isdigit() and int(index) < self.config.articles else None
+            if article is None or article.slug != slug or n > article.pages * self.config.images_per_page:
+                return "image", None, "image/jpeg"
+            return "image", content.image(n), "image/jpeg"
+        return "missing", None, "text/plain"
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        cfg = self.config
+        path = handler.path.split("?", 1)[0]
+        with self._lock:
+            self._hits[path] += 1
+            hit = self._hits[path]
+            seq, self._served = self._served, self._served + 1
+
+        delay = cfg.latency + cfg.jitter * (2 * _unit(cfg.seed, "j", path, hit) - 1)
+        if delay > 0:
+            time.sleep(delay)
+
+        kind, body, content_type = self._route(path)
+        rate = {"page": cfg.error_rate, "image": cfg.image_error_rate}.get(kind, 0.0)
+        down = cfg.outage_start is not None and 0 <= seq - cfg.outage_start < cfg.outage_length
+        if down or (body is not None and rate > 0 and _unit(cfg.seed, "e", path, hit) < rate):
+            kind, body = "error", None
+            status = 503
+        elif body is None:
+            status = 404
+        else:
+            status = 200
+
+        if body is None:
+            self._send(handler, kind, status, b"", "text/plain")
+            return
+
+        if kind == "image":
+            etag = f'"{zlib.crc32(body):08x}"'
+            byte_range = handler.headers.get("Range", "")
+            if byte_range.startswith("bytes=") and handler.headers.get("If-Range", etag) == etag:
+                start = int(byte_range[6:].split("-", 1)[0] or 0)
+                if start >= len(body):
+                    self._send(handler, kind, 416, b"", "text/plain",
+                               {"Content-Range": f"bytes */{len(body)}"})
+                    return
+                self._send(handler, kind, 206, body[start:], content_type, {
+                    "Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}",
+                    "ETag": etag, "Accept-Ranges": "bytes",
+                })
+                return
+            self._send(handler, kind, 200, body, content_type, {"ETag": etag, "Accept-Ranges": "bytes"})
+            return
+        self._send(handler, kind, status, body, content_type)
+
+    def _send(
+        self,
+        handler: BaseHTTPRequestHandler,
+        kind: str,
+        status: int,
+        body: bytes,
+        content_type: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        if status == 404:
+            kind = "missing"
+        with self._lock:
+            self.requests[kind] += 1
+            self.bytes_sent[kind] += len(body)
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        if status == 503 and self.config.retry_after is not None:
+            handler.send_header("Retry-After", str(self.config.retry_after))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def add_site_arguments(parser: argparse.ArgumentParser) -> None:
+    """The :class:`SiteConfig` knobs as command-line flags (shared with bench_e2e.py)."""
+    defaults = SiteConfig()
+    parser.add_argument("--articles", type=int, default=defaults.articles)
+    parser.add_argument("--per-sitemap", type=int, default=defaults.per_sitemap)
+    parser.add_argument("--min-pages", type=int, default=defaults.min_pages)
+    parser.add_argument("--max-pages", type=int, default=defaults.max_pages)
+    parser.add_argument("--images-per-page", type=int, default=defaults.images_per_page)
+    parser.add_argument("--page-kb", type=int, default=defaults.page_kb)
+    parser.add_argument("--image-kb", type=int, default=defaults.image_kb)
+    parser.add_argument("--latency", type=float, default=defaults.latency, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=defaults.jitter, help="+/- seconds per response")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="503 share for article pages")
+    parser.add_argument("--image-error-rate", type=float, default=defaults.image_error_rate)
+    parser.add_argument("--retry-after", type=int, default=defaults.retry_after,
+                        help="Retry-After seconds on 503s (negative: no header)")
+    parser.add_argument("--outage-start", type=int, default=defaults.outage_start,
+                        help="request number at which every response becomes 503")
+    parser.add_argument("--outage-length", type=int, default=defaults.outage_length,
+                        help="requests the outage lasts")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def config_from_args(args: argparse.Namespace) -> SiteConfig:
+    return SiteConfig(
+        articles=args.articles,
+        per_sitemap=args.per_sitemap,
+        min_pages=args.min_pages,
+        max_pages=args.max_pages,
+        images_per_page=args.images_per_page,
+        page_kb=args.page_kb,
+        image_kb=args.image_kb,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        image_error_rate=args.image_error_rate,
+        retry_after=args.retry_after if args.retry_after >= 0 else None,
+        outage_start=args.outage_start,
+        outage_length=args.outage_length,
+        seed=args.seed,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8765)
+    add_site_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with MockSite(config_from_args(args), port=args.port) as site:
+        print(f"Serving {args.articles} synthetic articles at {site.base_url} (Ctrl-C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
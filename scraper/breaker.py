@@ -0,0 +1,231 @@
+"""
+breaker.py — Per-host circuit breaker: pause the crawl while the origin is down.
+
+Without it an outage burns through the queue: every pending article runs
+its fetch retries, fails and is marked ``failed``.  With it, requests to a
+host go through a :class:`CircuitBreaker` (wired into ``retry.RetryPolicy``,
+so page, sitemap and image fetches all share it):
+
+- **closed** — requests pass.  ``failure_threshold`` consecutive outage
+  errors (``5xx``, timeouts, refused / reset connections) open it; any
+  response that proves the host is up (success, ``404``, a bad body) resets
+  the count.  ``429`` is rate limiting, not an outage, and is left to
+  ``retry.py`` / ``throttle.py``.
+- **open** — every thread that wants the host blocks.  After
+  ``probe_interval`` one request is let through as a probe (**half-open**).
+- **half-open** — the probe's outcome decides: the host answered → closed,
+  everyone resumes; another outage error → open again with the probe
+  interval doubled (up to ``max_probe_interval``).
+
+A host that stays down for ``max_outage`` seconds makes every waiting and
+later request raise :class:`CircuitOpenError`, so the run ends instead of
+hanging.  ``scraper.py`` puts articles that fail while their host's breaker
+is not closed (and those whose failures tripped it) back to ``pending``
+rather than ``failed`` and re-queues them within the run.
+
+Covers:
+- ``BreakerConfig``: threshold and timings
+- ``CircuitBreaker.before(url)`` / ``record(url, exc)``: gate and feed one
+  request
+- ``is_closed(url)``, ``gave_up(url)``, ``trips(url)``, ``snapshot()``,
+  ``summary()``
+
+Usage:
+    from breaker import BreakerConfig, CircuitBreaker
+    import retry
+    retry.configure(breaker=CircuitBreaker(BreakerConfig(failure_threshold=5)))
+"""
+
+from __future__ import annotations
+
+import http.client
+import logging
+import socket
+import threading
+import time
+import urllib.error
+from dataclasses import dataclass
+from typing import Callable
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """The host has been down longer than ``max_outage``; not retried."""
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    """Threshold and timings (seconds) for :class:`CircuitBreaker`."""
+
+    failure_threshold: int = 5
+    probe_interval: float = 15.0
+    max_probe_interval: float = 120.0
+    max_outage: float | None = 1800.0  # None: wait for the host forever
+
+
+# DNS, refused / reset / dropped connections, timeouts, short bodies
+_NETWORK_ERRORS = (
+    urllib.error.URLError,
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    socket.gaierror,
+    http.client.HTTPException,
+)
+
+
+def is_outage_error(exc: BaseException) -> bool:
+    """True if *exc* says the host is down (not merely busy or missing a page)."""
+    if isinstance(exc, urllib.error.HTTPError):
+        return exc.code >= 500
+    return isinstance(exc, _NETWORK_ERRORS)  # not local OSErrors: disk full, permission denied …
+
+
+# ---------------------------------------------------------------------------
+# Breaker
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Host:
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    next_probe: float = 0.0
+    interval: float = 0.0
+    trips: int = 0
+    down_seconds: float = 0.0
+    gave_up: bool = False
+
+
+class CircuitBreaker:
+    """Thread-safe per-host breaker shared by every fetch path."""
+
+    def __init__(
+        self,
+        config: BreakerConfig | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.config = config or BreakerConfig()
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._hosts: dict[str, _Host] = {}
+
+    def _host(self, url: str) -> tuple[str, _Host]:
+        host = urlsplit(url).netloc
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _Host()
+        return host, state
+
+    # -- request path ---------------------------------------------------------
+
+    def before(self, url: str) -> None:
+        """
+        Block while *url*'s host is open or a probe is in flight; return
+        when the request may go (possibly as the probe).  Raises
+        :class:`CircuitOpenError` once the outage exceeds ``max_outage``.
+        """
+        max_outage = self.config.max_outage
+        with self._cond:
+            host, state = self._host(url)
+            while True:
+                if state.gave_up:
+                    raise CircuitOpenError(f"{host} unreachable for over {max_outage:.0f}s")
+                if state.state == CLOSED:
+                    return
+                now = self._clock()
+                if max_outage is not None and now - state.opened_at > max_outage:
+                    state.gave_up = True
+                    logger.error("%s down for over %.0fs; giving up", host, max_outage)
+                    self._cond.notify_all()
+                    continue
+                if state.state == OPEN and now >= state.next_probe:
+                    state.state = HALF_OPEN
+                    return
+                timeout = state.next_probe - now if state.state == OPEN else None
+                if max_outage is not None:
+                    deadline = state.opened_at + max_outage - now
+                    timeout = deadline if timeout is None else min(timeout, deadline)
+                self._cond.wait(max(timeout, 0.0) if timeout is not None else None)
+
+    def record(self, url: str, exc: BaseException | None) -> None:
+        """Feed the outcome of a request admitted by :meth:`before` (``None`` = success)."""
+        cfg = self.config
+        with self._cond:
+            host, state = self._host(url)
+            now = self._clock()
+            if exc is None or not is_outage_error(exc):
+                if state.state != CLOSED:
+                    state.down_seconds += now - state.opened_at
+                    logger.warning("%s is back after %.0fs; resuming", host, now - state.opened_at)
+                    self._cond.notify_all()
+                state.state, state.failures = CLOSED, 0
+                return
+            state.failures += 1
+            if state.state == HALF_OPEN:
+                state.state = OPEN
+                state.interval = min(state.interval * 2, cfg.max_probe_interval)
+                state.next_probe = now + state.interval
+                self._cond.notify_all()
+            elif state.state == CLOSED and state.failures >= cfg.failure_threshold:
+                state.state = OPEN
+                state.opened_at = now
+                state.interval = cfg.probe_interval
+                state.next_probe = now + state.interval
+                state.trips += 1
+                logger.warning(
+                    "%s failed %d times in a row (%s); pausing requests, probing every %gs",
+                    host, state.failures, exc, state.interval,
+                )
+
+    # -- queries --------------------------------------------------------------
+
+    def is_closed(self, url: str) -> bool:
+        with self._cond:
+            return self._host(url)[1].state == CLOSED
+
+    def gave_up(self, url: str) -> bool:
+        with self._cond:
+            return self._host(url)[1].gave_up
+
+    def trips(self, url: str) -> int:
+        """Times *url*'s host has opened so far."""
+        with self._cond:
+            return self._host(url)[1].trips
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-host breaker state (for logs and the end-of-run summary)."""
+        with self._cond:
+            return {
+                host: {
+                    "state": state.state,
+                    "consecutive_failures": state.failures,
+                    "trips": state.trips,
+                    "down_seconds": state.down_seconds,
+                    "gave_up": state.gave_up,
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def summary(self) -> str | None:
+        """One line per host that tripped, or ``None``."""
+        lines = [
+            f"Circuit breaker [{host}]: opened {s['trips']}x, paused {s['down_seconds']:.0f}s"
+            + (" (gave up)" if s["gave_up"] else f", now {s['state']}")
+            for host, s in self.snapshot().items()
+            if s["trips"]
+        ]
+        return "\n".join(lines) or None
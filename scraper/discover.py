@@ -61,12 +61,15 @@ _DEFAULT_DELAY = 1.0  # seconds between requests during discovery
 
 def _fetch_xml(url: str, delay: float = 0.0) -> bytes:
     """
-    Fetch *url* and return raw bytes. Raises on HTTP errors.
+    Fetch *url* and return raw bytes. Transient errors are retried under
+    ``retry.default_policy``; anything else (or running out) raises.
 
     Separated so unit tests can monkeypatch this function directly.
     """
     import urllib.request
 
+    from retry import default_policy
+
     req = urllib.request.Request(
         url,
         headers={
@@ -78,8 +81,12 @@ def _fetch_xml(url: str, delay: float = 0.0) -> bytes:
     )
     if delay > 0:
         time.sleep(delay)
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return resp.read()
+
+    def attempt() -> bytes:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.read()
+
+    return default_policy().call(url, attempt)
 
 
 def _fetch_html(url: str, delay: float = 0.0) -> bytes:
@@ -128,17 +135,21 @@ def _parse_post_sitemap(xml_bytes: bytes) -> list[tuple[str, str | None]]:
 def fetch_all_article_urls_from_sitemap(
     delay: float = _DEFAULT_DELAY,
     verbose: bool = False,
+    *,
+    base_url: str = BASE_URL,
 ) -> list[tuple[str, str | None]]:
     """
     Pull the sitemap index and iterate over all post sub-sitemaps.
 
     Returns a deduplicated list of ``(url, lastmod)`` tuples for every
-    article discovered via WordPress sitemaps.
+    article discovered via WordPress sitemaps.  *base_url* points discovery
+    at another host (e.g. the local mock site in ``benchmarks/``).
     """
+    index_url = f"{base_url.rstrip('/')}/wp-sitemap.xml"
     if verbose:
-        logger.info("Fetching sitemap index: %s", SITEMAP_INDEX_URL)
+        logger.info("Fetching sitemap index: %s", index_url)
 
-    index_bytes = _fetch_xml(SITEMAP_INDEX_URL)
+    index_bytes = _fetch_xml(index_url)
     sub_sitemap_urls = _parse_sitemap_index(index_bytes)
 
     if verbose:
@@ -243,6 +254,8 @@ def _find_next_page(html_bytes: bytes, current_url: str) -> str | None:
 def fetch_article_urls_from_categories(
     delay: float = _DEFAULT_DELAY,
     verbose: bool = False,
+    *,
+    base_url: str = BASE_URL,
 ) -> list[str]:
     """
     Fallback: discover article URLs by paginating through category listing pages.
@@ -253,6 +266,7 @@ def fetch_article_urls_from_categories(
     urls: list[str] = []
 
     for cat_url in CATEGORY_URLS:
+        cat_url = base_url.rstrip("/") + cat_url[len(BASE_URL):]
         page_url: str | None = cat_url
         page_num = 1
 
@@ -355,6 +369,7 @@ def run_discovery(
     delay: float = _DEFAULT_DELAY,
     verbose: bool = False,
     use_category_fallback: bool = True,
+    base_url: str = BASE_URL,
 ) -> Manifest:
     """
     Full discovery pipeline:
@@ -369,17 +384,21 @@ def run_discovery(
     if verbose:
         logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 
-    manifest = load_manifest(output_dir)
+    manifest = load_manifest(output_dir, lazy=True)
     url_lastmod_pairs: list[tuple[str, str | None]] = []
 
     try:
-        url_lastmod_pairs = fetch_all_article_urls_from_sitemap(delay=delay, verbose=verbose)
+        url_lastmod_pairs = fetch_all_article_urls_from_sitemap(
+            delay=delay, verbose=verbose, base_url=base_url
+        )
     except Exception as exc:  # noqa: BLE001
         logger.warning("Sitemap discovery failed (%s). Attempting category fallback.", exc)
 
     if not url_lastmod_pairs and use_category_fallback:
         logger.info("No URLs from sitemap — using category page fallback.")
-        cat_urls = fetch_article_urls_from_categories(delay=delay, verbose=verbose)
+        cat_urls = fetch_article_urls_from_categories(
+            delay=delay, verbose=verbose, base_url=base_url
+        )
         url_lastmod_pairs = [(u, None) for u in cat_urls]
 
     added = populate_manifest(manifest, url_lastmod_pairs, verbose=verbose)
@@ -0,0 +1,559 @@
+"""
+entry_store.py — Compact column store for manifest entries.
+
+``CompactEntries`` is a drop-in ``slug → ManifestEntry`` mapping for
+``Manifest.entries`` that keeps every field in parallel arrays instead of
+one pydantic model per article, so sorting and filtering 100k+ entries
+touch ints and bytes rather than model attributes.
+
+Covers:
+- Statuses interned as one byte each (``bytearray``)
+- URLs split into a shared prefix table + slug (``https://…/2024/`` + slug + ``/``)
+- ``last_modified`` / ``scraped_at`` stored as epoch seconds + UTC offset
+  (the original string is kept only when it would not round-trip)
+- Counters in ``array('I')``; ``error``, ``failures``, ``images`` and the
+  ``in_progress`` lease (``worker``, ``lease_until``) in sparse dicts
+- Derived query columns computed once at ingest: sort key (epoch),
+  publication year (from the URL prefix) and ``last_modified`` month
+- A date index (rows ordered by sort key) kept up to date on append, so
+  "latest N pending" walks the index instead of sorting
+- Conversion at the edges: ``store[slug]`` builds a ``ManifestEntry``
+
+An entry handed out by ``store[slug]`` (or stored with ``store[slug] = e``)
+is *live*: the model object is authoritative until :meth:`CompactEntries.pack`
+folds it back into the columns, so callers can keep mutating the objects
+they hold.  Column queries read live entries through the model.
+
+Usage:
+    from entry_store import CompactEntries
+    manifest.entries = CompactEntries.from_mapping(manifest.entries)
+    order = manifest.entries.sorted_slugs(statuses={ScrapeStatus.PENDING})
+"""
+
+from __future__ import annotations
+
+import bisect
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from models import ImageInfo, ManifestEntry, ScrapeStatus
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+_STATUSES: tuple[ScrapeStatus, ...] = tuple(ScrapeStatus)
+_STATUS_CODE: dict[ScrapeStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
+_STATUS_BY_VALUE: dict[str, int] = {status.value: code for code, status in enumerate(_STATUSES)}
+
+NO_DATE = -(2**63)  # last_modified is None
+BAD_DATE = -(2**62)  # present but unparseable — sorts before every real date
+_NAIVE = -32768  # tz column marker for strings without an offset
+_NO_PREFIX = 0xFFFFFFFF  # URL does not end in "<slug>/" — full URL kept in _url_odd
+
+
+# ---------------------------------------------------------------------------
+# Date column
+# ---------------------------------------------------------------------------
+
+
+def parse_date(value: str | None) -> tuple[int, int, int]:
+    """
+    Encode an ISO 8601 string as ``(epoch, tz_minutes, local_month)``.
+
+    Naive strings are treated as UTC for the epoch (as ``get_sorted_entries``
+    always has); ``None`` → ``NO_DATE`` and unparseable → ``BAD_DATE``.
+    """
+    if value is None:
+        return NO_DATE, _NAIVE, 0
+    try:
+        dt = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return BAD_DATE, _NAIVE, 0
+    offset = dt.utcoffset()
+    if offset is None:  # naive
+        return int(dt.replace(tzinfo=timezone.utc).timestamp()), _NAIVE, dt.month
+    return int(dt.timestamp()), int(offset.total_seconds() // 60), dt.month
+
+
+class _DateColumn:
+    """ISO 8601 strings as ``(epoch seconds, UTC offset minutes)`` pairs."""
+
+    __slots__ = ("epoch", "tz", "month", "odd", "zulu")
+
+    def __init__(self, *, zulu: bool = False) -> None:
+        self.epoch = array("q")
+        self.tz = array("h")
+        self.month = bytearray()  # local month 1–12, 0 = none
+        self.odd: dict[int, str] = {}  # strings that do not round-trip
+        self.zulu = zulu  # canonical form ends in "Z" (``_now_iso``) instead of "+00:00"
+
+    def _encode(self, value: str | None) -> tuple[int, int, int, bool]:
+        if value is None:
+            return NO_DATE, _NAIVE, 0, False
+        try:
+            dt = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return BAD_DATE, _NAIVE, 0, True
+        offset = dt.utcoffset()
+        if offset is None:
+            epoch, tz = int(dt.replace(tzinfo=timezone.utc).timestamp()), _NAIVE
+        else:
+            epoch, tz = int(dt.timestamp()), int(offset.total_seconds() // 60)
+        # _decode reproduces dt.isoformat() for whole seconds and whole-minute offsets
+        text = dt.isoformat()
+        if self.zulu and tz == 0:
+            text = text.replace("+00:00", "Z")
+        odd = dt.microsecond != 0 or (offset is not None and offset.seconds % 60 != 0) or text != value
+        return epoch, tz, dt.month, odd
+
+    def _decode(self, epoch: int, tz: int) -> str:
+        if tz == _NAIVE:
+            return datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None).isoformat()
+        dt = datetime.fromtimestamp(epoch, timezone(timedelta(minutes=tz)))
+        text = dt.isoformat()
+        if self.zulu and tz == 0:
+            text = text.replace("+00:00", "Z")
+        return text
+
+    def append(self, value: str | None) -> None:
+        self.epoch.append(0)
+        self.tz.append(0)
+        self.month.append(0)
+        self.set(len(self.epoch) - 1, value)
+
+    def set(self, i: int, value: str | None) -> None:
+        epoch, tz, month, odd = self._encode(value)
+        self.epoch[i], self.tz[i], self.month[i] = epoch, tz, month
+        if odd:
+            self.odd[i] = value  # type: ignore[assignment]
+        else:
+            self.odd.pop(i, None)
+
+    def get(self, i: int) -> str | None:
+        if i in self.odd:
+            return self.odd[i]
+        epoch = self.epoch[i]
+        if epoch == NO_DATE:
+            return None
+        return self._decode(epoch, self.tz[i])
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+class CompactEntries(MutableMapping):
+    """``slug → ManifestEntry`` mapping backed by parallel arrays."""
+
+    def __init__(self) -> None:
+        self._slugs: list[str | None] = []  # None = deleted
+        self._pos: dict[str, int] = {}
+        self._status = bytearray()
+        self._images_status = bytearray()
+        self._prefixes: list[str] = []
+        self._prefix_ids: dict[str, int] = {}
+        self._url_prefix = array("I")
+        self._url_odd: dict[int, str] = {}
+        self._prefix_year: list[int] = []  # publication year per prefix, 0 = none
+        self._year = array("H")
+        self._last_modified = _DateColumn()
+        self._scraped_at = _DateColumn(zulu=True)
+        self._pages_found = array("I")
+        self._images_found = array("I")
+        self._images_downloaded = array("I")
+        self._errors: dict[int, str] = {}
+        self._failures: dict[int, int] = {}
+        self._leases: dict[int, tuple[str | None, float | None]] = {}  # (worker, lease_until)
+        self._images: dict[int, tuple[tuple[str, str, int | None, int | None], ...]] = {}
+        self._live: dict[int, ManifestEntry] = {}
+        self._live_dates: dict[int, str | None] = {}  # last_modified when it went live
+        self._date_index: list[int] | None = None  # dated rows by (sort key, row)
+
+    @classmethod
+    def from_mapping(cls, entries) -> "CompactEntries":
+        """
+        Build a store from ``Manifest.entries`` — a dict of models, raw JSON
+        dicts, or a ``LazyEntries`` view (read without validating).
+        """
+        if isinstance(entries, CompactEntries):
+            return entries
+        items = entries.to_jsonable() if hasattr(entries, "to_jsonable") else entries
+        store = cls()
+        for slug, value in items.items():
+            store._append(slug, value)
+        return store
+
+    # -- packing ------------------------------------------------------------
+
+    def _append(self, slug: str, value: ManifestEntry | dict) -> int:
+        i = len(self._slugs)
+        self._slugs.append(sys.intern(slug))
+        self._pos[slug] = i
+        self._status.append(0)
+        self._images_status.append(0)
+        self._url_prefix.append(_NO_PREFIX)
+        self._year.append(0)
+        self._last_modified.append(None)
+        self._scraped_at.append(None)
+        self._pages_found.append(0)
+        self._images_found.append(0)
+        self._images_downloaded.append(0)
+        self._pack(i, value, indexed=False)
+        if self._date_index is not None and self._last_modified.epoch[i] != NO_DATE:
+            epoch = self._last_modified.epoch
+            bisect.insort_right(self._date_index, i, key=epoch.__getitem__)
+        return i
+
+    def _pack(self, i: int, entry: ManifestEntry | dict, *, indexed: bool = True) -> None:
+        value: Mapping[str, Any] = entry.__dict__ if isinstance(entry, ManifestEntry) else entry
+        slug = self._slugs[i]
+        old_epoch = self._last_modified.epoch[i]
+
+        url = value["url"]
+        tail = f"{slug}/"
+        if url.endswith(tail) and len(url) > len(tail):
+            prefix = url[: -len(tail)]
+            pid = self._prefix_ids.get(prefix)
+            if pid is None:
+                pid = self._prefix_ids[prefix] = len(self._prefixes)
+                self._prefixes.append(prefix)
+                self._prefix_year.append(_url_year(prefix))
+            self._url_prefix[i] = pid
+            self._url_odd.pop(i, None)
+            self._year[i] = self._prefix_year[pid]
+        else:
+            self._url_prefix[i] = _NO_PREFIX
+            self._url_odd[i] = url
+            self._year[i] = _url_year(url)
+
+        self._status[i] = _code(value.get("status", ScrapeStatus.PENDING))
+        self._images_status[i] = _code(value.get("images_status", ScrapeStatus.PENDING))
+        self._last_modified.set(i, value.get("last_modified"))
+        if indexed and self._last_modified.epoch[i] != old_epoch:
+            self._date_index = None  # rebuilt on next query
+        self._scraped_at.set(i, value.get("scraped_at"))
+        self._pages_found[i] = value.get("pages_found", 0)
+        self._images_found[i] = value.get("images_found", 0)
+        self._images_downloaded[i] = value.get("images_downloaded", 0)
+
+        error = value.get("error")
+        if error is None:
+            self._errors.pop(i, None)
+        else:
+            self._errors[i] = error
+        failures = value.get("failures", 0)
+        if failures:
+            self._failures[i] = failures
+        else:
+            self._failures.pop(i, None)
+        lease = (value.get("worker"), value.get("lease_until"))
+        if lease != (None, None):
+            self._leases[i] = lease
+        else:
+            self._leases.pop(i, None)
+        images = value.get("images") or ()
+        if images:
+            self._images[i] = tuple(_image_tuple(img) for img in images)
+        else:
+            self._images.pop(i, None)
+
+    def _row(self, i: int) -> dict:
+        """Column values of row *i* as a ``ManifestEntry``-shaped JSON dict."""
+        row = self._fields(i)
+        row["status"] = row["status"].value
+        row["images_status"] = row["images_status"].value
+        row["images"] = [
+            {"file": f, "format": fmt, "width": w, "height": h}
+            for f, fmt, w, h in self._images.get(i, ())
+        ]
+        return row
+
+    def _fields(self, i: int) -> dict:
+        """Column values of row *i* as ``ManifestEntry`` field values."""
+        slug = self._slugs[i]
+        pid = self._url_prefix[i]
+        worker, lease_until = self._leases.get(i, (None, None))
+        return {
+            "url": self._url_odd[i] if pid == _NO_PREFIX else f"{self._prefixes[pid]}{slug}/",
+            "slug": slug,
+            "status": _STATUSES[self._status[i]],
+            "last_modified": self._last_modified.get(i),
+            "scraped_at": self._scraped_at.get(i),
+            "error": self._errors.get(i),
+            "pages_found": self._pages_found[i],
+            "images_found": self._images_found[i],
+            "images_downloaded": self._images_downloaded[i],
+            "failures": self._failures.get(i, 0),
+            "worker": worker,
+            "lease_until": lease_until,
+            "images_status": _STATUSES[self._images_status[i]],
+            "images": [
+                ImageInfo.model_construct(file=f, format=fmt, width=w, height=h)
+                for f, fmt, w, h in self._images.get(i, ())
+            ],
+        }
+
+    def _build(self, i: int) -> ManifestEntry:
+        # model_validate on already-typed values is cheaper than model_construct
+        return ManifestEntry.model_validate(self._fields(i))
+
+    def pack(self) -> None:
+        """Fold every live entry back into the columns and drop the models."""
+        for i, entry in self._live.items():
+            self._pack(i, entry)
+        self._live.clear()
+        self._live_dates.clear()
+
+    def _go_live(self, i: int, entry: ManifestEntry) -> None:
+        self._live[i] = entry
+        self._live_dates[i] = entry.last_modified
+
+    def _sync_live_dates(self) -> None:
+        """Fold ``last_modified`` edits made on live models into the date columns."""
+        for i, seen in self._live_dates.items():
+            current = self._live[i].last_modified
+            if current != seen:
+                self._last_modified.set(i, current)
+                self._live_dates[i] = current
+                self._date_index = None
+
+    # -- mapping interface --------------------------------------------------
+
+    def __getitem__(self, slug: str) -> ManifestEntry:
+        i = self._pos[slug]
+        entry = self._live.get(i)
+        if entry is None:
+            entry = self._build(i)
+            self._go_live(i, entry)
+        return entry
+
+    def __setitem__(self, slug: str, entry: ManifestEntry) -> None:
+        i = self._pos.get(slug)
+        if i is None:
+            i = self._append(slug, entry)
+        else:
+            self._pack(i, entry)
+        self._go_live(i, entry)
+
+    def __delitem__(self, slug: str) -> None:
+        i = self._pos.pop(slug)
+        self._slugs[i] = None
+        self._live.pop(i, None)
+        self._live_dates.pop(i, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return (slug for slug in self._slugs if slug is not None)
+
+    def __len__(self) -> int:
+        return len(self._pos)
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self._pos
+
+    def __repr__(self) -> str:
+        return f"CompactEntries({len(self._pos)} entries, {len(self._live)} live)"
+
+    # -- column access ------------------------------------------------------
+
+    @property
+    def live(self) -> int:
+        """Number of entries currently held as models."""
+        return len(self._live)
+
+    def _rows(self) -> Iterator[int]:
+        return (i for i, slug in enumerate(self._slugs) if slug is not None)
+
+    def status_code(self, i: int) -> int:
+        entry = self._live.get(i)
+        return self._status[i] if entry is None else _STATUS_CODE[entry.status]
+
+    def status_of(self, slug: str) -> ScrapeStatus:
+        return _STATUSES[self.status_code(self._pos[slug])]
+
+    def statuses(self) -> Iterator[ScrapeStatus]:
+        for i in self._rows():
+            yield _STATUSES[self.status_code(i)]
+
+    def status_counts(self) -> dict[ScrapeStatus, int]:
+        """Entries per article status, counted on the byte column."""
+        status = self._status
+        if len(self._pos) != len(self._slugs):  # deleted rows present
+            status = bytearray(status[i] for i in self._rows())
+        counts = {s: status.count(code) for s, code in _STATUS_CODE.items()}
+        for i, entry in self._live.items():
+            if self._slugs[i] is not None:
+                counts[_STATUSES[self._status[i]]] -= 1
+                counts[entry.status] += 1
+        return counts
+
+    def date_key(self, i: int) -> int:
+        """Sort key for ``last_modified``: epoch seconds, ``BAD_DATE`` or ``NO_DATE``."""
+        return self._last_modified.epoch[i]
+
+    def year_of(self, i: int) -> int | None:
+        """Publication year from the URL path (``/YYYY/``)."""
+        return self._year[i] or None
+
+    def month_of(self, i: int) -> int | None:
+        """Month of ``last_modified`` in its own offset (as ``extract_month_from_lastmod``)."""
+        return self._last_modified.month[i] or None
+
+    def date_index(self) -> list[int]:
+        """Dated rows ordered by sort key, ties in insertion order (built once, then kept)."""
+        self._sync_live_dates()
+        if self._date_index is None:
+            epoch = self._last_modified.epoch
+            self._date_index = sorted(
+                (i for i in self._rows() if epoch[i] != NO_DATE), key=epoch.__getitem__
+            )
+        return self._date_index
+
+    def iter_by_date(self, direction: str = "latest") -> Iterator[int]:
+        """
+        Yield rows newest-first (``latest``) or oldest-first, undated rows last.
+
+        Ties keep insertion order in both directions, matching a stable sort.
+        """
+        index = self.date_index()
+        slugs, epoch = self._slugs, self._last_modified.epoch
+        if direction == "latest":
+            end = len(index)
+            while end > 0:
+                start = end - 1
+                key = epoch[index[start]]
+                while start > 0 and epoch[index[start - 1]] == key:
+                    start -= 1
+                for i in index[start:end]:
+                    if slugs[i] is not None:
+                        yield i
+                end = start
+        else:
+            for i in index:
+                if slugs[i] is not None:
+                    yield i
+        for i in self._rows():
+            if epoch[i] == NO_DATE:
+                yield i
+
+    def select(self, statuses: Iterable[ScrapeStatus] | None = None) -> list[int]:
+        """Row numbers (insertion order) whose article status is in *statuses*."""
+        if statuses is None:
+            return list(self._rows())
+        wanted = {_STATUS_CODE[s] for s in statuses}
+        status, live = self._status, self._live
+        if not live:
+            return [i for i in self._rows() if status[i] in wanted]
+        return [i for i in self._rows() if self.status_code(i) in wanted]
+
+    def entries_at(self, rows: Iterable[int]) -> list[ManifestEntry]:
+        """Materialize the entries at *rows* (the conversion edge)."""
+        slugs = self._slugs
+        return [self[slugs[i]] for i in rows]  # type: ignore[index]
+
+    def sorted_slugs(
+        self,
+        *,
+        statuses: Iterable[ScrapeStatus] | None = None,
+        direction: str = "latest",
+    ) -> list[str]:
+        """Slugs sorted by ``last_modified`` (undated last) without building models."""
+        rows = self.iter_by_date(direction)
+        if statuses is not None:
+            rows = self.filter_status(rows, statuses)
+        return [self._slugs[i] for i in rows]  # type: ignore[misc]
+
+    def filter_status(self, rows: Iterable[int], statuses: Iterable[ScrapeStatus]) -> Iterator[int]:
+        """Lazily keep the *rows* whose article status is in *statuses*."""
+        wanted = {_STATUS_CODE[s] for s in statuses}
+        status, live = self._status, self._live
+        for i in rows:
+            entry = live.get(i)
+            if (status[i] if entry is None else _STATUS_CODE[entry.status]) in wanted:
+                yield i
+
+    # -- serialization ------------------------------------------------------
+
+    def to_jsonable(self) -> dict[str, dict | ManifestEntry]:
+        """Rows as plain dicts, live entries as models (see ``serialize.py``)."""
+        live = self._live
+        return {
+            slug: live[i] if i in live else self._row(i)
+            for i, slug in enumerate(self._slugs)
+            if slug is not None
+        }
+
+    def materialize(self) -> dict[str, ManifestEntry]:
+        """Build every entry and return a plain dict."""
+        return {slug: self[slug] for slug in self}
+
+    def export_columns(self) -> dict:
+        """
+        Copy the fixed-width query columns (deleted rows dropped, live
+        entries folded in) for ``snapshot.py``: ``slugs`` plus one array per
+        field — statuses as codes of ``ScrapeStatus`` order, dates as sort
+        keys (``NO_DATE`` / ``BAD_DATE`` sentinels).
+        """
+        if len(self._pos) == len(self._slugs):
+            rows = None
+            slugs = list(self._slugs)
+        else:
+            rows = list(self._rows())
+            slugs = [self._slugs[i] for i in rows]
+        columns = {
+            "status": self._status,
+            "images_status": self._images_status,
+            "year": self._year,
+            "month": self._last_modified.month,
+            "last_modified": self._last_modified.epoch,
+            "scraped_at": self._scraped_at.epoch,
+            "pages_found": self._pages_found,
+            "images_found": self._images_found,
+            "images_downloaded": self._images_downloaded,
+        }
+        for name, column in columns.items():
+            copy = column[:] if rows is None else column[:0]
+            if rows is not None:
+                copy.extend(column[i] for i in rows)
+            columns[name] = copy
+        position = {i: k for k, i in enumerate(rows)} if rows is not None else None
+        for i, entry in self._live.items():
+            if self._slugs[i] is None:
+                continue
+            k = i if position is None else position[i]
+            epoch, _, month = parse_date(entry.last_modified)
+            columns["status"][k] = _STATUS_CODE[entry.status]
+            columns["images_status"][k] = _STATUS_CODE[entry.images_status]
+            columns["year"][k] = _url_year(entry.url)
+            columns["month"][k] = month
+            columns["last_modified"][k] = epoch
+            columns["scraped_at"][k] = parse_date(entry.scraped_at)[0]
+            columns["pages_found"][k] = entry.pages_found
+            columns["images_found"][k] = entry.images_found
+            columns["images_downloaded"][k] = entry.images_downloaded
+        columns["slugs"] = slugs
+        return columns
+
+
+def _url_year(url: str) -> int:
+    from manifest import extract_year_from_url  # manifest imports this module
+
+    return extract_year_from_url(url) or 0
+
+
+def _code(status: ScrapeStatus | str) -> int:
+    if isinstance(status, ScrapeStatus):
+        return _STATUS_CODE[status]
+    try:
+        return _STATUS_BY_VALUE[status]
+    except KeyError:
+        raise ValueError(f"invalid manifest status {status!r}") from None
+
+
+def _image_tuple(img: ImageInfo | dict) -> tuple[str, str, int | None, int | None]:
+    fields: Mapping[str, Any] = img.__dict__ if isinstance(img, ImageInfo) else img
+    return (fields["file"], sys.intern(fields["format"]), fields.get("width"), fields.get("height"))
@@ -16,6 +16,8 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import json
 import logging
 import re
@@ -28,6 +30,7 @@ from urllib.parse import urljoin, urlparse
 
 from manifest import update_entry_status
 from models import ArticleData, Manifest, ScrapeStatus
+from sinks import JsonFileSink
 
 logger = logging.getLogger(__name__)
 
@@ -56,42 +59,38 @@ _BOLD_TITLE_RE = re.compile(
 # ---------------------------------------------------------------------------
 
 FetcherFn = Callable[[str], bytes]
+# Runs page fetches (possibly on other workers); results or raised errors, in order
+MapPagesFn = Callable[[list[Callable[[], dict]]], list["dict | Exception"]]
 
 
-def _default_fetcher(url: str, delay: float = 0.0, max_retries: int = 3) -> bytes:
+def _default_fetcher(url: str, delay: float = 0.0, max_retries: int | None = None) -> bytes:
     """
-    Fetch *url* with exponential backoff retry.
+    Fetch *url* under the shared retry policy (``retry.default_policy``).
 
-    Retries up to *max_retries* times on transient HTTP/network errors.
-    Raises the last exception if all retries are exhausted.
+    Transient errors (5xx, 429, timeouts, dropped connections) are retried
+    up to *max_retries* times (default: the policy's ``--max-retries``) with
+    jittered backoff or the server's ``Retry-After``; 404s and other
+    permanent errors raise immediately.
     """
-    import urllib.error
     import urllib.request
 
+    from retry import default_policy
+
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (compatible; TasteOfCinemaBot/1.0; "
             "+https://github.com/basemkhurram)"
         )
     }
+    if delay > 0:
+        time.sleep(delay)
 
-    last_exc: Exception | None = None
-    for attempt in range(max_retries + 1):
-        if delay > 0 and attempt == 0:
-            time.sleep(delay)
-        elif attempt > 0:
-            backoff = min(2 ** attempt, 30)
-            logger.warning("Retry %d/%d for %s (backoff %ds)", attempt, max_retries, url, backoff)
-            time.sleep(backoff)
-        try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                return resp.read()
-        except (urllib.error.URLError, OSError, TimeoutError) as exc:
-            last_exc = exc
-            if attempt == max_retries:
-                raise
-    raise last_exc  # type: ignore[misc]
+    def attempt() -> bytes:
+        req = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.read()
+
+    return default_policy().call(url, attempt, max_retries=max_retries)
 
 
 # ---------------------------------------------------------------------------
@@ -367,11 +366,12 @@ def _fetch_and_parse_page(
     url: str,
     fetcher: FetcherFn,
     delay: float,
+    sleep: Callable[[float], None] = time.sleep,
 ) -> dict:
     """Fetch *url* and parse article HTML. Returns parsed dict."""
     html_bytes = fetcher(url)
     if delay > 0:
-        time.sleep(delay)
+        sleep(delay)
     return _parse_article_html(html_bytes, url)
 
 
@@ -381,6 +381,8 @@ def fetch_all_pages(
     fetcher: FetcherFn,
     delay: float = 2.0,
     max_pages: int = 20,
+    sleep: Callable[[float], None] = time.sleep,
+    map_pages: MapPagesFn | None = None,
 ) -> list[dict]:
     """
     Follow pagination links and return a list of parsed page dicts in order.
@@ -388,6 +390,11 @@ def fetch_all_pages(
     - *first_page_data*: already-parsed data for page 1
     - Follows links from .page-links, .pagination, .post-page-numbers
     - Loop protection: max_pages cap + visited set
+    - *sleep* performs the *delay* between pages (injectable for timing)
+    - *map_pages* (``scheduler.PriorityScheduler.run_pieces``): every page
+      known so far is fetched in one batch through it, so the pages of a
+      long article run on several workers; without it pages go one by one.
+      Page order is the same either way.
     """
     pages = [first_page_data]
     visited: set[str] = {base_url}
@@ -396,25 +403,36 @@ def fetch_all_pages(
     queue = [link for link in page_links if link not in visited and _is_same_article(base_url, link)]
 
     while queue and len(pages) < max_pages:
-        next_url = queue.pop(0)
-        if next_url in visited:
-            continue
-        visited.add(next_url)
-
-        try:
-            page_data = _fetch_and_parse_page(next_url, fetcher, delay)
+        batch: list[str] = []
+        while queue and len(pages) + len(batch) < max_pages and (map_pages is not None or not batch):
+            next_url = queue.pop(0)
+            if next_url not in visited:
+                visited.add(next_url)
+                batch.append(next_url)
+
+        tasks = [functools.partial(_fetch_and_parse_page, link, fetcher, delay, sleep) for link in batch]
+        results = map_pages(tasks) if map_pages is not None else [_attempt(task) for task in tasks]
+        for next_url, page_data in zip(batch, results):
+            if isinstance(page_data, Exception):
+                logger.warning("Failed to fetch page %s: %s", next_url, page_data)
+                continue
             pages.append(page_data)
 
             # Discover further pagination links from this page
             for link in page_data.get("pagination_links", []):
                 if link not in visited and _is_same_article(base_url, link):
                     queue.append(link)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to fetch page %s: %s", next_url, exc)
 
     return pages
 
 
+def _attempt(task: Callable[[], dict]) -> dict | Exception:
+    try:
+        return task()
+    except Exception as exc:  # noqa: BLE001
+        return exc
+
+
 # ---------------------------------------------------------------------------
 # High-level: extract single article (T013–T018)
 # ---------------------------------------------------------------------------
@@ -433,6 +451,10 @@ def extract_article(
     output_dir: Path | None = None,
     manifest: Manifest | None = None,
     slug: str | None = None,
+    sink=None,
+    sleep: Callable[[float], None] = time.sleep,
+    manifest_lock=None,
+    map_pages: MapPagesFn | None = None,
 ) -> ArticleData:
     """
     Extract full article content from *url*, following pagination.
@@ -442,9 +464,15 @@ def extract_article(
     2. Follow pagination links to merge all pages (T014).
     3. Extract movie titles (T015).
     4. Build ArticleData (T013, T016).
-    5. Write JSON to *output_dir*/articles/<slug>.json (T018).
+    5. Write JSON to *output_dir*/articles/<slug>.json (T018), or through
+       *sink* (see ``sinks.py``) when one is given.
     6. Update manifest entry status (T018).
 
+    *sleep* performs the *delay* between pagination fetches.  The manifest
+    update holds *manifest_lock* when one is given (parallel article lanes).
+    *map_pages* spreads the pagination fetches over workers (see
+    :func:`fetch_all_pages`); merging waits for the last page.
+
     Returns the completed ArticleData.
     """
     if fetcher is None:
@@ -454,7 +482,7 @@ def extract_article(
     first_page_data = _parse_article_html(first_page_html, url)
 
     # --- Fetch remaining pages ---
-    all_pages = fetch_all_pages(url, first_page_data, fetcher, delay=delay)
+    all_pages = fetch_all_pages(url, first_page_data, fetcher, delay=delay, sleep=sleep, map_pages=map_pages)
 
     # --- Merge content ---
     merged_content_parts: list[str] = []
@@ -498,25 +526,25 @@ def extract_article(
     )
 
     # --- Write JSON output (T018) ---
-    if output_dir is not None:
+    if sink is None and output_dir is not None:
+        sink = JsonFileSink(output_dir)
+    if sink is not None:
         _slug = slug or _url_to_slug(url)
-        articles_dir = output_dir / "articles"
-        articles_dir.mkdir(parents=True, exist_ok=True)
-        out_path = articles_dir / f"{_slug}.json"
-        out_path.write_text(article.model_dump_json(indent=2), encoding="utf-8")
+        out_path = sink.write(_slug, article)
         logger.info("Saved %s (%d pages, %d images)", out_path, pages_merged, len(all_inline_images))
 
     # --- Update manifest entry (T018) ---
     if manifest is not None and slug is not None:
         try:
-            update_entry_status(
-                manifest,
-                slug,
-                ScrapeStatus.COMPLETED,
-                pages_found=pages_merged,
-                images_found=len(all_inline_images) + (1 if featured_image else 0),
-                images_downloaded=0,  # updated by images.py later
-            )
+            with manifest_lock or contextlib.nullcontext():
+                update_entry_status(
+                    manifest,
+                    slug,
+                    ScrapeStatus.COMPLETED,
+                    pages_found=pages_merged,
+                    images_found=len(all_inline_images) + (1 if featured_image else 0),
+                    images_downloaded=0,  # updated by images.py later
+                )
         except KeyError:
             pass  # slug not in manifest — that's OK
 
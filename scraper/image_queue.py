@@ -0,0 +1,272 @@
+"""
+image_queue.py — Persistent per-image backlog queue (``image_queue.json``).
+
+Images that failed (or never finished because the run stopped) are tracked
+here one task per file, independent of article status.  ``--images-only``
+drains the queue in parallel with exponential backoff, so missing images
+can be fixed without re-scraping any article.
+
+Covers:
+- Seeding: completed articles whose ``images_status`` is not completed are
+  compared against ``images/<slug>/`` and every missing file is queued
+- Drain: thread pool, per-task attempts + ``next_retry_at`` backoff
+- Manifest update once a slug's backlog is cleared (or given up on)
+
+Usage:
+    from image_queue import drain_image_queue, load_image_queue, seed_image_queue
+    queue = load_image_queue(output_dir)
+    seed_image_queue(queue, manifest, output_dir)
+    result = drain_image_queue(queue, output_dir, workers=3)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from images import ImageProbe, existing_image, fetch_image, image_info, plan_article_images
+from manifest import update_image_status
+from models import ImageInfo, ImageQueue, ImageTask, Manifest, ScrapeStatus
+from retry import is_permanent, retry_after
+from serialize import dump_model, load_model
+from sinks import CORPUS_DIRNAME, load_corpus_index, read_article
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+QUEUE_FILENAME = "image_queue.json"
+
+_DEFAULT_MAX_ATTEMPTS = 5  # per drain run
+_RETRY_BASE = 5.0  # seconds; doubles per attempt
+_RETRY_CAP = 300.0
+
+
+# ---------------------------------------------------------------------------
+# IO helpers
+# ---------------------------------------------------------------------------
+
+
+def load_image_queue(output_dir: Path) -> ImageQueue:
+    """Load ``image_queue.json`` from *output_dir*, or return an empty queue."""
+    queue_path = output_dir / QUEUE_FILENAME
+    if not queue_path.exists():
+        return ImageQueue()
+    return load_model(ImageQueue, queue_path.read_bytes())
+
+
+def save_image_queue(queue: ImageQueue, output_dir: Path) -> None:
+    """Persist *queue* atomically (write to a temp file, then rename)."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    queue_path = output_dir / QUEUE_FILENAME
+    tmp_path = queue_path.with_name(QUEUE_FILENAME + ".tmp")
+    tmp_path.write_bytes(dump_model(queue) + b"\n")
+    os.replace(tmp_path, queue_path)
+
+
+# ---------------------------------------------------------------------------
+# Queue helpers
+# ---------------------------------------------------------------------------
+
+
+def task_key(slug: str, filename: str) -> str:
+    return f"{slug}/{filename}"
+
+
+def enqueue_image(queue: ImageQueue, slug: str, index: int, url: str, filename: str) -> ImageTask:
+    """Add one image to *queue*; an existing task (and its attempts) is kept."""
+    key = task_key(slug, filename)
+    if key not in queue.tasks:
+        queue.tasks[key] = ImageTask(url=url, slug=slug, index=index, filename=filename)
+    return queue.tasks[key]
+
+
+def _load_article_images(
+    output_dir: Path,
+    slug: str,
+    corpus_index: dict[str, tuple[str, int, int]],
+    db_path: Path | None = None,
+) -> tuple[str | None, list[str]] | None:
+    """Return ``(featured_image, inline_images)`` from a saved article (any sink)."""
+    data = read_article(output_dir, slug, index=corpus_index, db_path=db_path)
+    if data is None:
+        return None
+    return data.get("featured_image"), data.get("inline_images") or []
+
+
+def seed_image_queue(
+    queue: ImageQueue,
+    manifest: Manifest,
+    output_dir: Path,
+    *,
+    slugs: list[str] | None = None,
+    db_path: Path | None = None,
+) -> int:
+    """
+    Queue every missing image of completed articles with incomplete images.
+
+    *slugs* limits the scan (the scrape phase passes the articles it just
+    processed).  *db_path* lets articles staged in SQLite be found too.  Articles whose images turn out to be all present on disk
+    are marked ``images_status = completed`` directly.  Returns the number
+    of tasks added.
+    """
+    added = 0
+    queued_slugs = {task.slug for task in queue.tasks.values()}
+    corpus_index = load_corpus_index(output_dir / CORPUS_DIRNAME)
+    if slugs is None:
+        candidates = list(manifest.entries.values())
+    else:
+        candidates = [manifest.entries[s] for s in slugs if s in manifest.entries]
+
+    for entry in candidates:
+        if entry.status != ScrapeStatus.COMPLETED or entry.images_status == ScrapeStatus.COMPLETED:
+            continue
+        article_images = _load_article_images(output_dir, entry.slug, corpus_index, db_path)
+        if article_images is None:
+            logger.debug("No article JSON for %s — cannot seed its images", entry.slug)
+            continue
+
+        planned = plan_article_images(*article_images)
+        img_dir = output_dir / "images" / entry.slug
+        present: list[ImageInfo] = []
+        for index, url, filename in planned:
+            probe = existing_image(img_dir / filename)
+            if probe is not None:
+                present.append(image_info(filename, probe))
+                continue
+            if task_key(entry.slug, filename) not in queue.tasks:
+                added += 1
+            enqueue_image(queue, entry.slug, index, url, filename)
+            queued_slugs.add(entry.slug)
+
+        entry.images_found = len(planned)
+        update_image_status(
+            manifest,
+            entry.slug,
+            ScrapeStatus.PENDING if entry.slug in queued_slugs else None,
+            images=present,
+        )
+    return added
+
+
+# ---------------------------------------------------------------------------
+# Drain
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ImageQueueResult:
+    """Summary of one drain of the image backlog."""
+
+    downloaded: int = 0
+    retries: int = 0
+    abandoned: int = 0
+    remaining: int = 0
+    images: dict[str, list[ImageInfo]] = field(default_factory=dict)  # slug → new images
+    errors: list[str] = field(default_factory=list)
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before attempt ``attempts + 1``: 5s, 10s, 20s … capped at 5 min."""
+    return min(_RETRY_BASE * 2 ** max(0, attempts - 1), _RETRY_CAP)
+
+
+def drain_image_queue(
+    queue: ImageQueue,
+    output_dir: Path,
+    *,
+    workers: int = 2,
+    delay: float = 0.0,
+    max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+    downloader=None,  # injectable for tests
+    clock: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
+) -> ImageQueueResult:
+    """
+    Download outstanding images until the queue is empty or every remaining
+    task has used *max_attempts* attempts in this run.
+
+    Ready tasks (``next_retry_at <= now``) are fetched in a thread pool of
+    *workers*; failures bump ``attempts`` and push ``next_retry_at`` out by
+    :func:`retry_delay` (or the server's ``Retry-After``, if longer).  A
+    permanent error (404, not an image — see ``retry.classify_error``) is
+    given up for this run straight away.  When nothing is ready the drain
+    sleeps until the earliest retry.  The queue is saved after every round.
+    These are the only retries: each attempt is a single download.
+    """
+    result = ImageQueueResult()
+    budget = {key: task.attempts + max_attempts for key, task in queue.tasks.items()}
+
+    def attempt(task: ImageTask) -> ImageProbe | Exception:
+        local_path = output_dir / "images" / task.slug / task.filename
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            probe = existing_image(local_path)
+            if probe is None:
+                if delay > 0:
+                    sleep(delay)
+                probe = fetch_image(task.url, local_path, downloader=downloader, max_retries=0)
+            return probe
+        except Exception as exc:  # noqa: BLE001
+            return exc
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="image-queue") as pool:
+        while True:
+            live = [
+                (key, task)
+                for key, task in queue.tasks.items()
+                if task.attempts < budget[key]
+            ]
+            if not live:
+                break
+            now = clock()
+            ready = [(key, task) for key, task in live if task.next_retry_at <= now]
+            if not ready:
+                sleep(max(0.0, min(task.next_retry_at for _, task in live) - now))
+                continue
+
+            outcomes = pool.map(attempt, [task for _, task in ready])
+            for (key, task), outcome in zip(ready, outcomes):
+                if not isinstance(outcome, Exception):
+                    del queue.tasks[key]
+                    result.downloaded += 1
+                    result.images.setdefault(task.slug, []).append(image_info(task.filename, outcome))
+                    continue
+                exc = outcome
+                task.attempts += 1
+                task.last_error = str(exc)
+                task.next_retry_at = clock() + max(retry_delay(task.attempts), retry_after(exc) or 0.0)
+                result.retries += 1
+                if is_permanent(exc):
+                    budget[key] = task.attempts  # 404 etc.: no point retrying this run
+                if task.attempts >= budget[key]:
+                    result.abandoned += 1
+                    msg = f"Giving up on {task.url} after {task.attempts} attempts: {exc}"
+                    result.errors.append(msg)
+                    logger.warning(msg)
+            save_image_queue(queue, output_dir)
+
+    result.remaining = len(queue.tasks)
+    return result
+
+
+def apply_image_queue_result(manifest: Manifest, queue: ImageQueue, result: ImageQueueResult) -> None:
+    """
+    Record newly downloaded images on the manifest and settle ``images_status``.
+
+    A slug with no tasks left is derived completed/failed from its counts;
+    one whose remaining tasks were given up on this run is ``failed``.
+    """
+    outstanding = {task.slug for task in queue.tasks.values()}
+    for slug in set(result.images) | outstanding:
+        if slug not in manifest.entries:
+            continue
+        status = ScrapeStatus.FAILED if slug in outstanding else None
+        update_image_status(manifest, slug, status, images=result.images.get(slug, []))
@@ -5,6 +5,14 @@ Covers:
 - T020: Image downloading with per-article directory creation + HTTP error handling
 - T021: Filename sanitization, index-prefix ordering, extension preservation
 - T022: Skip-existing logic for incremental runs (FR-015)
+- Header-only validation: magic bytes + dimensions probed from the first
+  bytes of the streamed response; non-images are never written to disk
+- Interrupted downloads keep their ``.part`` file and resume with HTTP
+  ``Range`` requests when the server supports it (ETag/length validated)
+- ImageLane: background lane that drains inline images with its own
+  concurrency while the article fast lane moves on; an image-heavy article
+  is split into batches that run on different lane workers and are merged
+  into one result when the last batch finishes
 
 Usage:
     from images import download_article_images
@@ -13,14 +21,24 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
+import json
 import logging
+import os
 import re
+import shutil
+import struct
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
+
+from models import ImageInfo
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +47,15 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 _DEFAULT_DELAY = 2.0  # seconds between image downloads
-_MAX_RETRIES = 3
+_LANE_BATCH = 10  # inline images per ImageLane task
+
+# Bytes buffered before the probe decides; JPEG SOF markers normally sit
+# within the first few KB, but large EXIF/ICC blocks can push them further.
+_PROBE_BYTES = 64 * 1024
+_COPY_CHUNK = 64 * 1024
+
+# Content-Range: bytes <start>-<end>/<total | *>
+_CONTENT_RANGE_RE = re.compile(r"^bytes\s+(\d+)-(\d+)/(\d+|\*)$")
 
 # Allowed characters in sanitized filenames
 _SAFE_CHAR_RE = re.compile(r"[^a-z0-9\-]")
@@ -93,38 +119,285 @@ def build_filename(index: int, url: str, is_thumbnail: bool = False) -> str:
     return f"{prefix}-{stem}{ext}"
 
 
+# ---------------------------------------------------------------------------
+# Header-only image probe
+# ---------------------------------------------------------------------------
+
+
+class InvalidImageError(ValueError):
+    """Raised when a response body is not a recognisable image."""
+
+
+@dataclass(frozen=True)
+class ImageProbe:
+    """Format and (when found in the header) dimensions of an image."""
+
+    format: str
+    width: int | None = None
+    height: int | None = None
+
+
+def _probe_jpeg(head: bytes) -> ImageProbe:
+    """Walk JPEG segments until a SOFn marker yields the dimensions."""
+    pos = 2
+    while pos + 4 <= len(head):
+        if head[pos] != 0xFF:
+            break
+        marker = head[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:  # no length field
+            pos += 2
+            continue
+        (length,) = struct.unpack(">H", head[pos + 2 : pos + 4])
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if pos + 9 > len(head):
+                break
+            height, width = struct.unpack(">HH", head[pos + 5 : pos + 9])
+            return ImageProbe("jpeg", width, height)
+        pos += 2 + length
+    return ImageProbe("jpeg")
+
+
+def _probe_webp(head: bytes) -> ImageProbe:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and len(head) >= 30:
+        width, height = struct.unpack("<HH", head[26:30])
+        return ImageProbe("webp", width & 0x3FFF, height & 0x3FFF)
+    if chunk == b"VP8L" and len(head) >= 25:
+        bits = int.from_bytes(head[21:25], "little")
+        return ImageProbe("webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b"VP8X" and len(head) >= 30:
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return ImageProbe("webp", width, height)
+    return ImageProbe("webp")
+
+
+def probe_image(head: bytes) -> ImageProbe | None:
+    """
+    Identify an image from its leading bytes without decoding it.
+
+    Recognises JPEG, PNG, GIF, WebP and BMP by magic bytes and reads the
+    dimensions from the header where present.  Returns ``None`` for empty
+    bodies and anything else (HTML error pages, JSON, truncated junk).
+    """
+    if head.startswith(b"\xff\xd8\xff"):
+        return _probe_jpeg(head)
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        if len(head) >= 24 and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return ImageProbe("png", width, height)
+        return ImageProbe("png")
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        if len(head) >= 10:
+            width, height = struct.unpack("<HH", head[6:10])
+            return ImageProbe("gif", width, height)
+        return ImageProbe("gif")
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return _probe_webp(head)
+    if head[:2] == b"BM" and len(head) >= 26:
+        width, height = struct.unpack("<ii", head[18:26])
+        return ImageProbe("bmp", width, abs(height))
+    return None
+
+
+def _probe_file(path: Path) -> ImageProbe | None:
+    """Probe the header of an on-disk file."""
+    try:
+        with path.open("rb") as fh:
+            return probe_image(fh.read(_PROBE_BYTES))
+    except OSError:
+        return None
+
+
+def _read_head(resp, size: int) -> bytes:
+    """Read up to *size* bytes from *resp* (short reads are retried)."""
+    parts: list[bytes] = []
+    remaining = size
+    while remaining > 0:
+        chunk = resp.read(remaining)
+        if not chunk:
+            break
+        parts.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(parts)
+
+
+def _part_path(dest: Path) -> Path:
+    return dest.with_name(dest.name + ".part")
+
+
+def _write_atomic(dest: Path, data: bytes) -> None:
+    """Write *data* to a ``.part`` sibling and rename it into place."""
+    part = _part_path(dest)
+    part.write_bytes(data)
+    os.replace(part, dest)
+
+
+def _meta_path(part: Path) -> Path:
+    return part.with_name(part.name + ".json")
+
+
+def _read_part_meta(meta_path: Path) -> dict | None:
+    """Load the validators saved next to a ``.part`` file, if any."""
+    try:
+        with meta_path.open("r", encoding="utf-8") as fh:
+            meta = json.load(fh)
+        return meta if isinstance(meta, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _content_range_matches(value: str | None, offset: int, length: int | None) -> bool:
+    """Check ``Content-Range: bytes <offset>-<end>/<length>`` against the part file."""
+    match = _CONTENT_RANGE_RE.match(value or "")
+    if not match or int(match.group(1)) != offset:
+        return False
+    total = match.group(3)
+    return length is None or total == "*" or int(total) == length
+
+
 # ---------------------------------------------------------------------------
 # HTTP download helper (T020)
 # ---------------------------------------------------------------------------
 
+_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (compatible; TasteOfCinemaBot/1.0; "
+        "+https://github.com/basemkhurram)"
+    )
+}
+
 
-def _download_bytes(url: str, max_retries: int = _MAX_RETRIES) -> bytes:
+def _fetch_resumable(url: str, dest: Path) -> ImageProbe:
     """
-    Download *url* and return raw bytes.  Retries with exponential backoff.
-    Raises ``urllib.error.URLError`` if all retries fail.
+    One download attempt for :func:`_download_to_file`.
+
+    If ``<dest>.part`` exists and the previous response advertised
+    ``Accept-Ranges: bytes`` plus a validator, ask for the remaining bytes
+    with ``Range`` / ``If-Range``.  A ``206`` whose ``Content-Range`` and
+    ``ETag`` match is appended; anything else (``200``, changed validator)
+    restarts from byte 0.  A body shorter than the expected length raises
+    ``OSError`` and leaves the ``.part`` for the next attempt.
     """
-    last_exc: Exception | None = None
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (compatible; TasteOfCinemaBot/1.0; "
-            "+https://github.com/basemkhurram)"
-        )
-    }
+    part = _part_path(dest)
+    meta_path = _meta_path(part)
+    meta = _read_part_meta(meta_path) or {}  # missing / corrupt sidecar: full download
+    offset = part.stat().st_size if part.exists() else 0
+
+    headers = dict(_HEADERS)
+    validator = meta.get("etag") or meta.get("last_modified")
+    resumable = bool(
+        offset > 0 and meta.get("url") == url and meta.get("accept_ranges") and isinstance(validator, str)
+    )
+    if resumable:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = str(validator)
+
+    probe: ImageProbe | None = None
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        resp_cm = urllib.request.urlopen(req, timeout=30)
+    except urllib.error.HTTPError as exc:
+        # 416: nothing left to send — the part file may already be complete
+        if not (exc.code == 416 and resumable and meta.get("length") == offset):
+            raise
+        expected = offset
+    else:
+        with resp_cm as resp:
+            status = getattr(resp, "status", 200)
+            etag = resp.headers.get("ETag")
+            if (
+                resumable
+                and status == 206
+                and _content_range_matches(resp.headers.get("Content-Range"), offset, meta.get("length"))
+                and (etag is None or meta.get("etag") in (None, etag))
+            ):
+                logger.info("Resuming %s at byte %d", url, offset)
+                expected = meta.get("length")
+                with part.open("ab") as fh:
+                    shutil.copyfileobj(resp, fh, _COPY_CHUNK)
+            else:
+                head = _read_head(resp, _PROBE_BYTES)
+                probe = probe_image(head)
+                if probe is None:
+                    content_type = resp.headers.get("Content-Type", "unknown")
+                    raise InvalidImageError(
+                        f"not an image ({len(head)} bytes, Content-Type: {content_type})"
+                    )
+                length = resp.headers.get("Content-Length")
+                expected = int(length) if length and length.isdigit() else None
+                meta = {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": resp.headers.get("Last-Modified"),
+                    "length": expected,
+                    "accept_ranges": "bytes" in (resp.headers.get("Accept-Ranges") or "").lower(),
+                }
+                meta_path.write_text(json.dumps(meta), encoding="utf-8")
+                with part.open("wb") as fh:
+                    fh.write(head)
+                    shutil.copyfileobj(resp, fh, _COPY_CHUNK)
+
+    size = part.stat().st_size
+    if expected is not None and size != expected:
+        raise ConnectionError(f"incomplete download ({size}/{expected} bytes)")
+    if probe is None:
+        probe = _probe_file(part)
+        if probe is None:
+            raise InvalidImageError(f"resumed file is not an image ({size} bytes)")
+    os.replace(part, dest)
+    meta_path.unlink(missing_ok=True)
+    return probe
+
+
+def _throttled(throttle, url: str):
+    """``throttle.request`` for an image URL, or a no-op without ``--adaptive``."""
+    return throttle.request(url, kind="image") if throttle is not None else contextlib.nullcontext()
+
+
+def _download_to_file(
+    url: str,
+    dest: Path,
+    max_retries: int | None = None,
+    *,
+    on_retry: Callable[[], None] | None = None,
+    throttle=None,
+) -> ImageProbe:
+    """
+    Stream *url* into *dest* and return its probe.  Transient errors are
+    retried under the shared retry policy (``retry.default_policy``).
+
+    The first ``_PROBE_BYTES`` of the body are buffered and probed before
+    anything touches the disk; a body that is not an image raises
+    ``InvalidImageError`` immediately (not retried), as do 404s and other
+    permanent HTTP errors.  The rest is streamed to ``<dest>.part`` and
+    renamed into place once complete.
+
+    An interrupted transfer keeps its ``.part`` (plus a ``.part.json`` with
+    the ETag / Last-Modified / Content-Length validators), so the retry —
+    or a later run — resumes it with an HTTP ``Range`` request.
+
+    *on_retry* is called before each retry (used for run metrics).  With a
+    *throttle* (``throttle.AdaptiveThrottle``) every attempt waits for a
+    slot and reports its outcome.
+    """
+    from retry import default_policy
 
-    for attempt in range(max_retries + 1):
-        if attempt > 0:
-            backoff = min(2 ** attempt, 30)
-            logger.warning("Retry %d/%d for image %s (backoff %ds)", attempt, max_retries, url, backoff)
-            time.sleep(backoff)
+    part = _part_path(dest)
+
+    def attempt() -> ImageProbe:
         try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                return resp.read()
-        except (urllib.error.URLError, OSError, TimeoutError) as exc:
-            last_exc = exc
-            if attempt == max_retries:
-                raise
-    raise last_exc  # type: ignore[misc]
+            with _throttled(throttle, url):
+                return _fetch_resumable(url, dest)
+        except InvalidImageError:
+            part.unlink(missing_ok=True)
+            _meta_path(part).unlink(missing_ok=True)
+            raise
+
+    return default_policy().call(url, attempt, max_retries=max_retries, on_retry=on_retry)
 
 
 # ---------------------------------------------------------------------------
@@ -140,19 +413,106 @@ class ImageDownloadResult:
     downloaded: int = 0
     skipped: int = 0
     failed: int = 0
+    retries: int = 0
+    bytes: int = 0  # size of the files downloaded (not skipped) this time
     errors: list[str] = field(default_factory=list)
     local_paths: list[Path] = field(default_factory=list)
+    images: list[ImageInfo] = field(default_factory=list)  # probed format/size per file
+    failed_images: list[tuple[int, str, str]] = field(default_factory=list)  # (index, url, filename)
 
     @property
     def total_found(self) -> int:
         return self.downloaded + self.skipped + self.failed
 
+    def merge(self, other: "ImageDownloadResult") -> None:
+        """Add *other* (another batch of the same article) into this result."""
+        self.downloaded += other.downloaded
+        self.skipped += other.skipped
+        self.failed += other.failed
+        self.retries += other.retries
+        self.bytes += other.bytes
+        self.errors.extend(other.errors)
+        self.local_paths.extend(other.local_paths)
+        self.images.extend(other.images)
+        self.failed_images.extend(other.failed_images)
+
 
 # ---------------------------------------------------------------------------
 # High-level download orchestrator (T020–T022)
 # ---------------------------------------------------------------------------
 
 
+def image_info(filename: str, probe: ImageProbe) -> ImageInfo:
+    """Convert a probe into the manifest's ``ImageInfo`` record."""
+    return ImageInfo(file=filename, format=probe.format, width=probe.width, height=probe.height)
+
+
+def plan_article_images(
+    featured_image_url: str | None,
+    inline_image_urls: list[str],
+) -> list[tuple[int, str, str]]:
+    """
+    Return the ordered ``(index, url, filename)`` list for one article.
+
+    The featured image (if any) is always index 0 / ``00-thumbnail``.
+    """
+    planned: list[tuple[int, str, str]] = []
+    index = 0
+    if featured_image_url:
+        planned.append((index, featured_image_url, build_filename(index, featured_image_url, is_thumbnail=True)))
+        index += 1
+    for img_url in inline_image_urls:
+        planned.append((index, img_url, build_filename(index, img_url)))
+        index += 1
+    return planned
+
+
+def fetch_image(
+    url: str,
+    local_path: Path,
+    *,
+    downloader=None,
+    on_retry: Callable[[], None] | None = None,
+    throttle=None,
+    max_retries: int | None = None,
+) -> ImageProbe:
+    """
+    Download one image to *local_path* and return its probe.
+
+    Uses the streaming downloader unless *downloader* ``(url) -> bytes`` is
+    given.  Raises ``InvalidImageError`` for bodies that are not images.
+    *max_retries* overrides the retry policy's limit for the streaming
+    download (``0`` when the caller retries on its own schedule).
+    """
+    if downloader is None:
+        return _download_to_file(
+            url, local_path, max_retries=max_retries, on_retry=on_retry, throttle=throttle
+        )
+    with _throttled(throttle, url):
+        data = downloader(url)
+    probe = probe_image(data[:_PROBE_BYTES])
+    if probe is None:
+        raise InvalidImageError(f"not an image ({len(data)} bytes)")
+    _write_atomic(local_path, data)
+    return probe
+
+
+def existing_image(local_path: Path) -> ImageProbe | None:
+    """
+    Probe an already-downloaded file.
+
+    Returns the probe if it is a valid image; a non-image is deleted and
+    ``None`` returned so the caller fetches it again.
+    """
+    if not local_path.exists():
+        return None
+    probe = _probe_file(local_path)
+    if probe is None:
+        logger.warning("Existing file is not an image, re-downloading: %s", local_path)
+        local_path.unlink()
+    return probe
+
+
 def download_article_images(
     slug: str,
     featured_image_url: str | None,
@@ -161,6 +521,11 @@ def download_article_images(
     *,
     delay: float = _DEFAULT_DELAY,
     downloader=None,  # injectable for tests
+    featured: bool = True,
+    inline: bool = True,
+    sleep: Callable[[float], None] = time.sleep,
+    throttle=None,
+    batch: slice | None = None,
 ) -> ImageDownloadResult:
     """
     Download all images for a single article to ``output_dir/images/<slug>/``.
@@ -169,55 +534,183 @@ def download_article_images(
     - ``00-thumbnail.<ext>`` — featured image
     - ``01-<name>.<ext>``, ``02-<name>.<ext>`` — inline images in order
 
-    Existing files are skipped (T022 / FR-015 incremental support).
+    Existing files are skipped (T022 / FR-015 incremental support) unless
+    their header does not probe as an image, in which case they are deleted
+    and fetched again.  Bodies that are not images are rejected and counted
+    as failures.
+
+    *featured* / *inline* select which part of the list is fetched (the
+    fast lane takes only the thumbnail, the background lane only the
+    inline images).  *batch* narrows the selection further to one slice
+    (an ``ImageLane`` batch).  Filenames and indices are the same either way.
 
     *downloader* is an optional callable ``(url: str) -> bytes`` injected
-    during tests to avoid live HTTP.
+    during tests to avoid live HTTP.  *sleep* performs the per-image
+    *delay* (injectable for timing).  *throttle* (``--adaptive``) paces the
+    requests instead; pass ``delay=0`` with it.
     """
     article_img_dir = output_dir / "images" / slug
     article_img_dir.mkdir(parents=True, exist_ok=True)
 
     result = ImageDownloadResult(slug=slug)
 
-    _dl = downloader if downloader is not None else _download_bytes
+    def count_retry() -> None:
+        result.retries += 1
 
-    # --- Build ordered list of (url, filename) ---
-    images: list[tuple[str, str]] = []  # (url, filename)
-    index = 0
-
-    if featured_image_url:
-        fname = build_filename(index, featured_image_url, is_thumbnail=True)
-        images.append((featured_image_url, fname))
-        index += 1
-
-    for img_url in inline_image_urls:
-        fname = build_filename(index, img_url)
-        images.append((img_url, fname))
-        index += 1
+    # --- Build ordered list of (index, url, filename) ---
+    images = [
+        item
+        for item in plan_article_images(featured_image_url, inline_image_urls)
+        if (featured if item[0] == 0 and featured_image_url else inline)
+    ]
+    if batch is not None:
+        images = images[batch]
 
     # --- Download each image ---
-    for url, filename in images:
+    for index, url, filename in images:
         local_path = article_img_dir / filename
 
-        # T022: Skip if already exists
-        if local_path.exists():
+        # T022: Skip if already exists (and is really an image)
+        probe = existing_image(local_path)
+        if probe is not None:
             result.skipped += 1
             result.local_paths.append(local_path)
+            result.images.append(image_info(filename, probe))
             logger.debug("Skipping existing image: %s", local_path)
             continue
 
         try:
             if delay > 0:
-                time.sleep(delay)
-            data = _dl(url)
-            local_path.write_bytes(data)
+                sleep(delay)
+            probe = fetch_image(
+                url, local_path, downloader=downloader, on_retry=count_retry, throttle=throttle
+            )
             result.downloaded += 1
+            result.bytes += local_path.stat().st_size
             result.local_paths.append(local_path)
+            result.images.append(image_info(filename, probe))
             logger.debug("Downloaded %s → %s", url, local_path)
         except Exception as exc:  # noqa: BLE001
             result.failed += 1
+            result.failed_images.append((index, url, filename))
             err_msg = f"Failed to download {url}: {exc}"
             result.errors.append(err_msg)
             logger.warning(err_msg)
 
     return result
+
+
+# ---------------------------------------------------------------------------
+# Background image lane
+# ---------------------------------------------------------------------------
+
+ImageDoneFn = Callable[[str, ImageDownloadResult], None]
+
+
+@dataclass
+class _LaneArticle:
+    """Batches of one article still running in the lane."""
+
+    on_done: ImageDoneFn
+    parts: list  # ImageDownloadResult per batch, None while running
+    future: Future
+
+
+class ImageLane:
+    """
+    Background lane that downloads inline images off the article path.
+
+    The article fast lane fetches HTML plus ``00-thumbnail`` and hands the
+    inline images to :meth:`submit`; a thread pool with its own
+    concurrency drains them.  An article's images are queued in batches of
+    *batch_size*, so a 150-image article is spread over every lane worker
+    instead of holding one.  *on_done* is called from a worker thread with
+    ``(slug, result)`` once the article's last batch has finished (results
+    merged, in image order), so callers must synchronise any shared state
+    they touch there.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        *,
+        delay: float = _DEFAULT_DELAY,
+        downloader=None,
+        throttle=None,
+        batch_size: int = _LANE_BATCH,
+    ) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="image-lane")
+        self._delay = delay
+        self._downloader = downloader
+        self._throttle = throttle
+        self._batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def depth(self) -> int:
+        """Articles queued or downloading in this lane."""
+        with self._lock:
+            return self._in_flight
+
+    def submit(
+        self,
+        slug: str,
+        featured_image_url: str | None,
+        inline_image_urls: list[str],
+        output_dir: Path,
+        on_done: ImageDoneFn,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> Future:
+        """
+        Queue the inline images of one article (*sleep* performs the delay).
+
+        The returned future resolves to the merged result.
+        """
+        size = self._batch_size
+        batches = [slice(i, i + size) for i in range(0, len(inline_image_urls), size)] or [slice(0, 0)]
+        article = _LaneArticle(on_done, [None] * len(batches), Future())
+        with self._lock:
+            self._in_flight += 1
+        for i, batch in enumerate(batches):
+            future = self._pool.submit(
+                download_article_images,
+                slug,
+                featured_image_url,
+                inline_image_urls,
+                output_dir,
+                delay=self._delay,
+                downloader=self._downloader,
+                featured=False,
+                sleep=sleep,
+                throttle=self._throttle,
+                batch=batch,
+            )
+            future.add_done_callback(lambda f, i=i: self._finish(f, slug, article, i))
+        return article.future
+
+    def _finish(self, future: Future, slug: str, article: _LaneArticle, index: int) -> None:
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Image lane failed for %s: %s", slug, exc)
+            part = ImageDownloadResult(slug=slug, failed=1, errors=[str(exc)])
+        else:
+            part = future.result()
+        with self._lock:
+            article.parts[index] = part
+            if any(p is None for p in article.parts):
+                return
+            self._in_flight -= 1
+        result = ImageDownloadResult(slug=slug)
+        for part in article.parts:
+            result.merge(part)
+        try:
+            article.on_done(slug, result)
+        except Exception:  # noqa: BLE001
+            logger.exception("Image lane callback failed for %s", slug)
+        article.future.set_result(result)
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting work; by default block until the lane is drained."""
+        self._pool.shutdown(wait=wait)
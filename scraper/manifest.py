@@ -5,18 +5,123 @@ Handles load/save from disk, add/update entries, status transitions,
 incremental filtering, sorting, slug lookup, year/month extraction,
 and --force override.
 
+``load_manifest(..., lazy=True)`` returns a manifest whose ``entries`` is a
+``LazyEntries`` view: the JSON is parsed once but each ``ManifestEntry`` is
+validated only when first accessed, and untouched entries are written back
+as-is on save.  Header counts (``total`` / ``completed`` / ``failed``) are
+available immediately.
+
+``load_manifest(..., compact=True)`` / ``compact_manifest`` store entries in
+an ``entry_store.CompactEntries`` column store instead; the query helpers
+below filter and sort on its columns and only build models for results.
+
+An article being scraped is ``in_progress``, leased to one worker until
+``lease_until`` (:func:`claim_entry`).  Any other status clears the lease.
+:func:`reclaim_expired_leases` puts the entries of workers that died or
+stalled back to ``pending`` at startup; live leases are left alone, so
+the work list (``pending`` / ``failed``) skips articles held elsewhere.
+
 See: specs/004-python-bulk-scraper/data-model.md
 """
 
 from __future__ import annotations
 
-import json
+import heapq
+import itertools
 import re
+import time
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urlparse
 
-from models import Manifest, ManifestEntry, ScrapeStatus
+from entry_store import CompactEntries, parse_date
+from models import ImageInfo, Manifest, ManifestEntry, ScrapeStatus
+from serialize import dump_model, load_json, load_model
+from snapshot import write_snapshot
+
+
+# ---------------------------------------------------------------------------
+# Lazy entry view
+# ---------------------------------------------------------------------------
+
+
+class LazyEntries(MutableMapping):
+    """
+    ``slug → ManifestEntry`` mapping over raw manifest JSON.
+
+    Values start out as the raw dicts from ``manifest.json`` and are replaced
+    by validated ``ManifestEntry`` objects on first access, so a run that
+    touches one slug validates one entry.  Key order is preserved.
+    """
+
+    __slots__ = ("_items",)
+    _items: dict[str, dict | ManifestEntry]
+
+    def __init__(self, raw: dict[str, dict | ManifestEntry]) -> None:
+        self._items = raw
+
+    def __getitem__(self, slug: str) -> ManifestEntry:
+        value = self._items[slug]
+        if not isinstance(value, ManifestEntry):
+            value = ManifestEntry.model_validate(value)
+            self._items[slug] = value
+        return value
+
+    def __setitem__(self, slug: str, entry: ManifestEntry) -> None:
+        self._items[slug] = entry
+
+    def __delitem__(self, slug: str) -> None:
+        del self._items[slug]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self._items
+
+    def __repr__(self) -> str:
+        return f"LazyEntries({len(self._items)} entries, {self.materialized} materialized)"
+
+    @property
+    def materialized(self) -> int:
+        """Number of entries validated so far."""
+        return sum(1 for v in self._items.values() if isinstance(v, ManifestEntry))
+
+    def status_of(self, slug: str) -> ScrapeStatus:
+        """Article status of *slug* without validating the entry."""
+        value = self._items[slug]
+        if isinstance(value, ManifestEntry):
+            return value.status
+        return ScrapeStatus(value.get("status", ScrapeStatus.PENDING.value))
+
+    def statuses(self) -> Iterator[ScrapeStatus]:
+        for slug in self._items:
+            yield self.status_of(slug)
+
+    def materialize(self) -> dict[str, ManifestEntry]:
+        """Validate every entry and return a plain dict."""
+        return {slug: self[slug] for slug in self._items}
+
+    def to_jsonable(self) -> dict[str, dict | ManifestEntry]:
+        """Raw dicts for untouched entries, models for the rest (see ``serialize.py``)."""
+        return self._items
+
+
+def _statuses(manifest: Manifest) -> Iterator[ScrapeStatus]:
+    if isinstance(manifest.entries, LazyEntries):
+        return manifest.entries.statuses()
+    return (e.status for e in manifest.entries.values())
+
+
+def compact_manifest(manifest: Manifest) -> CompactEntries:
+    """Move ``manifest.entries`` into a :class:`CompactEntries` store (in place)."""
+    entries = CompactEntries.from_mapping(manifest.entries)
+    manifest.entries = entries
+    return entries
 
 
 # ---------------------------------------------------------------------------
@@ -29,42 +134,70 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
-def load_manifest(output_dir: Path) -> Manifest:
+def load_manifest(output_dir: Path, *, lazy: bool = False, compact: bool = False) -> Manifest:
     """
     Load manifest.json from *output_dir*.  If the file does not exist,
     return a fresh empty Manifest (do NOT save yet).
+
+    With *lazy*, only the header is validated up front and ``entries`` is a
+    :class:`LazyEntries` view (validation on access).  With *compact*,
+    entries go straight from raw JSON into a :class:`CompactEntries` store.
     """
     manifest_path = output_dir / "manifest.json"
     if not manifest_path.exists():
-        return Manifest(discovered_at=_now_iso(), total=0)
-
-    with manifest_path.open("r", encoding="utf-8") as fh:
-        raw = json.load(fh)
-    return Manifest.model_validate(raw)
+        manifest = Manifest(discovered_at=_now_iso(), total=0)
+        if compact:
+            compact_manifest(manifest)
+        return manifest
+
+    data = manifest_path.read_bytes()
+    if not (lazy or compact):
+        return load_model(Manifest, data)
+
+    raw = load_json(data)
+    raw_entries = raw.pop("entries", None) or {}
+    manifest = Manifest.model_validate(raw)
+    if compact:
+        manifest.entries = CompactEntries.from_mapping(raw_entries)
+    else:
+        manifest.entries = LazyEntries(raw_entries)
+    return manifest
 
 
-def save_manifest(manifest: Manifest, output_dir: Path) -> None:
+def save_manifest(manifest: Manifest, output_dir: Path, *, snapshot_interval: float = 0.0) -> None:
     """
     Persist *manifest* to *output_dir*/manifest.json.
 
     Recomputes the ``total``, ``completed``, and ``failed`` summary counts
-    before writing to keep them consistent.
+    before writing to keep them consistent, then publishes the read-only
+    ``manifest.snap`` for concurrent readers (see ``snapshot.py``) unless
+    the last one is less than *snapshot_interval* seconds old.  Lazy
+    and compact entries are written without validating them; a compact
+    store is packed afterwards so the models touched since the last save
+    do not pile up.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     manifest_path = output_dir / "manifest.json"
 
-    # Recompute summary counts
+    # Recompute summary counts (no validation for lazy / compact entries)
     manifest.total = len(manifest.entries)
-    manifest.completed = sum(
-        1 for e in manifest.entries.values() if e.status == ScrapeStatus.COMPLETED
-    )
-    manifest.failed = sum(
-        1 for e in manifest.entries.values() if e.status == ScrapeStatus.FAILED
-    )
+    manifest.completed = 0
+    manifest.failed = 0
+    if isinstance(manifest.entries, CompactEntries):
+        counts = manifest.entries.status_counts()
+        manifest.completed = counts[ScrapeStatus.COMPLETED]
+        manifest.failed = counts[ScrapeStatus.FAILED]
+    else:
+        for status in _statuses(manifest):
+            if status == ScrapeStatus.COMPLETED:
+                manifest.completed += 1
+            elif status == ScrapeStatus.FAILED:
+                manifest.failed += 1
 
-    with manifest_path.open("w", encoding="utf-8") as fh:
-        fh.write(manifest.model_dump_json(indent=2))
-        fh.write("\n")
+    manifest_path.write_bytes(dump_model(manifest) + b"\n")
+    write_snapshot(manifest, output_dir, min_interval=snapshot_interval)
+    if isinstance(manifest.entries, CompactEntries):
+        manifest.entries.pack()
 
 
 # ---------------------------------------------------------------------------
@@ -95,6 +228,7 @@ def update_entry_status(
     pages_found: int | None = None,
     images_found: int | None = None,
     images_downloaded: int | None = None,
+    images: list[ImageInfo] | None = None,
     error: str | None = None,
 ) -> ManifestEntry:
     """
@@ -104,12 +238,15 @@ def update_entry_status(
     """
     entry = manifest.entries[slug]
     entry.status = status
+    if status != ScrapeStatus.IN_PROGRESS:
+        entry.worker = entry.lease_until = None
     if status == ScrapeStatus.COMPLETED:
         entry.scraped_at = _now_iso()
         entry.error = None
     elif status == ScrapeStatus.FAILED:
         entry.scraped_at = _now_iso()
         entry.error = error
+        entry.failures += 1
 
     if pages_found is not None:
         entry.pages_found = pages_found
@@ -117,7 +254,104 @@ def update_entry_status(
         entry.images_found = images_found
     if images_downloaded is not None:
         entry.images_downloaded = images_downloaded
+    if images is not None:
+        entry.images = images
+
+    return entry
+
 
+def claim_entry(manifest: Manifest, slug: str, worker: str, lease_until: float) -> ManifestEntry:
+    """
+    Mark *slug* ``in_progress``, leased to *worker* until *lease_until*
+    (Unix time).  Raises ``KeyError`` if *slug* is not in the manifest.
+    """
+    entry = update_entry_status(manifest, slug, ScrapeStatus.IN_PROGRESS)
+    entry.worker = worker
+    entry.lease_until = lease_until
+    return entry
+
+
+def renew_lease(manifest: Manifest, slug: str, worker: str, lease_until: float) -> bool:
+    """
+    Extend *worker*'s lease on *slug* to *lease_until*; False (and nothing
+    changed) unless the entry is ``in_progress`` and held by *worker*.
+    """
+    entry = manifest.entries.get(slug)
+    if entry is None or entry.status != ScrapeStatus.IN_PROGRESS or entry.worker != worker:
+        return False
+    entry.lease_until = lease_until
+    return True
+
+
+def _in_progress(manifest: Manifest) -> list[ManifestEntry]:
+    entries = manifest.entries
+    if isinstance(entries, CompactEntries):
+        return entries.entries_at(entries.select((ScrapeStatus.IN_PROGRESS,)))
+    if isinstance(entries, LazyEntries):
+        return [entries[s] for s in entries if entries.status_of(s) == ScrapeStatus.IN_PROGRESS]
+    return [e for e in entries.values() if e.status == ScrapeStatus.IN_PROGRESS]
+
+
+def reclaim_expired_leases(
+    manifest: Manifest,
+    *,
+    now: float | None = None,
+    is_gone: Callable[[str], bool] | None = None,
+) -> list[str]:
+    """
+    Put ``in_progress`` entries whose lease expired — or whose *worker*
+    *is_gone* says has exited — back to ``pending``.  Returns their slugs.
+    """
+    now = time.time() if now is None else now
+    reclaimed = []
+    for entry in _in_progress(manifest):
+        expired = entry.lease_until is None or entry.lease_until <= now
+        if expired or (is_gone is not None and entry.worker is not None and is_gone(entry.worker)):
+            update_entry_status(manifest, entry.slug, ScrapeStatus.PENDING)
+            reclaimed.append(entry.slug)
+    return reclaimed
+
+
+def release_leases(manifest: Manifest, worker: str) -> list[str]:
+    """Put the ``in_progress`` entries leased to *worker* back to ``pending``."""
+    released = []
+    for entry in _in_progress(manifest):
+        if entry.worker == worker:
+            update_entry_status(manifest, entry.slug, ScrapeStatus.PENDING)
+            released.append(entry.slug)
+    return released
+
+
+def update_image_status(
+    manifest: Manifest,
+    slug: str,
+    status: ScrapeStatus | None = None,
+    *,
+    images: list[ImageInfo] | None = None,
+) -> ManifestEntry:
+    """
+    Update image completion for an entry, independently of its article status.
+
+    *images* are merged into what the entry already records (the thumbnail
+    and the inline images complete in different lanes) and
+    ``images_downloaded`` follows the merged list.  When *status* is
+    omitted it is derived: ``completed`` once every image counted in
+    ``images_found`` is recorded, ``failed`` otherwise.
+
+    Raises ``KeyError`` if *slug* is not in the manifest.
+    """
+    entry = manifest.entries[slug]
+    if images is not None:
+        known = {i.file for i in entry.images}
+        entry.images = entry.images + [i for i in images if i.file not in known]
+        entry.images_downloaded = len(entry.images)
+    if status is None:
+        status = (
+            ScrapeStatus.COMPLETED
+            if len(entry.images) >= entry.images_found
+            else ScrapeStatus.FAILED
+        )
+    entry.images_status = status
     return entry
 
 
@@ -133,6 +367,10 @@ def get_pending_entries(manifest: Manifest) -> list[ManifestEntry]:
     Completed entries are skipped (incremental re-run support — FR-015).
     Order is preserved (dict insertion order, Python 3.7+).
     """
+    if isinstance(manifest.entries, CompactEntries):
+        return manifest.entries.entries_at(
+            manifest.entries.select((ScrapeStatus.PENDING, ScrapeStatus.FAILED))
+        )
     return [
         entry
         for entry in manifest.entries.values()
@@ -158,7 +396,9 @@ def reset_all_to_pending(manifest: Manifest) -> int:
             entry.status = ScrapeStatus.PENDING
             entry.scraped_at = None
             entry.error = None
+            entry.worker = entry.lease_until = None
             count += 1
+        entry.images_status = ScrapeStatus.PENDING
     return count
 
 
@@ -186,46 +426,89 @@ def get_sorted_entries(
         If True (default), only return entries with status pending or failed.
 
     Entries **without** ``last_modified`` are always placed at the end,
-    regardless of sort direction.
-    """
-    if pending_only:
-        entries = [
-            e
-            for e in manifest.entries.values()
-            if e.status in (ScrapeStatus.PENDING, ScrapeStatus.FAILED)
-        ]
-    else:
-        entries = list(manifest.entries.values())
+    regardless of sort direction.  See :func:`query_entries`.
+    """
+    return query_entries(
+        manifest,
+        statuses=_PENDING_STATUSES if pending_only else None,
+        direction=direction,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Query planner — status + year + month + sort + limit in one pass
+# ---------------------------------------------------------------------------
+
+_PENDING_STATUSES = (ScrapeStatus.PENDING, ScrapeStatus.FAILED)
 
-    def sort_key(entry: ManifestEntry) -> tuple[int, datetime]:
-        """Return (has_date, parsed_datetime) for sorting."""
+
+def query_entries(
+    manifest: Manifest,
+    *,
+    statuses: Iterable[ScrapeStatus] | None = _PENDING_STATUSES,
+    year: int | None = None,
+    month: int | None = None,
+    direction: str = "latest",
+    limit: int | None = None,
+) -> list[ManifestEntry]:
+    """
+    Return the work list: entries matching *statuses* (``None`` = any),
+    publication *year* (URL path) and *month* (``last_modified``), sorted by
+    ``last_modified`` in *direction* with undated entries last, truncated
+    to *limit*.
+
+    Equivalent to filtering, sorting and slicing in sequence, but done in
+    one pass:
+
+    - :class:`CompactEntries` — walk the date index, test the status / year
+      / month columns, stop after *limit* matches; only the returned
+      entries are built as models
+    - plain entries — one scan that filters and computes integer sort keys,
+      then ``heapq`` top-k when *limit* is set (full sort otherwise)
+
+    Unparseable dates sort as the earliest possible date; naive timestamps
+    are treated as UTC.
+    """
+    entries = manifest.entries
+    if limit is not None and limit <= 0:
+        return []
+
+    if isinstance(entries, CompactEntries):
+        rows = entries.iter_by_date(direction)
+        if statuses is not None:
+            rows = entries.filter_status(rows, statuses)
+        if year is not None:
+            rows = (i for i in rows if entries.year_of(i) == year)
+        if month is not None:
+            rows = (i for i in rows if entries.month_of(i) == month)
+        return entries.entries_at(itertools.islice(rows, limit))
+
+    wanted = set(statuses) if statuses is not None else None
+    dated: list[tuple[int, int, ManifestEntry]] = []
+    undated: list[ManifestEntry] = []
+    for seq, entry in enumerate(entries.values()):
+        if wanted is not None and entry.status not in wanted:
+            continue
+        if year is not None and extract_year_from_url(entry.url) != year:
+            continue
+        epoch, _, entry_month = parse_date(entry.last_modified)
+        if month is not None and entry_month != month:
+            continue
         if entry.last_modified is None:
-            # Place at end: (1, epoch) ensures they sort after dated entries
-            return (1, datetime.min.replace(tzinfo=timezone.utc))
-        try:
-            dt = datetime.fromisoformat(entry.last_modified)
-            # Normalize to UTC for correct cross-timezone comparison
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return (0, dt)
-        except (ValueError, TypeError):
-            return (1, datetime.min.replace(tzinfo=timezone.utc))
-
-    reverse = direction == "latest"
-    entries.sort(key=sort_key, reverse=reverse)
-
-    # Since we used reverse but nulls should always be at end,
-    # re-partition: dated first (sorted), then undated
-    dated = [e for e in entries if e.last_modified is not None]
-    undated = [e for e in entries if e.last_modified is None]
-
-    # Re-sort dated correctly
-    dated.sort(
-        key=lambda e: sort_key(e)[1],
-        reverse=reverse,
-    )
+            undated.append(entry)
+        else:
+            dated.append((epoch, seq, entry))
+
+    # Ties keep manifest order in both directions (like a stable sort)
+    if direction == "latest":
+        key = lambda item: (item[0], -item[1])  # noqa: E731
+        top = heapq.nlargest(limit, dated, key=key) if limit is not None else sorted(dated, key=key, reverse=True)
+    else:
+        key = lambda item: (item[0], item[1])  # noqa: E731
+        top = heapq.nsmallest(limit, dated, key=key) if limit is not None else sorted(dated, key=key)
 
-    return dated + undated
+    result = [entry for _, _, entry in top] + undated
+    return result if limit is None else result[:limit]
 
 
 # ---------------------------------------------------------------------------
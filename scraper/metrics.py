@@ -0,0 +1,323 @@
+"""
+metrics.py — Live progress metrics for long-running scrapes.
+
+``run_scrape_phase`` feeds a :class:`ScrapeMetrics` as articles and images
+finish; the numbers are exposed in the Prometheus text format so workers
+and ``--delay`` can be tuned while an 8–12 hour crawl is still running.
+
+Covers:
+- Counters: articles completed/failed, images downloaded/failed/skipped,
+  bytes fetched (HTML + images), image download retries
+- Gauges: articles/min, images/min, bytes/sec (since start), queue depth
+  (articles left in this run, articles waiting in the image lane), ETA
+- Per-stage latency histograms: ``fetch`` (per HTTP page), ``article``
+  (whole fast-lane article), ``images`` (fast-lane image step) and
+  ``image_lane`` (per article, handed off → finished)
+- ``--adaptive`` controller state per host (``throttle.py``): concurrency
+  limit, request interval, in-flight requests, latency, AIMD decisions
+- ``--metrics-port``: local HTTP endpoint (``/metrics`` text, ``/progress``
+  JSON) served from a daemon thread
+- ``--metrics-file``: Prometheus textfile (node_exporter textfile
+  collector), rewritten atomically after every article
+
+Usage:
+    from metrics import ScrapeMetrics, serve_metrics
+    metrics = ScrapeMetrics(textfile=Path("scraper.prom"))
+    server = serve_metrics(metrics, 9464)
+    metrics.start(total=len(pending))
+    with metrics.time("article"):
+        ...
+    metrics.article_done(ok=True)
+    server.shutdown()
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Iterator
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# Seconds; spans a cached article (~ms) to a slow multi-page fetch with delays
+DEFAULT_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+STAGES = ("fetch", "article", "images", "image_lane")
+
+_PREFIX = "scraper"
+
+
+# ---------------------------------------------------------------------------
+# Histogram
+# ---------------------------------------------------------------------------
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (Prometheus semantics, cumulative on render)."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)  # non-cumulative; +Inf is ``count``
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        for k, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[k] += 1
+                break
+        self.sum += seconds
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """``(le, count)`` pairs including ``+Inf``."""
+        pairs, running = [], 0
+        for bound, n in zip(self.buckets, self.counts):
+            running += n
+            pairs.append((_fmt(bound), running))
+        pairs.append(("+Inf", self.count))
+        return pairs
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+class ScrapeMetrics:
+    """
+    Thread-safe counters, gauges and stage histograms for one scrape run.
+
+    Fed from the article loop and from image-lane worker threads.
+    *textfile*, when set, is rewritten by :meth:`publish`.
+    """
+
+    def __init__(
+        self,
+        *,
+        textfile: Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.textfile = textfile
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        self.total = 0
+        self.articles_completed = 0
+        self.articles_failed = 0
+        self.images_downloaded = 0
+        self.images_failed = 0
+        self.images_skipped = 0
+        self.bytes = 0
+        self.retries = 0
+        self.image_lane_depth: Callable[[], int] = lambda: 0
+        self.throttle_state: Callable[[], dict] = dict  # ``AdaptiveThrottle.snapshot``
+        self.stages: dict[str, Histogram] = {stage: Histogram() for stage in STAGES}
+
+    # -- feeding ------------------------------------------------------------
+
+    def start(self, total: int) -> None:
+        """Reset the clock for a run over *total* articles."""
+        with self._lock:
+            self.total = total
+            self._started = self._clock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stages.setdefault(stage, Histogram()).observe(seconds)
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """Observe the wall time of the ``with`` block under *stage*."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.observe(stage, self._clock() - start)
+
+    def timed_fetcher(self, fetcher: Callable[[str], bytes]) -> Callable[[str], bytes]:
+        """Wrap a page fetcher so every call is timed (``fetch``) and its bytes counted."""
+
+        def fetch(url: str) -> bytes:
+            with self.time("fetch"):
+                body = fetcher(url)
+            self.add_bytes(len(body))
+            return body
+
+        return fetch
+
+    def add_bytes(self, n: int) -> None:
+        with self._lock:
+            self.bytes += n
+
+    def article_done(self, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self.articles_completed += 1
+            else:
+                self.articles_failed += 1
+
+    def images_done(self, result) -> None:
+        """Fold an ``images.ImageDownloadResult`` into the image counters."""
+        with self._lock:
+            self.images_downloaded += result.downloaded
+            self.images_failed += result.failed
+            self.images_skipped += result.skipped
+            self.retries += result.retries
+            self.bytes += result.bytes
+
+    # -- reading ------------------------------------------------------------
+
+    def snapshot(self) -> dict:
+        """Current values, including derived rates and ETA."""
+        with self._lock:
+            elapsed = max(self._clock() - self._started, 1e-9)
+            done = self.articles_completed + self.articles_failed
+            remaining = max(self.total - done, 0)
+            per_sec = done / elapsed
+            return {
+                "elapsed_seconds": elapsed,
+                "total": self.total,
+                "articles_completed": self.articles_completed,
+                "articles_failed": self.articles_failed,
+                "images_downloaded": self.images_downloaded,
+                "images_failed": self.images_failed,
+                "images_skipped": self.images_skipped,
+                "bytes": self.bytes,
+                "retries": self.retries,
+                "articles_per_minute": per_sec * 60,
+                "images_per_minute": self.images_downloaded / elapsed * 60,
+                "bytes_per_second": self.bytes / elapsed,
+                "queue_articles": remaining,
+                "queue_image_lane": self.image_lane_depth(),
+                "eta_seconds": remaining / per_sec if per_sec > 0 else None,
+                "throttle": self.throttle_state(),
+                "stages": {
+                    name: {"count": h.count, "sum": h.sum, "buckets": h.cumulative()}
+                    for name, h in self.stages.items()
+                },
+            }
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        snap = self.snapshot()
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: list[tuple[str, float]]) -> None:
+            lines.append(f"# HELP {_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {_PREFIX}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{_PREFIX}_{name}{labels} {_fmt(value)}")
+
+        metric("articles_total", "counter", "Articles finished in this run.", [
+            ('{outcome="completed"}', snap["articles_completed"]),
+            ('{outcome="failed"}', snap["articles_failed"]),
+        ])
+        metric("images_total", "counter", "Images handled in this run.", [
+            ('{outcome="downloaded"}', snap["images_downloaded"]),
+            ('{outcome="failed"}', snap["images_failed"]),
+            ('{outcome="skipped"}', snap["images_skipped"]),
+        ])
+        metric("bytes_total", "counter", "HTML and image bytes fetched.", [("", snap["bytes"])])
+        metric("retries_total", "counter", "Image download retries.", [("", snap["retries"])])
+        metric("articles_per_minute", "gauge", "Articles finished per minute since start.",
+               [("", snap["articles_per_minute"])])
+        metric("images_per_minute", "gauge", "Images downloaded per minute since start.",
+               [("", snap["images_per_minute"])])
+        metric("bytes_per_second", "gauge", "Bytes fetched per second since start.",
+               [("", snap["bytes_per_second"])])
+        metric("queue_depth", "gauge", "Work not yet finished.", [
+            ('{queue="articles"}', snap["queue_articles"]),
+            ('{queue="image_lane"}', snap["queue_image_lane"]),
+        ])
+        metric("eta_seconds", "gauge", "Estimated seconds until the article queue is empty.",
+               [("", snap["eta_seconds"] if snap["eta_seconds"] is not None else float("nan"))])
+        metric("elapsed_seconds", "gauge", "Seconds since the run started.", [("", snap["elapsed_seconds"])])
+
+        hosts = snap["throttle"]
+        if hosts:
+            metric("throttle_concurrency_limit", "gauge", "Adaptive in-flight request limit per host.",
+                   [(f'{{host="{h}"}}', s["concurrency_limit"]) for h, s in hosts.items()])
+            metric("throttle_interval_seconds", "gauge", "Adaptive minimum gap between request starts per host.",
+                   [(f'{{host="{h}"}}', s["interval_seconds"]) for h, s in hosts.items()])
+            metric("throttle_in_flight", "gauge", "Requests in flight per host.",
+                   [(f'{{host="{h}"}}', s["in_flight"]) for h, s in hosts.items()])
+            metric("throttle_latency_seconds", "gauge", "Smoothed response latency per host and request kind.",
+                   [(f'{{host="{h}",kind="{k}"}}', v) for h, s in hosts.items() for k, v in s["latency_seconds"].items()])
+            metric("throttle_decisions_total", "counter", "AIMD adjustments per host.",
+                   [(f'{{host="{h}",decision="{d}"}}', n) for h, s in hosts.items() for d, n in s["decisions"].items()])
+            metric("throttle_responses_total", "counter", "Throttled requests per host by outcome.",
+                   [(f'{{host="{h}",outcome="{o}"}}', n) for h, s in hosts.items() for o, n in s["outcomes"].items()])
+
+        lines.append(f"# HELP {_PREFIX}_stage_seconds Wall time per pipeline stage.")
+        lines.append(f"# TYPE {_PREFIX}_stage_seconds histogram")
+        for stage, data in snap["stages"].items():
+            for le, count in data["buckets"]:
+                lines.append(f'{_PREFIX}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {count}')
+            lines.append(f'{_PREFIX}_stage_seconds_sum{{stage="{stage}"}} {_fmt(data["sum"])}')
+            lines.append(f'{_PREFIX}_stage_seconds_count{{stage="{stage}"}} {data["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def publish(self) -> None:
+        """Rewrite the textfile (if configured) atomically."""
+        if self.textfile is None:
+            return
+        self.textfile.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.textfile.with_name(self.textfile.name + ".tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, self.textfile)
+
+
+def _fmt(value: float) -> str:
+    if value != value:  # NaN
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(round(float(value), 6))
+
+
+# ---------------------------------------------------------------------------
+# HTTP endpoint
+# ---------------------------------------------------------------------------
+
+
+def serve_metrics(metrics: ScrapeMetrics, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve ``/metrics`` (Prometheus text) and ``/progress`` (JSON) on
+    *host*:*port* from a daemon thread.  Call ``shutdown()`` when done;
+    port 0 picks a free port (see ``server.server_address``).
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            path = self.path.split("?", 1)[0]
+            if path == "/metrics":
+                body = metrics.render().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/progress":
+                body = json.dumps(metrics.snapshot()).encode("utf-8")
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:  # noqa: A002 - silence access log
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
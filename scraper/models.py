@@ -7,9 +7,10 @@ See: specs/004-python-bulk-scraper/data-model.md
 
 from __future__ import annotations
 
+from collections.abc import MutableMapping
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_serializer
 
 
 class ScrapeStatus(str, Enum):
@@ -18,6 +19,7 @@ class ScrapeStatus(str, Enum):
     PENDING = "pending"
     COMPLETED = "completed"
     FAILED = "failed"
+    IN_PROGRESS = "in_progress"  # leased by a running worker (see ManifestEntry.worker)
 
 
 class ArticleData(BaseModel):
@@ -40,6 +42,15 @@ class ArticleData(BaseModel):
     scraped_at: str  # ISO 8601
 
 
+class ImageInfo(BaseModel):
+    """Header-probed metadata for one downloaded image file."""
+
+    file: str  # e.g. "01-crash-2005.jpg"
+    format: str  # jpeg | png | gif | webp | bmp
+    width: int | None = None
+    height: int | None = None
+
+
 class ManifestEntry(BaseModel):
     """Tracking entry for a single article in the manifest."""
 
@@ -52,6 +63,11 @@ class ManifestEntry(BaseModel):
     pages_found: int = 0
     images_found: int = 0
     images_downloaded: int = 0
+    failures: int = 0  # failed scrape attempts, across runs
+    worker: str | None = None  # holder of the in_progress lease ("host-pid" by default)
+    lease_until: float | None = None  # Unix timestamp the lease expires; reclaimable after
+    images_status: ScrapeStatus = ScrapeStatus.PENDING  # tracked apart from article status
+    images: list[ImageInfo] = []
 
 
 class Manifest(BaseModel):
@@ -62,4 +78,30 @@ class Manifest(BaseModel):
     total: int  # Total number of entries
     completed: int = 0
     failed: int = 0
-    entries: dict[str, ManifestEntry] = {}  # keyed by slug
+    # keyed by slug; a dict, or a lazy / compact store from manifest.py / entry_store.py
+    entries: MutableMapping[str, ManifestEntry] = {}
+
+    @field_serializer("entries", when_used="json")
+    def _dump_entries(self, entries: MutableMapping[str, ManifestEntry]):
+        # Lazy and compact stores dump their raw rows instead of validating every entry
+        to_jsonable = getattr(entries, "to_jsonable", None)
+        return to_jsonable() if to_jsonable is not None else entries
+
+
+class ImageTask(BaseModel):
+    """One outstanding image in the persistent image backlog queue."""
+
+    url: str
+    slug: str
+    index: int
+    filename: str
+    attempts: int = 0
+    next_retry_at: float = 0.0  # Unix timestamp; 0 = ready now
+    last_error: str | None = None
+
+
+class ImageQueue(BaseModel):
+    """Root of image_queue.json — outstanding images keyed by "<slug>/<filename>"."""
+
+    version: int = 1
+    tasks: dict[str, ImageTask] = {}
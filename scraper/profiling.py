@@ -0,0 +1,196 @@
+"""
+profiling.py — ``--profile``: cProfile + a sampling profiler per run phase.
+
+Wrapping a phase (``discovery``, ``scrape``) in :meth:`ProfileSession.phase`
+writes, for that phase:
+
+- ``<run>-<phase>.prof`` — cProfile stats of the calling thread (the
+  article lane); open with ``python -m pstats``, snakeviz, etc.
+- ``<run>-<phase>.folded`` — collapsed stacks (``thread;mod:func;... N``)
+  from a background thread sampling *every* thread with
+  ``sys._current_frames()``, so the image lane shows up too.  Feed it to
+  ``flamegraph.pl`` or drop it on speedscope.app.  Samples are wall-clock:
+  a thread blocked on a socket or ``sleep`` is counted where it waits.
+
+and, for the run, ``<run>-summary.json`` with per-phase wall time, process
+CPU time (all threads) and the top functions, which answers "CPU or I/O?"
+without opening a viewer.  ``<run>`` is the UTC start time
+(``YYYYmmdd-HHMMSS``), so repeated runs into one directory do not collide.
+
+Usage:
+    python scraper.py --limit 50 --profile ../scraped/profiles
+    flamegraph.pl ../scraped/profiles/20261019-061500-scrape.folded > scrape.svg
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_INTERVAL = 0.005  # seconds between samples
+_MAX_DEPTH = 128
+_TOP = 8
+
+# "ThreadPoolExecutor-0_1", "image-lane-2" → one flamegraph root per pool
+_THREAD_SUFFIX = re.compile(r"(?:[-_]\d+)+$")
+
+
+# ---------------------------------------------------------------------------
+# Sampling profiler
+# ---------------------------------------------------------------------------
+
+
+def _frame_label(code) -> str:
+    module = Path(code.co_filename).stem
+    return f"{module}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """
+    Background thread that snapshots every other thread's Python stack
+    every *interval* seconds and counts collapsed stacks.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample(skip=own)
+
+    def sample(self, skip: int | None = None) -> None:
+        """Record one stack per live thread (except *skip*)."""
+        names = {t.ident: _THREAD_SUFFIX.sub("", t.name) for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == skip:
+                continue
+            labels: list[str] = []
+            while frame is not None and len(labels) < _MAX_DEPTH:
+                labels.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            labels.append(names.get(ident, "thread"))
+            self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+
+    def write_collapsed(self, path: Path) -> None:
+        """Brendan Gregg's collapsed format: one ``stack count`` per line."""
+        lines = [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+        path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+
+    def top_leaves(self, n: int = _TOP) -> list[tuple[str, float]]:
+        """``(thread;leaf function, share of samples)`` for the hottest leaves."""
+        leaves: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            parts = stack.split(";")
+            leaves[f"{parts[0]};{parts[-1]}"] += count
+        total = sum(leaves.values()) or 1
+        return [(leaf, count / total) for leaf, count in leaves.most_common(n)]
+
+
+# ---------------------------------------------------------------------------
+# Session
+# ---------------------------------------------------------------------------
+
+
+class ProfileSession:
+    """Profiles for one CLI run, written under *directory*."""
+
+    def __init__(self, directory: Path, *, interval: float = DEFAULT_INTERVAL) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.interval = interval
+        self.run_id = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        self.phases: list[dict] = []
+
+    def path(self, suffix: str) -> Path:
+        return self.directory / f"{self.run_id}-{suffix}"
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Profile the ``with`` block as phase *name*."""
+        profile = cProfile.Profile()
+        sampler = SamplingProfiler(self.interval)
+        wall, cpu = time.perf_counter(), time.process_time()
+        sampler.start()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            sampler.stop()
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self._finish(name, profile, sampler, wall, cpu)
+
+    def _finish(self, name: str, profile: cProfile.Profile, sampler: SamplingProfiler,
+                wall: float, cpu: float) -> None:
+        prof_path, folded_path = self.path(f"{name}.prof"), self.path(f"{name}.folded")
+        profile.dump_stats(prof_path)
+        sampler.write_collapsed(folded_path)
+
+        stats = pstats.Stats(profile)
+        by_self = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)  # type: ignore[attr-defined]
+        top_self = [
+            {"function": func if file == "~" else f"{Path(file).stem}:{func}:{line}",
+             "calls": nc, "self_seconds": round(tt, 4), "cumulative_seconds": round(ct, 4)}
+            for (file, line, func), (_, nc, tt, ct, _) in by_self[:_TOP]
+        ]
+        self.phases.append({
+            "phase": name,
+            "wall_seconds": round(wall, 4),
+            "cpu_seconds": round(cpu, 4),
+            "cpu_share": round(cpu / wall, 4) if wall else 0.0,
+            "samples": sampler.samples,
+            "top_self": top_self,
+            "top_sampled": [{"leaf": leaf, "share": round(share, 4)} for leaf, share in sampler.top_leaves()],
+            "prof": str(prof_path),
+            "folded": str(folded_path),
+        })
+        self.write_summary()
+
+    def write_summary(self) -> Path:
+        path = self.path("summary.json")
+        path.write_text(json.dumps({"run": self.run_id, "phases": self.phases}, indent=2), encoding="utf-8")
+        return path
+
+    def format_summary(self) -> str:
+        """Per-phase wall vs CPU and the hottest functions, for the end-of-run printout."""
+        lines = [f"Profile ({self.directory / self.run_id}-*)"]
+        for phase in self.phases:
+            lines.append(
+                f"  {phase['phase']:<10} wall {phase['wall_seconds']:8.2f}s  "
+                f"cpu {phase['cpu_seconds']:8.2f}s ({phase['cpu_share'] * 100:.0f}%)  "
+                f"{phase['samples']} samples"
+            )
+            for row in phase["top_self"][:3]:
+                lines.append(f"      self {row['self_seconds']:7.3f}s  {row['function']}")
+        return "\n".join(lines)
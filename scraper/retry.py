@@ -0,0 +1,289 @@
+"""
+retry.py — One retry policy for every page, sitemap and image fetch.
+
+Before this, each fetch path retried (or not) on its own: ``2 ** attempt``
+sleeps on any ``URLError``/``OSError`` including 404s, no ``Retry-After``,
+and no retries at all for the article fetcher.  Now they all call
+:meth:`RetryPolicy.call` on the process-wide :func:`default_policy`.
+
+Covers:
+- Classification: ``408``/``425``/``429`` and ``5xx`` responses, timeouts,
+  refused / reset / dropped connections and short bodies are transient;
+  other ``4xx`` (404, 410 …), bad bodies (not an image) and local
+  ``OSError``s (permission denied, disk full) are permanent and fail on
+  the first attempt
+- ``Retry-After`` (seconds or HTTP date) on a transient response sets the
+  wait, and holds back every other request to that host until it passes; a
+  wait longer than ``max_retry_after`` gives up instead of stalling the run
+- Backoff: ``base_delay * 2 ** attempt`` capped at ``max_delay`` with equal
+  jitter (half fixed, half random) so parallel lanes do not retry in step
+- Retry budget: retries may not exceed ``budget_min + budget_ratio x
+  requests`` over the run, so during an outage requests fail fast instead
+  of multiplying the load (and the dead time) by ``max_retries``
+- Optional ``breaker`` (``breaker.CircuitBreaker``): each attempt waits
+  while the host is down and reports its outcome
+- ``stats`` counters for the end-of-run summary
+
+Usage:
+    from retry import default_policy
+    body = default_policy().call(url, lambda: urlopen(url).read())
+    fetch = default_policy().fetcher(fetch)
+
+    import retry
+    retry.configure(max_retries=5)          # CLI --max-retries
+"""
+
+from __future__ import annotations
+
+import http.client
+import logging
+import random
+import socket
+import threading
+import time
+import urllib.error
+from collections import Counter
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, TypeVar
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ---------------------------------------------------------------------------
+# Classification
+# ---------------------------------------------------------------------------
+
+TRANSIENT = "transient"
+PERMANENT = "permanent"
+
+_TRANSIENT_STATUS = frozenset({408, 425, 429})
+# DNS, refused / reset / dropped connections, timeouts, short bodies
+_TRANSIENT_ERRORS = (
+    urllib.error.URLError,
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    socket.gaierror,
+    http.client.HTTPException,
+)
+
+
+def classify_error(exc: BaseException) -> str:
+    """``TRANSIENT`` if retrying *exc* can succeed, else ``PERMANENT``."""
+    if isinstance(exc, urllib.error.HTTPError):
+        return TRANSIENT if exc.code in _TRANSIENT_STATUS or exc.code >= 500 else PERMANENT
+    if isinstance(exc, _TRANSIENT_ERRORS):
+        return TRANSIENT
+    return PERMANENT  # incl. local OSErrors: permission denied, disk full …
+
+
+def is_permanent(exc: BaseException) -> bool:
+    return classify_error(exc) == PERMANENT
+
+
+def retry_after(exc: BaseException, now: datetime | None = None) -> float | None:
+    """Seconds requested by a ``Retry-After`` header on *exc*, if any."""
+    headers = getattr(exc, "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - (now or datetime.now(timezone.utc))).total_seconds(), 0.0)
+
+
+# ---------------------------------------------------------------------------
+# Policy
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RetryConfig:
+    """Retry limits (seconds where timed)."""
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    max_retry_after: float = 120.0
+    budget_ratio: float = 0.2
+    budget_min: int = 20
+
+
+class RetryPolicy:
+    """
+    Retries with classification, ``Retry-After``, jitter and a shared budget.
+
+    Thread-safe; one instance is shared by the article lane, the image lane
+    and discovery so the budget and ``Retry-After`` holds are global.
+    """
+
+    def __init__(
+        self,
+        config: RetryConfig | None = None,
+        *,
+        sleep: Callable[[float], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rand: Callable[[], float] = random.random,
+        breaker=None,
+    ) -> None:
+        self.config = config or RetryConfig()
+        self.breaker = breaker  # breaker.CircuitBreaker gating every attempt, or None
+        self._sleep = sleep
+        self._clock = clock
+        self._rand = rand
+        self._lock = threading.Lock()
+        self._held_until: dict[str, float] = {}  # host -> clock() time
+        self.stats: Counter[str] = Counter()
+
+    # -- budget ---------------------------------------------------------------
+
+    def _spend_retry(self) -> bool:
+        cfg = self.config
+        with self._lock:
+            if self.stats["retries"] >= cfg.budget_min + cfg.budget_ratio * self.stats["requests"]:
+                self.stats["budget_exhausted"] += 1
+                return False
+            self.stats["retries"] += 1
+            return True
+
+    # -- Retry-After holds ----------------------------------------------------
+
+    def _hold(self, host: str, seconds: float) -> None:
+        with self._lock:
+            until = self._clock() + seconds
+            if until > self._held_until.get(host, 0.0):
+                self._held_until[host] = until
+
+    def _host_wait(self, host: str) -> float:
+        with self._lock:
+            return max(self._held_until.get(host, 0.0) - self._clock(), 0.0)
+
+    # -- backoff --------------------------------------------------------------
+
+    def backoff(self, attempt: int, exc: BaseException) -> float:
+        """Seconds to wait before retry number *attempt* (1-based) after *exc*."""
+        cfg = self.config
+        requested = retry_after(exc)
+        if requested is not None:
+            return requested + self._rand() * min(cfg.base_delay, 1.0)
+        cap = min(cfg.base_delay * 2 ** attempt, cfg.max_delay)
+        return cap / 2 + self._rand() * cap / 2
+
+    # -- calling --------------------------------------------------------------
+
+    def call(
+        self,
+        url: str,
+        attempt_fn: Callable[[], T],
+        *,
+        max_retries: int | None = None,
+        on_retry: Callable[[], None] | None = None,
+        sleep: Callable[[float], None] | None = None,
+    ) -> T:
+        """
+        Run *attempt_fn* (one request to *url*) until it succeeds, the error
+        is permanent, retries or the budget run out, or ``Retry-After`` asks
+        for longer than ``max_retry_after``; then the last error is raised.
+
+        *on_retry* is called before each retry (run metrics); *sleep*
+        overrides the wait (timing).
+        """
+        cfg = self.config
+        limit = cfg.max_retries if max_retries is None else max_retries
+        sleep = sleep or self._sleep or time.sleep
+        host = urlsplit(url).netloc
+        with self._lock:
+            self.stats["requests"] += 1
+
+        attempt = 0
+        wait = self._host_wait(host)
+        while True:
+            if wait > 0:
+                sleep(wait)
+            if self.breaker is not None:
+                self.breaker.before(url)  # blocks while the host is down
+            try:
+                result = attempt_fn()
+            except Exception as exc:
+                if self.breaker is not None:
+                    self.breaker.record(url, exc)
+                if is_permanent(exc):
+                    with self._lock:
+                        self.stats["permanent"] += 1
+                    raise
+                requested = retry_after(exc)
+                if requested is not None:
+                    if requested > cfg.max_retry_after:
+                        logger.warning("%s asks to retry after %.0fs; giving up for this run", url, requested)
+                        with self._lock:
+                            self.stats["retry_after_too_long"] += 1
+                        raise
+                    self._hold(host, requested)  # every request to the host waits, retry or not
+                if attempt >= limit:
+                    with self._lock:
+                        self.stats["exhausted"] += 1
+                    raise
+                if not self._spend_retry():
+                    logger.warning("Retry budget exhausted; not retrying %s (%s)", url, exc)
+                    raise
+                attempt += 1
+                wait = max(self.backoff(attempt, exc), self._host_wait(host))
+                logger.warning("Retry %d/%d for %s in %.1fs (%s)", attempt, limit, url, wait, exc)
+                if on_retry is not None:
+                    on_retry()
+            else:
+                if self.breaker is not None:
+                    self.breaker.record(url, None)
+                return result
+
+    def fetcher(self, fetcher: Callable[[str], bytes]) -> Callable[[str], bytes]:
+        """Wrap a ``(url) -> bytes`` fetcher so every call goes through :meth:`call`."""
+
+        def fetch(url: str) -> bytes:
+            return self.call(url, lambda: fetcher(url))
+
+        return fetch
+
+    def summary(self) -> str | None:
+        """One line for the end-of-run printout, or ``None`` if nothing failed."""
+        s = self.stats
+        if not (s["retries"] or s["permanent"] or s["budget_exhausted"] or s["exhausted"]):
+            return None
+        return (
+            f"Retries: {s['retries']} ({s['permanent']} permanent errors not retried, "
+            f"{s['exhausted']} gave up after max retries, {s['budget_exhausted']} over budget, "
+            f"{s['retry_after_too_long']} Retry-After too long)"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Process-wide policy
+# ---------------------------------------------------------------------------
+
+_default = RetryPolicy()
+
+
+def default_policy() -> RetryPolicy:
+    """The policy used by every fetch path."""
+    return _default
+
+
+def configure(*, breaker=None, **overrides) -> RetryPolicy:
+    """
+    Replace the default policy (fresh budget and stats) with *overrides*
+    applied and *breaker* (``breaker.CircuitBreaker``) gating every attempt.
+    """
+    global _default
+    _default = RetryPolicy(replace(RetryConfig(), **overrides), breaker=breaker)
+    return _default
@@ -0,0 +1,312 @@
+"""
+scheduler.py — Priority work queue for the article lane.
+
+``run_scrape_phase`` used to walk a static list in ``--sort`` order.  It now
+pulls from a :class:`PriorityScheduler` shared by its ``--workers`` threads:
+the highest-scoring ready entry goes first, and entries re-enqueued with a
+delay (transient failures) wait in a second heap until they are due.
+
+A long article is split into pieces: its pagination pages go through
+:meth:`PriorityScheduler.run_pieces`, which hands them to whichever workers
+are free (pieces go before new articles, oldest article first) while the
+owning worker runs pieces too until its own are done, then merges.  One
+10-page article no longer holds a single worker for all ten fetches.
+
+With ``--priority`` entries are scored by :func:`score_entry` (higher =
+sooner) instead of by sort position:
+
+- **referenced** — the article's URL is the ``source_url`` of an
+  ``import_batches`` row that is not completed: an editor is waiting on it
+- **recency** — ``last_modified`` decays with a half-life (undated = oldest)
+- **failures** — every earlier failed attempt (``ManifestEntry.failures``)
+  pushes it back, so a broken article does not hold up working ones
+- **cost** — estimated requests (pages + images from an earlier attempt,
+  or a typical article's if never fetched); cheaper first
+
+Covers:
+- ``PriorityWeights`` and :func:`score_entry`
+- :func:`referenced_slugs`: slugs of articles in open import batches
+- ``PriorityScheduler``: ``push(entry, score, delay)``, blocking ``pop()``,
+  ``done()``, ``close()``, ``run_pieces(fns)``
+- :func:`requeue_delay`: in-run backoff for transient failures
+- ``refill``: a ``PriorityScheduler`` fed from a shared ``workqueue.py``
+  queue one lease at a time (multi-node crawls)
+
+Usage:
+    from scheduler import Piece, PriorityScheduler, referenced_slugs, score_entry
+    referenced = referenced_slugs(db_path)
+    sched = PriorityScheduler()
+    for entry in entries:
+        sched.push(entry, score_entry(entry, referenced=referenced))
+    while (item := sched.pop()) is not None:
+        try:
+            if isinstance(item, Piece):
+                item()
+            else:
+                ...  # process the article; may call sched.run_pieces(...)
+        finally:
+            sched.done()
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import math
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+from models import ManifestEntry
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+_TYPICAL_COST = 12  # requests for an article never fetched: ~2 pages + ~10 images
+_REQUEUE_BASE = 30.0  # seconds before the first in-run retry of a transient failure
+_REQUEUE_CAP = 300.0
+
+
+@dataclass(frozen=True)
+class PriorityWeights:
+    """Weights of the :func:`score_entry` terms."""
+
+    referenced: float = 100.0
+    recency: float = 10.0
+    recency_half_life_days: float = 365.0
+    failure: float = 3.0
+    cost: float = 2.0
+
+
+def _slug_of(url: str) -> str:
+    parts = [p for p in urlparse(url).path.split("/") if p]
+    return parts[-1] if parts else ""
+
+
+def referenced_slugs(db_path: Path | None) -> set[str]:
+    """
+    Slugs of articles named as ``source_url`` by ``import_batches`` rows that
+    are not completed, from the app database at *db_path*.  Missing database
+    or table → empty set.
+    """
+    if db_path is None or not db_path.exists():
+        return set()
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            rows = conn.execute(
+                "SELECT source_url FROM import_batches WHERE status IS NULL OR status != 'completed'"
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as exc:
+        logger.warning("Could not read import_batches from %s: %s", db_path, exc)
+        return set()
+    return {slug for (url,) in rows if url and (slug := _slug_of(url))}
+
+
+def score_entry(
+    entry: ManifestEntry,
+    *,
+    referenced: set[str] | frozenset[str] = frozenset(),
+    weights: PriorityWeights = PriorityWeights(),
+    now: datetime | None = None,
+) -> float:
+    """Priority of *entry* (higher = scraped sooner)."""
+    score = weights.referenced if entry.slug in referenced else 0.0
+
+    if entry.last_modified:
+        try:
+            modified = datetime.fromisoformat(entry.last_modified)
+        except ValueError:
+            modified = None
+        if modified is not None:
+            if modified.tzinfo is None:
+                modified = modified.replace(tzinfo=timezone.utc)
+            age_days = max(((now or datetime.now(timezone.utc)) - modified).total_seconds() / 86400, 0.0)
+            score += weights.recency * 0.5 ** (age_days / weights.recency_half_life_days)
+
+    score -= weights.failure * min(entry.failures, 10)
+
+    cost = entry.pages_found + entry.images_found if entry.pages_found else _TYPICAL_COST
+    score -= weights.cost * math.log1p(cost) / math.log1p(_TYPICAL_COST)
+    return score
+
+
+def requeue_delay(failures: int) -> float:
+    """Wait before an in-run retry after *failures* failed attempts: 30 s, 60 s … 5 min."""
+    return min(_REQUEUE_BASE * 2 ** max(failures - 1, 0), _REQUEUE_CAP)
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+class Piece:
+    """One split-off unit of an article in flight; calling it runs it once."""
+
+    __slots__ = ("_fn", "_cond", "result", "finished")
+
+    def __init__(self, fn: Callable[[], Any], cond: threading.Condition) -> None:
+        self._fn = fn
+        self._cond = cond
+        self.result: Any = None  # return value, or the exception raised
+        self.finished = False
+
+    def __call__(self) -> None:
+        try:
+            result = self._fn()
+        except Exception as exc:  # noqa: BLE001 — handed back to the owner
+            result = exc
+        with self._cond:
+            self.result, self.finished = result, True
+            self._cond.notify_all()
+
+
+# Next entries from an outside source (``workqueue.WorkQueue`` leases):
+# a list, empty if nothing is available yet, or None once it is drained.
+RefillFn = Callable[[], "list[tuple[ManifestEntry, float]] | None"]
+
+
+class PriorityScheduler:
+    """
+    Thread-safe priority queue with delayed re-enqueue and split pieces.
+
+    :meth:`pop` blocks while nothing is ready but work is delayed or still
+    in flight (a worker may re-enqueue it), and returns ``None`` once the
+    queue is drained or :meth:`close` was called.  It returns a waiting
+    :class:`Piece` (to be called) before any entry.  Every popped item must
+    be followed by one :meth:`done`.  Equal scores keep push order.
+
+    With *refill*, :meth:`pop` asks the source for more whenever nothing
+    local is ready (one caller at a time, at most every *refill_interval*
+    seconds while it has nothing), and the queue is only drained once the
+    source returns ``None``.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        refill: RefillFn | None = None,
+        refill_interval: float = 1.0,
+    ) -> None:
+        self._clock = clock
+        self._refill = refill
+        self._refill_interval = refill_interval
+        self._refilling = False
+        self._next_refill = 0.0
+        self._cond = threading.Condition()
+        self._ready: list[tuple[float, int, ManifestEntry]] = []  # (-score, seq, entry)
+        self._delayed: list[tuple[float, int, float, ManifestEntry]] = []  # (due, seq, score, entry)
+        self._pieces: deque[Piece] = deque()
+        self._seq = itertools.count()
+        self._active = 0
+        self._closed = False
+
+    def push(self, entry: ManifestEntry, score: float, delay: float = 0.0) -> None:
+        """Enqueue *entry*; with *delay* it becomes ready that many seconds from now."""
+        with self._cond:
+            if delay > 0:
+                heapq.heappush(self._delayed, (self._clock() + delay, next(self._seq), score, entry))
+            else:
+                heapq.heappush(self._ready, (-score, next(self._seq), entry))
+            self._cond.notify()
+
+    def pop(self) -> Piece | ManifestEntry | None:
+        """A waiting piece, else the highest-priority ready entry; ``None`` when done."""
+        with self._cond:
+            while not self._closed:
+                if self._pieces:
+                    self._active += 1
+                    return self._pieces.popleft()
+                now = self._clock()
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, seq, score, entry = heapq.heappop(self._delayed)
+                    heapq.heappush(self._ready, (-score, seq, entry))
+                if self._ready:
+                    self._active += 1
+                    return heapq.heappop(self._ready)[2]
+                if self._refill is not None and not self._refilling and now >= self._next_refill:
+                    self._pull()
+                    continue
+                if not self._delayed and not self._active and self._refill is None and not self._refilling:
+                    return None
+                wakeups = [self._delayed[0][0]] if self._delayed else []
+                if self._refill is not None and not self._refilling:
+                    wakeups.append(self._next_refill)
+                self._cond.wait(max(min(wakeups) - now, 0.0) if wakeups else None)
+            return None
+
+    def _pull(self) -> None:
+        """Call *refill* (without holding the lock) and queue what it returns."""
+        refill = self._refill
+        if refill is None:
+            return
+        self._refilling = True
+        self._cond.release()
+        try:
+            items = refill()
+        finally:
+            self._cond.acquire()
+            self._refilling = False
+            self._cond.notify_all()
+        if items is None:
+            self._refill = None  # the source is drained for good
+        elif not items:
+            self._next_refill = self._clock() + self._refill_interval
+        for entry, score in items or ():
+            heapq.heappush(self._ready, (-score, next(self._seq), entry))
+
+    def done(self) -> None:
+        """Mark one popped entry finished (after any re-enqueue)."""
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def run_pieces(self, fns: list[Callable[[], Any]]) -> list[Any]:
+        """
+        Run *fns* (pieces of the caller's article) on any free worker and
+        return their results — or the exceptions they raised — in order.
+        The caller runs waiting pieces itself until its own are finished,
+        so this cannot deadlock even when every worker is waiting.
+        """
+        pieces = [Piece(fn, self._cond) for fn in fns]
+        with self._cond:
+            self._pieces.extend(pieces)
+            self._cond.notify_all()
+        while True:
+            with self._cond:
+                if all(piece.finished for piece in pieces):
+                    return [piece.result for piece in pieces]
+                if self._pieces:
+                    piece = self._pieces.popleft()
+                else:
+                    self._cond.wait()
+                    continue
+            piece()
+
+    def close(self) -> list[ManifestEntry]:
+        """Stop handing out entries (pieces still run); return the entries still queued."""
+        with self._cond:
+            self._closed = True
+            left = [entry for _, _, entry in self._ready] + [entry for *_, entry in self._delayed]
+            self._ready.clear()
+            self._delayed.clear()
+            self._cond.notify_all()
+            return left
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._ready) + len(self._delayed)
@@ -16,10 +16,13 @@ See: specs/004-python-bulk-scraper/contracts/json-schema.md for CLI contract.
 from __future__ import annotations
 
 import argparse
+import contextlib
 import logging
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import Callable
 
 # ---------------------------------------------------------------------------
 # Argument parsing (T027)
@@ -63,7 +66,14 @@ def build_parser() -> argparse.ArgumentParser:
         metavar="N",
         type=int,
         default=3,
-        help="Number of parallel workers (default: 3, max: 5)",
+        help="Parallel article workers, each pacing itself with --delay (default: 3, max: 5)",
+    )
+    parser.add_argument(
+        "--image-workers",
+        metavar="N",
+        type=int,
+        default=2,
+        help="Concurrent downloads in the background inline-image lane (default: 2, max: 5)",
     )
     parser.add_argument(
         "--output-dir",
@@ -72,6 +82,133 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Output directory (default: ../scraped relative to scraper/)",
     )
+    parser.add_argument(
+        "--output-format",
+        choices=["json", "jsonl", "sqlite"],
+        default="json",
+        help=(
+            "Article output: one JSON file per article (default), a sharded JSONL corpus, "
+            "or the scraped_articles staging table in the app database"
+        ),
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["gzip", "zstd", "none"],
+        default="gzip",
+        help="Shard compression for --output-format jsonl (default: gzip)",
+    )
+    parser.add_argument(
+        "--db",
+        metavar="PATH",
+        type=str,
+        default=None,
+        help="App database for --output-format sqlite (default: ../data/cinema.db)",
+    )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        default=False,
+        help="Write manifest and article JSON without indentation (smaller, faster saves)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        metavar="PORT",
+        type=int,
+        default=None,
+        help="Serve live run metrics on http://127.0.0.1:PORT/metrics (Prometheus) and /progress (JSON)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        type=str,
+        default=None,
+        help="Rewrite a Prometheus textfile with live run metrics after every article",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        type=str,
+        default=None,
+        help="Append per-article stage timings to a JSONL trace and print a time breakdown",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        default=False,
+        help=(
+            "Tune request concurrency and pacing per host from latency and 429/5xx/timeouts "
+            "(AIMD); --delay becomes the starting interval"
+        ),
+    )
+    parser.add_argument(
+        "--min-delay",
+        metavar="SECONDS",
+        type=float,
+        default=0.25,
+        help="Smallest interval between requests to one host with --adaptive (default: 0.25)",
+    )
+    parser.add_argument(
+        "--max-delay",
+        metavar="SECONDS",
+        type=float,
+        default=30.0,
+        help="Largest interval between requests to one host with --adaptive (default: 30)",
+    )
+    parser.add_argument(
+        "--max-retries",
+        metavar="N",
+        type=int,
+        default=3,
+        help=(
+            "Retries per request on 5xx/429/timeouts, honouring Retry-After; 404s are not "
+            "retried (default: 3)"
+        ),
+    )
+    parser.add_argument(
+        "--breaker-threshold",
+        metavar="N",
+        type=int,
+        default=5,
+        help=(
+            "Pause all requests to a host after N consecutive 5xx/connection failures and "
+            "probe until it is back; 0 disables (default: 5)"
+        ),
+    )
+    parser.add_argument(
+        "--breaker-probe",
+        metavar="SECONDS",
+        type=float,
+        default=15.0,
+        help="First interval between probes of a host that is down; doubles up to 120 (default: 15)",
+    )
+    parser.add_argument(
+        "--max-outage",
+        metavar="SECONDS",
+        type=float,
+        default=1800.0,
+        help="Stop the run (articles stay pending) once a host has been down this long (default: 1800)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        type=str,
+        default=None,
+        help="Profile discovery and scraping: write cProfile .prof + collapsed-stack .folded files per phase to DIR",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        metavar="SECONDS",
+        type=float,
+        default=0.005,
+        help="Sampling interval of the --profile stack sampler (default: 0.005)",
+    )
+    parser.add_argument(
+        "--base-url",
+        metavar="URL",
+        type=str,
+        default=None,
+        help="Discover from another host, e.g. the local mock site (default: https://www.tasteofcinema.com)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -85,6 +222,55 @@ def build_parser() -> argparse.ArgumentParser:
         default="latest",
         help="Sort order for processing: latest (default) or oldest first",
     )
+    parser.add_argument(
+        "--priority",
+        action="store_true",
+        default=False,
+        help=(
+            "Order work by priority instead of --sort: articles in open import batches first, "
+            "then recent, cheap and rarely-failed ones"
+        ),
+    )
+    parser.add_argument(
+        "--requeue",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Re-enqueue an article that failed transiently up to N times in the run, after 30s+ (default: 1)",
+    )
+    parser.add_argument(
+        "--queue",
+        metavar="PATH",
+        type=Path,
+        default=None,
+        help=(
+            "Lease work from the shared SQLite queue at PATH (multi-node crawls; "
+            "fill it first with --publish)"
+        ),
+    )
+    parser.add_argument(
+        "--publish",
+        action="store_true",
+        default=False,
+        help="Run discovery and publish the pending entries to the --queue, then exit",
+    )
+    parser.add_argument(
+        "--worker-id",
+        metavar="ID",
+        type=str,
+        default=None,
+        help="This process's name on its --queue and in-progress manifest leases (default: host-pid)",
+    )
+    parser.add_argument(
+        "--lease",
+        metavar="SECONDS",
+        type=float,
+        default=600.0,
+        help=(
+            "How long a --queue or in-progress manifest lease lasts before another run "
+            "may reclaim it (default: 600)"
+        ),
+    )
     parser.add_argument(
         "--article",
         metavar="SLUG_OR_URL",
@@ -107,6 +293,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Filter articles by month (1-12, extracted from last_modified)",
     )
+    parser.add_argument(
+        "--images-only",
+        action="store_true",
+        default=False,
+        help="Only retry outstanding images from the image backlog queue; no article scraping",
+    )
+    parser.add_argument(
+        "--build-variants",
+        action="store_true",
+        default=False,
+        help="Render responsive width variants + srcset manifests for downloaded images, then exit",
+    )
     return parser
 
 
@@ -118,6 +316,15 @@ def _resolve_output_dir(output_dir_arg: str | None) -> Path:
     return (Path(__file__).parent.parent / "scraped").resolve()
 
 
+def _resolve_db_path(args) -> Path | None:
+    """The app database, when articles are (or may be) staged in SQLite."""
+    from sinks import default_db_path
+
+    if args.db:
+        return Path(args.db).resolve()
+    return default_db_path() if args.output_format == "sqlite" else None
+
+
 # ---------------------------------------------------------------------------
 # Discovery pipeline wiring (T028)
 # ---------------------------------------------------------------------------
@@ -127,12 +334,13 @@ def run_discovery_phase(
     output_dir: Path,
     delay: float,
     verbose: bool,
+    base_url: str | None = None,
 ) -> "Manifest":  # type: ignore[name-defined]  # noqa: F821
     """Run sitemap discovery and return the updated manifest. Exit 2 on failure."""
-    from discover import run_discovery
+    from discover import BASE_URL, run_discovery
 
     try:
-        manifest = run_discovery(output_dir, delay=delay, verbose=verbose)
+        manifest = run_discovery(output_dir, delay=delay, verbose=verbose, base_url=base_url or BASE_URL)
         return manifest
     except Exception as exc:
         logging.error("Discovery failed: %s", exc)
@@ -143,19 +351,25 @@ def run_discovery_phase(
 # Extraction + image pipeline wiring (T029)
 # ---------------------------------------------------------------------------
 
+def _usable_cache(data: dict | None) -> dict | None:
+    """Return *data* if it looks like a complete article (content > 200 chars)."""
+    try:
+        if data is not None and len(data.get("content", "")) > 200:
+            return data
+    except Exception:
+        pass
+    return None
+
+
 def try_load_cache(path: Path) -> dict | None:
     import json
     if not path.exists():
         return None
     try:
         with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        content = data.get("content", "")
-        if len(content) > 200:
-            return data
+            return _usable_cache(json.load(f))
     except Exception:
-        pass
-    return None
+        return None
 
 
 def _make_fetcher(delay: float):
@@ -177,6 +391,33 @@ def _make_fetcher(delay: float):
     return fetcher
 
 
+def _make_image_done(manifest, manifest_lock: threading.Lock, metrics=None, tracer=None, timer=None):
+    """Return the ImageLane callback that records inline-image completion."""
+    from manifest import update_image_status
+
+    submitted = time.monotonic()
+
+    def on_images_done(slug: str, result) -> None:
+        if metrics is not None:
+            metrics.observe("image_lane", time.monotonic() - submitted)
+            metrics.images_done(result)
+        if tracer is not None and timer is not None:
+            timer.ok = result.failed == 0
+            timer.images = result.downloaded
+            timer.bytes = result.bytes
+            timer.error = "; ".join(result.errors) or None
+            tracer.write(timer.record())
+        with manifest_lock:
+            try:
+                update_image_status(manifest, slug, images=result.images)
+            except KeyError:
+                pass
+        for err in result.errors:
+            logging.warning("  [%s] %s", slug, err)
+
+    return on_images_done
+
+
 def process_article(
     entry,
     output_dir: Path,
@@ -185,29 +426,86 @@ def process_article(
     delay: float,
     verbose: bool,
     force: bool = False,
+    *,
+    image_lane=None,
+    manifest_lock: threading.Lock | None = None,
+    sink=None,
+    metrics=None,
+    tracer=None,
+    throttle=None,
+    breaker=None,
+    on_failure: Callable[[Exception], None] | None = None,
+    map_pages=None,
 ) -> bool:
     """
     Extract content + download images for a single ManifestEntry.
     Returns True on success, False on failure.
+
+    With an *image_lane* this is the fast lane: the article is marked
+    completed once its JSON and ``00-thumbnail`` are on disk, and the inline
+    images are handed to the background lane (``images_status`` stays
+    ``pending`` until it finishes).  Without one, all images are fetched
+    here.
+
+    *sink* selects the article output format (``sinks.py``); the default is
+    one ``articles/<slug>.json`` per article.  *metrics* (``metrics.py``)
+    receives the image step timing and image counts.
+
+    Every stage runs under a ``timing.ArticleTimer``; with a *tracer*
+    (``timing.TraceWriter``) its record is appended to the trace.
+
+    *throttle* (``throttle.AdaptiveThrottle``, ``--adaptive``) paces the
+    thumbnail download; the caller passes a throttled *fetcher* and
+    ``delay=0``.
+
+    If the article fails while *breaker* (``breaker.CircuitBreaker``) has its
+    host open, the origin is down rather than the article broken: it goes
+    back to ``pending`` instead of ``failed``.  *on_failure* is called with
+    the error of a failed article (the scheduler re-enqueues transient ones).
+
+    *map_pages* (``scheduler.PriorityScheduler.run_pieces``) lets other
+    workers fetch the pagination pages; the time spent waiting for them is
+    booked to no stage (``timing.ArticleTimer.waiting``).
     """
     from extract import extract_article
     from images import download_article_images
-    from manifest import save_manifest, update_entry_status
+    from manifest import save_manifest, update_entry_status, update_image_status
     from models import ScrapeStatus
+    from sinks import JsonFileSink
+    from timing import ArticleTimer
 
     url = entry.url
     slug = entry.slug
+    lock = manifest_lock or threading.Lock()
+    if sink is None:
+        sink = JsonFileSink(output_dir)
+    timer = ArticleTimer(slug)
+    fetcher = timer.fetcher(fetcher)
+    split_pages: Callable[[list], list] | None = None
+    if map_pages is not None:
+        run_pieces = map_pages
+
+        def _timed_pieces(tasks: list) -> list:
+            with timer.waiting():
+                return run_pieces(tasks)
+
+        split_pages = _timed_pieces
 
     try:
         json_path = output_dir / "articles" / f"{slug}.json"
         article = None
 
         if not force:
-            cached_data = try_load_cache(json_path)
+            with timer.span("cache"):
+                if isinstance(sink, JsonFileSink):
+                    cached_data = try_load_cache(json_path)
+                else:
+                    cached_data = _usable_cache(sink.read(slug))
             if cached_data is not None:
                 from models import ArticleData
                 try:
                     article = ArticleData(**cached_data)
+                    timer.cached = True
                     if verbose:
                         logging.info("  [%s] loaded from cache", slug)
                 except Exception:
@@ -223,18 +521,24 @@ def process_article(
 
             # Fetch first page
             first_html = fetcher(url)
-            time.sleep(delay)
+            timer.sleep(delay)
 
             # Extract article (writes JSON, updates manifest to completed)
-            article = extract_article(
-                url,
-                first_html,
-                fetcher=fetcher,
-                delay=delay,
-                output_dir=output_dir,
-                manifest=manifest,
-                slug=slug,
-            )
+            with timer.span("parse"):
+                article = extract_article(
+                    url,
+                    first_html,
+                    fetcher=fetcher,
+                    delay=delay,
+                    output_dir=output_dir,
+                    manifest=manifest,
+                    slug=slug,
+                    sink=timer.sink(sink),
+                    sleep=timer.sleep,
+                    manifest_lock=lock,
+                    map_pages=split_pages,
+                )
+            timer.pages = article.pages_merged
 
             if verbose:
                 logging.info(
@@ -244,36 +548,127 @@ def process_article(
                     len(article.inline_images),
                 )
 
-        # Download images
-        img_result = download_article_images(
-            slug=slug,
-            featured_image_url=article.featured_image,
-            inline_image_urls=article.inline_images,
-            output_dir=output_dir,
-            delay=delay,
-        )
+        # Download images — only the thumbnail when a background lane is available
+        deferred = image_lane is not None and bool(article.inline_images)
+        images_started = time.monotonic()
+        with timer.span("images"):
+            img_result = download_article_images(
+                slug=slug,
+                featured_image_url=article.featured_image,
+                inline_image_urls=article.inline_images,
+                output_dir=output_dir,
+                delay=delay,
+                inline=not deferred,
+                sleep=timer.sleep,
+                throttle=throttle,
+            )
+        timer.bytes += img_result.bytes
+        if metrics is not None:
+            metrics.observe("images", time.monotonic() - images_started)
+            metrics.images_done(img_result)
 
         # Update image stats in manifest
-        update_entry_status(
-            manifest,
-            slug,
-            ScrapeStatus.COMPLETED,
-            images_downloaded=img_result.downloaded + img_result.skipped,
-        )
+        with timer.span("manifest"), lock:
+            update_entry_status(
+                manifest,
+                slug,
+                ScrapeStatus.COMPLETED,
+                images_found=len(article.inline_images) + (1 if article.featured_image else 0),
+                images_downloaded=img_result.downloaded + img_result.skipped,
+                images=img_result.images,
+            )
+            update_image_status(manifest, slug, ScrapeStatus.PENDING if deferred else None)
+
+        if deferred and image_lane is not None:
+            lane_timer = ArticleTimer(slug, kind="image_lane")
+            image_lane.submit(
+                slug,
+                article.featured_image,
+                article.inline_images,
+                output_dir,
+                _make_image_done(manifest, lock, metrics, tracer, lane_timer),
+                sleep=lane_timer.sleep,
+            )
 
+        timer.ok = True
         return True
 
     except Exception as exc:  # noqa: BLE001
         from manifest import update_entry_status
         from models import ScrapeStatus
 
-        logging.error("Failed to process %s: %s", url, exc)
+        timer.ok = False
+        timer.error = str(exc)
+        if breaker is not None and not breaker.is_closed(url):
+            logging.warning("Paused %s while its host is down (%s); back to pending", url, exc)
+            status = ScrapeStatus.PENDING
+        else:
+            logging.error("Failed to process %s: %s", url, exc)
+            status = ScrapeStatus.FAILED
         try:
-            update_entry_status(manifest, slug, ScrapeStatus.FAILED, error=str(exc))
+            with lock:
+                update_entry_status(manifest, slug, status, error=str(exc))
         except KeyError:
             pass
+        if on_failure is not None:
+            on_failure(exc)
         return False
 
+    finally:
+        if tracer is not None:
+            tracer.write(timer.record())
+
+
+def _record_image_backlog(
+    manifest, output_dir: Path, slugs: list[str], db_path: Path | None = None
+) -> int:
+    """Queue images of *slugs* still missing after a scrape run for ``--images-only``."""
+    from image_queue import load_image_queue, save_image_queue, seed_image_queue
+
+    queue = load_image_queue(output_dir)
+    added = seed_image_queue(queue, manifest, output_dir, slugs=slugs, db_path=db_path)
+    if queue.tasks:
+        save_image_queue(queue, output_dir)
+    if added:
+        logging.info("Queued %d missing images (retry with --images-only)", added)
+    return added
+
+
+def _ordered_pending(
+    manifest,
+    limit: int | None,
+    sort_direction: str,
+    year_filter: int | None,
+    month_filter: int | None,
+    *,
+    priority: bool = False,
+    db_path: Path | None = None,
+) -> tuple[list, dict[str, float]]:
+    """
+    Pending/failed entries in scrape order, and their scores (higher =
+    sooner): ``--sort`` position, or ``scheduler.score_entry`` with *priority*.
+    """
+    from manifest import query_entries
+    from scheduler import referenced_slugs, score_entry
+
+    # Pending/failed entries filtered by year/month, sorted, limited — one pass
+    pending = query_entries(
+        manifest,
+        year=year_filter,
+        month=month_filter,
+        direction=sort_direction,
+        limit=None if priority else limit,
+    )
+    if priority:
+        from sinks import default_db_path
+
+        referenced = referenced_slugs(db_path or default_db_path())
+        scores = {entry.slug: score_entry(entry, referenced=referenced) for entry in pending}
+        pending = sorted(pending, key=lambda e: scores[e.slug], reverse=True)[:limit]
+    else:
+        scores = {entry.slug: float(-i) for i, entry in enumerate(pending)}
+    return pending, scores
+
 
 def run_scrape_phase(
     manifest,
@@ -286,39 +681,87 @@ def run_scrape_phase(
     sort_direction: str = "latest",
     year_filter: int | None = None,
     month_filter: int | None = None,
+    image_workers: int = 2,
+    output_format: str = "json",
+    compression: str = "gzip",
+    db_path: Path | None = None,
+    metrics=None,
+    tracer=None,
+    throttle=None,
+    workers: int = 1,
+    priority: bool = False,
+    requeue: int = 0,
+    work_queue=None,
+    worker_id: str | None = None,
+    lease_seconds: float = 600.0,
 ) -> tuple[int, int]:
     """
     Run extraction + image download for all pending entries.
 
+    Articles (HTML + thumbnail) run in the fast lane: *workers* threads
+    pulling from a ``scheduler.PriorityScheduler``.  Entries go in
+    ``sort_direction`` order, or with *priority* by ``scheduler.score_entry``
+    (open ``import_batches`` in the app database at *db_path*, recency,
+    earlier failures, cost), and *limit* keeps the top entries either way.
+    An article that fails with a transient error (``retry.classify_error``)
+    is re-enqueued up to *requeue* times with a growing delay
+    (``scheduler.requeue_delay``) while other work continues.  With several
+    workers a multi-page article's pagination pages are split off as
+    scheduler pieces, so idle workers fetch them in parallel.
+
+    Inline images drain in a background ``ImageLane`` with *image_workers*
+    threads, which is joined before returning.  Articles are written through
+    the sink for *output_format* (``json`` files, a ``jsonl`` corpus or the
+    ``sqlite`` staging table at *db_path*, see ``sinks.py``).  *metrics* (a
+    ``metrics.ScrapeMetrics``) is fed as articles and images finish and
+    published after every article.  *tracer* (a ``timing.TraceWriter``)
+    receives one timing record per article and per image-lane batch.
+    With a *throttle* (``throttle.AdaptiveThrottle``) every page and image
+    request is paced by it and the fixed *delay* sleeps are dropped.
+    Page fetches are retried under ``retry.default_policy`` (images retry
+    inside the lane under the same policy and budget).  Articles put back to
+    ``pending`` by the policy's circuit breaker (origin down) — and those
+    that failed in the run of failures that tripped it — are re-queued and
+    wait in the breaker until the host is back; if the breaker gives up on
+    the host, the run stops and the rest stay ``pending``.
+
+    With a *work_queue* (``workqueue.WorkQueue``, ``--queue``) entries are
+    leased from the shared queue instead of taken from the manifest, and
+    each finished one stores its manifest record there; ``manifest.json`` is
+    written once at the end, by :func:`_merge_queue_results`, instead of
+    after every article.  Entries the run does not finish are released.
+
+    An article is ``in_progress`` while a worker has it, leased in the
+    manifest to *worker_id* (default ``host-pid``) for *lease_seconds* (the
+    queue's id and lease with *work_queue*), so a later run can tell it from
+    an abandoned one (``manifest.reclaim_expired_leases``).  The lease (and
+    the queue's) is renewed on the article's page fetches once a quarter of
+    it has passed, so a long article is not reclaimed while it runs.  Leases
+    still held when the run ends are released back to ``pending``.
+
     Returns (success_count, failure_count).
     """
-    from manifest import (
-        extract_month_from_lastmod,
-        extract_year_from_url,
-        get_sorted_entries,
-        save_manifest,
-    )
-
-    # Get sorted pending entries
-    pending = get_sorted_entries(manifest, direction=sort_direction, pending_only=True)
-
-    # Apply year filter
-    if year_filter is not None:
-        pending = [e for e in pending if extract_year_from_url(e.url) == year_filter]
-
-    # Apply month filter
-    if month_filter is not None:
-        pending = [
-            e
-            for e in pending
-            if extract_month_from_lastmod(e.last_modified) == month_filter
-        ]
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Apply limit
-    if limit is not None:
-        pending = pending[:limit]
-
-    total = len(pending)
+    from manifest import claim_entry, release_leases, renew_lease, save_manifest, update_entry_status
+    from models import ScrapeStatus
+    from retry import TRANSIENT, classify_error, default_policy
+    from scheduler import Piece, PriorityScheduler, RefillFn, requeue_delay
+    from snapshot import SNAPSHOT_INTERVAL
+    from workqueue import default_worker_id
+
+    if work_queue is not None:
+        worker_id, lease_seconds = work_queue.worker_id, work_queue.lease_seconds
+    worker_id = worker_id or default_worker_id()
+
+    if work_queue is None:
+        pending, scores = _ordered_pending(
+            manifest, limit, sort_direction, year_filter, month_filter, priority=priority, db_path=db_path
+        )
+        total = len(pending)
+    else:
+        pending, scores = [], {}
+        total = work_queue.outstanding()
 
     if total == 0:
         if verbose:
@@ -326,26 +769,353 @@ def run_scrape_phase(
         print("No matching articles to process.")
         return 0, 0
 
+    from images import ImageLane
+    from sinks import open_sink
+
     fetcher = _make_fetcher(delay)
     success = 0
     failure = 0
-
-    for i, entry in enumerate(pending, 1):
-        if verbose:
-            logging.info("[%d/%d] Scraping: %s", i, total, entry.url)
-
-        ok = process_article(entry, output_dir, manifest, fetcher, delay, verbose, force)
+    manifest_lock = threading.Lock()
+    if throttle is not None:
+        delay = 0  # the throttle paces requests instead
+    image_lane = ImageLane(image_workers, delay=delay, throttle=throttle)
+    sink = open_sink(output_dir, output_format, compression=compression, db_path=db_path)
+    if metrics is not None:
+        metrics.start(total)
+        metrics.image_lane_depth = lambda: image_lane.depth
+        fetcher = metrics.timed_fetcher(fetcher)
+        if throttle is not None:
+            metrics.throttle_state = throttle.snapshot
+    if throttle is not None:
+        fetcher = throttle.fetcher(fetcher)
+    fetcher = default_policy().fetcher(fetcher)  # outermost: the throttle sees each attempt
+    breaker = default_policy().breaker
+
+    leased: dict[str, bool | None] = {}  # queue mode: slug -> ok once finished
+    attempted: set[str] = set()
+    refill: RefillFn | None = None
+    if work_queue is not None:
+        from manifest import add_entry
+
+        queue = work_queue
+
+        def lease_next():
+            lease = queue.lease()
+            if lease is None:
+                return None if queue.outstanding() == 0 else []  # other nodes may drop leases
+            with manifest_lock:
+                entry = add_entry(manifest, lease.url, lease.slug)
+            scores[lease.slug] = lease.score
+            leased[lease.slug] = None
+            return [(entry, lease.score)]
+
+        refill = lease_next
+
+    scheduler = PriorityScheduler(refill=refill)
+
+    def renewing(fetch: Callable[[str], bytes], slug: str) -> Callable[[str], bytes]:
+        """*fetch* that first renews this worker's lease on *slug* when it is a quarter used."""
+        renewed = [time.monotonic()]
+
+        def fetch_and_renew(url: str) -> bytes:
+            now = time.monotonic()
+            if now - renewed[0] >= lease_seconds / 4:
+                renewed[0] = now
+                with manifest_lock:
+                    renew_lease(manifest, slug, worker_id, time.time() + lease_seconds)
+                if work_queue is not None and not work_queue.renew(slug):
+                    logging.warning("Lease on %s was taken over by another node", slug)
+            return fetch(url)
+
+        return fetch_and_renew
+
+    for entry in pending:
+        scheduler.push(entry, scores[entry.slug])
+    tally_lock = threading.Lock()
+    started_count = 0
+    requeues: dict[str, int] = {}  # in-run retries of transient failures
+    streak: list[tuple] = []  # (entry, counted, when) failed with no success since: an outage's first victims
+    stranded: list = []  # left pending after the breaker gave up on their host
+    unstarted: list = []  # still queued when a failed worker stopped the run
+
+    def settle(entry, ok: bool, error: Exception | None, started: float, trips: int) -> bool:
+        """
+        Tally one attempt (begun at *started*, with its host's breaker opened
+        *trips* times) and re-enqueue if due; True if the article is finished.
+        """
+        nonlocal success, failure
+        score = scores[entry.slug]
+        paused = not ok and breaker is not None and (
+            manifest.entries[entry.slug].status == ScrapeStatus.PENDING
+            or breaker.trips(entry.url) > trips  # the breaker tripped while it ran
+        )
+        if paused:
+            with manifest_lock:
+                update_entry_status(manifest, entry.slug, ScrapeStatus.PENDING)
+            for victim, counted, _ in streak:  # failed just before the breaker tripped
+                with manifest_lock:
+                    update_entry_status(manifest, victim.slug, ScrapeStatus.PENDING)
+                if counted:
+                    failure -= 1
+                    scheduler.push(victim, scores[victim.slug])
+            streak.clear()
         if ok:
             success += 1
-        else:
-            failure += 1
+            # the host answered after these failures (an article begun earlier proves nothing)
+            streak[:] = [item for item in streak if item[2] > started]
+            return True
+        if paused:
+            if breaker is not None and breaker.gave_up(entry.url):
+                stranded.append(entry)
+                failure += 1
+                return True
+            scheduler.push(entry, score)  # waits in the breaker until the host is back
+            return False
+        if (
+            error is not None and classify_error(error) == TRANSIENT
+            and requeues.get(entry.slug, 0) < requeue
+        ):
+            requeues[entry.slug] = requeues.get(entry.slug, 0) + 1
+            wait = requeue_delay(requeues[entry.slug])
+            logging.info("Retrying %s in %.0fs (%s)", entry.url, wait, error)
+            scheduler.push(entry, score, delay=wait)
+            if breaker is not None:
+                streak.append((entry, False, time.monotonic()))
+            return False
+        failure += 1
+        if breaker is not None:
+            streak.append((entry, True, time.monotonic()))
+        return True
 
-        # Persist manifest after every article (crash recovery)
-        save_manifest(manifest, output_dir)
+    def work() -> None:
+        nonlocal failure, started_count
+        while (entry := scheduler.pop()) is not None:
+            try:
+                if isinstance(entry, Piece):
+                    entry()  # a page of an article another worker is merging
+                    continue
+                if work_queue is not None:
+                    if entry.slug in attempted and not work_queue.renew(entry.slug):
+                        logging.warning("Lease on %s expired while it waited; left to its new owner", entry.slug)
+                        with tally_lock:
+                            leased.pop(entry.slug, None)
+                        continue
+                    attempted.add(entry.slug)
+                with tally_lock:
+                    started_count += 1
+                    n = started_count
+                if verbose:
+                    logging.info("[%d/%d] Scraping: %s", n, total, entry.url)
+
+                started = time.monotonic()
+                trips = breaker.trips(entry.url) if breaker is not None else 0
+                errors: list[Exception] = []
+                with manifest_lock:
+                    claim_entry(manifest, entry.slug, worker_id, time.time() + lease_seconds)
+                ok = process_article(
+                    entry,
+                    output_dir,
+                    manifest,
+                    renewing(fetcher, entry.slug),
+                    delay,
+                    verbose,
+                    force,
+                    image_lane=image_lane,
+                    manifest_lock=manifest_lock,
+                    sink=sink,
+                    metrics=metrics,
+                    tracer=tracer,
+                    throttle=throttle,
+                    breaker=breaker,
+                    on_failure=errors.append,
+                    map_pages=scheduler.run_pieces if workers > 1 else None,
+                )
+                with tally_lock:
+                    finished = settle(entry, ok, errors[0] if errors else None, started, trips)
+                    finished = finished and entry not in stranded
+
+                if work_queue is not None:
+                    if finished:
+                        with manifest_lock:
+                            record = manifest.entries[entry.slug].model_dump(mode="json")
+                        if work_queue.complete(entry.slug, record, ok=ok):
+                            leased[entry.slug] = ok
+                        else:
+                            leased.pop(entry.slug, None)
+                else:
+                    # Persist manifest after every article (crash recovery); the
+                    # snapshot is throttled and rewritten by the final save
+                    with manifest_lock:
+                        save_manifest(manifest, output_dir, snapshot_interval=SNAPSHOT_INTERVAL)
+                if metrics is not None:
+                    metrics.observe("article", time.monotonic() - started)
+                    if finished:
+                        metrics.article_done(ok)
+                    metrics.publish()
+                if not ok and breaker is not None and breaker.gave_up(entry.url):
+                    left = scheduler.close()
+                    with tally_lock:
+                        stranded.extend(left)
+                        failure += len(left)
+            finally:
+                scheduler.done()
 
+    try:
+        if workers <= 1:
+            work()
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="article-lane") as pool:
+                futures = [pool.submit(work) for _ in range(workers)]
+                try:
+                    for future in futures:
+                        future.result()
+                finally:
+                    unstarted.extend(scheduler.close())  # a failed worker stops the others after their article
+    finally:
+        if verbose and image_lane.depth:
+            logging.info("Waiting for %d articles in the image lane...", image_lane.depth)
+        image_lane.close(wait=True)
+        sink.close()
+        staged_db = db_path if output_format == "sqlite" else None
+        with manifest_lock:
+            release_leases(manifest, worker_id)
+        if work_queue is not None:
+            for entry in unstarted + stranded:
+                work_queue.release(entry.slug)
+            _merge_queue_results(work_queue, manifest, output_dir, leased, staged_db)
+        else:
+            _record_image_backlog(manifest, output_dir, [e.slug for e in pending], staged_db)
+            with manifest_lock:
+                save_manifest(manifest, output_dir)
+        if metrics is not None:
+            metrics.publish()
+
+    if stranded:
+        print(f"Origin unreachable; stopping with {len(stranded)} articles left pending.")
     return success, failure
 
 
+def _merge_queue_results(
+    work_queue, manifest, output_dir: Path, finished: dict[str, bool | None], staged_db: Path | None = None
+) -> None:
+    """
+    Refresh the queue records of the entries this node *finished* (their
+    images finished after them), then merge every node's finished records
+    into the shared ``manifest.json`` and image backlog — inside one
+    exclusive queue transaction, so two nodes never write them at once.
+    Entries other nodes hold are marked ``in_progress`` under their lease.
+    The merged summary counts are copied back to *manifest*.
+    """
+    from manifest import claim_entry, load_manifest, reclaim_expired_leases, release_leases, save_manifest
+    from models import ManifestEntry
+    from workqueue import worker_gone
+
+    done = [slug for slug, ok in finished.items() if ok is not None]
+    for slug in done:
+        work_queue.complete(slug, manifest.entries[slug].model_dump(mode="json"), ok=finished[slug])
+
+    with work_queue.exclusive() as conn:
+        shared = load_manifest(output_dir, compact=True)
+        for slug, record in work_queue.records(conn).items():
+            shared.entries[slug] = ManifestEntry.model_validate(record)
+            manifest.entries[slug] = ManifestEntry.model_validate(record)
+        release_leases(shared, work_queue.worker_id)
+        reclaim_expired_leases(shared, is_gone=worker_gone)
+        for slug, (owner, lease_until) in work_queue.leases(conn).items():
+            if slug in shared.entries:
+                claim_entry(shared, slug, owner, lease_until)
+        _record_image_backlog(shared, output_dir, done, staged_db)
+        save_manifest(shared, output_dir)
+    # the run summary is printed from this node's manifest
+    manifest.total, manifest.completed, manifest.failed = shared.total, shared.completed, shared.failed
+
+
+def _start_metrics(args):
+    """Build the run metrics (and HTTP endpoint) requested on the command line."""
+    if args.metrics_port is None and args.metrics_file is None:
+        return None, None
+    from metrics import ScrapeMetrics, serve_metrics
+
+    textfile = Path(args.metrics_file).resolve() if args.metrics_file else None
+    metrics = ScrapeMetrics(textfile=textfile)
+    server = None
+    if args.metrics_port is not None:
+        server = serve_metrics(metrics, args.metrics_port)
+        host, port = server.server_address[:2]
+        print(f"Metrics: http://{host}:{port}/metrics")
+    return metrics, server
+
+
+def _make_throttle(args, workers: int, image_workers: int):
+    """The ``--adaptive`` controller, or None; its ceiling is the lanes' thread count."""
+    if not args.adaptive:
+        return None
+    from throttle import AdaptiveThrottle, ThrottleConfig
+
+    return AdaptiveThrottle(ThrottleConfig(
+        max_concurrency=workers + image_workers,
+        initial_interval=args.delay,
+        min_interval=min(args.min_delay, args.delay),
+        max_interval=max(args.max_delay, args.delay),
+    ))
+
+
+def _make_breaker(args):
+    """The per-host circuit breaker (``--breaker-threshold``), or None if disabled."""
+    if args.breaker_threshold <= 0:
+        return None
+    from breaker import BreakerConfig, CircuitBreaker
+
+    return CircuitBreaker(BreakerConfig(
+        failure_threshold=args.breaker_threshold,
+        probe_interval=args.breaker_probe,
+        max_probe_interval=max(120.0, args.breaker_probe),
+        max_outage=args.max_outage if args.max_outage > 0 else None,
+    ))
+
+
+def _print_throttle_summary(throttle) -> None:
+    """Where ``--adaptive`` settled for each host."""
+    for host, state in throttle.snapshot().items():
+        decisions = state["decisions"]
+        print(
+            f"Adaptive [{host}]: concurrency {state['concurrency_limit']:.1f}, "
+            f"interval {state['interval_seconds']:.2f}s "
+            f"({decisions['increase']} increases, {decisions['decrease']} decreases)"
+        )
+
+
+def _open_tracer(args):
+    """The ``--trace`` writer, or None."""
+    if args.trace is None:
+        return None
+    from timing import TraceWriter
+
+    return TraceWriter(Path(args.trace).resolve())
+
+
+def _print_trace_summary(tracer) -> None:
+    """Print where this run's wall-clock time went (``--trace``)."""
+    from timing import format_summary, summarize_trace
+
+    print(format_summary(summarize_trace(tracer.records)))
+    print(f"Trace: {tracer.path}")
+
+
+def _open_profiler(args):
+    """The ``--profile`` session, or None."""
+    if args.profile is None:
+        return None
+    from profiling import ProfileSession
+
+    return ProfileSession(Path(args.profile).resolve(), interval=args.profile_interval)
+
+
+def _profile_phase(profiler, name: str):
+    """Profile the ``with`` block as phase *name* when ``--profile`` is on."""
+    return profiler.phase(name) if profiler is not None else contextlib.nullcontext()
+
+
 # ---------------------------------------------------------------------------
 # Verbose logging (T030)
 # ---------------------------------------------------------------------------
@@ -362,6 +1132,8 @@ def _configure_logging(verbose: bool) -> None:
 
 def _print_summary(manifest, success: int, failure: int) -> None:
     """Print final run summary to stdout."""
+    from models import ScrapeStatus
+
     total = len(manifest.entries)
     completed = manifest.completed
     print("\n" + "=" * 60)
@@ -372,6 +1144,13 @@ def _print_summary(manifest, success: int, failure: int) -> None:
     print(f"  This run — failed          : {failure}")
     if manifest.failed:
         print(f"  Overall failed entries     : {manifest.failed}")
+    images_incomplete = sum(
+        1
+        for e in manifest.entries.values()
+        if e.status == ScrapeStatus.COMPLETED and e.images_status != ScrapeStatus.COMPLETED
+    )
+    if images_incomplete:
+        print(f"  Articles missing images    : {images_incomplete}")
     print("=" * 60)
 
 
@@ -411,6 +1190,15 @@ def main(argv: list[str] | None = None) -> int:
 
     _configure_logging(args.verbose)
 
+    from serialize import configure as configure_serializer
+
+    configure_serializer(pretty=not args.compact_json)
+
+    import retry
+
+    breaker = _make_breaker(args)
+    retry.configure(max_retries=max(0, args.max_retries), breaker=breaker)
+
     # Validate --year
     if args.year is not None and args.year < 2000:
         print(f"error: --year must be a valid year ≥ 2000, got: {args.year}", file=sys.stderr)
@@ -420,57 +1208,227 @@ def main(argv: list[str] | None = None) -> int:
     workers = min(max(1, args.workers), 5)
     if workers != args.workers:
         logging.warning("--workers clamped to %d (valid range: 1–5)", workers)
+    image_workers = min(max(1, args.image_workers), 5)
+    if image_workers != args.image_workers:
+        logging.warning("--image-workers clamped to %d (valid range: 1–5)", image_workers)
 
     output_dir = _resolve_output_dir(args.output_dir)
 
     if args.verbose:
         logging.info("Output directory: %s", output_dir)
 
+    # --build-variants: local image batch job, no network
+    if args.build_variants:
+        return _run_build_variants_mode(args, output_dir, workers)
+
+    if args.publish and args.queue is None:
+        print("error: --publish needs --queue PATH", file=sys.stderr)
+        return EXIT_FATAL
+
+    # --images-only: drain the image backlog, no article scraping
+    if args.images_only:
+        return _run_images_only_mode(args, output_dir, image_workers)
+
     # --article mode: single article short-circuit
     if args.article is not None:
         return _run_single_article_mode(args, output_dir)
 
+    profiler = _open_profiler(args)
+
     # --- Phase 1: Discovery (T028) ---
-    manifest = run_discovery_phase(output_dir, delay=args.delay, verbose=args.verbose)
+    queue_path: Path | None = None if args.publish else args.queue
+    node = queue_path is not None
+    if node:
+        from manifest import load_manifest
+
+        manifest = load_manifest(output_dir)  # the publisher discovered; entries come from the queue
+    else:
+        with _profile_phase(profiler, "discovery"):
+            manifest = run_discovery_phase(output_dir, delay=args.delay, verbose=args.verbose, base_url=args.base_url)
 
     discovered = len(manifest.entries)
     if args.verbose:
         logging.info("Manifest contains %d article entries", discovered)
 
+    from manifest import compact_manifest
+
+    compact_manifest(manifest)
+
     # --discover-only: exit after building manifest
     if args.discover_only:
         from manifest import save_manifest
         save_manifest(manifest, output_dir)
         print(f"Discovery complete. {discovered} articles in manifest.")
         print(f"Manifest saved to: {output_dir / 'manifest.json'}")
+        if profiler is not None:
+            print(profiler.format_summary())
         return EXIT_SUCCESS
 
+    # In-progress entries of workers that exited or whose lease ran out
+    from manifest import reclaim_expired_leases
+    from workqueue import worker_gone
+
+    reclaimed = reclaim_expired_leases(manifest, is_gone=worker_gone)
+    if reclaimed:
+        print(f"Reclaimed {len(reclaimed)} in-progress articles from stopped workers.")
+
     # --force: reset all entries to pending
-    if args.force:
+    if args.force and not node:
         from manifest import reset_all_to_pending, save_manifest
         reset_count = reset_all_to_pending(manifest)
         save_manifest(manifest, output_dir)
         if args.verbose:
             logging.info("--force: reset %d entries to pending", reset_count)
 
+    if args.publish:
+        return _run_publish_mode(args, manifest, output_dir)
+
+    work_queue = None
+    if queue_path is not None:
+        from workqueue import WorkQueue
+
+        work_queue = WorkQueue(queue_path, worker_id=args.worker_id, lease_seconds=args.lease)
+
     # --- Phase 2: Scrape + images (T029) ---
-    success, failure = run_scrape_phase(
-        manifest,
-        output_dir,
-        delay=args.delay,
-        limit=args.limit,
-        verbose=args.verbose,
-        force=args.force,
-        sort_direction=args.sort,
-        year_filter=args.year,
-        month_filter=args.month,
-    )
+    metrics, metrics_server = _start_metrics(args)
+    tracer = _open_tracer(args)
+    throttle = _make_throttle(args, workers, image_workers)
+    try:
+        with _profile_phase(profiler, "scrape"):
+            success, failure = run_scrape_phase(
+                manifest,
+                output_dir,
+                delay=args.delay,
+                limit=args.limit,
+                verbose=args.verbose,
+                force=args.force,
+                sort_direction=args.sort,
+                year_filter=args.year,
+                month_filter=args.month,
+                image_workers=image_workers,
+                output_format=args.output_format,
+                compression=args.compression,
+                db_path=_resolve_db_path(args),
+                metrics=metrics,
+                tracer=tracer,
+                throttle=throttle,
+                workers=workers,
+                priority=args.priority,
+                requeue=max(0, args.requeue),
+                work_queue=work_queue,
+                worker_id=args.worker_id,
+                lease_seconds=args.lease,
+            )
+    finally:
+        if metrics_server is not None:
+            metrics_server.shutdown()
+            metrics_server.server_close()
+        if tracer is not None:
+            tracer.close()
 
     _print_summary(manifest, success, failure)
+    if tracer is not None:
+        _print_trace_summary(tracer)
+    if throttle is not None:
+        _print_throttle_summary(throttle)
+    retry_summary = retry.default_policy().summary()
+    if retry_summary is not None:
+        print(retry_summary)
+    breaker_summary = breaker.summary() if breaker is not None else None
+    if breaker_summary is not None:
+        print(breaker_summary)
+    if work_queue is not None:
+        _print_queue_summary(work_queue)
+        work_queue.close()
+    if profiler is not None:
+        print(profiler.format_summary())
 
     return _exit_code(success, failure)
 
 
+def _run_publish_mode(args, manifest, output_dir: Path) -> int:
+    """
+    Handle --publish: put the pending entries (after --year/--month/--limit,
+    in --sort or --priority order) on the shared --queue for the nodes.
+    """
+    from manifest import save_manifest
+    from workqueue import WorkQueue
+
+    pending, scores = _ordered_pending(
+        manifest, args.limit, args.sort, args.year, args.month,
+        priority=args.priority, db_path=_resolve_db_path(args),
+    )
+    work_queue = WorkQueue(args.queue)
+    try:
+        added = work_queue.publish((e.slug, e.url, scores[e.slug]) for e in pending)
+        outstanding = work_queue.outstanding()
+    finally:
+        work_queue.close()
+    save_manifest(manifest, output_dir)
+    print(f"Published {added} new articles to {args.queue} ({outstanding} outstanding).")
+    return EXIT_SUCCESS
+
+
+def _print_queue_summary(work_queue) -> None:
+    """One line on the shared queue after a --queue run."""
+    from workqueue import DONE, FAILED, LEASED, QUEUED
+
+    counts = work_queue.counts()
+    line = ", ".join(f"{counts.get(state, 0)} {state}" for state in (QUEUED, LEASED, DONE, FAILED))
+    if work_queue.reclaimed:
+        line += f"; reclaimed {work_queue.reclaimed} expired leases"
+    print(f"Work queue [{work_queue.worker_id}]: {line}")
+
+
+def _run_images_only_mode(args, output_dir: Path, image_workers: int) -> int:
+    """
+    Handle --images-only: seed the image backlog from the manifest and drain
+    it with backoff.  Articles are never re-fetched.
+    """
+    from image_queue import (
+        apply_image_queue_result,
+        drain_image_queue,
+        load_image_queue,
+        save_image_queue,
+        seed_image_queue,
+    )
+    from manifest import load_manifest, save_manifest
+
+    manifest = load_manifest(output_dir)
+    queue = load_image_queue(output_dir)
+    added = seed_image_queue(queue, manifest, output_dir, db_path=_resolve_db_path(args))
+    if args.verbose:
+        logging.info("Image backlog: %d outstanding (%d newly queued)", len(queue.tasks), added)
+
+    result = drain_image_queue(queue, output_dir, workers=image_workers, delay=args.delay)
+    apply_image_queue_result(manifest, queue, result)
+    save_image_queue(queue, output_dir)
+    save_manifest(manifest, output_dir)
+
+    print(
+        f"Images downloaded: {result.downloaded}  "
+        f"retries: {result.retries}  still outstanding: {result.remaining}"
+    )
+    return _exit_code(result.downloaded, result.remaining)
+
+
+def _run_build_variants_mode(args, output_dir: Path, workers: int) -> int:
+    """Handle --build-variants: render width variants for ``output_dir/images/``."""
+    from variants import build_variants
+
+    try:
+        result = build_variants(output_dir, workers=workers)
+    except RuntimeError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return EXIT_FATAL
+
+    print(
+        f"Variants built for {result.slugs} articles: "
+        f"{result.rendered} rendered, {result.skipped} unchanged, {result.failed} failed."
+    )
+    return _exit_code(result.rendered + result.skipped, result.failed)
+
+
 def _run_single_article_mode(args, output_dir: Path) -> int:
     """
     Handle --article mode: scrape a single article by slug or URL.
@@ -496,7 +1454,7 @@ def _run_single_article_mode(args, output_dir: Path) -> int:
             logging.info("Single-article mode (URL): %s", url)
 
         # Create a minimal manifest with just this entry
-        manifest = load_manifest(output_dir)
+        manifest = load_manifest(output_dir, lazy=True)
         if slug not in manifest.entries:
             from manifest import add_entry
             add_entry(manifest, url, slug)
@@ -506,10 +1464,10 @@ def _run_single_article_mode(args, output_dir: Path) -> int:
         if args.verbose:
             logging.info("Single-article mode (slug): %s", slug)
 
-        manifest = load_manifest(output_dir)
+        manifest = load_manifest(output_dir, lazy=True)
         if not manifest.entries:
             # Manifest is empty — need discovery first
-            manifest = run_discovery_phase(output_dir, delay=args.delay, verbose=args.verbose)
+            manifest = run_discovery_phase(output_dir, delay=args.delay, verbose=args.verbose, base_url=args.base_url)
 
         url = lookup_slug(manifest, slug)  # exits 2 if not found
 
@@ -524,9 +1482,26 @@ def _run_single_article_mode(args, output_dir: Path) -> int:
         entry.status = ScrapeStatus.PENDING
         entry.scraped_at = None
 
-    fetcher = _make_fetcher(args.delay)
-    ok = process_article(entry, output_dir, manifest, fetcher, args.delay, args.verbose, args.force)
+    from retry import default_policy
+    from sinks import open_sink
+
+    fetcher = default_policy().fetcher(_make_fetcher(args.delay))
+    sink = open_sink(
+        output_dir, args.output_format, compression=args.compression, db_path=_resolve_db_path(args)
+    )
+    tracer = _open_tracer(args)
+    try:
+        ok = process_article(
+            entry, output_dir, manifest, fetcher, args.delay, args.verbose, args.force,
+            sink=sink, tracer=tracer,
+        )
+    finally:
+        sink.close()
+        if tracer is not None:
+            tracer.close()
     save_manifest(manifest, output_dir)
+    if tracer is not None:
+        _print_trace_summary(tracer)
 
     if ok:
         print(f"Successfully scraped: {slug}")
@@ -0,0 +1,496 @@
+"""
+sinks.py — Article output sinks.
+
+The scraper writes every ``ArticleData`` through a sink:
+
+- ``JsonFileSink``   — one pretty-printed ``articles/<slug>.json`` per article
+                       (default; what ``readLocalScrapedArticle`` reads)
+- ``JsonlCorpusSink`` — appends compact JSON lines to rotating, optionally
+                       compressed shards under ``corpus/`` with a
+                       slug → (shard, offset, length) index
+- ``SqliteStagingSink`` — upserts rows into the ``scraped_articles`` staging
+                       table of the app database (``data/cinema.db``) in
+                       batched transactions
+
+Corpus layout::
+
+    corpus/
+    ├── articles-00000.jsonl.gz   # one gzip member (or zstd frame) per record
+    ├── articles-00001.jsonl.gz
+    └── index.jsonl               # {"slug", "shard", "offset", "length"} per write
+
+Each record is compressed independently, so a shard is still a normal
+``.jsonl.gz`` / ``.jsonl.zst`` for streaming readers (``zcat``, ``zstdcat``)
+while a single article can be read by seeking to its offset.  Later index
+lines override earlier ones for the same slug.
+
+Usage:
+    from sinks import open_sink, read_article
+    sink = open_sink(output_dir, "jsonl", compression="gzip")   # or "sqlite"
+    sink.write(slug, article)
+    sink.close()
+    data = read_article(output_dir, slug)   # dict | None, any format
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from models import ArticleData
+from serialize import dump_model
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+CORPUS_DIRNAME = "corpus"
+INDEX_FILENAME = "index.jsonl"
+
+COMPRESSIONS = ("gzip", "zstd", "none")
+_SUFFIXES = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst", "none": ".jsonl"}
+
+_DEFAULT_SHARD_BYTES = 64 * 1024 * 1024
+
+STAGING_TABLE = "scraped_articles"
+_DEFAULT_BATCH_SIZE = 200
+
+# Keep in sync with data/schema.sql and the 20261019_scraped_articles_staging
+# migration in src/lib/db/index.ts.
+STAGING_DDL = f"""
+CREATE TABLE IF NOT EXISTS {STAGING_TABLE} (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    slug TEXT UNIQUE NOT NULL,
+    title_en TEXT NOT NULL,
+    content TEXT NOT NULL,
+    author TEXT,
+    category TEXT NOT NULL,
+    tags TEXT,
+    featured_image TEXT,
+    inline_images TEXT,
+    movie_titles TEXT,
+    source_url TEXT NOT NULL,
+    source_site TEXT DEFAULT 'tasteofcinema.com',
+    page_count INTEGER DEFAULT 1,
+    scraped_at DATETIME,
+    staged_at DATETIME DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+_UPSERT_SQL = f"""
+INSERT INTO {STAGING_TABLE} (
+    slug, title_en, content, author, category, tags, featured_image,
+    inline_images, movie_titles, source_url, page_count, scraped_at
+) VALUES (
+    :slug, :title_en, :content, :author, :category, :tags, :featured_image,
+    :inline_images, :movie_titles, :source_url, :page_count, :scraped_at
+)
+ON CONFLICT(slug) DO UPDATE SET
+    title_en = excluded.title_en,
+    content = excluded.content,
+    author = excluded.author,
+    category = excluded.category,
+    tags = excluded.tags,
+    featured_image = excluded.featured_image,
+    inline_images = excluded.inline_images,
+    movie_titles = excluded.movie_titles,
+    source_url = excluded.source_url,
+    page_count = excluded.page_count,
+    scraped_at = excluded.scraped_at,
+    staged_at = CURRENT_TIMESTAMP
+"""
+
+
+# ---------------------------------------------------------------------------
+# Compression helpers
+# ---------------------------------------------------------------------------
+
+
+def _zstd():
+    try:
+        import zstandard  # type: ignore[import]
+    except ImportError as exc:
+        raise RuntimeError(
+            'zstd compression requires the zstandard package. Install with: pip install -e ".[corpus]"'
+        ) from exc
+    return zstandard
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if compression == "zstd":
+        return _zstd().ZstdCompressor(level=6).compress(data)
+    return data
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        return _zstd().ZstdDecompressor().decompress(data)
+    return data
+
+
+def _compression_for(shard_name: str) -> str:
+    for compression, suffix in _SUFFIXES.items():
+        if compression != "none" and shard_name.endswith(suffix):
+            return compression
+    return "none"
+
+
+# ---------------------------------------------------------------------------
+# One file per article (default)
+# ---------------------------------------------------------------------------
+
+
+class JsonFileSink:
+    """Write ``articles/<slug>.json`` — the original per-article layout."""
+
+    def __init__(self, output_dir: Path) -> None:
+        self.articles_dir = output_dir / "articles"
+
+    def path_for(self, slug: str) -> Path:
+        return self.articles_dir / f"{slug}.json"
+
+    def write(self, slug: str, article: ArticleData) -> Path:
+        self.articles_dir.mkdir(parents=True, exist_ok=True)
+        out_path = self.path_for(slug)
+        out_path.write_bytes(dump_model(article))
+        return out_path
+
+    def read(self, slug: str) -> dict | None:
+        try:
+            with self.path_for(slug).open("r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def close(self) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Rotating JSONL shards + index
+# ---------------------------------------------------------------------------
+
+
+def load_corpus_index(corpus_dir: Path) -> dict[str, tuple[str, int, int]]:
+    """Return ``slug → (shard, offset, length)`` from ``index.jsonl`` (last write wins)."""
+    index: dict[str, tuple[str, int, int]] = {}
+    index_path = corpus_dir / INDEX_FILENAME
+    if not index_path.exists():
+        return index
+    with index_path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                rec = json.loads(line)
+                index[rec["slug"]] = (rec["shard"], int(rec["offset"]), int(rec["length"]))
+            except (ValueError, KeyError, TypeError):
+                continue  # torn trailing line after a crash
+    return index
+
+
+def read_corpus_record(corpus_dir: Path, shard: str, offset: int, length: int) -> dict:
+    """Read and decode one record from a shard by offset."""
+    with (corpus_dir / shard).open("rb") as fh:
+        fh.seek(offset)
+        raw = fh.read(length)
+    return json.loads(_decompress(raw, _compression_for(shard)))
+
+
+class JsonlCorpusSink:
+    """
+    Append articles to rotating JSONL shards under ``output_dir/corpus/``.
+
+    A new shard is started once the current one reaches *shard_max_bytes*.
+    The record is flushed to its shard before its index line is appended,
+    so the index never points at bytes that were not written; on open, any
+    unindexed tail left in the last shard by a crash is truncated away.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        *,
+        compression: str = "gzip",
+        shard_max_bytes: int = _DEFAULT_SHARD_BYTES,
+    ) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"unknown compression {compression!r} (expected one of {COMPRESSIONS})")
+        if compression == "zstd":
+            _zstd()  # fail fast when the optional dependency is missing
+        self.corpus_dir = output_dir / CORPUS_DIRNAME
+        self.compression = compression
+        self.shard_max_bytes = shard_max_bytes
+        self.index = load_corpus_index(self.corpus_dir)
+        self._lock = threading.Lock()
+        self._shard_no = self._last_shard_no()
+        self._shard_open = ""  # name of the shard being appended to, once opened
+        self._shard_fh: BinaryIO | None = None
+        self._index_fh: TextIO | None = None
+
+    # -- shard bookkeeping --------------------------------------------------
+
+    def _shard_name(self, number: int) -> str:
+        return f"articles-{number:05d}{_SUFFIXES[self.compression]}"
+
+    def _last_shard_no(self) -> int:
+        numbers = [
+            int(p.name.split("-", 1)[1].split(".", 1)[0])
+            for p in self.corpus_dir.glob("articles-*.jsonl*")
+            if p.name.split("-", 1)[1].split(".", 1)[0].isdigit()
+        ]
+        return max(numbers, default=0)
+
+    def _open_shard(self) -> tuple[str, BinaryIO]:
+        self.corpus_dir.mkdir(parents=True, exist_ok=True)
+        name = self._shard_name(self._shard_no)
+        path = self.corpus_dir / name
+        if path.exists():
+            indexed_end = max(
+                (off + length for shard, off, length in self.index.values() if shard == name),
+                default=0,
+            )
+            if path.stat().st_size > indexed_end:
+                logger.warning("Truncating unindexed tail of %s at byte %d", path, indexed_end)
+                with path.open("r+b") as fh:
+                    fh.truncate(indexed_end)
+        return name, path.open("ab")
+
+    # -- sink interface -----------------------------------------------------
+
+    def write(self, slug: str, article: ArticleData) -> Path:
+        record = _compress(dump_model(article, pretty=False) + b"\n", self.compression)
+        with self._lock:
+            if self._shard_fh is None:
+                self._shard_open, self._shard_fh = self._open_shard()
+            shard_fh = self._shard_fh
+            if shard_fh.tell() > 0 and shard_fh.tell() + len(record) > self.shard_max_bytes:
+                shard_fh.close()
+                self._shard_no += 1
+                self._shard_open, shard_fh = self._open_shard()
+                self._shard_fh = shard_fh
+
+            offset = shard_fh.tell()
+            shard_fh.write(record)
+            shard_fh.flush()
+
+            if self._index_fh is None:
+                self._index_fh = (self.corpus_dir / INDEX_FILENAME).open("a", encoding="utf-8")
+            entry = {"slug": slug, "shard": self._shard_open, "offset": offset, "length": len(record)}
+            self._index_fh.write(json.dumps(entry) + "\n")
+            self._index_fh.flush()
+            self.index[slug] = (self._shard_open, offset, len(record))
+            return self.corpus_dir / self._shard_open
+
+    def read(self, slug: str) -> dict | None:
+        loc = self.index.get(slug)
+        if loc is None:
+            return None
+        with self._lock:
+            if self._shard_fh is not None:
+                self._shard_fh.flush()
+        try:
+            return read_corpus_record(self.corpus_dir, *loc)
+        except (OSError, ValueError):
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            for fh in (self._shard_fh, self._index_fh):
+                if fh is not None:
+                    fh.close()
+            self._shard_fh = None
+            self._index_fh = None
+
+
+# ---------------------------------------------------------------------------
+# SQLite staging table in the app database
+# ---------------------------------------------------------------------------
+
+
+def _staging_row(slug: str, article: ArticleData) -> dict:
+    return {
+        "slug": slug,
+        "title_en": article.title,
+        "content": article.content,
+        "author": article.author,
+        "category": article.category,
+        "tags": json.dumps(article.tags, ensure_ascii=False),
+        "featured_image": article.featured_image,
+        "inline_images": json.dumps(article.inline_images, ensure_ascii=False),
+        "movie_titles": json.dumps(article.movie_titles, ensure_ascii=False),
+        "source_url": article.url,
+        "page_count": article.pages_merged,
+        "scraped_at": article.scraped_at,
+    }
+
+
+def _article_from_row(row: sqlite3.Row) -> dict:
+    """Map a staging row back to the ``ArticleData`` JSON shape."""
+    return {
+        "title": row["title_en"],
+        "content": row["content"],
+        "author": row["author"] or "",
+        "url": row["source_url"],
+        "featured_image": row["featured_image"],
+        "inline_images": json.loads(row["inline_images"] or "[]"),
+        "movie_titles": json.loads(row["movie_titles"] or "[]"),
+        "category": row["category"],
+        "tags": json.loads(row["tags"] or "[]"),
+        "pages_merged": row["page_count"] or 1,
+        "scraped_at": row["scraped_at"] or "",
+    }
+
+
+def connect_app_db(db_path: Path) -> sqlite3.Connection:
+    """Open the app database with the same pragmas as ``src/lib/db/index.ts``."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(STAGING_DDL)
+    conn.commit()
+    return conn
+
+
+class SqliteStagingSink:
+    """
+    Upsert articles into ``scraped_articles`` in the app database.
+
+    Rows are buffered and written *batch_size* at a time with one
+    ``executemany`` of a single prepared upsert inside one transaction, so
+    a bulk run costs a handful of commits instead of one file per article.
+    The admin import selects from the table; ``slug`` is the conflict key.
+    """
+
+    def __init__(self, db_path: Path, *, batch_size: int = _DEFAULT_BATCH_SIZE) -> None:
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self._conn: sqlite3.Connection | None = connect_app_db(db_path)
+        self._pending: list[dict] = []
+        self._lock = threading.Lock()
+
+    def write(self, slug: str, article: ArticleData) -> Path:
+        with self._lock:
+            self._connection()  # fail now rather than buffer rows that are never written
+            self._pending.append(_staging_row(slug, article))
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+        return self.db_path
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise ValueError(f"staging sink for {self.db_path} is closed")
+        return self._conn
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        conn = self._connection()
+        with conn:  # one transaction per batch
+            conn.executemany(_UPSERT_SQL, self._pending)
+        self._pending.clear()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def read(self, slug: str) -> dict | None:
+        with self._lock:
+            self._flush()
+            row = self._connection().execute(
+                f"SELECT * FROM {STAGING_TABLE} WHERE slug = ?", (slug,)
+            ).fetchone()
+        return _article_from_row(row) if row is not None else None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._flush()
+            self._conn.close()
+            self._conn = None
+
+
+def read_staged_article(db_path: Path, slug: str) -> dict | None:
+    """Read one article from the staging table (``None`` if absent or no DB)."""
+    if not db_path.exists():
+        return None
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=30)
+    conn.row_factory = sqlite3.Row
+    try:
+        row = conn.execute(f"SELECT * FROM {STAGING_TABLE} WHERE slug = ?", (slug,)).fetchone()
+    except sqlite3.OperationalError:
+        return None  # table not created yet
+    finally:
+        conn.close()
+    return _article_from_row(row) if row is not None else None
+
+
+# ---------------------------------------------------------------------------
+# Factory + format-agnostic lookup
+# ---------------------------------------------------------------------------
+
+
+def default_db_path() -> Path:
+    """The Next.js app database: ``<repo>/data/cinema.db``."""
+    return (Path(__file__).parent.parent / "data" / "cinema.db").resolve()
+
+
+def open_sink(
+    output_dir: Path,
+    output_format: str = "json",
+    *,
+    compression: str = "gzip",
+    db_path: Path | None = None,
+):
+    """Return the sink for ``--output-format`` (``json`` | ``jsonl`` | ``sqlite``)."""
+    if output_format == "jsonl":
+        return JsonlCorpusSink(output_dir, compression=compression)
+    if output_format == "sqlite":
+        return SqliteStagingSink(db_path or default_db_path())
+    return JsonFileSink(output_dir)
+
+
+def read_article(
+    output_dir: Path,
+    slug: str,
+    *,
+    index: dict[str, tuple[str, int, int]] | None = None,
+    db_path: Path | None = None,
+) -> dict | None:
+    """
+    Look up a saved article by slug in any output format.
+
+    Tries ``articles/<slug>.json`` first, then the corpus index, then the
+    staging table when *db_path* is given.  Pass a preloaded *index*
+    (``load_corpus_index``) when looking up many slugs.
+    """
+    data = JsonFileSink(output_dir).read(slug)
+    if data is not None:
+        return data
+    corpus_dir = output_dir / CORPUS_DIRNAME
+    if index is None:
+        index = load_corpus_index(corpus_dir)
+    loc = index.get(slug)
+    if loc is not None:
+        try:
+            return read_corpus_record(corpus_dir, *loc)
+        except (OSError, ValueError, RuntimeError):
+            pass
+    if db_path is not None:
+        try:
+            return read_staged_article(db_path, slug)
+        except sqlite3.Error:
+            return None
+    return None
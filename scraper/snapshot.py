@@ -0,0 +1,317 @@
+"""
+snapshot.py — Read-only, memory-mappable manifest snapshot (``manifest.snap``).
+
+``manifest.json`` has to be read and parsed in full, while the scraper is
+rewriting it, just to answer "how far along is the run?".  Every
+``save_manifest`` therefore also publishes ``manifest.snap``: the query
+columns of the manifest as fixed-width little-endian arrays plus one string
+table, so a reader can ``mmap`` the file and look at counts, statuses or a
+single slug without parsing anything.
+
+Covers:
+- Writer: columns from :meth:`CompactEntries.export_columns` (the live
+  store when the manifest is compact), written to a temp file and renamed
+  over ``manifest.snap`` (atomic — a reader that already mapped the old
+  file keeps a consistent view of it); the per-article saves of a run are
+  throttled to one snapshot per ``SNAPSHOT_INTERVAL`` seconds
+- Reader: :class:`ManifestSnapshot` maps the file and exposes per-status
+  counts, row access, slug lookup (binary search over a sorted-order
+  column) and status scans
+
+File layout (little-endian, every section 8-byte aligned)::
+
+    header       magic "TOCSNAP1", version u32, rows u32, generated_at i64,
+                 status names (64 bytes, comma-separated, NUL-padded),
+                 per-status counts u32[8], section offsets u64[12]
+    last_modified     i64[rows]   epoch seconds; NO_DATE / BAD_DATE sentinels
+    scraped_at        i64[rows]
+    pages_found       u32[rows]
+    images_found      u32[rows]
+    images_downloaded u32[rows]
+    slug_offsets      u32[rows + 1]  byte offsets into the string table
+    slug_order        u32[rows]      rows sorted by slug (UTF-8 byte order)
+    year              u16[rows]      publication year from the URL, 0 = none
+    status            u8[rows]       index into the status names
+    images_status     u8[rows]
+    month             u8[rows]       last_modified month, 0 = none
+    strings           UTF-8 slugs, concatenated
+
+Usage:
+    from snapshot import ManifestSnapshot, write_snapshot
+    write_snapshot(manifest, output_dir)          # done by save_manifest
+    with ManifestSnapshot.open(output_dir) as snap:
+        snap.counts()                             # {"pending": 812, ...}
+        snap.status_of("the-10-best-films-of-1999")
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Literal
+
+from entry_store import BAD_DATE, NO_DATE, CompactEntries
+from models import Manifest, ScrapeStatus
+
+# ---------------------------------------------------------------------------
+# Format
+# ---------------------------------------------------------------------------
+
+SNAPSHOT_FILENAME = "manifest.snap"
+MAGIC = b"TOCSNAP1"
+VERSION = 2  # 2: status names widened to 64 bytes (``in_progress``)
+SNAPSHOT_INTERVAL = 1.0  # seconds between snapshots of per-article saves
+
+_MAX_STATUSES = 8
+_Typecode = Literal["q", "I", "H", "B"]
+# (section, array typecode) in file order — widest first keeps alignment
+_SECTIONS: tuple[tuple[str, _Typecode], ...] = (
+    ("last_modified", "q"),
+    ("scraped_at", "q"),
+    ("pages_found", "I"),
+    ("images_found", "I"),
+    ("images_downloaded", "I"),
+    ("slug_offsets", "I"),
+    ("slug_order", "I"),
+    ("year", "H"),
+    ("status", "B"),
+    ("images_status", "B"),
+    ("month", "B"),
+    ("strings", "B"),
+)
+_STATUS_NAMES = 64
+_HEADER = struct.Struct(f"<8sIIq{_STATUS_NAMES}s{_MAX_STATUSES}I{len(_SECTIONS)}Q")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+
+_last_written: dict[Path, float] = {}  # snapshot path → monotonic time of the last write
+
+
+def write_snapshot(manifest: Manifest, output_dir: Path, *, min_interval: float = 0.0) -> Path | None:
+    """
+    Publish the query columns of *manifest* as ``output_dir/manifest.snap``.
+
+    Written to a temp file first and renamed into place, so readers only
+    ever see a complete snapshot.  When the last snapshot of *output_dir*
+    is less than *min_interval* seconds old it is kept and None returned.
+    """
+    path = output_dir / SNAPSHOT_FILENAME
+    now = time.monotonic()
+    last = _last_written.get(path)
+    if min_interval > 0 and last is not None and now - last < min_interval:
+        return None
+
+    entries = manifest.entries
+    store = entries if isinstance(entries, CompactEntries) else CompactEntries.from_mapping(entries)
+    columns = store.export_columns()
+    slugs: list[str] = columns.pop("slugs")
+    n = len(slugs)
+
+    encoded = [slug.encode("utf-8") for slug in slugs]
+    offsets = array("I", [0])
+    total = 0
+    for raw in encoded:
+        total += len(raw)
+        offsets.append(total)
+    columns["slug_offsets"] = offsets
+    columns["slug_order"] = array("I", sorted(range(n), key=encoded.__getitem__))
+    columns["strings"] = b"".join(encoded)
+
+    statuses = tuple(ScrapeStatus)
+    names = ",".join(s.value for s in statuses).encode("ascii")
+    assert len(statuses) <= _MAX_STATUSES and len(names) <= _STATUS_NAMES, "snapshot header too small"
+    counts = [0] * _MAX_STATUSES
+    for code in range(len(statuses)):
+        counts[code] = columns["status"].count(code)
+
+    blobs: list[bytes] = []
+    section_offsets: list[int] = []
+    position = _align(_HEADER.size)
+    for name, _ in _SECTIONS:
+        column = columns[name]
+        if isinstance(column, array) and sys.byteorder != "little":
+            column = column[:]
+            column.byteswap()
+        blob = bytes(column)
+        section_offsets.append(position)
+        blobs.append(blob)
+        position = _align(position + len(blob))
+
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        n,
+        int(time.time()),
+        names,
+        *counts,
+        *section_offsets,
+    )
+    out = bytearray(position)
+    out[: len(header)] = header
+    for offset, blob in zip(section_offsets, blobs):
+        out[offset : offset + len(blob)] = blob
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(SNAPSHOT_FILENAME + ".tmp")
+    tmp_path.write_bytes(out)
+    os.replace(tmp_path, path)
+    _last_written[path] = now
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+
+class ManifestSnapshot:
+    """
+    A memory-mapped ``manifest.snap``.
+
+    Nothing is parsed up front: columns are ``memoryview`` casts over the
+    mapping.  Keep the object open only as long as needed — it pins the
+    snapshot it mapped, not the latest one.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        try:
+            fields = _HEADER.unpack_from(self._view)
+        except struct.error:
+            self.close()
+            raise ValueError(f"{path}: truncated snapshot header") from None
+        magic, version, rows, generated_at, names = fields[:5]
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a version {VERSION} manifest snapshot")
+        self.path = path
+        self.rows: int = rows
+        self.generated_at: int = generated_at
+        self.statuses: tuple[str, ...] = tuple(names.rstrip(b"\0").decode("ascii").split(","))
+        self._counts = fields[5 : 5 + len(self.statuses)]
+
+        offsets = fields[5 + _MAX_STATUSES :]
+        self._columns: dict[str, memoryview] = {}
+        for (name, typecode), start, end in zip(_SECTIONS, offsets, (*offsets[1:], len(self._view))):
+            if name == "strings":
+                self._columns[name] = self._view[start:end]
+                continue
+            length = rows + 1 if name == "slug_offsets" else rows
+            if name == "status":
+                self._status_span = (start, start + length)
+            size = length * array(typecode).itemsize
+            self._columns[name] = self._view[start : start + size].cast(typecode)
+
+    @classmethod
+    def open(cls, output_dir: Path) -> "ManifestSnapshot | None":
+        """Map ``output_dir/manifest.snap``, or return None if none was published."""
+        path = output_dir / SNAPSHOT_FILENAME
+        if not path.exists():
+            return None
+        return cls(path)
+
+    def close(self) -> None:
+        for column in getattr(self, "_columns", {}).values():
+            column.release()
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "ManifestSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.rows
+
+    # -- queries ------------------------------------------------------------
+
+    def counts(self) -> dict[str, int]:
+        """Entries per article status (precomputed in the header)."""
+        return dict(zip(self.statuses, self._counts))
+
+    def column(self, name: str) -> memoryview:
+        """Raw fixed-width column (see the file layout in the module docstring)."""
+        return self._columns[name]
+
+    def slug(self, row: int) -> str:
+        offsets = self._columns["slug_offsets"]
+        return bytes(self._columns["strings"][offsets[row] : offsets[row + 1]]).decode("utf-8")
+
+    def find(self, slug: str) -> int | None:
+        """Row of *slug* (binary search over ``slug_order``), or None."""
+        target = slug.encode("utf-8")
+        order, offsets, strings = (
+            self._columns["slug_order"],
+            self._columns["slug_offsets"],
+            self._columns["strings"],
+        )
+        lo, hi = 0, self.rows
+        while lo < hi:
+            mid = (lo + hi) // 2
+            row = order[mid]
+            if bytes(strings[offsets[row] : offsets[row + 1]]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.rows:
+            row = order[lo]
+            if bytes(strings[offsets[row] : offsets[row + 1]]) == target:
+                return row
+        return None
+
+    def status(self, row: int) -> str:
+        return self.statuses[self._columns["status"][row]]
+
+    def status_of(self, slug: str) -> str | None:
+        row = self.find(slug)
+        return None if row is None else self.status(row)
+
+    def select(self, status: str) -> Iterator[int]:
+        """Rows (manifest order) whose article status is *status*."""
+        needle = bytes([self.statuses.index(status)])
+        start, end = self._status_span
+        pos = self._mmap.find(needle, start, end)
+        while pos != -1:
+            yield pos - start
+            pos = self._mmap.find(needle, pos + 1, end)
+
+    def entry(self, row: int) -> dict:
+        """
+        One row as a dict.  Dates are epoch seconds (None when missing or
+        unparseable); ``year`` / ``month`` are None when unknown.
+        """
+        cols = self._columns
+        return {
+            "slug": self.slug(row),
+            "status": self.status(row),
+            "images_status": self.statuses[cols["images_status"][row]],
+            "last_modified": _epoch(cols["last_modified"][row]),
+            "scraped_at": _epoch(cols["scraped_at"][row]),
+            "year": cols["year"][row] or None,
+            "month": cols["month"][row] or None,
+            "pages_found": cols["pages_found"][row],
+            "images_found": cols["images_found"][row],
+            "images_downloaded": cols["images_downloaded"][row],
+        }
+
+
+def _epoch(value: int) -> int | None:
+    return None if value in (NO_DATE, BAD_DATE) else value
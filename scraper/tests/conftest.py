@@ -5,6 +5,7 @@ Provides:
 - mock sitemap XML responses
 - mock article HTML (single-page and multi-page)
 - temp output directories
+- a fresh retry policy per test
 """
 
 from __future__ import annotations
@@ -28,6 +29,16 @@ def output_dir(tmp_path: Path) -> Path:
     return out
 
 
+@pytest.fixture(autouse=True)
+def fresh_retry_policy():
+    """Each test starts with a default retry policy (fresh budget, ``--max-retries`` unset)."""
+    import retry
+
+    retry.configure()
+    yield
+    retry.configure()
+
+
 # ---------------------------------------------------------------------------
 # Sitemap XML fixtures
 # ---------------------------------------------------------------------------
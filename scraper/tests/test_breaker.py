@@ -0,0 +1,172 @@
+"""
+test_breaker.py — Unit tests for breaker.py (per-host circuit breaker).
+
+Tests: opens after consecutive outage errors only (not 404 / 429 or local
+disk errors, reset by a success), blocks other threads until one probe succeeds, a failed probe
+re-opens with a longer interval, gives up after ``max_outage``, the retry
+policy waits on it, and end-to-end runs against the mock site where an
+outage leaves articles pending (re-queued and completed) instead of failed.
+"""
+
+from __future__ import annotations
+
+import email.message
+import errno
+import sys
+import threading
+import time
+import urllib.error
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import scraper.scraper as scraper_module
+from breaker import BreakerConfig, CircuitBreaker, CircuitOpenError
+from manifest import load_manifest
+from mock_site import MockSite, SiteConfig
+from models import ScrapeStatus
+from retry import RetryConfig, RetryPolicy
+
+URL = "https://www.tasteofcinema.com/2020/some-article/"
+
+
+def _http_error(code: int) -> urllib.error.HTTPError:
+    return urllib.error.HTTPError(URL, code, "error", email.message.Message(), None)
+
+
+def _trip(breaker: CircuitBreaker, n: int) -> None:
+    for _ in range(n):
+        breaker.before(URL)
+        breaker.record(URL, _http_error(503))
+
+
+# ---------------------------------------------------------------------------
+# Breaker
+# ---------------------------------------------------------------------------
+
+
+def test_opens_after_consecutive_outage_errors_only() -> None:
+    breaker = CircuitBreaker(BreakerConfig(failure_threshold=3))
+    _trip(breaker, 2)
+    breaker.record(URL, None)  # success resets the run
+    _trip(breaker, 2)
+    for exc in (_http_error(404), _http_error(429)):
+        breaker.record(URL, exc)  # the host answered
+    _trip(breaker, 2)
+    assert breaker.is_closed(URL)
+
+    breaker.record(URL, ConnectionResetError())
+    assert not breaker.is_closed(URL)
+    assert breaker.is_closed("https://other.example/")
+    assert breaker.snapshot()["www.tasteofcinema.com"]["trips"] == 1
+
+
+def test_local_os_errors_are_not_outages() -> None:
+    breaker = CircuitBreaker(BreakerConfig(failure_threshold=3))
+    policy = RetryPolicy(RetryConfig(max_retries=0), breaker=breaker)
+
+    def disk_full() -> bytes:
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    for _ in range(3):
+        with pytest.raises(OSError):
+            policy.call(URL, disk_full)
+    breaker.record(URL, PermissionError("denied"))
+    assert breaker.is_closed(URL)
+
+
+def test_open_breaker_blocks_until_a_probe_succeeds() -> None:
+    breaker = CircuitBreaker(BreakerConfig(failure_threshold=1, probe_interval=0.1))
+    _trip(breaker, 1)
+    opened = time.monotonic()
+
+    breaker.before(URL)  # becomes the probe once the interval has passed
+    assert time.monotonic() - opened >= 0.09
+
+    released: list[float] = []
+    waiter = threading.Thread(target=lambda: (breaker.before(URL), released.append(time.monotonic())))
+    waiter.start()
+    time.sleep(0.1)
+    assert released == []  # the probe is still in flight
+    breaker.record(URL, None)
+    waiter.join(timeout=2)
+    assert released and breaker.is_closed(URL)
+
+
+def test_failed_probe_reopens_with_longer_interval() -> None:
+    breaker = CircuitBreaker(BreakerConfig(failure_threshold=1, probe_interval=0.05, max_probe_interval=0.5))
+    _trip(breaker, 1)
+    started = time.monotonic()
+    breaker.before(URL)
+    breaker.record(URL, TimeoutError("timed out"))  # probe failed: wait 0.1 now
+    breaker.before(URL)
+    assert time.monotonic() - started >= 0.14
+    assert not breaker.is_closed(URL)
+
+
+def test_gives_up_after_max_outage() -> None:
+    breaker = CircuitBreaker(BreakerConfig(failure_threshold=1, probe_interval=10, max_outage=0.1))
+    _trip(breaker, 1)
+    with pytest.raises(CircuitOpenError):
+        breaker.before(URL)
+    assert breaker.gave_up(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before(URL)
+
+
+def test_retry_policy_waits_on_breaker() -> None:
+    breaker = CircuitBreaker(BreakerConfig(failure_threshold=2, probe_interval=0.05))
+    policy = RetryPolicy(RetryConfig(max_retries=5, base_delay=0.001), breaker=breaker)
+    errors = [_http_error(502), _http_error(502), _http_error(502)]
+
+    def attempt() -> bytes:
+        if errors:
+            raise errors.pop(0)
+        return b"ok"
+
+    started = time.monotonic()
+    assert policy.call(URL, attempt) == b"ok"
+    assert time.monotonic() - started >= 0.09  # two probe intervals (0.05, then 0.1)
+    assert breaker.is_closed(URL)
+
+
+# ---------------------------------------------------------------------------
+# End to end
+# ---------------------------------------------------------------------------
+
+OUTAGE = SiteConfig(articles=8, per_sitemap=10, max_pages=1, images_per_page=1, page_kb=2, image_kb=1,
+                    retry_after=None, outage_start=8, outage_length=6)
+
+
+def _run(output_dir: Path, config: SiteConfig, *extra: str) -> tuple[int, Counter]:
+    with MockSite(config) as site:
+        code = scraper_module.main([
+            "--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0",
+            "--max-retries", "0", "--requeue", "0", "--breaker-probe", "0.05", *extra,
+        ])
+    manifest = load_manifest(output_dir)
+    return code, Counter(e.status for e in manifest.entries.values())
+
+
+def test_outage_pauses_crawl_instead_of_failing_articles(output_dir: Path, capsys) -> None:
+    code, statuses = _run(output_dir, OUTAGE, "--breaker-threshold", "3")
+    assert code == 0 and statuses == {ScrapeStatus.COMPLETED: 8}
+    assert "Circuit breaker [127.0.0.1:" in capsys.readouterr().out
+
+
+def test_outage_without_breaker_fails_articles(output_dir: Path) -> None:
+    code, statuses = _run(output_dir, OUTAGE, "--breaker-threshold", "0")
+    assert code == 1 and statuses[ScrapeStatus.FAILED] > 0
+
+
+def test_long_outage_stops_run_with_articles_pending(output_dir: Path, capsys) -> None:
+    config = SiteConfig(articles=6, per_sitemap=10, max_pages=1, images_per_page=1, page_kb=2, image_kb=1,
+                        retry_after=None, outage_start=6, outage_length=10_000)
+    code, statuses = _run(output_dir, config, "--breaker-threshold", "2", "--max-outage", "0.3")
+    assert code == 1
+    assert ScrapeStatus.FAILED not in statuses and statuses[ScrapeStatus.PENDING] > 0
+    assert "Origin unreachable; stopping" in capsys.readouterr().out
@@ -0,0 +1,222 @@
+"""
+test_entry_store.py — Unit tests for the compact manifest entry store.
+
+Tests: lossless round-trip (odd URLs/dates, images, errors), live entries
+stay authoritative, sort/filter parity with the pydantic path, status
+counts, derived year/month columns, date index maintenance, save/load
+through manifest.py.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from entry_store import CompactEntries
+from manifest import (
+    compact_manifest,
+    extract_month_from_lastmod,
+    extract_year_from_url,
+    get_pending_entries,
+    get_sorted_entries,
+    load_manifest,
+    save_manifest,
+    update_entry_status,
+)
+from models import ImageInfo, Manifest, ManifestEntry, ScrapeStatus
+
+BASE = "https://www.tasteofcinema.com"
+
+
+def _entries() -> list[ManifestEntry]:
+    return [
+        ManifestEntry(url=f"{BASE}/2022/a/", slug="a", last_modified="2022-06-15T10:00:00+00:00"),
+        ManifestEntry(url=f"{BASE}/2024/b/", slug="b", last_modified="2024-03-20T14:30:00-08:00"),
+        ManifestEntry(url=f"{BASE}/2023/c/", slug="c", last_modified=None),
+        ManifestEntry(url=f"{BASE}/2023/d/", slug="d", last_modified="not a date"),
+        ManifestEntry(url=f"{BASE}/2021/e/", slug="e", last_modified="2021-01-02T03:04:05"),
+        ManifestEntry(url=f"{BASE}/2024/b-dup/", slug="f", last_modified="2024-03-20T22:30:00Z"),
+        ManifestEntry(
+            url=f"{BASE}/2020/g/",
+            slug="g",
+            status=ScrapeStatus.COMPLETED,
+            images_status=ScrapeStatus.FAILED,
+            last_modified="2020-05-05T05:05:05.250+05:30",
+            scraped_at="2026-02-28T14:32:11Z",
+            error="timeout",
+            pages_found=3,
+            images_found=2,
+            images_downloaded=1,
+            images=[ImageInfo(file="00-thumbnail.jpg", format="jpeg", width=800, height=None)],
+        ),
+        ManifestEntry(url=f"{BASE}/2019/h/", slug="h", status=ScrapeStatus.FAILED, scraped_at="2026-02-28 10:00",
+                      failures=2),
+        ManifestEntry(url=f"{BASE}/2018/i/", slug="i", status=ScrapeStatus.IN_PROGRESS,
+                      last_modified="2018-01-01T00:00:00+00:00", worker="host-a-41", lease_until=1_790_000_000.5),
+    ]
+
+
+def _manifest() -> Manifest:
+    return Manifest(
+        discovered_at="2026-01-01T00:00:00Z",
+        total=0,
+        entries={e.slug: e for e in _entries()},
+    )
+
+
+def test_round_trip_is_lossless() -> None:
+    store = CompactEntries.from_mapping({e.slug: e for e in _entries()})
+
+    assert store.materialize() == {e.slug: e for e in _entries()}
+    assert store.live == len(store)
+
+
+def test_from_raw_dicts_without_models() -> None:
+    raw = {e.slug: e.model_dump(mode="json") for e in _entries()}
+    store = CompactEntries.from_mapping(raw)
+
+    assert store.live == 0
+    assert store.to_jsonable() == raw
+    assert store.status_of("g") == ScrapeStatus.COMPLETED
+    assert store.live == 0
+
+
+def test_live_entries_are_authoritative() -> None:
+    store = CompactEntries.from_mapping({e.slug: e for e in _entries()})
+    entry = store["a"]
+    entry.status = ScrapeStatus.COMPLETED
+
+    assert store.status_of("a") == ScrapeStatus.COMPLETED
+    assert "a" not in [s for s in store.sorted_slugs(statuses={ScrapeStatus.PENDING})]
+    assert store.to_jsonable()["a"] is entry
+
+    store.pack()
+    assert store.live == 0
+    assert store["a"].status == ScrapeStatus.COMPLETED
+    assert store["a"] is not entry
+
+
+def test_setitem_and_delete() -> None:
+    store = CompactEntries()
+    store["x"] = ManifestEntry(url="https://other.example/x?id=1", slug="x")
+    store["y"] = ManifestEntry(url=f"{BASE}/2024/y/", slug="y")
+    store.pack()
+    del store["x"]
+
+    assert list(store) == ["y"]
+    assert len(store) == 1
+    assert "x" not in store
+    store["x"] = ManifestEntry(url="https://other.example/x?id=1", slug="x")
+    store.pack()
+    assert store["x"].url == "https://other.example/x?id=1"
+
+
+def test_status_counts_include_live_and_deleted() -> None:
+    store = CompactEntries.from_mapping({e.slug: e.model_dump(mode="json") for e in _entries()})
+    store["a"].status = ScrapeStatus.FAILED
+    del store["g"]
+
+    counts = store.status_counts()
+    assert counts == {
+        ScrapeStatus.PENDING: 5, ScrapeStatus.COMPLETED: 0, ScrapeStatus.FAILED: 2, ScrapeStatus.IN_PROGRESS: 1,
+    }
+    assert counts == {s: list(store.statuses()).count(s) for s in ScrapeStatus}
+
+
+def test_invalid_status_rejected() -> None:
+    with pytest.raises(ValueError):
+        CompactEntries.from_mapping({"x": {"url": "u", "slug": "x", "status": "bogus"}})
+
+
+@pytest.mark.parametrize("direction", ["latest", "oldest"])
+@pytest.mark.parametrize("pending_only", [True, False])
+def test_sort_parity_with_pydantic_path(direction: str, pending_only: bool) -> None:
+    plain = _manifest()
+    compact = _manifest()
+    compact_manifest(compact)
+
+    expected = [e.slug for e in get_sorted_entries(plain, direction=direction, pending_only=pending_only)]
+    actual = [e.slug for e in get_sorted_entries(compact, direction=direction, pending_only=pending_only)]
+    assert actual == expected
+
+
+def test_pending_parity() -> None:
+    compact = _manifest()
+    compact_manifest(compact)
+    assert [e.slug for e in get_pending_entries(compact)] == [
+        e.slug for e in get_pending_entries(_manifest())
+    ]
+
+
+def test_compact_save_load(output_dir: Path) -> None:
+    manifest = _manifest()
+    compact_manifest(manifest)
+    update_entry_status(manifest, "a", ScrapeStatus.COMPLETED)
+    save_manifest(manifest, output_dir)
+
+    assert (manifest.total, manifest.completed, manifest.failed) == (9, 2, 1)
+    loaded = load_manifest(output_dir, compact=True)
+    assert isinstance(loaded.entries, CompactEntries)
+    assert loaded.entries.live == 0
+    assert loaded.entries["g"] == _manifest().entries["g"]
+    assert load_manifest(output_dir).entries["a"].status == ScrapeStatus.COMPLETED
+
+
+def test_compact_save_packs_and_keeps_store(output_dir: Path) -> None:
+    import serialize
+
+    manifest = _manifest()
+    store = compact_manifest(manifest)
+    update_entry_status(manifest, "a", ScrapeStatus.COMPLETED)
+    assert store.live == 1
+    backend = serialize.current_backend()
+    serialize.configure(backend="pydantic")
+    try:
+        save_manifest(manifest, output_dir)
+    finally:
+        serialize.configure(backend=backend)
+
+    assert manifest.entries is store and store.live == 0
+    assert store["a"].status == ScrapeStatus.COMPLETED
+    assert load_manifest(output_dir).entries["a"].status == ScrapeStatus.COMPLETED
+
+
+# ---------------------------------------------------------------------------
+# Derived columns + date index
+# ---------------------------------------------------------------------------
+
+
+def test_year_month_columns_match_extractors() -> None:
+    store = CompactEntries.from_mapping({e.slug: e for e in _entries()})
+    store.pack()
+    for i, entry in enumerate(_entries()):
+        assert store.year_of(i) == extract_year_from_url(entry.url)
+        assert store.month_of(i) == extract_month_from_lastmod(entry.last_modified)
+
+
+def test_date_index_kept_on_append() -> None:
+    manifest = _manifest()
+    store = compact_manifest(manifest)
+    store.sorted_slugs()  # builds the index
+    index = store.date_index()
+
+    store["new"] = ManifestEntry(url=f"{BASE}/2025/new/", slug="new", last_modified="2025-01-01T00:00:00Z")
+    store["old"] = ManifestEntry(url=f"{BASE}/2010/old/", slug="old", last_modified="2010-01-01T00:00:00Z")
+
+    assert store.date_index() is index
+    assert store.sorted_slugs()[0] == "new"
+    assert store.sorted_slugs(direction="oldest")[:2] == ["d", "old"]
+
+
+def test_date_index_follows_live_edits() -> None:
+    store = compact_manifest(_manifest())
+    assert store.sorted_slugs()[0] == "b"
+
+    store["a"].last_modified = "2030-01-01T00:00:00+00:00"
+
+    assert store.sorted_slugs()[0] == "a"
+    assert store.sorted_slugs(direction="oldest")[-2:] == ["c", "h"]  # undated stay last
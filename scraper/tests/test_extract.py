@@ -151,6 +151,43 @@ def test_pagination_loop_protection() -> None:
     assert len(pages) <= 3
 
 
+def test_map_pages_fetches_known_pages_in_one_batch() -> None:
+    """With map_pages every known page goes out in one batch; order and failures match the sequential path."""
+    base = "https://example.com/article/"
+    hrefs = [base] + [f"{base}{n}/" for n in range(2, 6)]
+    links = "".join(f'<a class="post-page-numbers" href="{href}">{n}</a>' for n, href in enumerate(hrefs, 1))
+
+    def page(n: int) -> bytes:
+        return (f'<html><body><h1 class="entry-title">Article</h1><div class="entry-content">'
+                f'<p>Page {n}</p>{links}</div></body></html>').encode()
+
+    def fake_fetcher(url: str) -> bytes:
+        n = int(url.rstrip("/").rsplit("/", 1)[-1]) if url != base else 1
+        if n == 3:
+            raise ConnectionResetError("reset")
+        return page(n)
+
+    batches: list[int] = []
+
+    def map_pages(tasks):
+        batches.append(len(tasks))
+        results = []
+        for task in reversed(tasks):  # finish out of order
+            try:
+                results.append(task())
+            except Exception as exc:  # noqa: BLE001
+                results.append(exc)
+        return results[::-1]
+
+    first = _parse_article_html(page(1), base)
+    split = fetch_all_pages(base, first, fetcher=fake_fetcher, delay=0, map_pages=map_pages)
+    sequential = fetch_all_pages(base, first, fetcher=fake_fetcher, delay=0)
+
+    assert batches == [4]
+    assert [p["content_parts"] for p in split] == [p["content_parts"] for p in sequential]
+    assert len(split) == 4  # page 3 failed
+
+
 # ---------------------------------------------------------------------------
 # Movie title extraction (T015)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,216 @@
+"""
+test_image_queue.py — Unit tests for the persistent image backlog queue.
+
+Tests: seeding from manifest + article JSON, persistence round-trip,
+drain success, backoff scheduling, give-up after max attempts, one
+request per attempt (no nested retries),
+manifest images_status settlement, --images-only CLI mode.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from image_queue import (
+    apply_image_queue_result,
+    drain_image_queue,
+    load_image_queue,
+    retry_delay,
+    save_image_queue,
+    seed_image_queue,
+)
+from models import ImageQueue, Manifest, ManifestEntry, ScrapeStatus
+
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x20\x00\x00\x00\x10\x08\x02\x00\x00\x00"
+
+
+def _setup_article(output_dir: Path, slug: str, inline: list[str]) -> Manifest:
+    articles = output_dir / "articles"
+    articles.mkdir(parents=True, exist_ok=True)
+    (articles / f"{slug}.json").write_text(
+        json.dumps({"featured_image": "https://example.com/thumb.png", "inline_images": inline}),
+        encoding="utf-8",
+    )
+    entry = ManifestEntry(
+        url=f"https://example.com/{slug}/",
+        slug=slug,
+        status=ScrapeStatus.COMPLETED,
+        images_status=ScrapeStatus.FAILED,
+    )
+    return Manifest(discovered_at="2026-02-28T00:00:00Z", total=1, entries={slug: entry})
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_seed_queues_only_missing_files(output_dir: Path) -> None:
+    manifest = _setup_article(output_dir, "art", ["https://example.com/a.png", "https://example.com/b.png"])
+    img_dir = output_dir / "images" / "art"
+    img_dir.mkdir(parents=True)
+    (img_dir / "00-thumbnail.png").write_bytes(PNG)
+
+    queue = ImageQueue()
+    added = seed_image_queue(queue, manifest, output_dir)
+
+    assert added == 2
+    assert sorted(queue.tasks) == ["art/01-a.png", "art/02-b.png"]
+    assert queue.tasks["art/01-a.png"].index == 1
+    entry = manifest.entries["art"]
+    assert entry.images_status == ScrapeStatus.PENDING
+    assert entry.images_downloaded == 1
+
+
+def test_seed_is_idempotent_and_keeps_attempts(output_dir: Path) -> None:
+    manifest = _setup_article(output_dir, "art", ["https://example.com/a.png"])
+    queue = ImageQueue()
+    seed_image_queue(queue, manifest, output_dir)
+    queue.tasks["art/01-a.png"].attempts = 3
+
+    assert seed_image_queue(queue, manifest, output_dir) == 0
+    assert queue.tasks["art/01-a.png"].attempts == 3
+
+
+def test_seed_marks_complete_when_nothing_missing(output_dir: Path) -> None:
+    manifest = _setup_article(output_dir, "art", [])
+    img_dir = output_dir / "images" / "art"
+    img_dir.mkdir(parents=True)
+    (img_dir / "00-thumbnail.png").write_bytes(PNG)
+
+    queue = ImageQueue()
+    assert seed_image_queue(queue, manifest, output_dir) == 0
+    assert manifest.entries["art"].images_status == ScrapeStatus.COMPLETED
+
+
+def test_queue_round_trip(output_dir: Path) -> None:
+    manifest = _setup_article(output_dir, "art", ["https://example.com/a.png"])
+    queue = ImageQueue()
+    seed_image_queue(queue, manifest, output_dir)
+    save_image_queue(queue, output_dir)
+
+    loaded = load_image_queue(output_dir)
+    assert loaded.tasks.keys() == queue.tasks.keys()
+    assert load_image_queue(output_dir / "missing").tasks == {}
+
+
+def test_drain_downloads_and_settles_manifest(output_dir: Path) -> None:
+    manifest = _setup_article(output_dir, "art", ["https://example.com/a.png"])
+    queue = ImageQueue()
+    seed_image_queue(queue, manifest, output_dir)
+
+    result = drain_image_queue(queue, output_dir, workers=2, downloader=lambda url: PNG)
+    apply_image_queue_result(manifest, queue, result)
+
+    assert result.downloaded == 2
+    assert queue.tasks == {}
+    assert (output_dir / "images" / "art" / "01-a.png").read_bytes() == PNG
+    entry = manifest.entries["art"]
+    assert entry.images_status == ScrapeStatus.COMPLETED
+    assert entry.images_downloaded == 2
+
+
+def test_drain_retries_with_backoff(output_dir: Path) -> None:
+    manifest = _setup_article(output_dir, "art", [])
+    queue = ImageQueue()
+    seed_image_queue(queue, manifest, output_dir)
+    clock = _Clock()
+    calls = {"n": 0}
+
+    def flaky(url: str) -> bytes:
+        calls["n"] += 1
+        if calls["n"] < 3:
+            raise ConnectionResetError("connection reset")
+        return PNG
+
+    result = drain_image_queue(
+        queue, output_dir, downloader=flaky, clock=clock, sleep=clock.sleep
+    )
+
+    assert result.downloaded == 1
+    assert result.retries == 2
+    assert clock.slept == [retry_delay(1), retry_delay(2)]
+
+
+def test_drain_gives_up_after_max_attempts(output_dir: Path) -> None:
+    manifest = _setup_article(output_dir, "art", [])
+    queue = ImageQueue()
+    seed_image_queue(queue, manifest, output_dir)
+    clock = _Clock()
+
+    def always_fails(url: str) -> bytes:
+        raise ConnectionError("503")
+
+    result = drain_image_queue(
+        queue, output_dir, max_attempts=2, downloader=always_fails, clock=clock, sleep=clock.sleep
+    )
+    apply_image_queue_result(manifest, queue, result)
+
+    assert result.abandoned == 1
+    assert result.remaining == 1
+    task = queue.tasks["art/00-thumbnail.png"]
+    assert task.attempts == 2
+    assert task.last_error == "503"
+    assert manifest.entries["art"].images_status == ScrapeStatus.FAILED
+
+
+def test_drain_attempt_is_a_single_request(output_dir: Path, monkeypatch) -> None:
+    import urllib.request
+
+    manifest = _setup_article(output_dir, "art", [])
+    queue = ImageQueue()
+    seed_image_queue(queue, manifest, output_dir)
+    clock = _Clock()
+    requests: list[str] = []
+
+    def refused(req, timeout=None):
+        requests.append(req.full_url)
+        raise ConnectionRefusedError("refused")
+
+    monkeypatch.setattr(urllib.request, "urlopen", refused)
+    result = drain_image_queue(queue, output_dir, max_attempts=2, clock=clock, sleep=clock.sleep)
+
+    assert result.retries == 2
+    assert len(requests) == 2  # the drain's backoff is the only retry layer
+
+
+def test_retry_delay_is_capped() -> None:
+    assert retry_delay(1) == 5.0
+    assert retry_delay(2) == 10.0
+    assert retry_delay(20) == 300.0
+
+
+def test_images_only_mode_does_not_fetch_articles(output_dir: Path, monkeypatch) -> None:
+    import images
+    import scraper.scraper as scraper_module
+    from manifest import load_manifest, save_manifest
+
+    manifest = _setup_article(output_dir, "art", ["https://example.com/a.png"])
+    save_manifest(manifest, output_dir)
+
+    def fake_fetch(url: str, dest: Path, **_):
+        dest.write_bytes(PNG)
+        return images.probe_image(PNG)
+
+    monkeypatch.setattr(images, "_download_to_file", fake_fetch)
+    monkeypatch.setattr(scraper_module, "run_discovery_phase", pytest.fail)
+
+    code = scraper_module.main(["--images-only", "--delay", "0", "--output-dir", str(output_dir)])
+
+    assert code == 0
+    assert load_manifest(output_dir).entries["art"].images_status == ScrapeStatus.COMPLETED
+    assert load_image_queue(output_dir).tasks == {}
@@ -7,7 +7,10 @@ filename sanitization, thumbnail ordering (index-prefix).
 
 from __future__ import annotations
 
+import struct
 import sys
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -18,10 +21,23 @@ from images import (
     ImageDownloadResult,
     build_filename,
     download_article_images,
+    probe_image,
     sanitize_filename,
 )
 
 
+def _png(width: int = 640, height: int = 480) -> bytes:
+    """Minimal PNG header (signature + IHDR) — enough for the probe."""
+    return b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\rIHDR" + struct.pack(">II", width, height) + b"\x08\x02\x00\x00\x00"
+
+
+def _jpeg(width: int = 800, height: int = 600) -> bytes:
+    """Minimal JPEG header: SOI, an APP0 segment, then SOF0 with dimensions."""
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof0 = b"\xff\xc0" + struct.pack(">HBHHB", 11, 8, height, width, 1) + b"\x01\x11\x00"
+    return b"\xff\xd8" + app0 + sof0 + b"\x00" * 32
+
+
 # ---------------------------------------------------------------------------
 # Filename sanitization (T021)
 # ---------------------------------------------------------------------------
@@ -73,7 +89,7 @@ def test_download_article_images_success(output_dir: Path) -> None:
     """All images downloaded when downloader returns valid bytes."""
 
     def mock_downloader(url: str) -> bytes:
-        return b"fake-image-content"
+        return _jpeg()
 
     result = download_article_images(
         slug="test-article",
@@ -106,13 +122,13 @@ def test_download_skips_existing_images(output_dir: Path) -> None:
     img_dir = output_dir / "images" / "my-article"
     img_dir.mkdir(parents=True)
     existing = img_dir / "00-thumbnail.jpg"
-    existing.write_bytes(b"existing-content")
+    existing.write_bytes(_png())
 
     fetch_count = {"n": 0}
 
     def mock_downloader(url: str) -> bytes:
         fetch_count["n"] += 1
-        return b"new-content"
+        return _jpeg()
 
     result = download_article_images(
         slug="my-article",
@@ -127,7 +143,7 @@ def test_download_skips_existing_images(output_dir: Path) -> None:
     assert result.downloaded == 0
     assert fetch_count["n"] == 0
     # File content unchanged
-    assert existing.read_bytes() == b"existing-content"
+    assert existing.read_bytes() == _png()
 
 
 # ---------------------------------------------------------------------------
@@ -143,8 +159,6 @@ def test_download_handles_http_error(output_dir: Path) -> None:
         # Simulate network error after 0 retries (direct raise)
         raise urllib.error.URLError("connection refused")
 
-    from images import _download_bytes
-    # Patch max_retries to 0 so test doesn't sleep
     result = download_article_images(
         slug="failing-article",
         featured_image_url="https://example.com/img.jpg",
@@ -174,7 +188,7 @@ def test_download_result_total_found(output_dir: Path) -> None:
         call_count["n"] += 1
         if call_count["n"] == 2:
             raise urllib.error.URLError("timeout")
-        return b"bytes"
+        return _png()
 
     result = download_article_images(
         slug="mixed-article",
@@ -187,3 +201,339 @@ def test_download_result_total_found(output_dir: Path) -> None:
 
     assert result.total_found == 3
     assert result.downloaded + result.failed == 3
+
+
+# ---------------------------------------------------------------------------
+# Header-only probe + validation
+# ---------------------------------------------------------------------------
+
+
+def test_probe_image_png_dimensions() -> None:
+    probe = probe_image(_png(1200, 675))
+    assert probe is not None
+    assert (probe.format, probe.width, probe.height) == ("png", 1200, 675)
+
+
+def test_probe_image_jpeg_dimensions_after_app_segment() -> None:
+    probe = probe_image(_jpeg(1920, 1080))
+    assert probe is not None
+    assert (probe.format, probe.width, probe.height) == ("jpeg", 1920, 1080)
+
+
+def test_probe_image_gif_and_webp() -> None:
+    gif = b"GIF89a" + struct.pack("<HH", 320, 240) + b"\x00" * 8
+    webp = b"RIFF" + b"\x00" * 4 + b"WEBPVP8X" + b"\x00" * 8 + (99).to_bytes(3, "little") + (49).to_bytes(3, "little")
+    probe = probe_image(gif)
+    assert probe is not None and probe.width == 320
+    probe = probe_image(webp)
+    assert probe is not None
+    assert (probe.format, probe.width, probe.height) == ("webp", 100, 50)
+
+
+def test_probe_image_rejects_html_and_empty() -> None:
+    assert probe_image(b"<!DOCTYPE html><html><body>404</body></html>") is None
+    assert probe_image(b"") is None
+
+
+def test_download_rejects_non_image_body(output_dir: Path) -> None:
+    """HTML error pages are counted as failures and never written to disk."""
+    result = download_article_images(
+        slug="html-error",
+        featured_image_url="https://example.com/thumb.jpg",
+        inline_image_urls=[],
+        output_dir=output_dir,
+        delay=0,
+        downloader=lambda url: b"<html><body>Not Found</body></html>",
+    )
+
+    assert result.failed == 1
+    assert "not an image" in result.errors[0]
+    assert list((output_dir / "images" / "html-error").iterdir()) == []
+
+
+def test_download_replaces_invalid_existing_file(output_dir: Path) -> None:
+    """A previously saved non-image is deleted and fetched again."""
+    img_dir = output_dir / "images" / "stale"
+    img_dir.mkdir(parents=True)
+    (img_dir / "00-thumbnail.jpg").write_bytes(b"")
+
+    result = download_article_images(
+        slug="stale",
+        featured_image_url="https://example.com/thumb.jpg",
+        inline_image_urls=[],
+        output_dir=output_dir,
+        delay=0,
+        downloader=lambda url: _jpeg(),
+    )
+
+    assert result.downloaded == 1
+    assert result.skipped == 0
+    assert (img_dir / "00-thumbnail.jpg").read_bytes() == _jpeg()
+
+
+def test_download_result_records_probed_dimensions(output_dir: Path) -> None:
+    result = download_article_images(
+        slug="dims",
+        featured_image_url="https://example.com/thumb.jpg",
+        inline_image_urls=["https://example.com/still.png"],
+        output_dir=output_dir,
+        delay=0,
+        downloader=lambda url: _png(300, 200) if url.endswith(".png") else _jpeg(1024, 576),
+    )
+
+    info = {i.file: i for i in result.images}
+    assert info["00-thumbnail.jpg"].format == "jpeg"
+    assert (info["00-thumbnail.jpg"].width, info["00-thumbnail.jpg"].height) == (1024, 576)
+    assert info["01-still.png"].width == 300
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes, content_type: str) -> None:
+        import io
+
+        self._buf = io.BytesIO(body)
+        self.headers = {"Content-Type": content_type}
+
+    def read(self, n: int = -1) -> bytes:
+        return self._buf.read(n)
+
+    def __enter__(self) -> "_FakeResponse":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+def test_streaming_download_probes_before_writing(output_dir: Path, monkeypatch) -> None:
+    import urllib.request
+
+    import images
+
+    bodies = {
+        "https://example.com/ok.png": (_png(64, 32) + b"\x00" * 200_000, "image/png"),
+        "https://example.com/bad.jpg": (b"<html>error</html>", "text/html"),
+    }
+    monkeypatch.setattr(
+        urllib.request, "urlopen", lambda req, timeout=30: _FakeResponse(*bodies[req.full_url])
+    )
+
+    ok = output_dir / "ok.png"
+    probe = images._download_to_file("https://example.com/ok.png", ok, max_retries=0)
+    assert (probe.width, probe.height) == (64, 32)
+    assert ok.stat().st_size == len(bodies["https://example.com/ok.png"][0])
+
+    bad = output_dir / "bad.jpg"
+    with pytest.raises(images.InvalidImageError, match="text/html"):
+        images._download_to_file("https://example.com/bad.jpg", bad, max_retries=0)
+    assert not bad.exists()
+    assert not (output_dir / "bad.jpg.part").exists()
+
+
+# ---------------------------------------------------------------------------
+# Featured/inline split + background lane
+# ---------------------------------------------------------------------------
+
+
+def test_download_featured_only_keeps_indices(output_dir: Path) -> None:
+    fetched: list[str] = []
+
+    def downloader(url: str) -> bytes:
+        fetched.append(url)
+        return _jpeg()
+
+    urls = ["https://example.com/a.jpg", "https://example.com/b.jpg"]
+    thumb = download_article_images(
+        "split", "https://example.com/t.jpg", urls, output_dir, delay=0, downloader=downloader, inline=False
+    )
+    rest = download_article_images(
+        "split", "https://example.com/t.jpg", urls, output_dir, delay=0, downloader=downloader, featured=False
+    )
+
+    assert fetched == ["https://example.com/t.jpg", *urls]
+    assert [p.name for p in thumb.local_paths] == ["00-thumbnail.jpg"]
+    assert [p.name for p in rest.local_paths] == ["01-a.jpg", "02-b.jpg"]
+
+
+def test_image_lane_drains_inline_images(output_dir: Path) -> None:
+    from images import ImageLane
+
+    done: dict[str, ImageDownloadResult] = {}
+    lane = ImageLane(2, delay=0, downloader=lambda url: _png())
+    for slug in ("one", "two", "three"):
+        lane.submit(
+            slug,
+            "https://example.com/t.jpg",
+            ["https://example.com/x.png", "https://example.com/y.png"],
+            output_dir,
+            lambda s, r: done.__setitem__(s, r),
+        )
+    lane.close(wait=True)
+
+    assert set(done) == {"one", "two", "three"}
+    assert all(r.downloaded == 2 for r in done.values())
+    assert lane.depth == 0
+    assert not (output_dir / "images" / "one" / "00-thumbnail.jpg").exists()
+
+
+def test_image_lane_splits_articles_into_batches(output_dir: Path) -> None:
+    from images import ImageLane
+
+    threads: set[str] = set()
+
+    def downloader(url: str) -> bytes:
+        threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        if url.endswith("/bad.png"):
+            raise ConnectionResetError("reset")
+        return _png()
+
+    done: list[ImageDownloadResult] = []
+    urls = [f"https://example.com/{n}.png" for n in range(6)] + ["https://example.com/bad.png"]
+    lane = ImageLane(3, delay=0, downloader=downloader, batch_size=2)
+    future = lane.submit("heavy", None, urls, output_dir, lambda s, r: done.append(r))
+    result = future.result(timeout=5)
+    lane.close(wait=True)
+
+    assert done == [result] and lane.depth == 0
+    assert (result.downloaded, result.failed) == (6, 1)
+    assert [p.name for p in result.local_paths] == [f"{i:02d}-{i}.png" for i in range(6)]
+    assert [info.file for info in result.images] == [p.name for p in result.local_paths]
+    assert result.failed_images == [(6, urls[6], "06-bad.png")]
+    assert len(threads) > 1
+
+
+# ---------------------------------------------------------------------------
+# Range resume
+# ---------------------------------------------------------------------------
+
+
+class _RangeServer:
+    """Fake urlopen: first response drops mid-body, then honours Range."""
+
+    def __init__(self, body: bytes, *, etag: str = '"v1"', drop_at: int | None = None) -> None:
+        self.body = body
+        self.etag = etag
+        self.drop_at = drop_at
+        self.requests: list[dict[str, str]] = []
+
+    def __call__(self, req, timeout: float = 30):
+        import email.message
+        import io
+
+        hdrs = {k.lower(): v for k, v in req.header_items()}
+        self.requests.append(hdrs)
+        headers = email.message.Message()
+        headers["ETag"] = self.etag
+        headers["Accept-Ranges"] = "bytes"
+        start = 0
+        status = 200
+        range_hdr = hdrs.get("range")
+        if range_hdr and hdrs.get("if-range") == self.etag:
+            start = int(range_hdr.split("=")[1].rstrip("-"))
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{len(self.body) - 1}/{len(self.body)}"
+        headers["Content-Length"] = str(len(self.body) - start)
+        payload = self.body[start:]
+        drop_at, self.drop_at = self.drop_at, None
+
+        class _Resp:
+            def __init__(self) -> None:
+                self.status = status
+                self.headers = headers
+                self._buf = io.BytesIO(payload)
+                self._sent = 0
+
+            def read(self, n: int = -1) -> bytes:
+                if drop_at is not None and self._sent >= drop_at:
+                    raise ConnectionResetError("connection dropped")
+                limit = n if n >= 0 else len(payload)
+                if drop_at is not None:
+                    limit = min(limit, drop_at - self._sent)
+                chunk = self._buf.read(limit)
+                self._sent += len(chunk)
+                return chunk
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc: object) -> None:
+                return None
+
+        return _Resp()
+
+
+def test_interrupted_download_resumes_with_range(output_dir: Path, monkeypatch) -> None:
+    import urllib.request
+
+    import images
+
+    body = _png(200, 100) + bytes(range(256)) * 1000
+    server = _RangeServer(body, drop_at=100_000)
+    monkeypatch.setattr(urllib.request, "urlopen", server)
+    monkeypatch.setattr(images.time, "sleep", lambda s: None)
+
+    dest = output_dir / "big.png"
+    probe = images._download_to_file("https://example.com/big.png", dest, max_retries=1)
+
+    assert dest.read_bytes() == body
+    assert (probe.width, probe.height) == (200, 100)
+    assert "range" not in server.requests[0]
+    assert server.requests[1]["range"] == "bytes=100000-"
+    assert not (output_dir / "big.png.part").exists()
+    assert not (output_dir / "big.png.part.json").exists()
+
+
+def test_partial_file_survives_for_a_later_run(output_dir: Path, monkeypatch) -> None:
+    import urllib.request
+
+    import images
+
+    body = _png() + b"\x00" * 150_000
+    server = _RangeServer(body, drop_at=80_000)
+    monkeypatch.setattr(urllib.request, "urlopen", server)
+
+    dest = output_dir / "img.png"
+    with pytest.raises(OSError):
+        images._download_to_file("https://example.com/img.png", dest, max_retries=0)
+    assert (output_dir / "img.png.part").stat().st_size == 80_000
+
+    images._download_to_file("https://example.com/img.png", dest, max_retries=0)
+    assert dest.read_bytes() == body
+    assert server.requests[-1]["range"] == "bytes=80000-"
+
+
+def test_part_without_sidecar_restarts_from_zero(output_dir: Path, monkeypatch) -> None:
+    import urllib.request
+
+    import images
+
+    body = _png() + b"\x02" * 1000
+    server = _RangeServer(body)
+    monkeypatch.setattr(urllib.request, "urlopen", server)
+    (output_dir / "img.png.part").write_bytes(b"stale bytes")
+    (output_dir / "img.png.part.json").write_text("{not json")
+
+    dest = output_dir / "img.png"
+    images._download_to_file("https://example.com/img.png", dest, max_retries=0)
+    assert dest.read_bytes() == body
+    assert "range" not in server.requests[-1]
+
+
+def test_changed_validator_restarts_from_zero(output_dir: Path, monkeypatch) -> None:
+    import urllib.request
+
+    import images
+
+    first = _RangeServer(_png() + b"\x01" * 150_000, etag='"old"', drop_at=80_000)
+    monkeypatch.setattr(urllib.request, "urlopen", first)
+    dest = output_dir / "img.png"
+    with pytest.raises(OSError):
+        images._download_to_file("https://example.com/img.png", dest, max_retries=0)
+
+    new_body = _png() + b"\x02" * 120_000
+    second = _RangeServer(new_body, etag='"new"')
+    monkeypatch.setattr(urllib.request, "urlopen", second)
+    images._download_to_file("https://example.com/img.png", dest, max_retries=0)
+
+    assert second.requests[0]["if-range"] == '"old"'
+    assert dest.read_bytes() == new_body
@@ -2,7 +2,8 @@
 test_manifest.py — Unit tests for manifest CRUD operations.
 
 Tests: create, load, update status, add new entries, handle missing file,
-incremental filtering, --force reset.
+in-progress leases (claim, reclaim, release), incremental filtering,
+--force reset, lazy loading.
 """
 
 from __future__ import annotations
@@ -17,14 +18,20 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from manifest import (
+    LazyEntries,
     add_entry,
+    claim_entry,
     get_pending_entries,
     load_manifest,
+    reclaim_expired_leases,
+    release_leases,
+    renew_lease,
     reset_all_to_pending,
     save_manifest,
     update_entry_status,
+    update_image_status,
 )
-from models import Manifest, ScrapeStatus
+from models import ImageInfo, Manifest, ScrapeStatus
 
 
 # ---------------------------------------------------------------------------
@@ -129,6 +136,9 @@ def test_update_entry_to_failed(output_dir: Path) -> None:
     entry = manifest.entries["x"]
     assert entry.status == ScrapeStatus.FAILED
     assert entry.error == "Connection timeout"
+    assert entry.failures == 1
+    update_entry_status(manifest, "x", ScrapeStatus.FAILED, error="Connection timeout")
+    assert manifest.entries["x"].failures == 2
 
 
 def test_update_entry_missing_slug_raises() -> None:
@@ -137,6 +147,104 @@ def test_update_entry_missing_slug_raises() -> None:
         update_entry_status(manifest, "nonexistent", ScrapeStatus.COMPLETED)
 
 
+# ---------------------------------------------------------------------------
+# update_image_status
+# ---------------------------------------------------------------------------
+
+
+def test_update_image_status_accumulates_lanes() -> None:
+    """Thumbnail and inline lanes add to the same counters without touching article status."""
+    manifest = Manifest(discovered_at="2026-02-28T00:00:00Z", total=0)
+    add_entry(manifest, "https://example.com/x/", "x")
+    thumb = ImageInfo(file="00-thumbnail.jpg", format="jpeg", width=800, height=450)
+    update_entry_status(
+        manifest, "x", ScrapeStatus.COMPLETED, images_found=2, images_downloaded=1, images=[thumb]
+    )
+    update_image_status(manifest, "x", ScrapeStatus.PENDING)
+
+    inline = ImageInfo(file="01-a.png", format="png", width=10, height=10)
+    update_image_status(manifest, "x", images=[thumb, inline])
+
+    entry = manifest.entries["x"]
+    assert entry.status == ScrapeStatus.COMPLETED
+    assert entry.images_status == ScrapeStatus.COMPLETED
+    assert entry.images_downloaded == 2
+    assert [i.file for i in entry.images] == ["00-thumbnail.jpg", "01-a.png"]
+
+
+def test_update_image_status_derives_failed_when_images_missing() -> None:
+    manifest = Manifest(discovered_at="2026-02-28T00:00:00Z", total=0)
+    add_entry(manifest, "https://example.com/x/", "x")
+    update_entry_status(manifest, "x", ScrapeStatus.COMPLETED, images_found=3)
+
+    update_image_status(manifest, "x", images=[ImageInfo(file="00-thumbnail.jpg", format="jpeg")])
+
+    assert manifest.entries["x"].images_status == ScrapeStatus.FAILED
+    assert manifest.entries["x"].images_downloaded == 1
+
+
+# ---------------------------------------------------------------------------
+# In-progress leases
+# ---------------------------------------------------------------------------
+
+
+def test_claimed_entry_is_skipped_until_finished() -> None:
+    manifest = Manifest(discovered_at="2026-02-28T00:00:00Z", total=0)
+    add_entry(manifest, "https://example.com/a/", "a")
+    entry = claim_entry(manifest, "a", "host-1", 1000.0)
+    assert (entry.status, entry.worker, entry.lease_until) == (ScrapeStatus.IN_PROGRESS, "host-1", 1000.0)
+    assert get_pending_entries(manifest) == []
+
+    update_entry_status(manifest, "a", ScrapeStatus.COMPLETED)
+    assert entry.worker is None and entry.lease_until is None
+
+
+@pytest.mark.parametrize("mode", ["plain", "lazy", "compact"])
+def test_reclaim_expired_and_abandoned_leases(output_dir: Path, mode: str) -> None:
+    manifest = Manifest(discovered_at="2026-02-28T00:00:00Z", total=0)
+    for slug in "abcd":
+        add_entry(manifest, f"https://example.com/{slug}/", slug)
+    claim_entry(manifest, "a", "live", 2000.0)
+    claim_entry(manifest, "b", "live", 500.0)  # lease expired
+    claim_entry(manifest, "c", "dead", 2000.0)  # holder exited
+    save_manifest(manifest, output_dir)
+    if mode != "plain":
+        manifest = load_manifest(output_dir, lazy=mode == "lazy", compact=mode == "compact")
+
+    reclaimed = reclaim_expired_leases(manifest, now=1000.0, is_gone=lambda worker: worker == "dead")
+
+    assert sorted(reclaimed) == ["b", "c"]
+    statuses = {slug: manifest.entries[slug].status for slug in "abcd"}
+    assert statuses == {"a": ScrapeStatus.IN_PROGRESS, "b": ScrapeStatus.PENDING,
+                        "c": ScrapeStatus.PENDING, "d": ScrapeStatus.PENDING}
+    assert manifest.entries["b"].worker is None
+
+
+def test_renew_lease_only_for_its_holder() -> None:
+    manifest = Manifest(discovered_at="2026-02-28T00:00:00Z", total=0)
+    add_entry(manifest, "https://example.com/a/", "a")
+    add_entry(manifest, "https://example.com/b/", "b")
+    claim_entry(manifest, "a", "me", 1000.0)
+    assert renew_lease(manifest, "a", "me", 2000.0)
+    assert manifest.entries["a"].lease_until == 2000.0
+    assert not renew_lease(manifest, "a", "other", 3000.0)
+    assert not renew_lease(manifest, "b", "me", 3000.0)  # not in progress
+    assert not renew_lease(manifest, "missing", "me", 3000.0)
+    assert manifest.entries["a"].lease_until == 2000.0
+    assert manifest.entries["b"].status == ScrapeStatus.PENDING
+
+
+def test_release_leases_of_one_worker() -> None:
+    manifest = Manifest(discovered_at="2026-02-28T00:00:00Z", total=0)
+    add_entry(manifest, "https://example.com/a/", "a")
+    add_entry(manifest, "https://example.com/b/", "b")
+    claim_entry(manifest, "a", "me", 1000.0)
+    claim_entry(manifest, "b", "other", 1000.0)
+    assert release_leases(manifest, "me") == ["a"]
+    assert manifest.entries["a"].status == ScrapeStatus.PENDING
+    assert manifest.entries["b"].status == ScrapeStatus.IN_PROGRESS
+
+
 # ---------------------------------------------------------------------------
 # get_pending_entries (T024)
 # ---------------------------------------------------------------------------
@@ -182,3 +290,64 @@ def test_reset_all_to_pending() -> None:
         assert entry.status == ScrapeStatus.PENDING
         assert entry.error is None
         assert entry.scraped_at is None
+
+
+# ---------------------------------------------------------------------------
+# Lazy loading
+# ---------------------------------------------------------------------------
+
+
+def _saved_manifest(output_dir: Path, n: int = 5) -> None:
+    manifest = Manifest(discovered_at="2026-02-28T00:00:00Z", total=0)
+    for i in range(n):
+        add_entry(manifest, f"https://example.com/{i}/", f"art-{i}")
+    update_entry_status(manifest, "art-0", ScrapeStatus.COMPLETED)
+    update_entry_status(manifest, "art-1", ScrapeStatus.FAILED, error="boom")
+    save_manifest(manifest, output_dir)
+
+
+def test_lazy_load_validates_on_access(output_dir: Path) -> None:
+    _saved_manifest(output_dir)
+
+    manifest = load_manifest(output_dir, lazy=True)
+
+    assert isinstance(manifest.entries, LazyEntries)
+    assert (manifest.total, manifest.completed, manifest.failed) == (5, 1, 1)
+    assert len(manifest.entries) == 5
+    assert "art-3" in manifest.entries
+    assert manifest.entries.materialized == 0
+
+    assert manifest.entries["art-1"].error == "boom"
+    assert manifest.entries.materialized == 1
+    assert manifest.entries.get("missing") is None
+
+
+def test_lazy_save_keeps_untouched_entries(output_dir: Path) -> None:
+    _saved_manifest(output_dir)
+    manifest = load_manifest(output_dir, lazy=True)
+    assert isinstance(manifest.entries, LazyEntries)
+
+    update_entry_status(manifest, "art-2", ScrapeStatus.COMPLETED)
+    add_entry(manifest, "https://example.com/new/", "new")
+    save_manifest(manifest, output_dir)
+
+    assert manifest.entries.materialized == 2
+    reloaded = load_manifest(output_dir)
+    assert (reloaded.total, reloaded.completed, reloaded.failed) == (6, 2, 1)
+    assert reloaded.entries["art-1"].error == "boom"
+    assert list(reloaded.entries)[-1] == "new"
+
+
+def test_lazy_save_with_pydantic_backend(output_dir: Path) -> None:
+    import serialize
+
+    _saved_manifest(output_dir)
+    manifest = load_manifest(output_dir, lazy=True)
+    backend = serialize.current_backend()
+    serialize.configure(backend="pydantic")
+    try:
+        save_manifest(manifest, output_dir)
+    finally:
+        serialize.configure(backend=backend)
+
+    assert load_manifest(output_dir).total == 5
@@ -0,0 +1,130 @@
+"""
+test_metrics.py — Unit tests for live scrape metrics.
+
+Tests: histogram buckets, rates / queue depth / ETA from a fake clock,
+Prometheus text rendering, atomic textfile publication, the HTTP endpoint,
+and run_scrape_phase feeding the metrics end to end (mocked HTTP).
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import images
+import scraper.scraper as scraper_module
+from images import ImageDownloadResult
+from metrics import Histogram, ScrapeMetrics, serve_metrics
+from models import Manifest, ManifestEntry
+
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x02\x00\x00\x00"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_histogram_cumulative_buckets() -> None:
+    hist = Histogram((0.1, 1.0))
+    for seconds in (0.05, 0.5, 0.7, 3.0):
+        hist.observe(seconds)
+    assert hist.cumulative() == [("0.1", 1), ("1", 3), ("+Inf", 4)]
+    assert hist.count == 4 and abs(hist.sum - 4.25) < 1e-9
+
+
+def test_rates_queue_and_eta() -> None:
+    clock = FakeClock()
+    metrics = ScrapeMetrics(clock=clock)
+    metrics.start(total=10)
+    metrics.image_lane_depth = lambda: 2
+    clock.now += 60
+    for ok in (True, True, False):
+        metrics.article_done(ok)
+    metrics.images_done(ImageDownloadResult(slug="a", downloaded=6, skipped=1, retries=2, bytes=6000))
+    metrics.add_bytes(1200)
+
+    snap = metrics.snapshot()
+    assert snap["articles_per_minute"] == 3
+    assert snap["images_per_minute"] == 6
+    assert snap["bytes_per_second"] == 120
+    assert (snap["queue_articles"], snap["queue_image_lane"]) == (7, 2)
+    assert snap["eta_seconds"] == 140  # 7 left at 3/min
+    assert snap["retries"] == 2
+
+
+def test_render_prometheus_text() -> None:
+    clock = FakeClock()
+    metrics = ScrapeMetrics(clock=clock)
+    metrics.start(total=4)
+    with metrics.time("fetch"):
+        clock.now += 0.2
+    text = metrics.render()
+
+    assert '# TYPE scraper_stage_seconds histogram' in text
+    assert 'scraper_stage_seconds_bucket{stage="fetch",le="0.25"} 1' in text
+    assert 'scraper_stage_seconds_bucket{stage="fetch",le="0.1"} 0' in text
+    assert 'scraper_stage_seconds_count{stage="fetch"} 1' in text
+    assert 'scraper_queue_depth{queue="articles"} 4' in text
+    assert "scraper_eta_seconds NaN" in text  # nothing finished yet
+
+
+def test_publish_textfile(tmp_path: Path) -> None:
+    textfile = tmp_path / "prom" / "scraper.prom"
+    metrics = ScrapeMetrics(textfile=textfile)
+    metrics.article_done(True)
+    metrics.publish()
+    assert 'scraper_articles_total{outcome="completed"} 1' in textfile.read_text()
+    assert not textfile.with_name("scraper.prom.tmp").exists()
+
+
+def test_http_endpoint() -> None:
+    metrics = ScrapeMetrics()
+    metrics.start(total=3)
+    metrics.article_done(True)
+    server = serve_metrics(metrics, 0)
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain")
+            assert b"scraper_articles_total" in resp.read()
+        with urllib.request.urlopen(f"http://{host}:{port}/progress", timeout=5) as resp:
+            assert json.load(resp)["queue_articles"] == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_run_scrape_phase_feeds_metrics(output_dir: Path, single_page_html: str, monkeypatch) -> None:
+    def fake_download(url: str, dest: Path, **_):
+        dest.write_bytes(PNG)
+        return images.probe_image(PNG)
+
+    monkeypatch.setattr(images, "_download_to_file", fake_download)
+    monkeypatch.setattr(scraper_module, "_make_fetcher", lambda delay: lambda url: single_page_html.encode())
+    manifest = Manifest(discovered_at="2026-01-01T00:00:00Z", total=1, entries={
+        "top-10": ManifestEntry(url="https://www.tasteofcinema.com/2023/top-10/", slug="top-10"),
+    })
+    metrics = ScrapeMetrics(textfile=output_dir / "scraper.prom")
+
+    success, failure = scraper_module.run_scrape_phase(
+        manifest, output_dir, delay=0, limit=None, verbose=False, force=False,
+        image_workers=1, metrics=metrics,
+    )
+
+    snap = metrics.snapshot()
+    assert (success, failure) == (1, 0)
+    assert snap["articles_completed"] == 1 and snap["queue_articles"] == 0
+    n_images = len(manifest.entries["top-10"].images)
+    assert n_images > 1 and snap["images_downloaded"] == n_images
+    assert snap["bytes"] == len(single_page_html.encode()) + n_images * len(PNG)
+    assert snap["stages"]["fetch"]["count"] >= 1
+    assert snap["stages"]["image_lane"]["count"] == 1
+    assert 'scraper_articles_total{outcome="completed"} 1' in (output_dir / "scraper.prom").read_text()
@@ -0,0 +1,91 @@
+"""
+test_mock_site.py — End-to-end runs of scraper.main() against the local mock site.
+
+Tests: the synthetic site's sitemaps / pages / images parse with the real
+discovery and extraction code, a full CLI run over ``--base-url`` scrapes
+every article and image, a re-run skips completed work, image ``Range``
+resumption, injected 503s fail articles without stopping the run.
+"""
+
+from __future__ import annotations
+
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import scraper.scraper as scraper_module
+from discover import _parse_post_sitemap, _parse_sitemap_index
+from images import probe_image
+from manifest import load_manifest
+from mock_site import MockSite, SiteConfig
+from models import ScrapeStatus
+
+SMALL = SiteConfig(articles=7, per_sitemap=3, min_pages=1, max_pages=3, images_per_page=2, page_kb=4, image_kb=2)
+
+
+def _get(url: str, headers: dict | None = None):
+    return urllib.request.urlopen(urllib.request.Request(url, headers=headers or {}), timeout=5)
+
+
+def test_site_content_parses() -> None:
+    with MockSite(SMALL) as site:
+        index = _parse_sitemap_index(_get(f"{site.base_url}/wp-sitemap.xml").read())
+        assert len(index) == 3
+        posts = [p for url in index for p in _parse_post_sitemap(_get(url).read())]
+        assert len(posts) == 7 and all(lastmod for _, lastmod in posts)
+
+        body = _get(f"{site.base_url}/wp-content/uploads/2012/10-best-thrillers-0-1.jpg").read()
+        probe = probe_image(body)
+        assert probe is not None and probe.format == "jpeg" and len(body) == 2048
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            _get(f"{site.base_url}/2012/no-such-article-99/")
+        assert exc.value.code == 404
+
+
+def test_image_range_request() -> None:
+    with MockSite(SMALL) as site:
+        url = f"{site.base_url}/wp-content/uploads/2012/10-best-thrillers-0-1.jpg"
+        with _get(url) as resp:
+            full, etag = resp.read(), resp.headers["ETag"]
+        with _get(url, {"Range": "bytes=1000-", "If-Range": etag}) as resp:
+            assert resp.status == 206 and resp.read() == full[1000:]
+
+
+def test_full_run_against_mock_site(output_dir: Path) -> None:
+    with MockSite(SMALL) as site:
+        argv = ["--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0"]
+        assert scraper_module.main(argv) == 0
+        first = site.stats()["requests"]
+        assert scraper_module.main(argv) == 0
+        second = site.stats()["requests"]
+
+    manifest = load_manifest(output_dir)
+    assert len(manifest.entries) == 7
+    assert all(e.status == ScrapeStatus.COMPLETED for e in manifest.entries.values())
+    images = sum(e.images_found for e in manifest.entries.values())
+    assert images > 7 * 2 and sum(e.images_downloaded for e in manifest.entries.values()) == images
+    assert first["page"] == sum(e.pages_found for e in manifest.entries.values())
+    assert first["page"] == sum(site.content.article(i).pages for i in range(7))
+    assert first["image"] == images
+    assert (second["page"], second["image"]) == (first["page"], first["image"])  # nothing re-fetched
+
+
+def test_page_errors_fail_articles(output_dir: Path) -> None:
+    config = SiteConfig(articles=6, per_sitemap=10, max_pages=1, images_per_page=1, page_kb=2, image_kb=1,
+                        error_rate=0.4, retry_after=None, seed=3)
+    with MockSite(config) as site:
+        argv = ["--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0", "--max-retries", "0",
+                "--requeue", "0"]
+        code = scraper_module.main(argv)
+        errors = site.stats()["requests"].get("error", 0)
+
+    manifest = load_manifest(output_dir)
+    failed = [e for e in manifest.entries.values() if e.status == ScrapeStatus.FAILED]
+    assert errors >= len(failed) > 0
+    assert code == 1
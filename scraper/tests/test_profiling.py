@@ -0,0 +1,83 @@
+"""
+test_profiling.py — Unit tests for the ``--profile`` session.
+
+Tests: the stack sampler sees other threads (pool suffixes folded), a
+phase writes loadable .prof / collapsed .folded files and a summary even
+when the phase raises, and ``main --profile`` profiles discovery and
+scraping against the local mock site.
+"""
+
+from __future__ import annotations
+
+import json
+import pstats
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import scraper.scraper as scraper_module
+from mock_site import MockSite, SiteConfig
+from profiling import ProfileSession, SamplingProfiler
+
+
+def _parked_in_wait(event: threading.Event) -> None:
+    event.wait(5)
+
+
+def test_sampler_records_other_threads() -> None:
+    release = threading.Event()
+    worker = threading.Thread(target=_parked_in_wait, args=(release,), name="image-lane-3")
+    worker.start()
+    sampler = SamplingProfiler()
+    try:
+        sampler.sample(skip=threading.get_ident())
+        sampler.sample(skip=threading.get_ident())
+    finally:
+        release.set()
+        worker.join()
+
+    (stack,) = [s for s in sampler.stacks if s.startswith("image-lane;")]
+    assert "test_profiling:_parked_in_wait" in stack.split(";")
+    assert sampler.stacks[stack] == 2 and sampler.samples == 2
+    assert not any(s.startswith("MainThread;") for s in sampler.stacks)
+
+
+def _busy(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def test_phase_writes_profiles(tmp_path: Path) -> None:
+    session = ProfileSession(tmp_path / "profiles", interval=0.001)
+    with session.phase("scrape"):
+        _busy(200_000)
+    with pytest.raises(RuntimeError), session.phase("discovery"):
+        raise RuntimeError("boom")
+
+    scrape = session.phases[0]
+    stats = pstats.Stats(scrape["prof"])
+    assert any(func == "_busy" for _, _, func in stats.stats)  # type: ignore[attr-defined]
+    assert Path(scrape["folded"]).read_text().strip()
+    assert scrape["wall_seconds"] > 0 and scrape["cpu_seconds"] > 0
+    summary = json.loads(session.path("summary.json").read_text())
+    assert [p["phase"] for p in summary["phases"]] == ["scrape", "discovery"]
+    assert "scrape" in session.format_summary()
+
+
+def test_main_profile_flag(tmp_path: Path, output_dir: Path, capsys) -> None:
+    profile_dir = tmp_path / "profiles"
+    config = SiteConfig(articles=3, max_pages=2, images_per_page=1, page_kb=2, image_kb=1)
+    with MockSite(config) as site:
+        code = scraper_module.main([
+            "--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0",
+            "--profile", str(profile_dir),
+        ])
+
+    assert code == 0
+    names = sorted(p.name.split("-", 2)[2] for p in profile_dir.iterdir())
+    assert names == ["discovery.folded", "discovery.prof", "scrape.folded", "scrape.prof", "summary.json"]
+    assert "Profile (" in capsys.readouterr().out
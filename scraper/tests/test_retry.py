@@ -0,0 +1,206 @@
+"""
+test_retry.py — Unit tests for retry.py (shared retry policy).
+
+Tests: error classification, Retry-After parsing (seconds / HTTP date),
+404s fail on the first attempt, 5xx retried with the requested wait,
+over-long Retry-After gives up, jitter bounds, the global retry budget,
+image-queue give-up on permanent errors, and recovery from injected 503s
+against the mock site.
+"""
+
+from __future__ import annotations
+
+import email.message
+import sys
+import urllib.error
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import scraper.scraper as scraper_module
+from image_queue import drain_image_queue
+from manifest import load_manifest
+from mock_site import MockSite, SiteConfig
+from models import ImageQueue, ImageTask, ScrapeStatus
+from retry import PERMANENT, TRANSIENT, RetryConfig, RetryPolicy, classify_error, retry_after
+
+URL = "https://www.tasteofcinema.com/2020/some-article/"
+
+
+def _http_error(code: int, retry_after_value: str | None = None) -> urllib.error.HTTPError:
+    headers = email.message.Message()
+    if retry_after_value is not None:
+        headers["Retry-After"] = retry_after_value
+    return urllib.error.HTTPError(URL, code, "error", headers, None)
+
+
+class _Flaky:
+    """Attempt function raising *errors* in turn, then returning b"ok"."""
+
+    def __init__(self, *errors: Exception) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self) -> bytes:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return b"ok"
+
+
+class _Clock:
+    """Fake monotonic clock; ``sleep`` records the wait and advances it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _policy(**config) -> tuple[RetryPolicy, list[float]]:
+    clock = _Clock()
+    policy = RetryPolicy(RetryConfig(**config), sleep=clock.sleep, clock=clock, rand=lambda: 0.0)
+    return policy, clock.sleeps
+
+
+# ---------------------------------------------------------------------------
+# Classification
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (_http_error(404), PERMANENT),
+        (_http_error(403), PERMANENT),
+        (_http_error(429), TRANSIENT),
+        (_http_error(408), TRANSIENT),
+        (_http_error(503), TRANSIENT),
+        (urllib.error.URLError("connection refused"), TRANSIENT),
+        (TimeoutError("timed out"), TRANSIENT),
+        (ConnectionResetError(), TRANSIENT),
+        (PermissionError("denied"), PERMANENT),
+        (OSError(28, "No space left on device"), PERMANENT),
+        (ValueError("not an image"), PERMANENT),
+    ],
+)
+def test_classify_error(exc: Exception, expected: str) -> None:
+    assert classify_error(exc) == expected
+
+
+def test_retry_after_parsing() -> None:
+    now = datetime(2026, 10, 19, 12, 0, 0, tzinfo=timezone.utc)
+    assert retry_after(_http_error(503, "7")) == 7.0
+    assert retry_after(_http_error(503, "Mon, 19 Oct 2026 12:00:30 GMT"), now=now) == 30.0
+    assert retry_after(_http_error(503, "Mon, 19 Oct 2026 11:00:00 GMT"), now=now) == 0.0
+    assert retry_after(_http_error(503, "soon")) is None
+    assert retry_after(_http_error(503)) is None
+    assert retry_after(ConnectionResetError("reset")) is None
+
+
+# ---------------------------------------------------------------------------
+# Policy
+# ---------------------------------------------------------------------------
+
+
+def test_permanent_error_is_not_retried() -> None:
+    policy, sleeps = _policy()
+    attempt = _Flaky(_http_error(404))
+    with pytest.raises(urllib.error.HTTPError):
+        policy.call(URL, attempt)
+    assert attempt.calls == 1 and sleeps == []
+    assert policy.stats["permanent"] == 1
+
+
+def test_transient_error_retried_with_retry_after() -> None:
+    policy, sleeps = _policy()
+    attempt = _Flaky(_http_error(503, "5"), ConnectionResetError("reset"))
+    assert policy.call(URL, attempt) == b"ok"
+    assert attempt.calls == 3
+    assert sleeps == [5.0, 2.0]  # Retry-After, then backoff 1 * 2**2 / 2 (rand = 0)
+    assert policy.stats["retries"] == 2
+
+
+def test_retry_after_holds_other_requests_to_the_host() -> None:
+    clock = _Clock()
+    policy = RetryPolicy(RetryConfig(), sleep=clock.sleep, clock=clock, rand=lambda: 0.0)
+    with pytest.raises(urllib.error.HTTPError):
+        policy.call(URL, _Flaky(_http_error(429, "10")), max_retries=0)
+    assert clock.sleeps == []
+    clock.now = 4.0
+    assert policy.call(URL, _Flaky()) == b"ok"
+    assert clock.sleeps == [6.0]
+    assert policy.call("https://other.example/x", _Flaky()) == b"ok"
+    assert clock.sleeps == [6.0]
+
+
+def test_long_retry_after_gives_up() -> None:
+    policy, sleeps = _policy(max_retry_after=60)
+    attempt = _Flaky(_http_error(503, "3600"))
+    with pytest.raises(urllib.error.HTTPError):
+        policy.call(URL, attempt)
+    assert attempt.calls == 1 and sleeps == []
+    assert policy.stats["retry_after_too_long"] == 1
+
+
+def test_backoff_jitter_bounds() -> None:
+    low = RetryPolicy(RetryConfig(base_delay=1, max_delay=10), rand=lambda: 0.0)
+    high = RetryPolicy(RetryConfig(base_delay=1, max_delay=10), rand=lambda: 0.999)
+    exc = ConnectionResetError("reset")
+    for attempt, cap in [(1, 2), (2, 4), (3, 8), (4, 10), (9, 10)]:
+        assert low.backoff(attempt, exc) == cap / 2
+        assert cap / 2 < high.backoff(attempt, exc) < cap
+
+
+def test_retry_budget_limits_retries_across_requests() -> None:
+    policy, sleeps = _policy(max_retries=5, budget_min=2, budget_ratio=0.0)
+    with pytest.raises(OSError):
+        policy.call(URL, _Flaky(*[ConnectionError("down")] * 10))
+    assert len(sleeps) == 2
+    attempt = _Flaky(ConnectionError("down"))
+    with pytest.raises(OSError):
+        policy.call(URL, attempt)
+    assert attempt.calls == 1 and len(sleeps) == 2
+    assert policy.stats["budget_exhausted"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Integration
+# ---------------------------------------------------------------------------
+
+
+def test_image_queue_gives_up_on_permanent_error(output_dir: Path) -> None:
+    queue = ImageQueue(tasks={
+        "art/01-a.png": ImageTask(slug="art", url="https://example.com/a.png", index=1, filename="01-a.png"),
+    })
+
+    def missing(url: str) -> bytes:
+        raise _http_error(404)
+
+    result = drain_image_queue(queue, output_dir, max_attempts=5, downloader=missing,
+                               clock=lambda: 0.0, sleep=lambda s: None)
+    assert result.abandoned == 1 and result.retries == 1
+    assert queue.tasks["art/01-a.png"].attempts == 1
+
+
+def test_page_errors_recovered_by_retries(output_dir: Path) -> None:
+    config = SiteConfig(articles=6, per_sitemap=10, max_pages=1, images_per_page=1, page_kb=2, image_kb=1,
+                        error_rate=0.4, retry_after=0, seed=3)
+    with MockSite(config) as site:
+        argv = ["--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0"]
+        code = scraper_module.main(argv)
+        errors = site.stats()["requests"].get("error", 0)
+
+    manifest = load_manifest(output_dir)
+    assert errors > 0 and code == 0
+    assert all(e.status == ScrapeStatus.COMPLETED for e in manifest.entries.values())
@@ -0,0 +1,243 @@
+"""
+test_scheduler.py — Unit tests for scheduler.py (article-lane priority queue).
+
+Tests: score order with push order on ties, delayed re-enqueue, ``pop``
+waits for in-flight work, ``close`` hands back the queue, each
+``score_entry`` term, ``referenced_slugs`` against an app database, the
+requeue backoff, pieces run by idle workers (and inline without them), and
+``main --priority --workers 2`` / multi-page articles split across
+``--workers 3`` against the mock site.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import scraper.scraper as scraper_module
+from manifest import load_manifest
+from mock_site import MockSite, SiteConfig
+from models import ManifestEntry, ScrapeStatus
+from scheduler import Piece, PriorityScheduler, PriorityWeights, referenced_slugs, requeue_delay, score_entry
+
+BASE = "https://www.tasteofcinema.com"
+NOW = datetime(2026, 10, 19, tzinfo=timezone.utc)
+
+
+def _entry(slug: str, **fields) -> ManifestEntry:
+    return ManifestEntry(url=f"{BASE}/2024/{slug}/", slug=slug, **fields)
+
+
+def _pop_entry(sched: PriorityScheduler) -> ManifestEntry:
+    entry = sched.pop()
+    assert isinstance(entry, ManifestEntry)
+    return entry
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+def test_pops_by_score_then_push_order() -> None:
+    sched = PriorityScheduler()
+    for slug, score in [("a", 1.0), ("b", 5.0), ("c", 1.0), ("d", 3.0)]:
+        sched.push(_entry(slug), score)
+    order = []
+    while (entry := sched.pop()) is not None:
+        assert isinstance(entry, ManifestEntry)
+        order.append(entry.slug)
+        sched.done()
+    assert order == ["b", "d", "a", "c"]
+
+
+def test_delayed_entry_waits_until_due() -> None:
+    clock = FakeClock()
+    sched = PriorityScheduler(clock=clock)
+    sched.push(_entry("late"), 100.0, delay=30)
+    sched.push(_entry("now"), 0.0)
+    assert _pop_entry(sched).slug == "now"
+    sched.done()
+    assert len(sched) == 1
+
+    clock.now = 30.0
+    assert _pop_entry(sched).slug == "late"
+    sched.done()
+    assert sched.pop() is None
+
+
+def test_pop_waits_for_in_flight_work() -> None:
+    sched = PriorityScheduler()
+    sched.push(_entry("a"), 1.0)
+    first = _pop_entry(sched)
+    popped: list[ManifestEntry] = []
+    waiter = threading.Thread(target=lambda: popped.append(_pop_entry(sched)))
+    waiter.start()
+    time.sleep(0.05)
+    assert popped == []  # "a" may still be re-enqueued
+
+    sched.push(first, 1.0)
+    sched.done()
+    waiter.join(timeout=2)
+    assert popped and popped[0].slug == "a"
+    sched.done()
+    assert sched.pop() is None
+
+
+def test_close_returns_queued_entries_and_stops_pop() -> None:
+    sched = PriorityScheduler()
+    sched.push(_entry("a"), 1.0)
+    sched.push(_entry("b"), 2.0, delay=60)
+    assert sorted(e.slug for e in sched.close()) == ["a", "b"]
+    assert sched.pop() is None and len(sched) == 0
+
+
+def test_run_pieces_spreads_over_idle_workers() -> None:
+    sched = PriorityScheduler()
+    sched.push(_entry("owner"), 2.0)
+    sched.push(_entry("next"), 1.0)
+    assert _pop_entry(sched).slug == "owner"
+    threads: set[str] = set()
+    queued = threading.Event()
+
+    def page(n: int):
+        def fetch() -> int:
+            queued.set()
+            threads.add(threading.current_thread().name)
+            time.sleep(0.05)
+            if n == 2:
+                raise ConnectionResetError("reset")
+            return n
+        return fetch
+
+    def helper() -> None:
+        queued.wait(timeout=2)
+        item = sched.pop()
+        assert isinstance(item, Piece)  # pieces go before the queued article
+        item()
+        sched.done()
+
+    workers = [threading.Thread(target=helper, name=f"helper-{i}") for i in range(2)]
+    for worker in workers:
+        worker.start()
+    results = sched.run_pieces([page(n) for n in range(4)])
+    for worker in workers:
+        worker.join(timeout=2)
+
+    assert results[:2] == [0, 1] and isinstance(results[2], OSError) and results[3] == 3
+    assert {"helper-0", "helper-1"} <= threads
+    sched.done()
+    assert _pop_entry(sched).slug == "next"
+
+
+def test_run_pieces_without_helpers_runs_inline() -> None:
+    sched = PriorityScheduler()
+    assert sched.run_pieces([lambda: "a", lambda: "b"]) == ["a", "b"]
+    sched.close()
+    assert sched.run_pieces([lambda: "c"]) == ["c"]  # pieces still run after close
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+
+def test_referenced_article_outranks_everything_else() -> None:
+    old = _entry("old", last_modified="2012-01-01T00:00:00+00:00", failures=2)
+    new = _entry("new", last_modified="2026-10-01T00:00:00+00:00")
+    assert score_entry(old, referenced={"old"}, now=NOW) > score_entry(new, now=NOW)
+
+
+def test_recency_failures_and_cost_terms() -> None:
+    weights = PriorityWeights()
+    recent = _entry("a", last_modified="2026-10-01T00:00:00+00:00")
+    year_old = _entry("b", last_modified="2025-10-19T00:00:00+00:00")
+    undated = _entry("c")
+    assert score_entry(recent, now=NOW) > score_entry(year_old, now=NOW) > score_entry(undated, now=NOW)
+    assert score_entry(recent, now=NOW) - score_entry(year_old, now=NOW) > weights.recency / 2 - 1
+
+    failed = _entry("a", last_modified="2026-10-01T00:00:00+00:00", failures=2)
+    assert score_entry(recent, now=NOW) - score_entry(failed, now=NOW) == 2 * weights.failure
+
+    cheap = _entry("d", pages_found=1, images_found=2)
+    costly = _entry("e", pages_found=4, images_found=60)
+    assert score_entry(cheap, now=NOW) > score_entry(undated, now=NOW) > score_entry(costly, now=NOW)
+
+
+def test_referenced_slugs_reads_open_import_batches(tmp_path: Path) -> None:
+    db = tmp_path / "app.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE import_batches (id INTEGER PRIMARY KEY, source_url TEXT, status TEXT)")
+    conn.executemany(
+        "INSERT INTO import_batches (source_url, status) VALUES (?, ?)",
+        [
+            (f"{BASE}/2024/waiting/", "processing"),
+            (f"{BASE}/2023/queued", None),
+            (f"{BASE}/2022/finished/", "completed"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    assert referenced_slugs(db) == {"waiting", "queued"}
+    assert referenced_slugs(tmp_path / "missing.db") == set()
+    assert referenced_slugs(None) == set()
+
+
+def test_referenced_slugs_without_table(tmp_path: Path) -> None:
+    db = tmp_path / "app.db"
+    sqlite3.connect(db).close()
+    assert referenced_slugs(db) == set()
+
+
+def test_requeue_delay_grows_to_cap() -> None:
+    assert [requeue_delay(n) for n in (1, 2, 3, 5, 9)] == [30.0, 60.0, 120.0, 300.0, 300.0]
+
+
+# ---------------------------------------------------------------------------
+# End to end
+# ---------------------------------------------------------------------------
+
+
+def test_main_priority_with_workers(output_dir: Path) -> None:
+    config = SiteConfig(articles=10, per_sitemap=10, max_pages=1, images_per_page=1, page_kb=2, image_kb=1)
+    with MockSite(config) as site:
+        code = scraper_module.main([
+            "--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0",
+            "--priority", "--workers", "2", "--limit", "6", "--db", str(output_dir / "app.db"),
+        ])
+
+    statuses = [e.status for e in load_manifest(output_dir).entries.values()]
+    assert code == 0
+    assert statuses.count(ScrapeStatus.COMPLETED) == 6
+    assert statuses.count(ScrapeStatus.PENDING) == 4
+
+
+def test_main_splits_multi_page_articles_across_workers(output_dir: Path) -> None:
+    config = SiteConfig(articles=4, per_sitemap=10, min_pages=4, max_pages=4, images_per_page=3,
+                        page_kb=2, image_kb=1)
+    with MockSite(config) as site:
+        code = scraper_module.main([
+            "--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0",
+            "--workers", "3", "--db", str(output_dir / "app.db"),
+        ])
+
+    entries = load_manifest(output_dir).entries.values()
+    assert code == 0
+    assert all(e.status == ScrapeStatus.COMPLETED and e.pages_found == 4 for e in entries)
+    assert all(e.images_status == ScrapeStatus.COMPLETED and e.images_downloaded == e.images_found for e in entries)
@@ -126,3 +126,48 @@ def test_process_article_force_ignores_cache(tmp_path: Path) -> None:
     assert ok is True
     # Should call the fetcher
     assert len(fetch_calls) >= 1
+
+def test_process_article_defers_inline_images_to_lane(tmp_path: Path, monkeypatch) -> None:
+    """Fast lane completes the article after the thumbnail; the lane finishes images."""
+    import images as images_module
+
+    png = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x02\x00\x00\x00"
+    monkeypatch.setattr(images_module, "_download_to_file", lambda url, dest, **_: _write_probe(dest, png))
+
+    articles_dir = tmp_path / "articles"
+    articles_dir.mkdir(parents=True)
+    data = {
+        "title": "Lane Article",
+        "url": "https://example.com/lane",
+        "author": "Test",
+        "content": "a" * 201,
+        "featured_image": "https://example.com/thumb.png",
+        "inline_images": ["https://example.com/one.png", "https://example.com/two.png"],
+        "category": "Lists",
+        "scraped_at": "2026-02-28T00:00:00Z",
+    }
+    (articles_dir / "lane.json").write_text(json.dumps(data), encoding="utf-8")
+    manifest = Manifest(discovered_at="2026-02-28T00:00:00Z", total=1, entries={
+        "lane": ManifestEntry(url="https://example.com/lane", slug="lane")
+    })
+
+    lane = images_module.ImageLane(1, delay=0)
+    ok = process_article(
+        manifest.entries["lane"], tmp_path, manifest, lambda u: b"", 0, False,
+        image_lane=lane,
+    )
+    entry = manifest.entries["lane"]
+    assert ok is True
+    assert entry.status == ScrapeStatus.COMPLETED
+
+    lane.close(wait=True)
+    assert entry.images_status == ScrapeStatus.COMPLETED
+    assert entry.images_downloaded == 3
+    assert [i.file for i in entry.images] == ["00-thumbnail.png", "01-one.png", "02-two.png"]
+
+
+def _write_probe(dest: Path, body: bytes):
+    from images import probe_image
+
+    dest.write_bytes(body)
+    return probe_image(body)
@@ -0,0 +1,95 @@
+"""
+test_serialize.py — Unit tests for the JSON serialization layer.
+
+Tests: byte-compatibility with model_dump_json on both backends (incl.
+non-ASCII text), compact mode, load round-trip, configure validation,
+manifest save with --compact-json.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import serialize
+from models import ArticleData, ImageInfo, Manifest, ManifestEntry, ScrapeStatus
+from serialize import configure, dump_model, load_model
+
+
+@pytest.fixture(autouse=True)
+def _restore_config():
+    backend, pretty = serialize._backend, serialize._pretty
+    yield
+    serialize._backend, serialize._pretty = backend, pretty
+
+
+def _manifest() -> Manifest:
+    entry = ManifestEntry(
+        url="https://www.tasteofcinema.com/2024/best-films/",
+        slug="best-films",
+        last_modified="2024-01-15T00:00:00+00:00",
+        status=ScrapeStatus.COMPLETED,
+        images_status=ScrapeStatus.FAILED,
+        images=[ImageInfo(file="00-thumbnail.jpg", format="jpeg", width=800, height=600)],
+        error='timeout "page 2"\n',
+    )
+    return Manifest(discovered_at="2026-02-28T00:00:00Z", total=1, entries={"best-films": entry})
+
+
+def _article() -> ArticleData:
+    return ArticleData(
+        title="أفضل ١٠ أفلام — Amélie 🎬",
+        content="<p>Line\tone two</p>",
+        author="Jack",
+        url="https://example.com/a/",
+        movie_titles=["Crash"],
+        category="lists",
+        scraped_at="2026-02-28T00:00:00Z",
+    )
+
+
+@pytest.mark.parametrize("backend", serialize.BACKENDS)
+@pytest.mark.parametrize("pretty", [True, False])
+def test_dump_matches_pydantic_bytes(backend: str, pretty: bool) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    configure(backend=backend)
+    for model in (_manifest(), _article()):
+        expected = model.model_dump_json(indent=2 if pretty else None).encode("utf-8")
+        assert dump_model(model, pretty=pretty) == expected
+
+
+def test_configured_pretty_default() -> None:
+    configure(pretty=False)
+    assert b"\n" not in dump_model(_manifest())
+    configure(pretty=True)
+    assert dump_model(_manifest()).startswith(b'{\n  "version": 1')
+
+
+def test_load_round_trip() -> None:
+    manifest = _manifest()
+    loaded = load_model(Manifest, dump_model(manifest, pretty=False))
+    assert loaded == manifest
+    assert loaded.entries["best-films"].status is ScrapeStatus.COMPLETED
+
+
+def test_configure_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        configure(backend="ujson")
+
+
+def test_compact_manifest_save(output_dir: Path) -> None:
+    from manifest import load_manifest, save_manifest
+
+    configure(pretty=False)
+    save_manifest(_manifest(), output_dir)
+
+    lines = (output_dir / "manifest.json").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["completed"] == 1
+    assert load_manifest(output_dir).entries["best-films"].images[0].width == 800
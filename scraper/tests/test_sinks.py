@@ -0,0 +1,236 @@
+"""
+test_sinks.py — Unit tests for article output sinks.
+
+Tests: per-article JSON sink, JSONL corpus round-trip, shard rotation,
+streaming readability of gzip shards, zstd shards, crash-tail recovery,
+format-agnostic read_article lookup, SQLite staging table batching/upsert.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import ArticleData
+from sinks import (
+    CORPUS_DIRNAME,
+    STAGING_TABLE,
+    JsonFileSink,
+    JsonlCorpusSink,
+    SqliteStagingSink,
+    load_corpus_index,
+    open_sink,
+    read_article,
+    read_staged_article,
+)
+
+
+def _article(slug: str, content: str = "body " * 60) -> ArticleData:
+    return ArticleData(
+        title=f"Title {slug}",
+        content=content,
+        author="Author",
+        url=f"https://example.com/{slug}/",
+        category="lists",
+        scraped_at="2026-02-28T00:00:00Z",
+    )
+
+
+def _found(record: dict | None) -> dict:
+    assert record is not None
+    return record
+
+
+def test_json_file_sink_round_trip(output_dir: Path) -> None:
+    sink = JsonFileSink(output_dir)
+    path = sink.write("art", _article("art"))
+
+    assert path == output_dir / "articles" / "art.json"
+    assert _found(sink.read("art"))["title"] == "Title art"
+    assert sink.read("missing") is None
+
+
+def test_corpus_round_trip(output_dir: Path) -> None:
+    sink = JsonlCorpusSink(output_dir)
+    sink.write("one", _article("one"))
+    sink.write("two", _article("two"))
+
+    assert _found(sink.read("two"))["title"] == "Title two"
+    sink.close()
+
+    reopened = JsonlCorpusSink(output_dir)
+    assert _found(reopened.read("one"))["url"] == "https://example.com/one/"
+    assert set(load_corpus_index(output_dir / CORPUS_DIRNAME)) == {"one", "two"}
+
+
+def test_gzip_shard_is_streamable(output_dir: Path) -> None:
+    sink = JsonlCorpusSink(output_dir)
+    for slug in ("a", "b", "c"):
+        sink.write(slug, _article(slug))
+    sink.close()
+
+    shard = output_dir / CORPUS_DIRNAME / "articles-00000.jsonl.gz"
+    with gzip.open(shard, "rt", encoding="utf-8") as fh:
+        titles = [json.loads(line)["title"] for line in fh]
+    assert titles == ["Title a", "Title b", "Title c"]
+
+
+def test_rewrite_overrides_index(output_dir: Path) -> None:
+    sink = JsonlCorpusSink(output_dir)
+    sink.write("art", _article("art", content="old " * 60))
+    sink.write("art", _article("art", content="new " * 60))
+    sink.close()
+
+    assert _found(read_article(output_dir, "art"))["content"].startswith("new")
+
+
+def test_shards_rotate_at_size_limit(output_dir: Path) -> None:
+    sink = JsonlCorpusSink(output_dir, compression="none", shard_max_bytes=600)
+    for slug in ("a", "b", "c"):
+        sink.write(slug, _article(slug))
+    sink.close()
+
+    shards = sorted(p.name for p in (output_dir / CORPUS_DIRNAME).glob("articles-*"))
+    assert shards == ["articles-00000.jsonl", "articles-00001.jsonl", "articles-00002.jsonl"]
+    assert _found(read_article(output_dir, "c"))["title"] == "Title c"
+
+
+def test_zstd_shards(output_dir: Path) -> None:
+    pytest.importorskip("zstandard")
+    sink = open_sink(output_dir, "jsonl", compression="zstd")
+    sink.write("art", _article("art"))
+    sink.close()
+
+    assert (output_dir / CORPUS_DIRNAME / "articles-00000.jsonl.zst").exists()
+    assert _found(read_article(output_dir, "art"))["title"] == "Title art"
+
+
+def test_unindexed_tail_is_truncated(output_dir: Path) -> None:
+    sink = JsonlCorpusSink(output_dir)
+    sink.write("art", _article("art"))
+    sink.close()
+
+    shard = output_dir / CORPUS_DIRNAME / "articles-00000.jsonl.gz"
+    indexed_size = shard.stat().st_size
+    with shard.open("ab") as fh:
+        fh.write(b"\x1f\x8b partial member from a crash")
+
+    sink = JsonlCorpusSink(output_dir)
+    sink.write("next", _article("next"))
+    sink.close()
+
+    with gzip.open(shard, "rt", encoding="utf-8") as fh:
+        assert len(fh.readlines()) == 2
+    assert load_corpus_index(output_dir / CORPUS_DIRNAME)["next"][1] == indexed_size
+
+
+def test_read_article_prefers_json_file(output_dir: Path) -> None:
+    JsonFileSink(output_dir).write("art", _article("art", content="file " * 60))
+    corpus = JsonlCorpusSink(output_dir)
+    corpus.write("art", _article("art", content="corpus " * 60))
+    corpus.close()
+
+    assert _found(read_article(output_dir, "art"))["content"].startswith("file")
+    assert read_article(output_dir, "missing") is None
+
+
+def test_unknown_compression_rejected(output_dir: Path) -> None:
+    with pytest.raises(ValueError):
+        JsonlCorpusSink(output_dir, compression="lz4")
+
+
+# ---------------------------------------------------------------------------
+# SQLite staging sink
+# ---------------------------------------------------------------------------
+
+
+def _count(db_path: Path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {STAGING_TABLE}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_staging_sink_batches_writes(tmp_path: Path) -> None:
+    db_path = tmp_path / "cinema.db"
+    sink = SqliteStagingSink(db_path, batch_size=2)
+
+    sink.write("a", _article("a"))
+    assert _count(db_path) == 0  # still buffered
+    sink.write("b", _article("b"))
+    assert _count(db_path) == 2
+    sink.write("c", _article("c"))
+    sink.close()
+
+    assert _count(db_path) == 3
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+
+
+def test_staging_sink_upserts_by_slug(tmp_path: Path) -> None:
+    db_path = tmp_path / "cinema.db"
+    sink = SqliteStagingSink(db_path)
+    sink.write("art", _article("art", content="old " * 60))
+    sink.write("art", _article("art", content="new " * 60))
+    sink.close()
+
+    assert _count(db_path) == 1
+    assert _found(read_staged_article(db_path, "art"))["content"].startswith("new")
+
+
+def test_staging_sink_rejects_use_after_close(tmp_path: Path) -> None:
+    sink = SqliteStagingSink(tmp_path / "cinema.db")
+    sink.close()
+    sink.close()  # idempotent
+    with pytest.raises(ValueError, match="closed"):
+        sink.write("art", _article("art"))
+    with pytest.raises(ValueError, match="closed"):
+        sink.read("art")
+
+
+def test_staging_round_trip_matches_article_shape(tmp_path: Path) -> None:
+    db_path = tmp_path / "cinema.db"
+    article = _article("art").model_copy(
+        update={"tags": ["oscars"], "inline_images": ["https://example.com/a.jpg"], "pages_merged": 3}
+    )
+    sink = open_sink(tmp_path, "sqlite", db_path=db_path)
+    sink.write("art", article)
+
+    assert sink.read("art") == json.loads(article.model_dump_json())
+    sink.close()
+    assert ArticleData.model_validate(read_staged_article(db_path, "art")) == article
+
+
+def test_staging_table_matches_app_schema(tmp_path: Path) -> None:
+    schema = (Path(__file__).parent.parent.parent / "data" / "schema.sql").read_text(encoding="utf-8")
+    app_db = sqlite3.connect(tmp_path / "app.db")
+    app_db.executescript(schema)
+    app_cols = [r[1] for r in app_db.execute(f"PRAGMA table_info({STAGING_TABLE})")]
+    app_db.close()
+
+    SqliteStagingSink(tmp_path / "sink.db").close()
+    sink_db = sqlite3.connect(tmp_path / "sink.db")
+    sink_cols = [r[1] for r in sink_db.execute(f"PRAGMA table_info({STAGING_TABLE})")]
+    sink_db.close()
+
+    assert app_cols == sink_cols
+
+
+def test_read_article_falls_back_to_staging(output_dir: Path, tmp_path: Path) -> None:
+    db_path = tmp_path / "cinema.db"
+    sink = SqliteStagingSink(db_path)
+    sink.write("art", _article("art"))
+    sink.close()
+
+    assert read_article(output_dir, "art") is None
+    assert _found(read_article(output_dir, "art", db_path=db_path))["title"] == "Title art"
+    assert read_staged_article(tmp_path / "missing.db", "art") is None
@@ -0,0 +1,130 @@
+"""
+test_snapshot.py — Unit tests for the memory-mapped manifest snapshot.
+
+Tests: save_manifest publishes manifest.snap, counts / rows / slug lookup
+match the manifest (plain and compact, with live edits and deletions),
+status scans, a mapped snapshot survives republication, throttled saves
+keep a recent snapshot, bad files are rejected.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from manifest import compact_manifest, save_manifest, update_entry_status
+from models import Manifest, ManifestEntry, ScrapeStatus
+from snapshot import SNAPSHOT_FILENAME, ManifestSnapshot, write_snapshot
+
+BASE = "https://www.tasteofcinema.com"
+
+
+def _manifest() -> Manifest:
+    manifest = Manifest(discovered_at="2026-01-01T00:00:00Z", total=0)
+    for slug, year, date, status in [
+        ("zebra", 2022, "2022-06-15T10:00:00+00:00", ScrapeStatus.PENDING),
+        ("alpha", 2024, "2024-03-20T14:30:00-08:00", ScrapeStatus.COMPLETED),
+        ("mango", 2023, None, ScrapeStatus.FAILED),
+        ("café-films", 2021, "not a date", ScrapeStatus.PENDING),
+    ]:
+        manifest.entries[slug] = ManifestEntry(
+            url=f"{BASE}/{year}/{slug}/", slug=slug, last_modified=date, status=status
+        )
+    return manifest
+
+
+def _open(output_dir: Path) -> ManifestSnapshot:
+    snap = ManifestSnapshot.open(output_dir)
+    assert snap is not None
+    return snap
+
+
+def _row(snap: ManifestSnapshot, slug: str) -> int:
+    row = snap.find(slug)
+    assert row is not None
+    return row
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_save_manifest_publishes_snapshot(output_dir: Path, compact: bool) -> None:
+    manifest = _manifest()
+    if compact:
+        compact_manifest(manifest)
+    save_manifest(manifest, output_dir)
+
+    with _open(output_dir) as snap:
+        assert len(snap) == 4
+        assert snap.counts() == {"pending": 2, "completed": 1, "failed": 1, "in_progress": 0}
+        assert [snap.slug(i) for i in range(len(snap))] == list(manifest.entries)
+        assert snap.status_of("alpha") == "completed"
+        assert snap.status_of("café-films") == "pending"
+        assert snap.status_of("missing") is None
+        assert list(snap.select("pending")) == [0, 3]
+
+
+def test_entry_columns(output_dir: Path) -> None:
+    manifest = _manifest()
+    manifest.entries["alpha"].scraped_at = "2026-02-28T14:32:11Z"
+    manifest.entries["alpha"].pages_found = 3
+    path = write_snapshot(manifest, output_dir)
+    assert path is not None
+
+    with ManifestSnapshot(path) as snap:
+        alpha = snap.entry(_row(snap, "alpha"))
+        assert alpha["last_modified"] == 1710973800  # 2024-03-20T22:30:00Z
+        assert alpha["scraped_at"] == 1772289131
+        assert (alpha["year"], alpha["month"], alpha["pages_found"]) == (2024, 3, 3)
+        mango = snap.entry(_row(snap, "mango"))
+        assert mango["last_modified"] is None and mango["month"] is None
+        assert snap.entry(_row(snap, "café-films"))["last_modified"] is None  # unparseable
+
+
+def test_compact_live_edits_and_deletions(output_dir: Path) -> None:
+    manifest = _manifest()
+    store = compact_manifest(manifest)
+    update_entry_status(manifest, "zebra", ScrapeStatus.COMPLETED, pages_found=2)
+    del store["mango"]
+    write_snapshot(manifest, output_dir)
+
+    with _open(output_dir) as snap:
+        assert len(snap) == 3
+        assert snap.counts() == {"pending": 1, "completed": 2, "failed": 0, "in_progress": 0}
+        assert snap.find("mango") is None
+        assert snap.entry(_row(snap, "zebra"))["pages_found"] == 2
+    assert store.live == 1  # publishing does not pack live entries
+
+
+def test_mapped_snapshot_survives_republish(output_dir: Path) -> None:
+    manifest = _manifest()
+    write_snapshot(manifest, output_dir)
+    with _open(output_dir) as old:
+        manifest.entries["zebra"].status = ScrapeStatus.COMPLETED
+        write_snapshot(manifest, output_dir)
+        assert old.status_of("zebra") == "pending"
+        with _open(output_dir) as new:
+            assert new.status_of("zebra") == "completed"
+    assert not (output_dir / (SNAPSHOT_FILENAME + ".tmp")).exists()
+
+
+def test_throttled_save_keeps_recent_snapshot(output_dir: Path) -> None:
+    manifest = _manifest()
+    save_manifest(manifest, output_dir)
+    update_entry_status(manifest, "zebra", ScrapeStatus.COMPLETED)
+    save_manifest(manifest, output_dir, snapshot_interval=60)
+    with _open(output_dir) as snap:
+        assert snap.status_of("zebra") == "pending"  # within the interval: not republished
+
+    save_manifest(manifest, output_dir)  # unthrottled (final) save
+    with _open(output_dir) as snap:
+        assert snap.status_of("zebra") == "completed"
+
+
+def test_open_missing_and_invalid(output_dir: Path) -> None:
+    assert ManifestSnapshot.open(output_dir) is None
+    (output_dir / SNAPSHOT_FILENAME).write_bytes(b"not a snapshot" * 20)
+    with pytest.raises(ValueError):
+        ManifestSnapshot.open(output_dir)
@@ -7,6 +7,8 @@ Verifies:
 - null-date entries placed last
 - correct handling of different timezone offsets
 - --limit applied after sort
+- query_entries: status/year/month/limit in one pass, plain and compact
+  stores agreeing with filter → sort → slice
 """
 
 from __future__ import annotations
@@ -19,7 +21,13 @@ import pytest
 # Adjust sys.path so tests can import from scraper/ root
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from manifest import get_sorted_entries
+from manifest import (
+    compact_manifest,
+    extract_month_from_lastmod,
+    extract_year_from_url,
+    get_sorted_entries,
+    query_entries,
+)
 from models import Manifest, ManifestEntry, ScrapeStatus
 
 
@@ -153,3 +161,76 @@ class TestGetSortedEntries:
         manifest = _make_manifest(entries)
         result = get_sorted_entries(manifest, direction="latest", pending_only=False)
         assert len(result) == 2
+
+
+# ---------------------------------------------------------------------------
+# query_entries — single-pass planner
+# ---------------------------------------------------------------------------
+
+
+def _query_corpus() -> list[ManifestEntry]:
+    """Duplicate dates (tie order), bad and naive dates, undated rows, mixed status."""
+    statuses = [ScrapeStatus.PENDING, ScrapeStatus.FAILED, ScrapeStatus.COMPLETED]
+    dates = [
+        "2023-05-01T00:00:00+00:00",
+        "2024-05-01T00:00:00+00:00",
+        None,
+        "2023-05-01T00:00:00+00:00",
+        "not-a-date",
+        "2024-02-10T12:00:00",
+        "2023-11-30T23:00:00-05:00",
+    ]
+    entries = []
+    for i in range(60):
+        year = 2022 + i % 3
+        entries.append(
+            ManifestEntry(
+                url=f"https://www.tasteofcinema.com/{year}/article-{i}/",
+                slug=f"article-{i}",
+                last_modified=dates[i % len(dates)],
+                status=statuses[i % 5 % 3],
+            )
+        )
+    return entries
+
+
+def _reference(manifest, *, year=None, month=None, direction="latest", limit=None):
+    """The pre-planner pipeline: sort, filter by year, filter by month, slice."""
+    result = get_sorted_entries(manifest, direction=direction, pending_only=True)
+    if year is not None:
+        result = [e for e in result if extract_year_from_url(e.url) == year]
+    if month is not None:
+        result = [e for e in result if extract_month_from_lastmod(e.last_modified) == month]
+    return result[:limit] if limit is not None else result
+
+
+class TestQueryEntries:
+    @pytest.mark.parametrize("compact", [False, True])
+    @pytest.mark.parametrize("direction", ["latest", "oldest"])
+    @pytest.mark.parametrize(
+        "year, month, limit",
+        [(None, None, None), (None, None, 5), (2023, None, 4), (None, 5, None), (2024, 5, 2), (None, None, 1000)],
+    )
+    def test_matches_filter_sort_slice(self, compact, direction, year, month, limit):
+        expected = [e.slug for e in _reference(_make_manifest(_query_corpus()), year=year, month=month, direction=direction, limit=limit)]
+        manifest = _make_manifest(_query_corpus())
+        if compact:
+            compact_manifest(manifest)
+        result = query_entries(manifest, year=year, month=month, direction=direction, limit=limit)
+        assert [e.slug for e in result] == expected
+
+    def test_limit_fills_from_undated_tail(self):
+        entries = [
+            ManifestEntry(url="https://www.tasteofcinema.com/2023/a/", slug="a", last_modified="2023-01-01T00:00:00+00:00"),
+            ManifestEntry(url="https://www.tasteofcinema.com/2023/b/", slug="b", last_modified=None),
+            ManifestEntry(url="https://www.tasteofcinema.com/2023/c/", slug="c", last_modified=None),
+        ]
+        result = query_entries(_make_manifest(entries), limit=2)
+        assert [e.slug for e in result] == ["a", "b"]
+
+    def test_any_status_and_zero_limit(self, sample_entries):
+        sample_entries[0].status = ScrapeStatus.COMPLETED
+        manifest = _make_manifest(sample_entries)
+        assert "old-article" in [e.slug for e in query_entries(manifest, statuses=None)]
+        assert "old-article" not in [e.slug for e in query_entries(manifest)]
+        assert query_entries(manifest, limit=0) == []
@@ -0,0 +1,182 @@
+"""
+test_throttle.py — Unit tests for the ``--adaptive`` AIMD controller.
+
+Tests: error classification, additive increase up to the bounds,
+multiplicative decrease on 429 / timeouts (once per cooldown), 404s and
+bad bodies leave the state alone, latency above the baseline counts as
+congestion, the concurrency limit blocks extra requests, metrics export,
+and a ``main --adaptive`` run against the mock site.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import urllib.error
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import pytest
+
+import scraper.scraper as scraper_module
+from images import InvalidImageError
+from metrics import ScrapeMetrics
+from mock_site import MockSite, SiteConfig
+from throttle import ERROR, NEUTRAL, OK, THROTTLED, TIMEOUT, AdaptiveThrottle, ThrottleConfig, classify
+
+URL = "https://www.tasteofcinema.com/2024/a/"
+HOST = "www.tasteofcinema.com"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _http_error(code: int) -> urllib.error.HTTPError:
+    return urllib.error.HTTPError(URL, code, "x", {}, None)  # type: ignore[arg-type]
+
+
+def _throttle(clock=None, **overrides) -> AdaptiveThrottle:
+    config = ThrottleConfig(**{"initial_interval": 1.0, "min_interval": 0.0, "interval_step": 0.25,
+                               "max_concurrency": 4, **overrides})
+    return AdaptiveThrottle(config, clock=clock or FakeClock())
+
+
+def _respond(throttle: AdaptiveThrottle, outcome: str, latency: float = 0.1, kind: str = "page") -> dict:
+    state = throttle._host(HOST)
+    state.next_start = 0.0  # tests drive release() directly; skip the pacing wait
+    throttle.acquire(HOST)
+    throttle.release(HOST, kind, outcome, latency)
+    return throttle.snapshot()[HOST]
+
+
+def test_classify() -> None:
+    assert classify(None) == OK
+    assert classify(_http_error(429)) == THROTTLED and classify(_http_error(503)) == THROTTLED
+    assert classify(_http_error(500)) == ERROR
+    assert classify(_http_error(404)) == NEUTRAL
+    assert classify(TimeoutError()) == TIMEOUT
+    assert classify(urllib.error.URLError(TimeoutError())) == TIMEOUT
+    assert classify(urllib.error.URLError(ConnectionRefusedError())) == ERROR
+    assert classify(InvalidImageError("not an image")) == NEUTRAL
+
+
+def test_additive_increase_is_bounded() -> None:
+    throttle = _throttle()
+    state = _respond(throttle, OK)
+    assert state["concurrency_limit"] == 2.0 and state["interval_seconds"] == 0.75
+    for _ in range(50):
+        state = _respond(throttle, OK)
+    assert state["concurrency_limit"] == 4 and state["interval_seconds"] == 0.0
+    increases = state["decisions"]["increase"]
+    assert _respond(throttle, OK)["decisions"]["increase"] == increases  # at the bounds: no decision
+
+
+def test_multiplicative_decrease_once_per_cooldown() -> None:
+    clock = FakeClock()
+    throttle = _throttle(clock, initial_concurrency=4.0, initial_interval=0.5)
+    state = _respond(throttle, THROTTLED)
+    assert (state["concurrency_limit"], state["interval_seconds"]) == (2.0, 1.0)
+    state = _respond(throttle, TIMEOUT)  # same burst
+    assert state["concurrency_limit"] == 2.0 and state["decisions"]["decrease"] == 1
+    clock.now += 5
+    state = _respond(throttle, ERROR)
+    assert (state["concurrency_limit"], state["interval_seconds"]) == (1.0, 2.0)
+    clock.now += 5
+    assert _respond(throttle, THROTTLED)["concurrency_limit"] == 1.0  # floor
+    assert state["outcomes"] == {"throttled": 1, "timeout": 1, "error": 1}
+
+
+def test_neutral_outcomes_leave_state() -> None:
+    throttle = _throttle()
+    before = _respond(throttle, NEUTRAL)
+    assert before["decisions"] == {"increase": 0, "decrease": 0}
+    assert (before["concurrency_limit"], before["interval_seconds"]) == (1.0, 1.0)
+
+
+def test_latency_above_baseline_backs_off() -> None:
+    throttle = _throttle(initial_concurrency=4.0)
+    for _ in range(6):
+        _respond(throttle, OK, latency=0.1)
+    _respond(throttle, OK, latency=2.0, kind="image")  # other kind: own baseline
+    state = _respond(throttle, OK, latency=0.1)
+    assert state["decisions"]["decrease"] == 0
+    for _ in range(3):
+        state = _respond(throttle, OK, latency=1.5)
+    assert state["decisions"]["decrease"] == 1 and state["concurrency_limit"] < 4
+    assert state["baseline_seconds"]["page"] < 0.2
+
+
+def test_concurrency_limit_blocks() -> None:
+    throttle = AdaptiveThrottle(ThrottleConfig(initial_interval=0.0, min_interval=0.0, max_concurrency=1))
+    started = threading.Event()
+    release = threading.Event()
+    order: list[str] = []
+
+    def slow(url: str) -> bytes:
+        order.append("slow")
+        started.set()
+        release.wait(5)
+        return b"x"
+
+    def second() -> None:
+        throttle.fetcher(lambda url: order.append("fast") or b"y")(URL)
+
+    first = threading.Thread(target=throttle.fetcher(slow), args=(URL,))
+    first.start()
+    started.wait(5)
+    waiter = threading.Thread(target=second)
+    waiter.start()
+    time.sleep(0.05)
+    assert order == ["slow"] and throttle.snapshot()[HOST]["in_flight"] == 1
+    release.set()
+    first.join()
+    waiter.join()
+    assert order == ["slow", "fast"]
+
+
+def test_fetcher_reraises_and_records() -> None:
+    throttle = _throttle()
+
+    def gone(url: str) -> bytes:
+        raise _http_error(429)
+
+    with pytest.raises(urllib.error.HTTPError):
+        throttle.fetcher(gone)(URL)
+    assert throttle.snapshot()[HOST]["outcomes"] == {"throttled": 1}
+
+
+def test_metrics_export() -> None:
+    throttle = _throttle()
+    _respond(throttle, OK)
+    metrics = ScrapeMetrics()
+    metrics.throttle_state = throttle.snapshot
+    text = metrics.render()
+    assert f'scraper_throttle_concurrency_limit{{host="{HOST}"}} 2' in text
+    assert f'scraper_throttle_decisions_total{{host="{HOST}",decision="increase"}} 1' in text
+    assert metrics.snapshot()["throttle"][HOST]["interval_seconds"] == 0.75
+    assert "scraper_throttle" not in ScrapeMetrics().render()
+
+
+def test_main_adaptive_against_mock_site(output_dir: Path, capsys) -> None:
+    config = SiteConfig(articles=8, max_pages=2, images_per_page=2, page_kb=2, image_kb=1,
+                        error_rate=0.2, retry_after=None, seed=1)
+    with MockSite(config) as site:
+        code = scraper_module.main([
+            "--base-url", site.base_url, "--output-dir", str(output_dir), "--adaptive",
+            "--delay", "0.05", "--min-delay", "0", "--image-workers", "2", "--max-retries", "0",
+            "--requeue", "0",
+        ])
+        errors = site.stats()["requests"].get("error", 0)
+
+    out = capsys.readouterr().out
+    assert code in (0, 1) and errors > 0
+    assert "Adaptive [127.0.0.1:" in out and "decreases)" in out
+    assert ", 0 decreases" not in out
@@ -0,0 +1,168 @@
+"""
+test_timing.py — Unit tests for per-article stage timing and the trace.
+
+Tests: exclusive nested spans, spans on other threads and the waiting span,
+sleep/fetch/sink wrappers, trace records
+from process_article (multi-page article, fast lane + image lane), the
+summary breakdown, torn trace lines.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import images
+import scraper.scraper as scraper_module
+from images import ImageLane
+from models import Manifest, ManifestEntry
+from timing import ArticleTimer, TraceWriter, format_summary, load_trace, summarize_trace
+
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x10\x00\x00\x00\x10\x08\x02\x00\x00\x00"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_nested_spans_are_exclusive() -> None:
+    clock = FakeClock()
+    timer = ArticleTimer("a", clock=clock, sleeper=clock.sleep)
+    fetch = timer.fetcher(lambda url: (clock.sleep(0.3), b"x" * 10)[1])
+
+    with timer.span("parse"):
+        clock.now += 0.05
+        fetch("https://example.com/2/")
+        timer.sleep(2.0)
+        clock.now += 0.05
+    clock.now += 0.1
+
+    record = timer.record()
+    assert record["parse_ms"] == 100.0
+    assert record["fetch_ms"] == 300.0
+    assert record["sleep_ms"] == 2000.0
+    assert record["other_ms"] == 100.0
+    assert record["total_ms"] == 2500.0
+    assert (record["fetches"], record["bytes"]) == (1, 10)
+
+
+def test_spans_on_other_threads_and_waiting() -> None:
+    clock = FakeClock()
+    timer = ArticleTimer("a", clock=clock, sleeper=clock.sleep)
+    fetch = timer.fetcher(lambda url: (clock.sleep(0.3), b"x" * 10)[1])
+
+    with timer.span("parse"):
+        clock.now += 0.05
+        with timer.waiting():  # another worker fetches page 2 meanwhile
+            worker = threading.Thread(target=fetch, args=("https://example.com/2/",))
+            worker.start()
+            worker.join()
+            clock.now += 0.2
+        clock.now += 0.05
+
+    record = timer.record()
+    assert record["parse_ms"] == 100.0
+    assert record["fetch_ms"] == 300.0  # booked by the worker's own span
+    assert record["other_ms"] == 200.0  # the wait itself
+    assert (record["fetches"], record["bytes"]) == (1, 10)
+
+
+def test_timed_sink_passes_through() -> None:
+    clock = FakeClock()
+    timer = ArticleTimer("a", clock=clock)
+
+    class Sink:
+        label = "sink"
+
+        def write(self, slug, article):
+            clock.now += 0.02
+            return f"{slug}.json"
+
+    sink = timer.sink(Sink())
+    assert sink.write("a", None) == "a.json"
+    assert sink.label == "sink"
+    assert timer.record()["write_ms"] == 20.0
+
+
+def test_process_article_trace_records(
+    tmp_path: Path, multi_page_html_p1: str, multi_page_html_p2: str, monkeypatch
+) -> None:
+    def fake_download(url: str, dest: Path, **_):
+        dest.write_bytes(PNG)
+        return images.probe_image(PNG)
+
+    monkeypatch.setattr(images, "_download_to_file", fake_download)
+    pages = {
+        "https://example.com/all-25-best-picture-winners/": multi_page_html_p1.encode(),
+        "https://example.com/all-25-best-picture-winners/2/": multi_page_html_p2.encode(),
+    }
+    manifest = Manifest(discovered_at="2026-01-01T00:00:00Z", total=1, entries={
+        "winners": ManifestEntry(url="https://example.com/all-25-best-picture-winners/", slug="winners"),
+    })
+    tracer = TraceWriter(tmp_path / "trace.jsonl")
+    lane = ImageLane(1, delay=0.001)
+
+    ok = scraper_module.process_article(
+        manifest.entries["winners"], tmp_path, manifest, pages.__getitem__, 0.001, False,
+        image_lane=lane, tracer=tracer,
+    )
+    lane.close(wait=True)
+    tracer.close()
+
+    assert ok is True
+    article, batch = load_trace(tmp_path / "trace.jsonl")
+    assert article["kind"] == "article" and article["ok"] is True
+    assert (article["pages"], article["fetches"]) == (2, 2)
+    assert article["bytes"] == sum(len(b) for b in pages.values()) + len(PNG)  # + thumbnail
+    assert article["sleep_ms"] > 0 and article["parse_ms"] > 0 and article["write_ms"] > 0
+    assert batch["kind"] == "image_lane" and batch["slug"] == "winners"
+    assert batch["images"] == len(manifest.entries["winners"].images) - 1
+    assert batch["sleep_ms"] > 0
+    assert tracer.records == [article, batch]
+
+
+def test_failed_article_is_traced(tmp_path: Path) -> None:
+    manifest = Manifest(discovered_at="2026-01-01T00:00:00Z", total=1, entries={
+        "gone": ManifestEntry(url="https://example.com/gone/", slug="gone"),
+    })
+    tracer = TraceWriter(tmp_path / "trace.jsonl")
+
+    def broken(url: str) -> bytes:
+        raise ConnectionResetError("connection reset")
+
+    assert scraper_module.process_article(manifest.entries["gone"], tmp_path, manifest, broken, 0, False, tracer=tracer) is False
+    (record,) = tracer.records
+    assert record["ok"] is False and record["error"] == "connection reset"
+
+
+def test_summary_breakdown(tmp_path: Path) -> None:
+    base = {"kind": "article", "ok": True, "cached": False, "pages": 2, "bytes": 1000, "cache_ms": 0,
+            "write_ms": 0, "manifest_ms": 0, "images_ms": 0}
+    records = [
+        {**base, "slug": "a", "fetch_ms": 1000, "parse_ms": 500, "sleep_ms": 6000, "other_ms": 500, "total_ms": 8000},
+        {**base, "slug": "b", "fetch_ms": 3000, "parse_ms": 500, "sleep_ms": 6000, "other_ms": 500, "total_ms": 10000},
+        {"kind": "image_lane", "slug": "a", "images": 4, "bytes": 4000, "sleep_ms": 3000, "total_ms": 4000},
+    ]
+    summary = summarize_trace(records)
+
+    assert summary["articles"] == 2 and summary["wall_seconds"] == 18
+    assert summary["categories"] == {"sleep": 12, "network": 4, "cpu/disk": 1, "other": 1}
+    assert summary["share"]["sleep"] == 12 / 18
+    assert (summary["lane_batches"], summary["lane_images"], summary["lane_sleep_seconds"]) == (1, 4, 3)
+    text = format_summary(summary)
+    assert "sleep" in text and "66.7%" in text and "image lane: 1 articles" in text
+
+    path = tmp_path / "trace.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in records) + '\n{"kind": "arti', encoding="utf-8")
+    assert load_trace(path) == records
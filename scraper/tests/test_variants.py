@@ -0,0 +1,179 @@
+"""
+test_variants.py — Unit tests for responsive image variant generation.
+
+Tests: width variants + no upscaling, srcset manifest contents,
+incremental skip (mtime/hash), re-render on change, alpha kept for LA
+sources, variant files of removed sources deleted, process pool path.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+Image = pytest.importorskip("PIL.Image")
+
+from variants import build_variants, variant_filename
+
+
+def _write_image(path: Path, width: int, height: int, color: str = "red") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (width, height), color).save(path, "JPEG")
+
+
+def _srcset(output_dir: Path, slug: str) -> dict:
+    return json.loads((output_dir / "variants" / slug / "srcset.json").read_text())
+
+
+def test_variant_filename() -> None:
+    assert variant_filename("01-crash-2005.jpg", 480) == "01-crash-2005-480w.webp"
+
+
+def test_build_variants_renders_widths(output_dir: Path) -> None:
+    _write_image(output_dir / "images" / "art" / "00-thumbnail.jpg", 1600, 800)
+
+    result = build_variants(output_dir, widths=(480, 960, 1440))
+
+    assert result.rendered == 1
+    assert result.failed == 0
+    out = output_dir / "variants" / "art"
+    for width in (480, 960, 1440):
+        with Image.open(out / f"00-thumbnail-{width}w.webp") as img:
+            assert img.size == (width, width // 2)
+
+    record = _srcset(output_dir, "art")["images"]["00-thumbnail.jpg"]
+    assert record["width"] == 1600
+    assert record["srcset"].startswith("00-thumbnail-480w.webp 480w")
+
+
+def test_build_variants_does_not_upscale(output_dir: Path) -> None:
+    _write_image(output_dir / "images" / "art" / "01-small.jpg", 600, 300)
+
+    build_variants(output_dir, widths=(480, 960, 1440))
+
+    record = _srcset(output_dir, "art")["images"]["01-small.jpg"]
+    assert [v["width"] for v in record["variants"]] == [480, 600]
+
+
+def test_build_variants_skips_unchanged(output_dir: Path) -> None:
+    _write_image(output_dir / "images" / "art" / "01-a.jpg", 800, 400)
+    build_variants(output_dir, widths=(480,))
+
+    second = build_variants(output_dir, widths=(480,))
+    assert second.rendered == 0
+    assert second.skipped == 1
+
+
+def test_build_variants_touch_without_change_is_skipped(output_dir: Path) -> None:
+    src = output_dir / "images" / "art" / "01-a.jpg"
+    _write_image(src, 800, 400)
+    build_variants(output_dir, widths=(480,))
+
+    stat = src.stat()
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+    result = build_variants(output_dir, widths=(480,))
+    assert result.rendered == 0
+    assert result.skipped == 1
+    assert _srcset(output_dir, "art")["images"]["01-a.jpg"]["mtime_ns"] == src.stat().st_mtime_ns
+
+
+def test_build_variants_rerenders_changed_source(output_dir: Path) -> None:
+    src = output_dir / "images" / "art" / "01-a.jpg"
+    _write_image(src, 800, 400)
+    build_variants(output_dir, widths=(480,))
+
+    _write_image(src, 1000, 500, color="blue")
+    stat = src.stat()
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+    result = build_variants(output_dir, widths=(480,))
+    assert result.rendered == 1
+    assert _srcset(output_dir, "art")["images"]["01-a.jpg"]["width"] == 1000
+
+
+def test_build_variants_reports_undecodable_source(output_dir: Path) -> None:
+    bad = output_dir / "images" / "art" / "01-broken.jpg"
+    bad.parent.mkdir(parents=True)
+    bad.write_bytes(b"<html>not an image</html>")
+
+    result = build_variants(output_dir, widths=(480,))
+    assert result.failed == 1
+    assert "01-broken.jpg" not in _srcset(output_dir, "art")["images"]
+
+
+def test_build_variants_keeps_alpha_of_la_source(output_dir: Path) -> None:
+    src = output_dir / "images" / "art" / "01-logo.png"
+    src.parent.mkdir(parents=True)
+    Image.new("LA", (960, 480), (128, 0)).save(src, "PNG")
+
+    build_variants(output_dir, widths=(480,))
+
+    with Image.open(output_dir / "variants" / "art" / "01-logo-480w.webp") as img:
+        assert img.mode == "RGBA" and img.getpixel((0, 0))[3] == 0
+
+
+def test_build_variants_deletes_variants_of_removed_source(output_dir: Path) -> None:
+    src = output_dir / "images" / "art" / "01-gone.jpg"
+    _write_image(src, 1000, 500)
+    build_variants(output_dir, widths=(480, 960))
+    out = output_dir / "variants" / "art"
+    assert (out / "01-gone-480w.webp").exists()
+
+    src.unlink()
+    build_variants(output_dir, widths=(480, 960))
+
+    assert "01-gone.jpg" not in _srcset(output_dir, "art")["images"]
+    assert not (out / "01-gone-480w.webp").exists() and not (out / "01-gone-960w.webp").exists()
+
+
+def _touch_later(src: Path) -> None:
+    stat = src.stat()
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+
+def test_build_variants_rerender_deletes_dropped_widths(output_dir: Path) -> None:
+    src = output_dir / "images" / "art" / "01-a.jpg"
+    _write_image(src, 1000, 500)
+    build_variants(output_dir, widths=(480, 960))
+    out = output_dir / "variants" / "art"
+    assert (out / "01-a-960w.webp").exists()
+
+    _write_image(src, 600, 300, color="blue")  # now too small for 960w
+    _touch_later(src)
+    build_variants(output_dir, widths=(480, 960))
+
+    assert (out / "01-a-480w.webp").exists()
+    assert not (out / "01-a-960w.webp").exists()
+
+
+def test_build_variants_failed_rerender_deletes_old_variants(output_dir: Path) -> None:
+    src = output_dir / "images" / "art" / "01-a.jpg"
+    _write_image(src, 1000, 500)
+    build_variants(output_dir, widths=(480,))
+    out = output_dir / "variants" / "art"
+    assert (out / "01-a-480w.webp").exists()
+
+    src.write_bytes(b"<html>not an image</html>")
+    _touch_later(src)
+    result = build_variants(output_dir, widths=(480,))
+
+    assert result.failed == 1
+    assert not (out / "01-a-480w.webp").exists()
+
+
+def test_build_variants_process_pool(output_dir: Path) -> None:
+    for slug in ("one", "two"):
+        _write_image(output_dir / "images" / slug / "00-thumbnail.jpg", 1000, 500)
+
+    result = build_variants(output_dir, widths=(480,), workers=2)
+
+    assert result.rendered == 2
+    assert result.slugs == 2
+    assert (output_dir / "variants" / "two" / "00-thumbnail-480w.webp").exists()
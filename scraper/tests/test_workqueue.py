@@ -0,0 +1,278 @@
+"""
+test_workqueue.py — Unit tests for workqueue.py (shared multi-node work queue).
+
+Tests: publishing is idempotent, leases go by score then publish order, an
+expired lease is reclaimed by another node, a lost lease cannot be renewed
+or completed, ``release`` re-queues, ``close`` closes every thread's
+connection, ``PriorityScheduler`` refill, ``worker_gone``, a long
+article's lease is renewed page by page, and end to end: ``--publish``
+then three ``--queue`` processes crawling the mock site together, a node
+taking over a dead node's leases, and a run resuming a crashed run's
+in-progress articles.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import scraper.scraper as scraper_module
+from manifest import claim_entry, load_manifest, save_manifest
+from mock_site import MockSite, SiteConfig
+from models import ManifestEntry, ScrapeStatus
+from scheduler import PriorityScheduler
+from workqueue import DONE, FAILED, LEASED, QUEUED, Lease, WorkQueue, default_worker_id, worker_gone
+
+SCRAPER_DIR = Path(__file__).parent.parent
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _queue(path: Path, worker: str, clock: FakeClock, lease_seconds: float = 60.0) -> WorkQueue:
+    return WorkQueue(path, worker_id=worker, lease_seconds=lease_seconds, clock=clock)
+
+
+def _lease(queue: WorkQueue) -> Lease:
+    lease = queue.lease()
+    assert lease is not None
+    return lease
+
+
+# ---------------------------------------------------------------------------
+# Queue
+# ---------------------------------------------------------------------------
+
+
+def test_publish_is_idempotent(tmp_path: Path) -> None:
+    queue = _queue(tmp_path / "work.queue", "a", FakeClock())
+    assert queue.publish([("x", "u/x", 1.0), ("y", "u/y", 2.0)]) == 2
+    queue.complete(_lease(queue).slug, {"slug": "y"}, ok=True)
+    assert queue.publish([("x", "u/x", 1.0), ("y", "u/y", 2.0), ("z", "u/z", 0.0)]) == 1
+    assert queue.counts() == {QUEUED: 2, DONE: 1}
+    assert queue.outstanding() == 2
+
+
+def test_leases_by_score_then_publish_order(tmp_path: Path) -> None:
+    queue = _queue(tmp_path / "work.queue", "a", FakeClock())
+    queue.publish([("a", "u/a", 1.0), ("b", "u/b", 5.0), ("c", "u/c", 1.0)])
+    leases = [_lease(queue) for _ in range(3)]
+    assert [lease.slug for lease in leases] == ["b", "a", "c"]
+    assert all(lease.attempts == 1 for lease in leases)
+    assert queue.lease() is None
+    assert queue.counts() == {LEASED: 3}
+
+
+def test_expired_lease_is_reclaimed_by_another_node(tmp_path: Path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "work.queue"
+    dead, alive = _queue(path, "dead", clock), _queue(path, "alive", clock)
+    dead.publish([("a", "u/a", 0.0)])
+    assert _lease(dead).slug == "a"
+    assert alive.lease() is None  # still leased
+
+    clock.now += 61
+    lease = _lease(alive)
+    assert lease.slug == "a" and lease.attempts == 2 and alive.reclaimed == 1
+
+    assert not dead.renew("a")
+    assert not dead.complete("a", {"slug": "a"}, ok=True)  # too late: not stored
+    assert alive.renew("a")
+    assert alive.complete("a", {"slug": "a", "status": "completed"}, ok=False)
+    assert alive.counts() == {FAILED: 1}
+    assert alive.records() == {"a": {"slug": "a", "status": "completed"}}
+
+
+def test_release_requeues_only_own_lease(tmp_path: Path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "work.queue"
+    a, b = _queue(path, "a", clock), _queue(path, "b", clock)
+    a.publish([("x", "u/x", 0.0)])
+    a.lease()
+    b.release("x")
+    assert b.lease() is None
+    a.release("x")
+    assert _lease(b).slug == "x"
+
+
+def test_close_closes_every_threads_connection(tmp_path: Path) -> None:
+    queue = _queue(tmp_path / "work.queue", "a", FakeClock())
+    queue.publish([("x", "u/x", 0.0)])
+    conns = [queue._conn()]
+    worker = threading.Thread(target=lambda: conns.append(queue._conn()))
+    worker.start()
+    worker.join()
+    assert conns[0] is not conns[1]
+
+    queue.close()
+    for conn in conns:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    assert queue.counts() == {QUEUED: 1}  # reopened on next use
+
+
+def test_scheduler_refill_until_source_is_drained() -> None:
+    batches = [[], [(ManifestEntry(url="u/a", slug="a"), 1.0)], None]
+    calls = []
+
+    def refill():
+        calls.append(1)
+        return batches.pop(0)
+
+    sched = PriorityScheduler(refill=refill, refill_interval=0.01)
+    entry = sched.pop()
+    assert isinstance(entry, ManifestEntry) and entry.slug == "a"  # polled again after an empty answer
+    sched.done()
+    assert sched.pop() is None and len(calls) == 3
+    assert sched.pop() is None and len(calls) == 3  # a drained source is not asked again
+
+
+def test_worker_gone_only_for_exited_local_processes() -> None:
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    host = socket.gethostname()
+    assert worker_gone(f"{host}-{exited.pid}")
+    assert worker_gone(default_worker_id())  # this pid: a dead run's lease
+    assert not worker_gone(f"{host}-{os.getppid()}")
+    assert not worker_gone(f"elsewhere-{exited.pid}")
+    assert not worker_gone("node-a")
+
+
+def test_lease_renewed_on_each_page(
+    output_dir: Path, multi_page_html_p1: str, multi_page_html_p2: str, monkeypatch
+) -> None:
+    import images
+
+    slug = "all-25-best-picture-winners"
+    manifest = load_manifest(output_dir)
+    manifest.entries[slug] = ManifestEntry(url=f"https://example.com/{slug}/", slug=slug)
+    leases = []
+
+    def fetch(url: str) -> bytes:
+        entry = manifest.entries[slug]
+        leases.append((entry.worker, entry.lease_until))
+        return (multi_page_html_p2 if url.endswith("/2/") else multi_page_html_p1).encode()
+
+    def no_image(url: str, dest: Path, **_):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(scraper_module, "_make_fetcher", lambda delay: fetch)
+    monkeypatch.setattr(images, "_download_to_file", no_image)
+    started = time.time()
+    scraper_module.run_scrape_phase(
+        manifest, output_dir, delay=0, limit=None, verbose=False, force=False,
+        image_workers=1, worker_id="me", lease_seconds=0.0,  # renew on every page
+    )
+
+    assert [worker for worker, _ in leases] == ["me", "me"]
+    assert started <= leases[0][1] < leases[1][1]
+    assert manifest.entries[slug].status == ScrapeStatus.COMPLETED
+    assert manifest.entries[slug].worker is None
+
+
+# ---------------------------------------------------------------------------
+# End to end
+# ---------------------------------------------------------------------------
+
+SITE = SiteConfig(articles=12, per_sitemap=20, max_pages=1, images_per_page=1, page_kb=2, image_kb=1)
+
+
+def _publish(site: MockSite, output_dir: Path, queue: Path) -> int:
+    return scraper_module.main([
+        "--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0",
+        "--queue", str(queue), "--publish",
+    ])
+
+
+def test_publish_needs_queue(output_dir: Path) -> None:
+    assert scraper_module.main(["--output-dir", str(output_dir), "--publish"]) == 2
+
+
+def test_nodes_share_the_crawl(output_dir: Path, tmp_path: Path) -> None:
+    queue = tmp_path / "crawl.queue"
+    with MockSite(dataclasses.replace(SITE, latency=0.1)) as site:  # slow enough for all nodes to join
+        assert _publish(site, output_dir, queue) == 0
+        nodes = [
+            subprocess.Popen(
+                [sys.executable, "scraper.py", "--output-dir", str(output_dir), "--delay", "0",
+                 "--queue", str(queue), "--worker-id", f"node-{i}", "--db", str(tmp_path / "app.db")],
+                cwd=SCRAPER_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            for i in range(3)
+        ]
+        codes = [node.wait(timeout=120) for node in nodes]
+        pages = site.stats()["requests"]["page"]
+
+    entries = load_manifest(output_dir).entries.values()
+    assert codes == [0, 0, 0]
+    assert len(entries) == 12 and all(e.status == ScrapeStatus.COMPLETED for e in entries)
+    assert all(e.images_status == ScrapeStatus.COMPLETED for e in entries)
+    assert pages == 12  # no article fetched twice
+    shared = WorkQueue(queue)
+    owners = {owner for (owner,) in shared._conn().execute("SELECT owner FROM work")}
+    shared.close()
+    assert len(owners) > 1 and owners <= {"node-0", "node-1", "node-2"}
+
+
+def test_node_reclaims_dead_nodes_leases(output_dir: Path, tmp_path: Path, capsys) -> None:
+    queue = tmp_path / "crawl.queue"
+    with MockSite(SITE) as site:
+        assert _publish(site, output_dir, queue) == 0
+        dead = WorkQueue(queue, worker_id="dead", lease_seconds=0.0)
+        assert dead.lease() is not None and dead.lease() is not None
+        dead.close()  # crashed holding two leases, which have already expired
+        code = scraper_module.main([
+            "--output-dir", str(output_dir), "--delay", "0", "--queue", str(queue),
+            "--worker-id", "alive", "--workers", "2", "--db", str(tmp_path / "app.db"),
+        ])
+
+    entries = load_manifest(output_dir).entries.values()
+    assert code == 0
+    assert all(e.status == ScrapeStatus.COMPLETED for e in entries)
+    out = capsys.readouterr().out
+    assert "Completed                  : 12" in out  # counted in the merged manifest
+    assert "Work queue [alive]: 0 queued, 0 leased, 12 done, 0 failed; reclaimed 2 expired leases" in out
+
+
+def test_run_resumes_crashed_runs_in_progress_articles(output_dir: Path, tmp_path: Path, capsys) -> None:
+    config = dataclasses.replace(SITE, articles=4)
+    with MockSite(config) as site:
+        args = ["--base-url", site.base_url, "--output-dir", str(output_dir), "--delay", "0",
+                "--db", str(tmp_path / "app.db")]
+        assert scraper_module.main([*args, "--discover-only"]) == 0
+        crashed = subprocess.Popen([sys.executable, "-c", "pass"])
+        crashed.wait()
+        manifest = load_manifest(output_dir)
+        held, dead, expired, _ = sorted(manifest.entries)
+        claim_entry(manifest, held, "elsewhere-1", time.time() + 600)  # another host, still working
+        claim_entry(manifest, dead, f"{socket.gethostname()}-{crashed.pid}", time.time() + 600)
+        claim_entry(manifest, expired, "elsewhere-2", time.time() - 1)
+        save_manifest(manifest, output_dir)
+
+        code = scraper_module.main(args)
+        pages = site.stats()["requests"]["page"]
+
+    entries = load_manifest(output_dir).entries
+    assert code == 0
+    assert "Reclaimed 2 in-progress articles from stopped workers." in capsys.readouterr().out
+    assert entries[held].status == ScrapeStatus.IN_PROGRESS and entries[held].worker == "elsewhere-1"
+    assert all(entries[slug].status == ScrapeStatus.COMPLETED for slug in entries if slug != held)
+    assert all(entries[slug].worker is None for slug in entries if slug != held)
+    assert pages == 3  # the held article is not fetched twice
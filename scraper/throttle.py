@@ -0,0 +1,261 @@
+"""
+throttle.py — Adaptive per-host concurrency and request pacing (``--adaptive``).
+
+With ``--adaptive`` every page and image request goes through an
+:class:`AdaptiveThrottle` instead of the fixed ``--delay`` sleeps.  For
+each host it keeps a concurrency limit (requests in flight) and an interval
+(minimum gap between request starts), and tunes both AIMD-style from what
+the server does:
+
+- success at normal latency → additive increase: the limit grows by
+  ``increase / limit`` (about +1 per ``limit`` successes) and the interval
+  shrinks by ``interval_step``
+- ``429`` / ``503``, other ``5xx``, connection errors, timeouts, or latency
+  above ``latency_tolerance`` x the host's baseline → multiplicative
+  decrease: the limit is multiplied by ``backoff`` and the interval divided
+  by it, at most once per ``cooldown`` seconds so one burst of failures
+  counts once
+- other ``4xx`` (404 …) and bad bodies say nothing about load and leave
+  the state alone
+
+Both stay within the configured bounds.  The latency baseline is tracked per
+request kind (``page`` / ``image``, whose sizes differ) and follows the
+fastest recent responses: it drops to any faster sample and creeps up
+slowly.
+
+Covers:
+- ``ThrottleConfig``: bounds and step sizes
+- ``AdaptiveThrottle.request(url, kind)``: context manager that waits for a
+  slot, times the request and feeds the outcome back
+- ``AdaptiveThrottle.fetcher(fetcher)``: wrap a ``(url) -> bytes`` fetcher
+- ``snapshot()``: per-host limit / interval / latency / decision counters,
+  exported by ``metrics.py`` (``scraper_throttle_*``)
+
+Usage:
+    from throttle import AdaptiveThrottle, ThrottleConfig
+    throttle = AdaptiveThrottle(ThrottleConfig(max_concurrency=3, initial_interval=2.0))
+    fetch = throttle.fetcher(fetch)
+    with throttle.request(image_url, kind="image"):
+        ...
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+import urllib.error
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+from urllib.parse import urlsplit
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Outcomes fed back into the controller
+OK = "ok"
+THROTTLED = "throttled"  # 429 / 503: the server asked us to slow down
+ERROR = "error"  # other 5xx, refused / reset connections
+TIMEOUT = "timeout"
+NEUTRAL = "neutral"  # 4xx, bad bodies: no load signal
+
+_BASELINE_DRIFT = 0.01  # share of the gap the baseline moves up per sample
+_LATENCY_ALPHA = 0.3  # EWMA weight of the newest latency sample
+_WARMUP = 5  # samples before latency can count as congestion
+
+
+@dataclass(frozen=True)
+class ThrottleConfig:
+    """Bounds and steps for :class:`AdaptiveThrottle` (seconds where timed)."""
+
+    min_concurrency: int = 1
+    max_concurrency: int = 3
+    initial_concurrency: float = 1.0
+    min_interval: float = 0.1
+    max_interval: float = 30.0
+    initial_interval: float = 2.0
+    increase: float = 1.0
+    interval_step: float = 0.05
+    backoff: float = 0.5
+    latency_tolerance: float = 2.5
+    cooldown: float = 2.0
+
+
+def classify(exc: BaseException | None) -> str:
+    """Map a request's exception (``None`` = success) to a controller outcome."""
+    if exc is None:
+        return OK
+    if isinstance(exc, urllib.error.HTTPError):
+        if exc.code in (429, 503):
+            return THROTTLED
+        return ERROR if exc.code >= 500 else NEUTRAL
+    if isinstance(exc, (TimeoutError, socket.timeout)):
+        return TIMEOUT
+    if isinstance(exc, urllib.error.URLError):
+        reason = exc.reason
+        return TIMEOUT if isinstance(reason, (TimeoutError, socket.timeout)) else ERROR
+    if isinstance(exc, ConnectionError):
+        return ERROR
+    return NEUTRAL
+
+
+# ---------------------------------------------------------------------------
+# Per-host state
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class HostState:
+    limit: float
+    interval: float
+    in_flight: int = 0
+    next_start: float = 0.0
+    last_decrease: float = float("-inf")
+    latency: dict[str, float] = field(default_factory=dict)  # kind -> EWMA seconds
+    baseline: dict[str, float] = field(default_factory=dict)  # kind -> seconds
+    samples: dict[str, int] = field(default_factory=dict)
+    decisions: dict[str, int] = field(default_factory=lambda: {"increase": 0, "decrease": 0})
+    outcomes: dict[str, int] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Controller
+# ---------------------------------------------------------------------------
+
+
+class AdaptiveThrottle:
+    """
+    AIMD controller shared by the article lane and the image lane.
+
+    Thread-safe: :meth:`request` blocks the calling thread until the host
+    has a free slot and its interval has elapsed.
+    """
+
+    def __init__(
+        self,
+        config: ThrottleConfig | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.config = config or ThrottleConfig()
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._hosts: dict[str, HostState] = {}
+
+    def _host(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            cfg = self.config
+            state = HostState(
+                limit=min(max(cfg.initial_concurrency, cfg.min_concurrency), cfg.max_concurrency),
+                interval=min(max(cfg.initial_interval, cfg.min_interval), cfg.max_interval),
+            )
+            self._hosts[host] = state
+        return state
+
+    # -- request path ---------------------------------------------------------
+
+    def acquire(self, host: str) -> None:
+        """Block until *host* has a free slot and its interval has passed."""
+        with self._cond:
+            while True:
+                state = self._host(host)
+                if state.in_flight < int(state.limit):
+                    wait = state.next_start - self._clock()
+                    if wait <= 0:
+                        state.in_flight += 1
+                        state.next_start = self._clock() + state.interval
+                        return
+                    self._cond.wait(wait)
+                else:
+                    self._cond.wait()
+
+    def release(self, host: str, kind: str, outcome: str, latency: float) -> None:
+        """Free the slot and adjust *host*'s limit and interval for *outcome*."""
+        with self._cond:
+            state = self._host(host)
+            state.in_flight -= 1
+            state.outcomes[outcome] = state.outcomes.get(outcome, 0) + 1
+            if outcome == OK:
+                if self._slow(state, kind, latency):
+                    self._decrease(state)
+                else:
+                    self._increase(state)
+            elif outcome != NEUTRAL:
+                self._decrease(state)
+            self._cond.notify_all()
+
+    @contextmanager
+    def request(self, url: str, kind: str = "page") -> Iterator[None]:
+        """Run one request to *url* under the throttle; exceptions propagate."""
+        host = urlsplit(url).netloc
+        self.acquire(host)
+        started = self._clock()
+        try:
+            yield
+        except BaseException as exc:
+            self.release(host, kind, classify(exc), self._clock() - started)
+            raise
+        self.release(host, kind, OK, self._clock() - started)
+
+    def fetcher(self, fetcher: Callable[[str], bytes], kind: str = "page") -> Callable[[str], bytes]:
+        """Wrap a ``(url) -> bytes`` fetcher so every call goes through :meth:`request`."""
+
+        def fetch(url: str) -> bytes:
+            with self.request(url, kind):
+                return fetcher(url)
+
+        return fetch
+
+    # -- AIMD -----------------------------------------------------------------
+
+    def _slow(self, state: HostState, kind: str, latency: float) -> bool:
+        """Update *kind*'s latency EWMA / baseline; True if latency signals congestion."""
+        n = state.samples.get(kind, 0) + 1
+        state.samples[kind] = n
+        ewma = state.latency.get(kind, latency)
+        ewma += _LATENCY_ALPHA * (latency - ewma)
+        state.latency[kind] = ewma
+        baseline = state.baseline.get(kind, latency)
+        baseline = latency if latency < baseline else baseline + _BASELINE_DRIFT * (latency - baseline)
+        state.baseline[kind] = baseline
+        return n > _WARMUP and ewma > self.config.latency_tolerance * baseline
+
+    def _increase(self, state: HostState) -> None:
+        cfg = self.config
+        limit = min(state.limit + cfg.increase / state.limit, cfg.max_concurrency)
+        interval = max(state.interval - cfg.interval_step, cfg.min_interval)
+        if (limit, interval) != (state.limit, state.interval):
+            state.limit, state.interval = limit, interval
+            state.decisions["increase"] += 1
+
+    def _decrease(self, state: HostState) -> None:
+        cfg = self.config
+        now = self._clock()
+        if now - state.last_decrease < cfg.cooldown:
+            return
+        state.last_decrease = now
+        state.limit = max(state.limit * cfg.backoff, cfg.min_concurrency)
+        state.interval = min(max(state.interval, cfg.interval_step) / cfg.backoff, cfg.max_interval)
+        state.next_start = max(state.next_start, now + state.interval)
+        state.decisions["decrease"] += 1
+
+    # -- reporting ------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-host controller state (for metrics and logs)."""
+        with self._cond:
+            return {
+                host: {
+                    "concurrency_limit": state.limit,
+                    "interval_seconds": state.interval,
+                    "in_flight": state.in_flight,
+                    "latency_seconds": dict(state.latency),
+                    "baseline_seconds": dict(state.baseline),
+                    "decisions": dict(state.decisions),
+                    "outcomes": dict(state.outcomes),
+                }
+                for host, state in self._hosts.items()
+            }
@@ -0,0 +1,320 @@
+"""
+timing.py — Per-article stage timing and the ``--trace`` JSONL trace.
+
+``process_article`` runs every article under an :class:`ArticleTimer`;
+with ``--trace`` each finished article (and each inline-image batch from
+the background lane) is appended to a JSONL file, and a summary of where
+wall-clock time went — sleeping vs network vs local CPU/disk — is printed
+at the end of the run.  That is the data to look at before changing
+``--workers`` / ``--delay``.
+
+Covers:
+- Exclusive stage spans: a span's time excludes the spans nested in it, so
+  ``parse`` (around ``extract_article``) does not include the pagination
+  fetches, ``--delay`` sleeps or the sink write that happen inside it
+- Spans are per thread: pagination pages fetched by other workers book
+  their own ``fetch`` / ``sleep`` time, and the owner's wait for them
+  (:meth:`ArticleTimer.waiting`) is left out of every stage, so with
+  ``--workers`` > 1 the stages of a split article can add up to more than
+  its ``total_ms``
+- Stages: ``cache``, ``fetch``, ``parse``, ``write``, ``images``,
+  ``manifest`` and ``sleep`` (the injectable ``sleep`` of the extract /
+  image helpers)
+- ``TraceWriter``: thread-safe JSONL appender
+- ``summarize_trace`` / ``format_summary``: totals and shares per category,
+  per-article percentiles
+
+Record (one JSON object per line)::
+
+    {"kind": "article", "slug": ..., "ok": true, "cached": false, "pages": 2,
+     "fetches": 2, "bytes": 183422, "cache_ms": 0.1, "fetch_ms": 812.4,
+     "parse_ms": 35.2, "write_ms": 1.9, "images_ms": 640.0, "manifest_ms": 0.4,
+     "sleep_ms": 6001.3, "other_ms": 2.1, "total_ms": 7493.4, "error": null}
+
+``kind == "image_lane"`` records cover one article's inline images in the
+background lane (``total_ms`` runs from hand-off, so it includes queueing).
+
+Usage:
+    python timing.py ../scraped/trace.jsonl      # re-print a summary
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+STAGES = ("cache", "fetch", "parse", "write", "images", "manifest", "sleep")
+
+# Where each stage's time goes in the summary.  ``images`` is mostly
+# transfer time (probing and writing a file are small next to it).
+CATEGORIES: dict[str, tuple[str, ...]] = {
+    "sleep": ("sleep",),
+    "network": ("fetch", "images"),
+    "cpu/disk": ("cache", "parse", "write", "manifest"),
+}
+
+
+# ---------------------------------------------------------------------------
+# Timer
+# ---------------------------------------------------------------------------
+
+
+class ArticleTimer:
+    """Stage stopwatch for one article (or one image-lane batch)."""
+
+    def __init__(
+        self,
+        slug: str,
+        *,
+        kind: str = "article",
+        clock: Callable[[], float] = time.perf_counter,
+        sleeper: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.slug = slug
+        self.kind = kind
+        self._clock = clock
+        self._sleeper = sleeper
+        self._started = clock()
+        self._local = threading.local()  # per-thread stack of [stage, start, nested seconds]
+        self._lock = threading.Lock()
+        self.seconds: dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.ok: bool | None = None
+        self.cached = False
+        self.pages = 0
+        self.fetches = 0
+        self.images = 0
+        self.bytes = 0
+        self.error: str | None = None
+
+    @property
+    def _stack(self) -> list[list]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, stage: str | None) -> Iterator[None]:
+        """Time the ``with`` block under *stage*, minus any nested spans."""
+        stack = self._stack
+        frame = [stage, self._clock(), 0.0]
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            elapsed = self._clock() - frame[1]
+            if stage is not None:
+                with self._lock:
+                    self.seconds[stage] = self.seconds.get(stage, 0.0) + elapsed - frame[2]
+            if stack:
+                stack[-1][2] += elapsed
+
+    def waiting(self):
+        """Span for blocking on pieces other threads time themselves: booked to no stage."""
+        return self.span(None)
+
+    def sleep(self, seconds: float) -> None:
+        """Drop-in ``time.sleep`` that books the pause under ``sleep``."""
+        if seconds <= 0:
+            return
+        with self.span("sleep"):
+            self._sleeper(seconds)
+
+    def fetcher(self, fetcher: Callable[[str], bytes]) -> Callable[[str], bytes]:
+        """Wrap a page fetcher: time under ``fetch``, count calls and bytes."""
+
+        def fetch(url: str) -> bytes:
+            with self.span("fetch"):
+                body = fetcher(url)
+            with self._lock:
+                self.fetches += 1
+                self.bytes += len(body)
+            return body
+
+        return fetch
+
+    def sink(self, sink) -> "_TimedSink":
+        """Wrap an article sink so ``write`` is timed under ``write``."""
+        return _TimedSink(sink, self)
+
+    def record(self) -> dict:
+        """The trace record (milliseconds, rounded to 0.1)."""
+        total = self._clock() - self._started
+        record: dict = {
+            "kind": self.kind,
+            "slug": self.slug,
+            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+            "ok": self.ok,
+        }
+        if self.kind == "article":
+            record.update(cached=self.cached, pages=self.pages, fetches=self.fetches)
+        else:
+            record["images"] = self.images
+        record["bytes"] = self.bytes
+        for stage, seconds in self.seconds.items():
+            record[f"{stage}_ms"] = round(seconds * 1000, 1)
+        record["other_ms"] = round(max(total - sum(self.seconds.values()), 0.0) * 1000, 1)
+        record["total_ms"] = round(total * 1000, 1)
+        record["error"] = self.error
+        return record
+
+
+class _TimedSink:
+    """Sink proxy that times ``write``; everything else passes through."""
+
+    def __init__(self, sink, timer: ArticleTimer) -> None:
+        self._sink = sink
+        self._timer = timer
+
+    def write(self, slug: str, article):
+        with self._timer.span("write"):
+            return self._sink.write(slug, article)
+
+    def __getattr__(self, name: str):
+        return getattr(self._sink, name)
+
+
+# ---------------------------------------------------------------------------
+# Trace file
+# ---------------------------------------------------------------------------
+
+
+class TraceWriter:
+    """
+    Append trace records to a JSONL file (safe to share across threads).
+
+    ``records`` holds what this writer added, so a run can summarize
+    itself even when the file already has earlier runs in it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.records: list[dict] = []
+        self._fh = path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._fh.write(line)
+            self._fh.flush()
+            self.records.append(record)
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+
+
+def load_trace(path: Path) -> list[dict]:
+    """Read a trace file; a torn last line (crash mid-write) is skipped."""
+    records = []
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Summary
+# ---------------------------------------------------------------------------
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def summarize_trace(records: Iterable[dict]) -> dict:
+    """
+    Aggregate trace records: per-stage and per-category seconds with their
+    share of fast-lane wall time, per-article percentiles, and image-lane
+    totals.
+    """
+    records = list(records)
+    articles = [r for r in records if r.get("kind", "article") == "article"]
+    lane = [r for r in records if r.get("kind") == "image_lane"]
+    wall = sum(r["total_ms"] for r in articles) / 1000
+    stages = {stage: sum(r.get(f"{stage}_ms", 0.0) for r in articles) / 1000 for stage in STAGES}
+    stages["other"] = sum(r.get("other_ms", 0.0) for r in articles) / 1000
+    categories = {name: sum(stages[s] for s in members) for name, members in CATEGORIES.items()}
+    categories["other"] = stages["other"]
+    totals = [r["total_ms"] / 1000 for r in articles]
+    fetched = [r for r in articles if not r.get("cached")]
+    return {
+        "articles": len(articles),
+        "failed": sum(1 for r in articles if r.get("ok") is False),
+        "cached": len(articles) - len(fetched),
+        "wall_seconds": wall,
+        "stages": stages,
+        "categories": categories,
+        "share": {name: (seconds / wall if wall else 0.0) for name, seconds in categories.items()},
+        "p50_seconds": _percentile(totals, 50),
+        "p95_seconds": _percentile(totals, 95),
+        "mean_pages": statistics.fmean(r.get("pages", 0) for r in fetched) if fetched else 0.0,
+        "bytes": sum(r.get("bytes", 0) for r in articles),
+        "lane_batches": len(lane),
+        "lane_seconds": sum(r["total_ms"] for r in lane) / 1000,
+        "lane_sleep_seconds": sum(r.get("sleep_ms", 0.0) for r in lane) / 1000,
+        "lane_images": sum(r.get("images", 0) for r in lane),
+        "lane_bytes": sum(r.get("bytes", 0) for r in lane),
+    }
+
+
+def format_summary(summary: dict) -> str:
+    """Human-readable table for :func:`summarize_trace` output."""
+    lines = [
+        f"Time breakdown — {summary['articles']} articles "
+        f"({summary['cached']} from cache, {summary['failed']} failed), "
+        f"{summary['wall_seconds']:.1f}s in the article lane",
+    ]
+    stages = summary["stages"]
+    for name, members in (*CATEGORIES.items(), ("other", ())):
+        seconds = summary["categories"][name]
+        detail = ", ".join(f"{s} {stages[s]:.1f}s" for s in members if len(members) > 1)
+        lines.append(
+            f"  {name:<9} {seconds:9.1f}s  {summary['share'][name] * 100:5.1f}%"
+            + (f"  ({detail})" if detail else "")
+        )
+    lines.append(
+        f"  per article: p50 {summary['p50_seconds']:.2f}s, p95 {summary['p95_seconds']:.2f}s, "
+        f"{summary['mean_pages']:.1f} pages, {summary['bytes'] / 1e6:.1f} MB fetched"
+    )
+    if summary["lane_batches"]:
+        lane_share = summary["lane_sleep_seconds"] / summary["lane_seconds"] if summary["lane_seconds"] else 0.0
+        lines.append(
+            f"  image lane: {summary['lane_batches']} articles, {summary['lane_images']} images, "
+            f"{summary['lane_bytes'] / 1e6:.1f} MB, {summary['lane_seconds']:.1f}s "
+            f"({lane_share * 100:.0f}% sleeping)"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("usage: python timing.py TRACE.jsonl", file=sys.stderr)
+        return 2
+    print(format_summary(summarize_trace(load_trace(Path(args[0])))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
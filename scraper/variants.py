@@ -0,0 +1,295 @@
+"""
+variants.py — Responsive image variant generation (batch, multi-process).
+
+Walks ``output_dir/images/<slug>/`` and renders several width variants of
+every downloaded image into ``output_dir/variants/<slug>/`` together with a
+per-slug ``srcset.json`` manifest that the Next.js pipeline can use instead
+of resizing on the web server.
+
+Covers:
+- Width variants (default 480 / 960 / 1440) encoded as WebP
+- Per-slug srcset manifest (``variants/<slug>/srcset.json``)
+- Incremental runs: an image is skipped when its source mtime and SHA-256
+  are unchanged since the last build
+- Parallel rendering in a process pool
+
+Requires Pillow (``pip install -e ".[images]"``).
+
+Usage:
+    from variants import build_variants
+    result = build_variants(output_dir, workers=4)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_WIDTHS: tuple[int, ...] = (480, 960, 1440)
+
+# Matches the quality used by src/lib/scraper/imageProcessor.ts
+_WEBP_QUALITY = 60
+
+_SRCSET_FILENAME = "srcset.json"
+_SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+_HASH_CHUNK = 1 << 16
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _require_pillow() -> None:
+    """Raise a descriptive ``RuntimeError`` if Pillow is not installed."""
+    try:
+        import PIL  # noqa: F401
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise RuntimeError(
+            "Variant generation requires Pillow. Install with: pip install -e \".[images]\""
+        ) from exc
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of *path*, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def variant_filename(source_name: str, width: int) -> str:
+    """
+    Build the output filename for one width variant.
+
+    e.g. ``("01-crash-2005.jpg", 480)`` → ``"01-crash-2005-480w.webp"``
+    """
+    stem = source_name.rsplit(".", 1)[0]
+    return f"{stem}-{width}w.webp"
+
+
+def _remove_variants(slug_out: Path, record: dict, keep: frozenset[str] = frozenset()) -> None:
+    """Delete the variant files listed in a srcset *record*, except those in *keep*."""
+    for variant in record.get("variants", []):
+        try:
+            if variant["file"] not in keep:
+                (slug_out / variant["file"]).unlink(missing_ok=True)
+        except (OSError, KeyError, TypeError):
+            logger.warning("Could not remove stale variant %s in %s", variant, slug_out)
+
+
+def _load_srcset(path: Path) -> dict:
+    """Load an existing srcset manifest, or return an empty skeleton."""
+    if not path.exists():
+        return {"images": {}}
+    try:
+        with path.open("r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if isinstance(data.get("images"), dict):
+            return data
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable srcset manifest: %s", path)
+    return {"images": {}}
+
+
+# ---------------------------------------------------------------------------
+# Worker (runs in a child process — must stay module-level / picklable)
+# ---------------------------------------------------------------------------
+
+
+def render_variants(source: str, out_dir: str, widths: tuple[int, ...]) -> dict:
+    """
+    Render WebP width variants of *source* into *out_dir*.
+
+    Widths wider than the source are not upscaled; the source width is
+    emitted instead (once) so every image has at least one variant.
+
+    Returns a JSON-serialisable record of the source dimensions and the
+    variants written.
+    """
+    from PIL import Image
+
+    src_path = Path(source)
+    dest_dir = Path(out_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    with Image.open(src_path) as img:
+        img.load()
+        src_w, src_h = img.size
+        if img.mode not in ("RGB", "RGBA"):
+            has_alpha = img.mode in ("LA", "PA") or "transparency" in img.info
+            img = img.convert("RGBA" if has_alpha else "RGB")
+
+        targets = sorted({min(w, src_w) for w in widths})
+        variants: list[dict] = []
+        for width in targets:
+            height = max(1, round(src_h * width / src_w))
+            name = variant_filename(src_path.name, width)
+            resized = img if width == src_w else img.resize((width, height), Image.Resampling.LANCZOS)
+            resized.save(dest_dir / name, "WEBP", quality=_WEBP_QUALITY)
+            variants.append({"width": width, "height": height, "file": name})
+
+    return {"width": src_w, "height": src_h, "variants": variants}
+
+
+# ---------------------------------------------------------------------------
+# Result dataclass
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class VariantBuildResult:
+    """Summary of one batch variant build."""
+
+    rendered: int = 0
+    skipped: int = 0
+    failed: int = 0
+    slugs: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Batch orchestrator
+# ---------------------------------------------------------------------------
+
+
+def _srcset_string(variants: list[dict]) -> str:
+    """Build an HTML ``srcset`` value with filenames relative to the slug dir."""
+    return ", ".join(f"{v['file']} {v['width']}w" for v in variants)
+
+
+def build_variants(
+    output_dir: Path,
+    *,
+    widths: tuple[int, ...] = DEFAULT_WIDTHS,
+    workers: int = 1,
+    slugs: list[str] | None = None,
+) -> VariantBuildResult:
+    """
+    Render width variants for every image under ``output_dir/images/``.
+
+    *slugs* restricts the build to the given article directories.
+    With ``workers > 1`` images are rendered in a ``ProcessPoolExecutor``;
+    ``workers <= 1`` renders in-process.
+
+    Each slug gets ``output_dir/variants/<slug>/srcset.json``::
+
+        {"slug": "...", "widths": [480, 960, 1440],
+         "images": {"01-crash.jpg": {"sha256": "...", "mtime_ns": 0,
+                                     "width": 1600, "height": 900,
+                                     "variants": [...], "srcset": "..."}}}
+    """
+    _require_pillow()
+
+    images_root = output_dir / "images"
+    variants_root = output_dir / "variants"
+    result = VariantBuildResult()
+
+    if not images_root.is_dir():
+        return result
+
+    slug_dirs = sorted(p for p in images_root.iterdir() if p.is_dir())
+    if slugs is not None:
+        wanted = set(slugs)
+        slug_dirs = [p for p in slug_dirs if p.name in wanted]
+
+    widths = tuple(sorted(set(widths)))
+    srcsets: dict[str, dict] = {}
+    jobs: list[tuple[str, str, Path, str, int]] = []  # (slug, name, path, sha, mtime_ns)
+
+    # --- Plan: decide which sources changed since the last build ---
+    for slug_dir in slug_dirs:
+        slug = slug_dir.name
+        srcset_path = variants_root / slug / _SRCSET_FILENAME
+        srcset = _load_srcset(srcset_path)
+        if srcset.get("widths") != list(widths):
+            for record in srcset["images"].values():  # width set changed — rebuild everything
+                _remove_variants(variants_root / slug, record)
+            srcset["images"] = {}
+        srcset["slug"] = slug
+        srcset["widths"] = list(widths)
+        srcsets[slug] = srcset
+
+        present: set[str] = set()
+        for src in sorted(slug_dir.iterdir()):
+            if not src.is_file() or src.suffix.lower() not in _SOURCE_EXTENSIONS:
+                continue
+            present.add(src.name)
+            mtime_ns = src.stat().st_mtime_ns
+            record = srcset["images"].get(src.name)
+
+            if record and record.get("mtime_ns") == mtime_ns:
+                result.skipped += 1
+                continue
+            sha = file_sha256(src)
+            if record and record.get("sha256") == sha:
+                record["mtime_ns"] = mtime_ns  # touched but unchanged
+                result.skipped += 1
+                continue
+            jobs.append((slug, src.name, src, sha, mtime_ns))
+
+        # Drop records (and variant files) of sources that no longer exist
+        for stale in set(srcset["images"]) - present:
+            _remove_variants(variants_root / slug, srcset["images"].pop(stale))
+
+    # --- Render ---
+    def _record(slug: str, name: str, sha: str, mtime_ns: int, rendered: dict) -> None:
+        previous = srcsets[slug]["images"].get(name)
+        if previous is not None:  # re-rendered source: drop files the new set no longer has
+            keep = frozenset(v["file"] for v in rendered["variants"])
+            _remove_variants(variants_root / slug, previous, keep)
+        rendered.update(
+            sha256=sha,
+            mtime_ns=mtime_ns,
+            srcset=_srcset_string(rendered["variants"]),
+        )
+        srcsets[slug]["images"][name] = rendered
+        result.rendered += 1
+
+    def _fail(slug: str, name: str, exc: Exception) -> None:
+        previous = srcsets[slug]["images"].pop(name, None)
+        if previous is not None:
+            _remove_variants(variants_root / slug, previous)
+        result.failed += 1
+        err_msg = f"Failed to render variants for {slug}/{name}: {exc}"
+        result.errors.append(err_msg)
+        logger.warning(err_msg)
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (job, pool.submit(render_variants, str(job[2]), str(variants_root / job[0]), widths))
+                for job in jobs
+            ]
+            for (slug, name, _, sha, mtime_ns), fut in futures:
+                try:
+                    _record(slug, name, sha, mtime_ns, fut.result())
+                except Exception as exc:  # noqa: BLE001
+                    _fail(slug, name, exc)
+    else:
+        for slug, name, src, sha, mtime_ns in jobs:
+            try:
+                _record(slug, name, sha, mtime_ns, render_variants(str(src), str(variants_root / slug), widths))
+            except Exception as exc:  # noqa: BLE001
+                _fail(slug, name, exc)
+
+    # --- Persist per-slug srcset manifests ---
+    for slug, srcset in srcsets.items():
+        slug_out = variants_root / slug
+        slug_out.mkdir(parents=True, exist_ok=True)
+        srcset["images"] = dict(sorted(srcset["images"].items()))
+        (slug_out / _SRCSET_FILENAME).write_text(json.dumps(srcset, indent=2) + "\n", encoding="utf-8")
+        result.slugs += 1
+
+    return result
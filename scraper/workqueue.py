@@ -0,0 +1,273 @@
+"""
+workqueue.py — Shared work queue for a crawl spread over several machines.
+
+One run publishes the manifest-derived work list (``--publish``) to a SQLite
+file on a volume every node can reach; then any number of ``scraper.py
+--queue PATH`` instances, on one host or many, lease entries from it one
+at a time.  Articles and images go to the shared ``--output-dir`` as usual.
+
+- A lease lasts ``lease_seconds``; a node that dies (or stalls) loses its
+  entries when their leases expire and the next ``lease`` call reclaims
+  them for another node.  Leases use the wall clock, so nodes need NTP.
+- A finished entry stores its ``ManifestEntry`` record in the queue.  Nodes
+  do not write ``manifest.json`` per article (they would overwrite each
+  other); at the end of a run :meth:`WorkQueue.exclusive` serialises one
+  merge of every finished record into the shared manifest.
+- Publishing is idempotent (``INSERT OR IGNORE``): re-publishing never
+  resets finished or leased entries.  Delete the file to start a new crawl.
+
+The database stays in SQLite's default rollback-journal mode: WAL needs
+shared memory, which network filesystems do not provide.  Each thread uses
+its own connection; every state change is one ``BEGIN IMMEDIATE``
+transaction, so two nodes never lease the same entry.
+
+Covers:
+- :func:`default_worker_id` / :func:`worker_gone`: ``host-pid`` worker ids,
+  also used for ``in_progress`` leases in the manifest
+- ``WorkQueue.publish(items)``: add ``(slug, url, score)`` rows
+- ``lease()`` / ``renew(slug)`` / ``complete(slug, record, ok)`` /
+  ``release(slug)``: one node's side of a lease
+- ``records()``, ``leases()``, ``counts()``, ``exclusive()``
+
+Usage:
+    from workqueue import WorkQueue
+    queue = WorkQueue(Path("/shared/crawl.queue"), worker_id="node-a")
+    queue.publish([(entry.slug, entry.url, score), ...])
+    while (lease := queue.lease()) is not None:
+        ...
+        queue.complete(lease.slug, entry.model_dump(mode="json"), ok=True)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work (
+    slug        TEXT PRIMARY KEY,
+    url         TEXT NOT NULL,
+    score       REAL NOT NULL DEFAULT 0,
+    seq         INTEGER NOT NULL,
+    state       TEXT NOT NULL DEFAULT 'queued',
+    owner       TEXT,
+    lease_until REAL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    record      TEXT,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS work_ready ON work (state, score DESC, seq);
+"""
+
+
+def default_worker_id() -> str:
+    """``host-pid``: unique per process, readable in the queue."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def worker_gone(worker_id: str) -> bool:
+    """
+    True if *worker_id* is a :func:`default_worker_id` of this host whose
+    process has exited (or is this process, reusing a dead run's pid).
+    Other hosts and custom ids cannot be checked: their leases must expire.
+    """
+    host, _, pid = worker_id.rpartition("-")
+    if host != socket.gethostname() or not pid.isdigit() or os.name != "posix":
+        return False
+    if int(pid) == os.getpid():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False  # alive, another user's
+    return False
+
+
+@dataclass(frozen=True)
+class Lease:
+    """One entry leased to this node."""
+
+    slug: str
+    url: str
+    score: float
+    attempts: int  # leases so far, this one included
+
+
+class WorkQueue:
+    """A node's handle on the shared queue file (thread-safe)."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        worker_id: str | None = None,
+        lease_seconds: float = 600.0,
+        clock: Callable[[], float] = time.time,
+        busy_timeout: float = 30.0,
+    ) -> None:
+        self.path = path
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        self._busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._conns: set[sqlite3.Connection] = set()  # every thread's connection, for close()
+        self._conns_lock = threading.Lock()
+        self.reclaimed = 0  # expired leases of other nodes taken over by this one
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn().executescript(_SCHEMA)
+
+    # -- connections ----------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn not in self._conns:  # first use in this thread, or closed
+            # check_same_thread=False only so close() can close it from another thread
+            conn = sqlite3.connect(
+                self.path, timeout=self._busy_timeout, isolation_level=None, check_same_thread=False
+            )
+            with self._conns_lock:
+                self._conns.add(conn)
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def exclusive(self) -> Iterator[sqlite3.Connection]:
+        """One write transaction: other nodes' queue calls wait until it ends."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # -- publishing -----------------------------------------------------------
+
+    def publish(self, items: Iterable[tuple[str, str, float]]) -> int:
+        """Add ``(slug, url, score)`` rows not queued yet; returns how many were new."""
+        with self.exclusive() as conn:
+            (seq,) = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM work").fetchone()
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO work (slug, url, score, seq) VALUES (?, ?, ?, ?)",
+                ((slug, url, score, seq + i) for i, (slug, url, score) in enumerate(items, 1)),
+            )
+            return conn.total_changes - before
+
+    # -- leasing --------------------------------------------------------------
+
+    def lease(self) -> Lease | None:
+        """
+        Lease the highest-scoring queued entry, or the oldest expired lease
+        of another node; ``None`` if there is nothing to take right now.
+        """
+        now = self._clock()
+        with self.exclusive() as conn:
+            row = conn.execute(
+                "SELECT slug, url, score, attempts, state, owner FROM work "
+                "WHERE state = ? OR (state = ? AND lease_until < ?) "
+                "ORDER BY state = ? DESC, score DESC, seq LIMIT 1",
+                (QUEUED, LEASED, now, QUEUED),
+            ).fetchone()
+            if row is None:
+                return None
+            slug, url, score, attempts, state, owner = row
+            conn.execute(
+                "UPDATE work SET state = ?, owner = ?, lease_until = ?, attempts = attempts + 1 WHERE slug = ?",
+                (LEASED, self.worker_id, now + self.lease_seconds, slug),
+            )
+        if state == LEASED:
+            self.reclaimed += 1
+            logger.warning("Reclaimed %s from %s (lease expired)", slug, owner)
+        return Lease(slug, url, score, attempts + 1)
+
+    def renew(self, slug: str) -> bool:
+        """Extend this node's lease on *slug*; False if it was lost to another node."""
+        with self.exclusive() as conn:
+            cur = conn.execute(
+                "UPDATE work SET lease_until = ? WHERE slug = ? AND state = ? AND owner = ?",
+                (self._clock() + self.lease_seconds, slug, LEASED, self.worker_id),
+            )
+            return cur.rowcount == 1
+
+    def complete(self, slug: str, record: dict, *, ok: bool) -> bool:
+        """
+        Finish this node's lease on *slug* with its manifest *record*.
+
+        Returns False (and stores nothing) if the lease expired and another
+        node took the entry over.
+        """
+        with self.exclusive() as conn:
+            cur = conn.execute(
+                "UPDATE work SET state = ?, record = ?, finished_at = ?, lease_until = NULL "
+                "WHERE slug = ? AND owner = ? AND state IN (?, ?, ?)",
+                (DONE if ok else FAILED, json.dumps(record), self._clock(), slug, self.worker_id,
+                 LEASED, DONE, FAILED),
+            )
+        if cur.rowcount != 1:
+            logger.warning("Lease on %s was lost to another node; dropping this result", slug)
+            return False
+        return True
+
+    def release(self, slug: str) -> None:
+        """Hand this node's lease on *slug* back to the queue unfinished."""
+        with self.exclusive() as conn:
+            conn.execute(
+                "UPDATE work SET state = ?, owner = NULL, lease_until = NULL WHERE slug = ? AND owner = ? AND state = ?",
+                (QUEUED, slug, self.worker_id, LEASED),
+            )
+
+    # -- reading --------------------------------------------------------------
+
+    def outstanding(self) -> int:
+        """Entries queued or leased (by any node)."""
+        (n,) = self._conn().execute(
+            "SELECT COUNT(*) FROM work WHERE state IN (?, ?)", (QUEUED, LEASED)
+        ).fetchone()
+        return n
+
+    def counts(self) -> dict[str, int]:
+        """Entries per state."""
+        return dict(self._conn().execute("SELECT state, COUNT(*) FROM work GROUP BY state").fetchall())
+
+    def leases(self, conn: sqlite3.Connection | None = None) -> dict[str, tuple[str, float]]:
+        """Entries leased right now (by any node): ``slug → (owner, lease_until)``."""
+        rows = (conn or self._conn()).execute(
+            "SELECT slug, owner, lease_until FROM work WHERE state = ?", (LEASED,)
+        )
+        return {slug: (owner, lease_until) for slug, owner, lease_until in rows}
+
+    def records(self, conn: sqlite3.Connection | None = None) -> dict[str, dict]:
+        """Manifest records of every finished entry, by slug."""
+        rows = (conn or self._conn()).execute(
+            "SELECT slug, record FROM work WHERE record IS NOT NULL AND state IN (?, ?)", (DONE, FAILED)
+        )
+        return {slug: json.loads(record) for slug, record in rows}
+
+    def close(self) -> None:
+        """Close the connections of every thread that used this handle."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, set()
+        for conn in conns:
+            conn.close()
+        self._local.conn = None
@@ -19,6 +19,12 @@ interface Job {
     completedAt: string | null;
 }
 
+interface BulkProgress {
+    total: number;
+    counts: Record<string, number>;
+    generatedAt: string;
+}
+
 interface ActiveJob {
     jobId: number;
     url: string;
@@ -96,6 +102,7 @@ export default function AdminImportPage() {
     const [scrapeDelay, setScrapeDelay]     = useState<number>(2);
     const [savingSettings, setSavingSettings] = useState(false);
     const [jobs, setJobs]                   = useState<Job[]>([]);
+    const [bulkProgress, setBulkProgress]   = useState<BulkProgress | null>(null);
     const [submitting, setSubmitting]       = useState(false);
     const [error, setError]                 = useState<string | null>(null);
     const [activeJobs, setActiveJobs]       = useState<ActiveJob[]>([]);
@@ -175,8 +182,13 @@ export default function AdminImportPage() {
     const fetchJobs = async () => {
         try {
             const res = await fetch('/api/scrape?limit=20&offset=0');
-            const { data } = await parseResponseJson<{ success?: boolean; jobs?: Job[] }>(res);
+            const { data } = await parseResponseJson<{
+                success?: boolean;
+                jobs?: Job[];
+                bulkProgress?: BulkProgress | null;
+            }>(res);
             if (res.ok && data?.success && data.jobs) setJobs(data.jobs);
+            if (res.ok) setBulkProgress(data?.bulkProgress ?? null);
         } catch { /* ignore */ }
     };
 
@@ -389,6 +401,22 @@ export default function AdminImportPage() {
             <div className={styles.listContainer}>
                 <h2 className={styles.listTitle}>سجل المعالجات</h2>
 
+                {bulkProgress && (
+                    <div className={styles.batchStatus}>
+                        <span>الساحب الجماعي: {bulkProgress.total} مقال</span>
+                        <span>-</span>
+                        <span style={{ color: 'var(--color-success)' }}>
+                            مكتمل: {bulkProgress.counts.completed ?? 0}
+                        </span>
+                        <span>-</span>
+                        <span>قيد الانتظار: {bulkProgress.counts.pending ?? 0}</span>
+                        <span>-</span>
+                        <span>فشل: {bulkProgress.counts.failed ?? 0}</span>
+                        <span>-</span>
+                        <span dir="rtl">آخر تحديث: {formatJobDate(bulkProgress.generatedAt)}</span>
+                    </div>
+                )}
+
                 {jobs.map(job => (
                     <div key={job.id} className={styles.batchItem}>
                         <div className={styles.batchHeader}>
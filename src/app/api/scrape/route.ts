@@ -3,6 +3,7 @@ import { cookies } from 'next/headers';
 import { getSession } from "@/lib/auth/session";
 import { createScrapeJob, listScrapeJobs } from '@/lib/db/scrapeJobs';
 import { runScrapePipeline } from '@/lib/scraper/pipeline';
+import { readScrapeProgress } from '@/lib/scraper/manifestSnapshot';
 import { ScrapeRequest, ScrapeResponse } from '@/types/api';
 
 export async function POST(req: Request) {
@@ -77,7 +78,10 @@ export async function GET(req: Request) {
             completedAt: job.completed_at
         }));
 
-        return NextResponse.json({ jobs: camelJobs, total: jobs.length });
+        // Progress of the Python bulk scraper, from its manifest.snap (null when none published)
+        const bulkProgress = readScrapeProgress();
+
+        return NextResponse.json({ jobs: camelJobs, total: jobs.length, bulkProgress });
     } catch (err: unknown) {
         return NextResponse.json({ success: false, error: err instanceof Error ? err.message : 'Server error' }, { status: 500 });
     }
@@ -73,6 +73,28 @@ const DB_MIGRATIONS: DbMigration[] = [
             ALTER TABLE articles ADD COLUMN quality_report TEXT DEFAULT NULL;
         `,
     },
+    {
+        id: '20261019_scraped_articles_staging',
+        sql: `
+            CREATE TABLE IF NOT EXISTS scraped_articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                slug TEXT UNIQUE NOT NULL,
+                title_en TEXT NOT NULL,
+                content TEXT NOT NULL,
+                author TEXT,
+                category TEXT NOT NULL,
+                tags TEXT,
+                featured_image TEXT,
+                inline_images TEXT,
+                movie_titles TEXT,
+                source_url TEXT NOT NULL,
+                source_site TEXT DEFAULT 'tasteofcinema.com',
+                page_count INTEGER DEFAULT 1,
+                scraped_at DATETIME,
+                staged_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+        `,
+    },
 ];
 
 function runMigrations(database: Database.Database): void {
@@ -0,0 +1,114 @@
+import fs from 'fs';
+import path from 'path';
+
+/**
+ * Reader for the Python scraper's manifest.snap (scraper/snapshot.py).
+ *
+ * The snapshot is a fixed-width, little-endian columnar copy of manifest.json
+ * that the scraper swaps in atomically as it saves the manifest (at most once a
+ * second mid-run), so progress can be read without parsing the (large,
+ * constantly rewritten) JSON. Served to the import page by GET /api/scrape.
+ * Node has no mmap, so the file is read into one Buffer and columns are
+ * accessed in place.
+ */
+
+const MAGIC = 'TOCSNAP1';
+const VERSION = 2;
+const MAX_STATUSES = 8;
+const STATUS_NAMES = 64;
+const SECTIONS = [
+    'last_modified',
+    'scraped_at',
+    'pages_found',
+    'images_found',
+    'images_downloaded',
+    'slug_offsets',
+    'slug_order',
+    'year',
+    'status',
+    'images_status',
+    'month',
+    'strings',
+] as const;
+type Section = (typeof SECTIONS)[number];
+
+// 8s magic, u32 version, u32 rows, i64 generated_at, 64s status names,
+// u32[8] counts, u64[12] section offsets
+const COUNTS_AT = 24 + STATUS_NAMES;
+const HEADER_SIZE = COUNTS_AT + 4 * MAX_STATUSES + 8 * SECTIONS.length;
+
+export interface ScrapeProgress {
+    total: number;
+    counts: Record<string, number>;
+    generatedAt: Date;
+}
+
+export interface ManifestSnapshot extends ScrapeProgress {
+    /** Article status of a slug, or null when the slug is not in the manifest. */
+    statusOf(slug: string): string | null;
+}
+
+function resolveSnapshotPath(): string {
+    return path.join(process.cwd(), 'scraped', 'manifest.snap');
+}
+
+/**
+ * Load scraped/manifest.snap, or return null when the scraper has not
+ * published one (or it is from an incompatible version).
+ */
+export function readManifestSnapshot(snapshotPath: string = resolveSnapshotPath()): ManifestSnapshot | null {
+    if (!fs.existsSync(snapshotPath)) {
+        return null;
+    }
+    const buf = fs.readFileSync(snapshotPath);
+    if (buf.length < HEADER_SIZE || buf.toString('latin1', 0, 8) !== MAGIC || buf.readUInt32LE(8) !== VERSION) {
+        return null;
+    }
+
+    const rows = buf.readUInt32LE(12);
+    const generatedAt = new Date(Number(buf.readBigInt64LE(16)) * 1000);
+    const statuses = buf.toString('ascii', 24, COUNTS_AT).replace(/\0+$/, '').split(',');
+    const counts: Record<string, number> = {};
+    statuses.forEach((status, code) => {
+        counts[status] = buf.readUInt32LE(COUNTS_AT + 4 * code);
+    });
+    const offsets = {} as Record<Section, number>;
+    SECTIONS.forEach((section, k) => {
+        offsets[section] = Number(buf.readBigUInt64LE(COUNTS_AT + 4 * MAX_STATUSES + 8 * k));
+    });
+
+    const slugAt = (row: number): Buffer => {
+        const start = buf.readUInt32LE(offsets.slug_offsets + 4 * row);
+        const end = buf.readUInt32LE(offsets.slug_offsets + 4 * (row + 1));
+        return buf.subarray(offsets.strings + start, offsets.strings + end);
+    };
+
+    // Binary search over slug_order (rows sorted by UTF-8 bytes)
+    const statusOf = (slug: string): string | null => {
+        const target = Buffer.from(slug, 'utf-8');
+        let lo = 0;
+        let hi = rows;
+        while (lo < hi) {
+            const mid = (lo + hi) >>> 1;
+            const row = buf.readUInt32LE(offsets.slug_order + 4 * mid);
+            if (Buffer.compare(slugAt(row), target) < 0) lo = mid + 1;
+            else hi = mid;
+        }
+        if (lo >= rows) return null;
+        const row = buf.readUInt32LE(offsets.slug_order + 4 * lo);
+        if (!slugAt(row).equals(target)) return null;
+        return statuses[buf[offsets.status + row]] ?? null;
+    };
+
+    return { total: rows, counts, generatedAt, statusOf };
+}
+
+/** Per-status article counts of the current scrape, or null if none published. */
+export function readScrapeProgress(snapshotPath?: string): ScrapeProgress | null {
+    const snapshot = readManifestSnapshot(snapshotPath);
+    if (!snapshot) {
+        return null;
+    }
+    const { total, counts, generatedAt } = snapshot;
+    return { total, counts, generatedAt };
+}
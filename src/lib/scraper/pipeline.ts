@@ -7,10 +7,11 @@ import { upsertArticle, getArticleBySlug, getArticleBySourceUrl } from '../db/ar
 import { translateArticle } from '../ai/translate';
 import { saveMarkdownFile } from '../content/mdx';
 import { ensureUniqueSlug } from '../content/slugs';
-import { formatSqliteDate } from '../db/index';
+import { formatSqliteDate, getDb } from '../db/index';
 
 import fs from 'fs';
 import path from 'path';
+import zlib from 'zlib';
 import { ScrapeResponse } from '@/types/api';
 
 // ---------------------------------------------------------------------------
@@ -61,16 +62,86 @@ function resolveLocalJsonPath(slug: string): string {
     return path.join(process.cwd(), 'scraped', 'articles', `${slug}.json`);
 }
 
+/**
+ * Look up a slug in the Python scraper's JSONL corpus (--output-format jsonl).
+ *
+ * corpus/index.jsonl maps slug → (shard, offset, length); later lines win.
+ * Each record is an independent gzip member (or plain line), so one article
+ * is read by seeking to its offset. zstd shards are not supported here.
+ */
+function readCorpusArticle(slug: string): LocalArticleJSON | null {
+    const corpusDir = path.join(process.cwd(), 'scraped', 'corpus');
+    const indexPath = path.join(corpusDir, 'index.jsonl');
+    if (!fs.existsSync(indexPath)) {
+        return null;
+    }
+    let loc: { shard: string; offset: number; length: number } | null = null;
+    for (const line of fs.readFileSync(indexPath, 'utf-8').split('\n')) {
+        if (!line.includes(`"${slug}"`)) continue;
+        try {
+            const rec = JSON.parse(line);
+            if (rec.slug === slug) loc = rec;
+        } catch {
+            // torn trailing line after a crash
+        }
+    }
+    if (!loc || loc.shard.endsWith('.zst')) {
+        return null;
+    }
+    const fd = fs.openSync(path.join(corpusDir, loc.shard), 'r');
+    try {
+        const buf = Buffer.alloc(loc.length);
+        fs.readSync(fd, buf, 0, loc.length, loc.offset);
+        const raw = loc.shard.endsWith('.gz') ? zlib.gunzipSync(buf) : buf;
+        return JSON.parse(raw.toString('utf-8'));
+    } finally {
+        fs.closeSync(fd);
+    }
+}
+
+/**
+ * Look up a slug in the scraped_articles staging table (--output-format sqlite).
+ * JSON array columns are stored as text and mapped back to LocalArticleJSON.
+ */
+function readStagedArticle(slug: string): LocalArticleJSON | null {
+    const row = getDb()
+        .prepare('SELECT * FROM scraped_articles WHERE slug = ?')
+        .get(slug) as Record<string, string | number | null> | undefined;
+    if (!row) {
+        return null;
+    }
+    const list = (value: string | number | null): string[] => JSON.parse(String(value ?? '[]'));
+    return {
+        title: String(row.title_en),
+        content: String(row.content),
+        author: String(row.author ?? ''),
+        url: String(row.source_url),
+        featured_image: row.featured_image === null ? null : String(row.featured_image),
+        inline_images: list(row.inline_images),
+        movie_titles: list(row.movie_titles),
+        category: String(row.category),
+        tags: list(row.tags),
+        pages_merged: Number(row.page_count ?? 1),
+        scraped_at: String(row.scraped_at ?? ''),
+    };
+}
+
 /**
  * Attempt to read a pre-scraped article JSON from the local filesystem.
  *
- * Returns the parsed ScrapeResponse['data'] if the file exists,
- * or null if the file is absent (caller should fall back to remote scrape).
+ * Returns the parsed ScrapeResponse['data'] if the file (or a corpus record or
+ * staged row) exists, or null if absent (caller should fall back to remote scrape).
  */
 export function readLocalScrapedArticle(slug: string): NonNullable<ScrapeResponse['data']> | null {
     const jsonPath = resolveLocalJsonPath(slug);
     if (!fs.existsSync(jsonPath)) {
-        return null;
+        try {
+            const record = readCorpusArticle(slug) ?? readStagedArticle(slug);
+            return record ? localJsonToScrapeData(record) : null;
+        } catch (err) {
+            console.warn(`[pipeline] Failed to read corpus/staged record for slug "${slug}": ${err}`);
+            return null;
+        }
     }
     try {
         const raw = fs.readFileSync(jsonPath, 'utf-8');